@@ -4,16 +4,17 @@ from __future__ import annotations
 
 from collections.abc import Mapping
 import argparse
-import hashlib
 import json
 from datetime import datetime
 from pathlib import Path
 
+from townlet.policy.curation import SampleCache, digest_groups
+
 DEFAULT_VERSIONS_PATH = Path("data/bc_datasets/versions.json")
 REQUIRED_VERSION_KEYS = {"manifest", "checksums", "captures_dir"}
 
 
-def parse_args() -> argparse.Namespace:
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Audit BC dataset catalogue")
     parser.add_argument(
         "--versions",
@@ -26,7 +27,13 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Return non-zero exit code if any dataset fails validation",
     )
-    return parser.parse_args()
+    parser.add_argument("--workers", type=int, default=1, help="Processes used to hash changed captures")
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-hash every capture instead of trusting the checksum cache in the captures dir",
+    )
+    return parser.parse_args(argv)
 
 
 def load_versions(path: Path) -> Mapping[str, Mapping[str, object]]:
@@ -38,7 +45,9 @@ def load_versions(path: Path) -> Mapping[str, Mapping[str, object]]:
     return data
 
 
-def audit_dataset(name: str, payload: Mapping[str, object]) -> dict[str, object]:
+def audit_dataset(
+    name: str, payload: Mapping[str, object], *, workers: int = 1, use_cache: bool = True
+) -> dict[str, object]:
     missing_keys = [key for key in REQUIRED_VERSION_KEYS if key not in payload]
     findings: list[str] = []
     status = "PASS"
@@ -75,6 +84,7 @@ def audit_dataset(name: str, payload: Mapping[str, object]) -> dict[str, object]
 
     checksum_failures: list[str] = []
     if checksum_data:
+        expected: dict[tuple[Path, ...], list[tuple[str, str]]] = {}
         for sample_name, entry in checksum_data.items():
             sample_path = captures_dir / Path(entry.get("sample", sample_name)).name
             meta_path = captures_dir / Path(entry.get("meta", f"{sample_name}.json")).name
@@ -87,11 +97,14 @@ def audit_dataset(name: str, payload: Mapping[str, object]) -> dict[str, object]
                     f"{sample_name}: sample/meta missing ({sample_path}, {meta_path})"
                 )
                 continue
-            digest = hashlib.sha256(sample_path.read_bytes() + meta_path.read_bytes()).hexdigest()
-            if digest != expected_digest:
-                checksum_failures.append(
-                    f"{sample_name}: checksum mismatch expected={expected_digest} actual={digest}"
-                )
+            expected.setdefault((sample_path, meta_path), []).append((sample_name, expected_digest))
+        cache = SampleCache.for_directory(captures_dir, enabled=use_cache)
+        for paths, digest in digest_groups(list(expected), cache=cache, workers=workers):
+            for sample_name, expected_digest in expected[paths]:
+                if digest != expected_digest:
+                    checksum_failures.append(
+                        f"{sample_name}: checksum mismatch expected={expected_digest} actual={digest}"
+                    )
         if checksum_failures:
             status = "FAIL"
             findings.extend(checksum_failures)
@@ -126,7 +139,7 @@ def audit_dataset(name: str, payload: Mapping[str, object]) -> dict[str, object]
     return dataset_info
 
 
-def audit_catalog(versions_path: Path) -> dict[str, object]:
+def audit_catalog(versions_path: Path, *, workers: int = 1, use_cache: bool = True) -> dict[str, object]:
     datasets = load_versions(versions_path)
     results = []
     failures = 0
@@ -134,7 +147,7 @@ def audit_catalog(versions_path: Path) -> dict[str, object]:
     for name, payload in datasets.items():
         if not isinstance(payload, Mapping):
             continue
-        report = audit_dataset(name, payload)
+        report = audit_dataset(name, payload, workers=workers, use_cache=use_cache)
         results.append(report)
         if report["status"] == "FAIL":
             failures += 1
@@ -149,9 +162,9 @@ def audit_catalog(versions_path: Path) -> dict[str, object]:
     }
 
 
-def main() -> None:
-    args = parse_args()
-    report = audit_catalog(args.versions)
+def main(argv: list[str] | None = None) -> None:
+    args = parse_args(argv)
+    report = audit_catalog(args.versions, workers=args.workers, use_cache=not args.no_cache)
     print(json.dumps(report, indent=2))
     if args.exit_on_failure and report["failures"]:
         raise SystemExit(1)
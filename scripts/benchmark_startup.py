@@ -0,0 +1,51 @@
+"""Startup-time benchmark for CLI entry points based on ``-X importtime``.
+
+Measures each registered entry point in a fresh interpreter and compares the
+fastest of ``--repeat`` runs with its budget. Exits non-zero when a budget is
+exceeded or a forbidden heavy module (PyTorch, FastAPI, rich, ...) is imported
+at startup, so CI catches import regressions.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+
+from townlet.benchmark.startup import ENTRY_POINTS, check_entry
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark CLI entry point import time")
+    parser.add_argument(
+        "--entry",
+        action="append",
+        choices=sorted(ENTRY_POINTS),
+        help="Entry point to check (repeatable; defaults to all).",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per entry; the fastest is used.")
+    parser.add_argument(
+        "--scale",
+        type=float,
+        default=1.0,
+        help="Multiply every budget by this factor (e.g. for slow CI runners).",
+    )
+    parser.add_argument("--json", action="store_true", help="Emit JSON results.")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    names = args.entry or sorted(ENTRY_POINTS)
+    results = [check_entry(ENTRY_POINTS[name], repeat=args.repeat, scale=args.scale) for name in names]
+    if args.json:
+        print(json.dumps([result.to_dict() for result in results], indent=2))
+    else:
+        for result in results:
+            status = "ok" if result.ok else "FAIL"
+            print(f"[{status}] {result.entry}: {result.import_ms:.1f}ms (budget {result.budget_ms:.1f}ms)")
+            for violation in result.violations:
+                print(f"    - {violation}")
+    return 0 if all(result.ok for result in results) else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
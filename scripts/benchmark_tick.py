@@ -14,10 +14,13 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("config", type=Path, help="Config file path")
     parser.add_argument("--ticks", type=int, default=2000, help="Tick count to run")
     parser.add_argument("--enforce-job-loop", action="store_true")
+    parser.add_argument("--systems", action="store_true", help="Print per-system runs, skips and mean time")
     return parser.parse_args()
 
 
-def benchmark(config_path: Path, ticks: int, enforce: bool) -> float:
+def benchmark(
+    config_path: Path, ticks: int, enforce: bool, *, systems: dict[str, dict[str, float]] | None = None
+) -> float:
     if ticks <= 0:
         raise ValueError("ticks must be positive for benchmarking")
     config = load_config(config_path)
@@ -26,13 +29,19 @@ def benchmark(config_path: Path, ticks: int, enforce: bool) -> float:
     start = time.perf_counter()
     loop.run_for(ticks)
     duration = time.perf_counter() - start
+    if systems is not None:
+        systems.update(loop.world_context.system_timings())
     return duration / ticks
 
 
 def main() -> None:
     args = parse_args()
-    avg = benchmark(args.config, args.ticks, args.enforce_job_loop)
+    systems: dict[str, dict[str, float]] = {}
+    avg = benchmark(args.config, args.ticks, args.enforce_job_loop, systems=systems if args.systems else None)
     print(f"average_tick_seconds={avg:.6f}")
+    for name, stats in systems.items():
+        mean_ms = stats["total_ms"] / stats["runs"] if stats["runs"] else 0.0
+        print(f"system={name} runs={int(stats['runs'])} skips={int(stats['skips'])} mean_ms={mean_ms:.4f}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,31 @@
+"""Convert a BC/replay manifest into a memory-mapped BC frame store."""
+
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+
+from townlet.policy.bc_store import build_bc_store
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Build a memory-mapped behaviour-cloning frame store.")
+    parser.add_argument("manifest", type=Path, help="BC or replay manifest listing the samples to convert.")
+    parser.add_argument("--output", type=Path, required=True, help="Directory for the store columns and bc_store.json.")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    index_path = build_bc_store(args.manifest, args.output)
+    index = json.loads(index_path.read_text())
+    print(
+        f"Wrote {index['frames']} frames from {len(index['samples'])} samples to {index_path} "
+        f"(action counts: {index['action_counts']})"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
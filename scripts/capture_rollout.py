@@ -13,6 +13,7 @@ from townlet.config.loader import load_config
 from townlet.core.sim_loop import SimulationLoop
 from townlet.policy.metrics import compute_sample_metrics
 from townlet.policy.replay import ReplaySample, frames_to_replay_sample
+from townlet.policy.rollout_shards import ShardedRolloutWriter
 from townlet.policy.scenario_utils import apply_scenario, seed_default_agents
 
 
@@ -53,6 +54,11 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Use numpy.savez_compressed for output NPZ files.",
     )
+    parser.add_argument(
+        "--sharded",
+        action="store_true",
+        help="Pack all agents into binary rollout shards indexed by <prefix>_shards.json.",
+    )
     return parser.parse_args()
 
 
@@ -96,6 +102,20 @@ def main() -> None:
         agent_id = frame.get("agent_id", "unknown")
         by_agent.setdefault(agent_id, []).append(frame)
 
+    if args.sharded:
+        with ShardedRolloutWriter(output_dir, prefix=args.prefix, compress=args.compress) as writer:
+            for agent_id, agent_frames in by_agent.items():
+                sample = frames_to_replay_sample(agent_frames)
+                sample.metadata.update({
+                    "agent_id": agent_id,
+                    "frame_count": len(agent_frames),
+                    "capture_metadata": capture_metadata,
+                })
+                sample.metadata["metrics"] = compute_sample_metrics(sample)
+                writer.add(agent_id, sample, frames=agent_frames)
+        print(f"Captured {len(by_agent)} replay samples to {writer.index_path}")
+        return
+
     manifest_entries: list[dict[str, object]] = []
     metrics_map: dict[str, dict[str, float]] = {}
     for index, (agent_id, agent_frames) in enumerate(by_agent.items(), start=1):
@@ -4,13 +4,20 @@ from __future__ import annotations
 
 import argparse
 import json
+from collections.abc import Iterable, Mapping
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, List, Mapping
 
-import numpy as np
-
-from townlet.policy.replay import load_replay_sample
+from townlet.policy.curation import (
+    DEFAULT_CACHE_NAME,
+    ManifestStreamWriter,
+    SampleCache,
+    entry_files,
+    evaluate_entries,
+    sample_metrics,
+)
+from townlet.policy.replay import load_replay_entry
+from townlet.policy.rollout_shards import ShardSampleRef, load_shard_index
 
 
 @dataclass
@@ -19,14 +26,27 @@ class EvaluationResult:
     meta_path: Path
     metrics: Mapping[str, float]
     accepted: bool
+    index: int | None = None
 
 
-def parse_args(argv: List[str] | None = None) -> argparse.Namespace:
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Curate scripted trajectories for BC datasets")
-    parser.add_argument("input", type=Path, help="Directory containing trajectory NPZ/JSON pairs")
+    parser.add_argument(
+        "input",
+        type=Path,
+        help="Directory containing trajectory NPZ/JSON pairs and/or rollout shard indexes, or a shard index file",
+    )
     parser.add_argument("--output", type=Path, required=True, help="Output manifest JSON path")
     parser.add_argument("--min-timesteps", type=int, default=10, help="Minimum timesteps to accept")
     parser.add_argument("--min-reward", type=float, default=None, help="Minimum total reward (optional)")
+    parser.add_argument("--workers", type=int, default=1, help="Processes used to evaluate uncached samples")
+    parser.add_argument(
+        "--cache",
+        type=Path,
+        default=None,
+        help=f"Sidecar metrics cache (default: <input dir>/{DEFAULT_CACHE_NAME})",
+    )
+    parser.add_argument("--no-cache", action="store_true", help="Ignore and do not write the metrics cache")
     return parser.parse_args(argv)
 
 
@@ -37,21 +57,52 @@ def _pair_files(directory: Path) -> Iterable[tuple[Path, Path]]:
             yield npz_path, json_path
 
 
+def _iter_entries(source: Path) -> Iterable[tuple[Path, Path] | ShardSampleRef]:
+    if source.is_file():
+        yield from load_shard_index(source)
+        return
+    yield from _pair_files(source)
+    for index_path in sorted(source.glob("*_shards.json")):
+        yield from load_shard_index(index_path)
+
+
+def evaluate_entry(entry: tuple[Path, Path] | ShardSampleRef) -> EvaluationResult:
+    if isinstance(entry, ShardSampleRef):
+        result = _evaluate(entry, entry.shard_path, entry.meta_path)
+        result.index = entry.index
+        return result
+    return evaluate_sample(*entry)
+
+
 def evaluate_sample(npz_path: Path, json_path: Path) -> EvaluationResult:
-    sample = load_replay_sample(npz_path, json_path)
-    rewards = sample.rewards.astype(float)
-    timesteps = int(sample.metadata.get("timesteps", rewards.shape[0]))
-    reward_sum = float(np.sum(rewards))
-    mean_reward = float(reward_sum / timesteps) if timesteps else 0.0
-    done_count = int(np.count_nonzero(sample.dones))
-
-    metrics = {
-        "timesteps": timesteps,
-        "reward_sum": reward_sum,
-        "mean_reward": mean_reward,
-        "done_count": done_count,
-    }
-    return EvaluationResult(npz_path, json_path, metrics, accepted=False)
+    return _evaluate((npz_path, json_path), npz_path, json_path)
+
+
+def _evaluate(
+    entry: tuple[Path, Path] | ShardSampleRef, sample_path: Path, meta_path: Path
+) -> EvaluationResult:
+    metrics = sample_metrics(load_replay_entry(entry))
+    return EvaluationResult(sample_path, meta_path, metrics, accepted=False)
+
+
+def _result(entry: tuple[Path, Path] | ShardSampleRef, metrics: Mapping[str, float]) -> EvaluationResult:
+    sample_path, meta_path = entry_files(entry)
+    index = entry.index if isinstance(entry, ShardSampleRef) else None
+    return EvaluationResult(sample_path, meta_path, metrics, accepted=False, index=index)
+
+
+def iter_results(
+    entries: Iterable[tuple[Path, Path] | ShardSampleRef],
+    *,
+    min_timesteps: int,
+    min_reward: float | None,
+    cache: SampleCache,
+    workers: int = 1,
+) -> Iterable[EvaluationResult]:
+    """Evaluate (or recall from ``cache``) and curate entries as they complete."""
+
+    for entry, metrics in evaluate_entries(entries, cache=cache, workers=workers):
+        yield curate(_result(entry, metrics), min_timesteps=min_timesteps, min_reward=min_reward)
 
 
 def curate(result: EvaluationResult, *, min_timesteps: int, min_reward: float | None) -> EvaluationResult:
@@ -62,18 +113,27 @@ def curate(result: EvaluationResult, *, min_timesteps: int, min_reward: float |
     return result
 
 
-def write_manifest(results: Iterable[EvaluationResult], output: Path) -> None:
-    manifest = []
-    for result in results:
-        entry = {
-            "sample": str(result.sample_path),
-            "meta": str(result.meta_path),
-            "metrics": dict(result.metrics),
-            "accepted": result.accepted,
-        }
-        manifest.append(entry)
-    output.parent.mkdir(parents=True, exist_ok=True)
-    output.write_text(json.dumps(manifest, indent=2))
+def manifest_entry(result: EvaluationResult) -> dict[str, object]:
+    entry: dict[str, object] = {
+        "sample": str(result.sample_path),
+        "meta": str(result.meta_path),
+        "metrics": dict(result.metrics),
+        "accepted": result.accepted,
+    }
+    if result.index is not None:
+        entry["index"] = result.index
+    return entry
+
+
+def write_manifest(results: Iterable[EvaluationResult], output: Path) -> list[EvaluationResult]:
+    """Stream ``results`` into ``output`` as they arrive; returns them for summaries."""
+
+    written: list[EvaluationResult] = []
+    with ManifestStreamWriter(output) as writer:
+        for result in results:
+            writer.write(manifest_entry(result))
+            written.append(result)
+    return written
 
 
 def summarise(results: Iterable[EvaluationResult]) -> Mapping[str, float]:
@@ -86,15 +146,20 @@ def summarise(results: Iterable[EvaluationResult]) -> Mapping[str, float]:
     }
 
 
-def main(argv: List[str] | None = None) -> None:
+def main(argv: list[str] | None = None) -> None:
     args = parse_args(argv)
-    results: List[EvaluationResult] = []
-    for npz_path, json_path in _pair_files(args.input):
-        result = evaluate_sample(npz_path, json_path)
-        result = curate(result, min_timesteps=args.min_timesteps, min_reward=args.min_reward)
-        results.append(result)
-
-    write_manifest(results, args.output)
+    cache_dir = args.input if args.input.is_dir() else args.input.parent
+    cache = SampleCache(None if args.no_cache else (args.cache or cache_dir / DEFAULT_CACHE_NAME))
+    results = write_manifest(
+        iter_results(
+            _iter_entries(args.input),
+            min_timesteps=args.min_timesteps,
+            min_reward=args.min_reward,
+            cache=cache,
+            workers=args.workers,
+        ),
+        args.output,
+    )
     summary = summarise(results)
     print(json.dumps(summary, indent=2))
 
@@ -0,0 +1,94 @@
+"""Export ConflictAwarePolicyNetwork as an optimised CPU inference artifact."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+import numpy as np
+
+from townlet.policy.inference import InferenceAccuracyError, export_inference_artifact
+from townlet.policy.models import ConflictAwarePolicyConfig, ConflictAwarePolicyNetwork
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Trace (and optionally int8-quantise) the policy network for live inference.")
+    parser.add_argument("--output", type=Path, required=True, help="Destination .pt artifact.")
+    parser.add_argument("--state-dict", type=Path, default=None, help="torch.save'd network state_dict (default: seed-0 init).")
+    parser.add_argument("--replay-manifest", type=Path, default=None, help="Replay manifest supplying accuracy-check frames.")
+    parser.add_argument("--check-frames", type=int, default=256, help="Frames used for the accuracy check.")
+    parser.add_argument("--map-shape", type=int, nargs=3, metavar=("C", "H", "W"), default=None)
+    parser.add_argument("--feature-dim", type=int, default=None)
+    parser.add_argument("--action-dim", type=int, required=True)
+    parser.add_argument("--hidden-dim", type=int, default=256)
+    parser.add_argument("--quantize", action="store_true", help="Dynamically quantise Linear layers to int8.")
+    parser.add_argument("--tolerance", type=float, default=None, help="Max absolute logit/value error vs fp32.")
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1], help="Batch sizes to benchmark.")
+    parser.add_argument("--benchmark-iterations", type=int, default=200, help="Timed iterations (0 disables).")
+    return parser.parse_args(argv)
+
+
+def _replay_frames(manifest: Path, limit: int) -> tuple[np.ndarray, np.ndarray]:
+    from townlet.policy.replay import _load_manifest, load_replay_entry
+
+    maps: list[np.ndarray] = []
+    features: list[np.ndarray] = []
+    collected = 0
+    for entry in _load_manifest(manifest):
+        sample = load_replay_entry(entry)
+        take = min(limit - collected, int(sample.map.shape[0]))
+        maps.append(np.asarray(sample.map[:take], dtype=np.float32))
+        features.append(np.asarray(sample.features[:take], dtype=np.float32))
+        collected += take
+        if collected >= limit:
+            break
+    if not collected:
+        raise ValueError(f"{manifest} contains no frames")
+    return np.concatenate(maps), np.concatenate(features)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    inputs = _replay_frames(args.replay_manifest, args.check_frames) if args.replay_manifest else None
+    map_shape = tuple(args.map_shape) if args.map_shape else (tuple(inputs[0].shape[1:]) if inputs else None)
+    feature_dim = args.feature_dim or (int(inputs[1].shape[1]) if inputs else None)
+    if map_shape is None or feature_dim is None or len(map_shape) != 3:
+        print("--map-shape and --feature-dim are required without --replay-manifest", file=sys.stderr)
+        return 2
+    channels, height, width = (int(size) for size in map_shape)
+    config = ConflictAwarePolicyConfig(
+        feature_dim=feature_dim,
+        map_shape=(channels, height, width),
+        action_dim=args.action_dim,
+        hidden_dim=args.hidden_dim,
+    )
+
+    import torch
+
+    torch.manual_seed(0)
+    network = ConflictAwarePolicyNetwork(config)
+    if args.state_dict is not None:
+        network.load_state_dict(torch.load(args.state_dict, map_location="cpu", weights_only=True))
+    try:
+        signature = export_inference_artifact(
+            network,
+            config,
+            args.output,
+            quantize=args.quantize,
+            tolerance=args.tolerance,
+            inputs=inputs,
+            check_samples=args.check_frames,
+            batch_sizes=args.batch_sizes,
+            benchmark_iterations=args.benchmark_iterations,
+        )
+    except InferenceAccuracyError as exc:
+        print(f"Export rejected: {exc}", file=sys.stderr)
+        return 1
+    print(json.dumps({"output": str(args.output), "accuracy": signature.accuracy, "latency_ms": signature.latency_ms}, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -58,6 +58,11 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Disable automatic pagination of agent cards",
     )
+    parser.add_argument(
+        "--lockstep",
+        action="store_true",
+        help="Render after every tick instead of running the simulation on a background thread",
+    )
     return parser.parse_args()
 
 
@@ -78,6 +83,7 @@ def main() -> None:
         agent_autorotate=not args.disable_agent_autorotate,
         telemetry_provider=telemetry_provider_name(loop),
         policy_provider=policy_provider_name(loop),
+        background_sim=not args.lockstep,
     )
 
 
@@ -0,0 +1,96 @@
+"""Prewarm the compiled configuration cache for a worker fleet.
+
+Loads each supplied simulation config, together with the affordance manifest it
+references, through the cache-aware loaders so subsequent workers sharing the
+cache directory skip YAML parsing, validation, and precondition compilation.
+Point workers at the same directory via ``TOWNLET_CONFIG_CACHE_DIR``.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+from pathlib import Path
+
+from townlet.config import load_config
+from townlet.config.affordance_manifest import (
+    AffordanceManifestError,
+    load_affordance_manifest,
+)
+from townlet.config.cache import CONFIG_CACHE_ENV, ConfigCache
+from townlet.world.preconditions import compile_manifest_preconditions
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Populate the Townlet compiled configuration cache",
+    )
+    parser.add_argument(
+        "configs",
+        nargs="+",
+        type=Path,
+        help="Simulation config YAML files to validate and cache.",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=None,
+        help=f"Cache directory (defaults to ${CONFIG_CACHE_ENV}).",
+    )
+    parser.add_argument(
+        "--clear",
+        action="store_true",
+        help="Remove existing cache entries before prewarming.",
+    )
+    return parser.parse_args(argv)
+
+
+def prewarm(configs: list[Path], cache: ConfigCache) -> list[str]:
+    """Populate ``cache`` for ``configs``, returning failure messages."""
+
+    failures: list[str] = []
+    for config_path in configs:
+        try:
+            config = load_config(config_path, cache=cache)
+        except (FileNotFoundError, ValueError) as exc:
+            failures.append(f"{config_path}: {exc}")
+            continue
+        manifest_path = Path(config.affordances.affordances_file).expanduser()
+        try:
+            manifest = load_affordance_manifest(manifest_path, cache=cache)
+        except (FileNotFoundError, AffordanceManifestError) as exc:
+            failures.append(f"{config_path}: affordance manifest {manifest_path}: {exc}")
+            continue
+        compile_manifest_preconditions(manifest, cache=cache)
+        print(
+            f"[ok] {config_path} config_id={config.config_id}"
+            f" manifest={manifest.path} sha256={manifest.checksum}"
+        )
+    return failures
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    cache_dir = args.cache_dir
+    if cache_dir is None:
+        env_dir = os.environ.get(CONFIG_CACHE_ENV, "").strip()
+        if not env_dir:
+            print(f"[error] Pass --cache-dir or set {CONFIG_CACHE_ENV}.", file=sys.stderr)
+            return 2
+        cache_dir = Path(env_dir)
+    cache = ConfigCache(cache_dir)
+    if args.clear:
+        removed = cache.clear()
+        print(f"[info] Removed {removed} cache entries from {cache.directory}")
+
+    failures = prewarm(list(args.configs), cache)
+    if failures:
+        print("[error] One or more configs failed to prewarm:", file=sys.stderr)
+        for failure in failures:
+            print(f"  - {failure}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
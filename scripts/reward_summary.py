@@ -9,6 +9,8 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Iterable, Iterator, Mapping, Sequence
 
+from townlet.telemetry.archive import TelemetryArchiveReader
+
 Number = float | int
 
 
@@ -109,20 +111,25 @@ def _is_number(value: object) -> bool:
     return isinstance(value, (int, float))
 
 
-def iter_payloads(path: Path) -> Iterator[tuple[Mapping[str, object], str]]:
-    text = path.read_text()
-    suffix = path.suffix.lower()
-    if suffix in {".jsonl", ".ndjson"}:
-        for idx, line in enumerate(text.splitlines(), start=1):
-            if not line.strip():
-                continue
-            payload = json.loads(line)
-            if isinstance(payload, Mapping):
-                yield payload, f"{path}:{idx}"
-            else:
-                raise ValueError(f"{path}:{idx}: expected JSON object")
+def _is_stream(path: Path) -> bool:
+    suffixes = [suffix.lower() for suffix in path.suffixes]
+    if suffixes and suffixes[-1] == ".gz":
+        suffixes = suffixes[:-1]
+    return path.is_dir() or (bool(suffixes) and suffixes[-1] in {".jsonl", ".ndjson"})
+
+
+def iter_payloads(
+    path: Path,
+    *,
+    start_tick: int | None = None,
+    end_tick: int | None = None,
+) -> Iterator[tuple[Mapping[str, object], str]]:
+    if _is_stream(path):
+        reader = TelemetryArchiveReader(path)
+        for entry in reader.iter_entries(start_tick=start_tick, end_tick=end_tick):
+            yield entry.record, entry.location
     else:
-        data = json.loads(text)
+        data = json.loads(path.read_text())
         if isinstance(data, Mapping):
             yield data, str(path)
         elif isinstance(data, Sequence):
@@ -135,10 +142,15 @@ def iter_payloads(path: Path) -> Iterator[tuple[Mapping[str, object], str]]:
             raise ValueError(f"{path}: expected JSON object or array")
 
 
-def collect_statistics(paths: Sequence[Path]) -> RewardAggregator:
+def collect_statistics(
+    paths: Sequence[Path],
+    *,
+    start_tick: int | None = None,
+    end_tick: int | None = None,
+) -> RewardAggregator:
     aggregator = RewardAggregator()
     for path in paths:
-        for payload, source in iter_payloads(path):
+        for payload, source in iter_payloads(path, start_tick=start_tick, end_tick=end_tick):
             aggregator.add_payload(payload, source)
     return aggregator
 
@@ -276,7 +288,12 @@ def render_json(summary: Mapping[str, object]) -> str:
 
 def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Summarise reward breakdown telemetry")
-    parser.add_argument("paths", nargs="+", type=Path, help="Telemetry JSON/JSONL files to analyse")
+    parser.add_argument(
+        "paths",
+        nargs="+",
+        type=Path,
+        help="Telemetry JSON/JSONL files (optionally .gz) or archive directories to analyse",
+    )
     parser.add_argument(
         "--format",
         choices={"text", "markdown", "json"},
@@ -295,13 +312,29 @@ def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
         default=5,
         help="Number of agents to show in top/bottom lists (default: 5)",
     )
+    parser.add_argument(
+        "--start-tick",
+        type=int,
+        default=None,
+        help="Ignore streamed payloads before this tick (inclusive range)",
+    )
+    parser.add_argument(
+        "--end-tick",
+        type=int,
+        default=None,
+        help="Ignore streamed payloads after this tick (inclusive range)",
+    )
     return parser.parse_args(argv)
 
 
 def main(argv: Sequence[str] | None = None) -> int:
     args = parse_args(argv)
     try:
-        summary = collect_statistics(args.paths).summary()
+        summary = collect_statistics(
+            args.paths,
+            start_tick=args.start_tick,
+            end_tick=args.end_tick,
+        ).summary()
     except (OSError, ValueError) as exc:
         sys.stderr.write(f"error: {exc}\n")
         return 1
@@ -9,6 +9,7 @@ from typing import Any, Dict
 import numpy as np
 
 from townlet.policy.replay import load_replay_sample
+from townlet.telemetry.archive import TelemetryArchiveReader
 
 
 def parse_args() -> argparse.Namespace:
@@ -28,7 +29,13 @@ def parse_args() -> argparse.Namespace:
         "--telemetry",
         type=Path,
         default=None,
-        help="Optional telemetry snapshot JSON to inspect",
+        help="Optional telemetry snapshot JSON, NDJSON stream log or archive directory to inspect",
+    )
+    parser.add_argument(
+        "--telemetry-tick",
+        type=int,
+        default=None,
+        help="Tick to reconstruct when --telemetry is a stream log or archive (default: latest)",
     )
     parser.add_argument(
         "--validate",
@@ -85,8 +92,17 @@ def render_observation(sample: Dict[str, Any]) -> None:
         print("Feature tensor length (consider using metadata carriers):", len(features))
 
 
-def inspect_telemetry(path: Path) -> None:
-    data = json.loads(path.read_text())
+def load_telemetry(path: Path, tick: int | None = None) -> dict[str, Any]:
+    if path.is_dir() or path.suffix in {".jsonl", ".ndjson", ".gz"}:
+        data = TelemetryArchiveReader(path).snapshot_at(tick)
+        if data is None:
+            raise SystemExit(f"No telemetry snapshot found in {path} at or before tick {tick}")
+        return data
+    return json.loads(path.read_text())
+
+
+def inspect_telemetry(path: Path, tick: int | None = None) -> None:
+    data = load_telemetry(path, tick)
     conflict = data.get("conflict") or data.get("conflict_snapshot")
     if conflict:
         print("Conflict queues:", conflict.get("queues"))
@@ -111,7 +127,7 @@ def main() -> None:
     obs = {"map": sample.map, "features": sample.features, "metadata": sample.metadata}
     render_observation(obs)
     if args.telemetry:
-        inspect_telemetry(args.telemetry)
+        inspect_telemetry(args.telemetry, args.telemetry_tick)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,69 @@
+"""Run a parallel hyperparameter / anneal-schedule sweep from a spec file."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+from pathlib import Path
+
+from townlet.config.loader import load_config
+from townlet.policy.models import torch_available
+from townlet.policy.training.sweep import SweepRunner, SweepSpec
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Run a Townlet training sweep.")
+    parser.add_argument("spec", type=Path, help="Sweep spec (YAML or JSON).")
+    parser.add_argument(
+        "--config",
+        type=Path,
+        default=None,
+        help="Base simulation config (defaults to the spec's base_config).",
+    )
+    parser.add_argument("--output", type=Path, required=True, help="Directory for results and the replay store.")
+    parser.add_argument("--workers", type=int, default=None, help="Concurrent trials (overrides the spec).")
+    parser.add_argument("--threads-per-trial", type=int, default=None, help="Torch threads per trial (overrides the spec).")
+    parser.add_argument(
+        "--replay-manifest",
+        type=Path,
+        default=None,
+        help="Replay manifest, capture directory or existing replay store index (overrides the spec).",
+    )
+    parser.add_argument("--dry-run", action="store_true", help="Print the expanded trials and exit.")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    spec = SweepSpec.load(args.spec)
+    for field, value in (
+        ("workers", args.workers),
+        ("threads_per_trial", args.threads_per_trial),
+        ("replay_manifest", args.replay_manifest),
+    ):
+        if value is not None:
+            setattr(spec, field, value)
+    config_path = args.config or spec.base_config
+    if config_path is None:
+        raise SystemExit("Provide --config or base_config in the sweep spec")
+    runner = SweepRunner(load_config(config_path), spec, args.output)
+    if args.dry_run:
+        print(json.dumps([{"trial_id": trial.trial_id, "overrides": trial.overrides} for trial in runner.trials], indent=2))
+        return 0
+    if not torch_available():
+        raise SystemExit("PyTorch is required for sweeps; install the ML extras")
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    summary = runner.run()
+    best = summary["best"]
+    print(
+        f"Sweep finished: {summary['completed']}/{summary['trials']} trials ok; "
+        f"results in {runner.results_path}, summary in {runner.summary_path}"
+    )
+    if best is not None:
+        print(f"Best {summary['objective']}={best['metrics'][summary['objective']]} ({best['trial_id']}: {best['overrides']})")
+    return 0 if summary["failed"] == 0 else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
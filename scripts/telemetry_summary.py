@@ -3,13 +3,16 @@ from __future__ import annotations
 
 import argparse
 import json
+from collections import deque
 from pathlib import Path
 from typing import Sequence
 
+from townlet.telemetry.archive import TelemetryArchiveReader
+
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Summarise PPO telemetry NDJSON logs")
-    parser.add_argument("log", type=Path, help="Path to NDJSON telemetry log")
+    parser.add_argument("log", type=Path, help="Path to NDJSON telemetry log (optionally .gz) or archive directory")
     parser.add_argument(
         "--baseline",
         type=Path,
@@ -30,18 +33,11 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
-def load_records(path: Path) -> list[dict[str, object]]:
-    records: list[dict[str, object]] = []
-    for line_number, line in enumerate(path.read_text().splitlines(), start=1):
-        if not line.strip():
-            continue
-        try:
-            payload = json.loads(line)
-        except json.JSONDecodeError as err:
-            raise ValueError(f"{path}:{line_number}: invalid JSON – {err}") from err
-        if not isinstance(payload, dict):
-            raise ValueError(f"{path}:{line_number}: expected JSON object")
-        records.append(payload)
+def load_records(path: Path, *, last: int | None = None) -> list[dict[str, object]]:
+    """Stream records from ``path``, keeping only the trailing ``last`` when set."""
+
+    stream = TelemetryArchiveReader(path).iter_records()
+    records: list[dict[str, object]] = list(deque(stream, maxlen=last) if last else stream)
     if not records:
         raise ValueError(f"{path}: no telemetry records found")
     return records
@@ -326,9 +322,7 @@ def render(summary: dict[str, object], fmt: str) -> str:
 
 def main() -> None:
     args = parse_args()
-    records = load_records(args.log)
-    if args.last:
-        records = records[-args.last :]
+    records = load_records(args.log, last=args.last)
     baseline = load_baseline(args.baseline)
     summary = summarise(records, baseline)
     print(render(summary, args.format))
@@ -2,11 +2,14 @@
 from __future__ import annotations
 
 import argparse
+import gzip
 import json
 import sys
 import time
 from pathlib import Path
-from typing import Iterator
+from typing import Iterator, TextIO
+
+from townlet.telemetry.archive import TelemetryArchiveReader
 
 MODES = {"ppo", "health"}
 
@@ -65,7 +68,7 @@ def build_parser() -> argparse.ArgumentParser:
         default="ppo",
         help="Which log format to parse: 'ppo' (default) or 'health'",
     )
-    parser.add_argument("log", type=Path, help="Path to NDJSON PPO telemetry log")
+    parser.add_argument("log", type=Path, help="Path to NDJSON PPO telemetry log (optionally .gz) or archive directory")
     parser.add_argument("--follow", action="store_true", help="Continuously watch for new entries")
     parser.add_argument(
         "--interval",
@@ -234,51 +237,75 @@ def parse_args_from_list(argv: list[str]) -> argparse.Namespace:
     return build_parser().parse_args(argv[1:])
 
 
+def _normalise_ppo_record(payload: object, source: object) -> dict[str, float]:
+    if not isinstance(payload, dict):
+        raise ValueError(f"{source}: expected JSON object, got {type(payload).__name__}")
+    missing = REQUIRED_KEYS - payload.keys()
+    if missing:
+        raise ValueError(f"{source}: telemetry record missing keys: {sorted(missing)}")
+    record = {
+        key: float(payload[key])
+        for key in REQUIRED_KEYS
+        if key not in {"data_mode"}
+    }
+    record["data_mode"] = str(payload["data_mode"])
+    for key in OPTIONAL_NUMERIC_KEYS:
+        if key in payload:
+            value = payload[key]
+            record[key] = (
+                None
+                if value is None
+                else float(value)
+            )
+    for key in OPTIONAL_BOOL_KEYS:
+        if key in payload:
+            record[key] = bool(payload[key])
+    for key in OPTIONAL_TEXT_KEYS:
+        if key in payload:
+            record[key] = str(payload[key])
+    for key in OPTIONAL_EVENT_KEYS:
+        record[key] = float(payload.get(key, 0.0) or 0.0)
+    return record
+
+
+def _require_followable(path: Path) -> None:
+    # Rotated segments are gzipped once closed, so they never grow; tailing
+    # one would only read compressed bytes as text.
+    if path.suffix == ".gz":
+        raise ValueError(f"{path}: cannot --follow a compressed segment; follow the live log or drop --follow")
+
+
+def _open_text(path: Path) -> TextIO:
+    if path.suffix == ".gz":
+        return gzip.open(path, "rt", encoding="utf-8")
+    return path.open("r", encoding="utf-8")
+
+
 def stream_records(path: Path, follow: bool, interval: float) -> Iterator[dict[str, float]]:
     while not path.exists():
         if not follow:
             raise FileNotFoundError(path)
         time.sleep(interval)
 
+    if not follow:
+        # One-shot scans go through the archive reader, which streams plain,
+        # gzipped and segmented logs without loading them into memory.
+        for entry in TelemetryArchiveReader(path).iter_entries():
+            yield _normalise_ppo_record(entry.record, entry.location)
+        return
+    if path.is_dir():
+        raise ValueError(f"{path}: --follow needs a log file; pass the live archive segment instead")
+    _require_followable(path)
+
     with path.open("r", encoding="utf-8") as handle:
         while True:
             position = handle.tell()
             line = handle.readline()
             if not line:
-                if follow:
-                    handle.seek(position)
-                    time.sleep(interval)
-                    continue
-                break
-            payload = json.loads(line)
-            if not isinstance(payload, dict):
-                raise ValueError(f"{path}: expected JSON object, got {type(payload).__name__}")
-            missing = REQUIRED_KEYS - payload.keys()
-            if missing:
-                raise ValueError(f"{path}: telemetry record missing keys: {sorted(missing)}")
-            record = {
-                key: float(payload[key])
-                for key in REQUIRED_KEYS
-                if key not in {"data_mode"}
-            }
-            record["data_mode"] = str(payload["data_mode"])
-            for key in OPTIONAL_NUMERIC_KEYS:
-                if key in payload:
-                    value = payload[key]
-                    record[key] = (
-                        None
-                        if value is None
-                        else float(value)
-                    )
-            for key in OPTIONAL_BOOL_KEYS:
-                if key in payload:
-                    record[key] = bool(payload[key])
-            for key in OPTIONAL_TEXT_KEYS:
-                if key in payload:
-                    record[key] = str(payload[key])
-            for key in OPTIONAL_EVENT_KEYS:
-                record[key] = float(payload.get(key, 0.0) or 0.0)
-            yield record
+                handle.seek(position)
+                time.sleep(interval)
+                continue
+            yield _normalise_ppo_record(json.loads(line), path)
 
 
 def _parse_health_line(line: str) -> dict[str, float]:
@@ -315,8 +342,10 @@ def stream_health_records(path: Path, follow: bool, interval: float) -> Iterator
         if not follow:
             raise FileNotFoundError(path)
         time.sleep(interval)
+    if follow:
+        _require_followable(path)
 
-    with path.open("r", encoding="utf-8") as handle:
+    with _open_text(path) as handle:
         while True:
             position = handle.tell()
             line = handle.readline()
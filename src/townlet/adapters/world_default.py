@@ -5,6 +5,7 @@ from __future__ import annotations
 from collections.abc import Callable, Iterable, Mapping
 from typing import TYPE_CHECKING, Any
 
+from townlet.dto.actions import ActionBatch, split_action_input
 from townlet.dto.observations import ObservationEnvelope
 from townlet.dto.world import SimulationSnapshot
 from townlet.lifecycle.manager import LifecycleManager
@@ -74,8 +75,8 @@ class DefaultWorldAdapter(WorldRuntime):
         *,
         tick: int,
         console_operations: Iterable[ConsoleCommandEnvelope] | None = None,
-        action_provider: Callable[[WorldState, int], Mapping[str, Any]] | None = None,
-        policy_actions: Mapping[str, Any] | None = None,
+        action_provider: Callable[[WorldState, int], Mapping[str, Any] | ActionBatch] | None = None,
+        policy_actions: Mapping[str, Any] | ActionBatch | None = None,
     ) -> RuntimeStepResult:
         lifecycle = self._lifecycle
         perturbations = self._perturbations
@@ -85,12 +86,16 @@ class DefaultWorldAdapter(WorldRuntime):
         queued_ops = list(console_operations or [])
 
         combined_actions: dict[str, Any] = {}
+        action_batch: ActionBatch | None = None
         if policy_actions is not None:
-            combined_actions.update(policy_actions)
+            combined_actions, action_batch = split_action_input(policy_actions)
         elif action_provider is not None:
             supplied = action_provider(self._context.state, tick)
-            combined_actions.update(supplied)
+            combined_actions, action_batch = split_action_input(supplied)
 
+        # Only batch-aware contexts receive ``action_batch``; mapping-only ticks keep
+        # the legacy call shape.
+        batch_kwargs: dict[str, Any] = {} if action_batch is None else {"action_batch": action_batch}
         result = self._context.tick(
             tick=tick,
             console_operations=queued_ops,
@@ -98,6 +103,7 @@ class DefaultWorldAdapter(WorldRuntime):
             lifecycle=lifecycle,
             perturbations=perturbations,
             ticks_per_day=self._ticks_per_day,
+            **batch_kwargs,
         )
         self._last_result = result
         self._last_envelope = None
@@ -130,7 +136,7 @@ class DefaultWorldAdapter(WorldRuntime):
         self._last_envelope = envelope
         return envelope
 
-    def apply_actions(self, actions: Mapping[str, Any]) -> None:
+    def apply_actions(self, actions: Mapping[str, Any] | ActionBatch) -> None:
         self._context.apply_actions(actions)
 
     def snapshot(
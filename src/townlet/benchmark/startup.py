@@ -0,0 +1,197 @@
+"""Import-time startup budgets for CLI entry points.
+
+Each entry point names its script under ``scripts/``, a cumulative import-time
+budget, and heavy modules it must not pull in eagerly (PyTorch, FastAPI, rich,
+...). The script's module body is executed (``__main__`` blocks excluded) with
+``-X importtime`` in a fresh interpreter, so the measurement follows whatever
+the script actually imports; ``scripts/benchmark_startup.py`` wraps these
+helpers for CI.
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+_PROBE = "import runpy"
+
+
+@dataclass(frozen=True)
+class EntryPoint:
+    """A CLI entry point: the script it runs and its startup budget."""
+
+    script: Path
+    budget_ms: float
+    forbidden: tuple[str, ...] = ()
+
+    @property
+    def name(self) -> str:
+        return self.script.stem
+
+    @property
+    def path(self) -> Path:
+        return self.script if self.script.is_absolute() else REPO_ROOT / self.script
+
+
+@dataclass
+class ImportProfile:
+    """Cumulative import time and module set observed for one interpreter run."""
+
+    total_ms: float
+    imported: set[str] = field(default_factory=set)
+    slowest: list[tuple[str, float]] = field(default_factory=list)
+
+
+_HEAVY = ("torch", "fastapi", "prometheus_client", "rich")
+
+ENTRY_POINTS: dict[str, EntryPoint] = {
+    entry.name: entry
+    for entry in (
+        EntryPoint(
+            Path("scripts/telemetry_summary.py"),
+            budget_ms=250.0,
+            forbidden=(*_HEAVY, "townlet.world.grid", "townlet.telemetry.publisher"),
+        ),
+        EntryPoint(
+            Path("scripts/validate_affordances.py"),
+            budget_ms=750.0,
+            forbidden=(*_HEAVY, "townlet.world.grid"),
+        ),
+        EntryPoint(
+            Path("scripts/prewarm_config_cache.py"),
+            budget_ms=750.0,
+            forbidden=(*_HEAVY, "townlet.world.grid"),
+        ),
+        EntryPoint(
+            Path("scripts/run_simulation.py"),
+            budget_ms=2000.0,
+            forbidden=_HEAVY,
+        ),
+        EntryPoint(
+            Path("scripts/observer_ui.py"),
+            budget_ms=2500.0,
+            forbidden=("torch", "fastapi", "prometheus_client"),
+        ),
+    )
+}
+
+
+def parse_importtime(stderr: str, *, baseline: frozenset[str] = frozenset()) -> ImportProfile:
+    """Parse ``-X importtime`` output into a cumulative profile.
+
+    Top-level rows whose module is in ``baseline`` (interpreter startup imports
+    such as ``site``) are excluded from the total.
+    """
+
+    total_us = 0
+    imported: set[str] = set()
+    rows: list[tuple[str, int]] = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        fields = line.split(":", 1)[1].split("|", 2)
+        if len(fields) != 3:
+            continue
+        cumulative = int(fields[1])
+        name = fields[2]
+        module = name.strip()
+        if module in baseline:
+            continue
+        imported.add(module)
+        rows.append((module, cumulative))
+        depth = (len(name) - len(name.lstrip(" ")) - 1) // 2
+        if depth == 0:
+            total_us += cumulative
+    rows.sort(key=lambda item: item[1], reverse=True)
+    return ImportProfile(
+        total_ms=total_us / 1000.0,
+        imported=imported,
+        slowest=[(module, cumulative / 1000.0) for module, cumulative in rows[:10]],
+    )
+
+
+def _run_importtime(statement: str) -> str:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if result.returncode != 0:
+        tail = result.stderr.strip().splitlines()[-1:] or ["<no output>"]
+        raise RuntimeError(f"Running {statement!r} failed: {tail[0]}")
+    return result.stderr
+
+
+@lru_cache(maxsize=1)
+def startup_modules() -> frozenset[str]:
+    """Modules imported by the interpreter and the ``runpy`` probe before any script code."""
+
+    return frozenset(parse_importtime(_run_importtime(_PROBE)).imported)
+
+
+def measure(script: Path) -> ImportProfile:
+    """Run ``script``'s module body in a fresh interpreter and return the import profile."""
+
+    statement = f"{_PROBE}; runpy.run_path({str(script)!r}, run_name='__startup_probe__')"
+    return parse_importtime(_run_importtime(statement), baseline=startup_modules())
+
+
+@dataclass
+class StartupCheck:
+    entry: str
+    import_ms: float
+    budget_ms: float
+    violations: list[str]
+    slowest: list[tuple[str, float]]
+
+    @property
+    def ok(self) -> bool:
+        return not self.violations
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "entry": self.entry,
+            "import_ms": round(self.import_ms, 1),
+            "budget_ms": round(self.budget_ms, 1),
+            "violations": list(self.violations),
+            "slowest": [[module, round(ms, 1)] for module, ms in self.slowest],
+        }
+
+
+def check_entry(entry: EntryPoint, *, repeat: int = 3, scale: float = 1.0) -> StartupCheck:
+    """Measure ``entry`` (best of ``repeat`` runs) against its budget."""
+
+    profiles = [measure(entry.path) for _ in range(max(1, repeat))]
+    best = min(profiles, key=lambda profile: profile.total_ms)
+    budget = entry.budget_ms * scale
+    violations: list[str] = []
+    if best.total_ms > budget:
+        violations.append(f"import time {best.total_ms:.1f}ms exceeds budget {budget:.1f}ms")
+    for module in entry.forbidden:
+        if module in best.imported:
+            violations.append(f"forbidden module '{module}' imported at startup")
+    return StartupCheck(
+        entry=entry.name,
+        import_ms=best.total_ms,
+        budget_ms=budget,
+        violations=violations,
+        slowest=best.slowest,
+    )
+
+
+__all__ = [
+    "ENTRY_POINTS",
+    "REPO_ROOT",
+    "EntryPoint",
+    "ImportProfile",
+    "StartupCheck",
+    "check_entry",
+    "measure",
+    "parse_importtime",
+]
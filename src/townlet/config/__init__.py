@@ -23,6 +23,7 @@ from .loader import (
     BCTrainingSettings,
     # Console auth moved (re-exported below)
     # CuriosityToggle moved (re-exported below)
+    DistributedTrainingSettings,
     EmbeddingAllocatorConfig,
     # LifecycleToggle moved (re-exported below)
     # ObservationFeatureFlags moved (re-exported below)
@@ -83,6 +84,7 @@ from .telemetry import (
     NarrationThrottleConfig,
     PersonalityNarrationConfig,
     RelationshipNarrationConfig,
+    TelemetryArchiveConfig,
     TelemetryBufferConfig,
     TelemetryConfig,
     TelemetryRetryPolicy,
@@ -97,6 +99,7 @@ from .world_config import (
     BehaviorConfig,
     EmploymentConfig,
     LifecycleConfig,
+    SystemSchedulerConfig,
 )
 
 __all__ = [
@@ -115,6 +118,7 @@ __all__ = [
     "ConsoleMode",
     "CuriosityConfig",
     "CuriosityToggle",
+    "DistributedTrainingSettings",
     "EmbeddingAllocatorConfig",
     "EmploymentConfig",
     "FloatRange",
@@ -160,6 +164,8 @@ __all__ = [
     "StageFlags",
     "StarvationCanaryConfig",
     "SystemFlags",
+    "SystemSchedulerConfig",
+    "TelemetryArchiveConfig",
     "TelemetryBufferConfig",
     "TelemetryConfig",
     "TelemetryRetryPolicy",
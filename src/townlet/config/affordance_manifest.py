@@ -5,12 +5,14 @@ from __future__ import annotations
 import hashlib
 import logging
 from collections.abc import Iterable, Mapping
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from pathlib import Path
 from typing import Any, cast
 
 import yaml
 
+from townlet.config.cache import ConfigCache, default_config_cache
+
 logger = logging.getLogger(__name__)
 
 
@@ -65,11 +67,17 @@ class AffordanceManifestError(ValueError):
 _ALLOWED_HOOK_KEYS = {"before", "after", "fail"}
 
 
-def load_affordance_manifest(path: Path) -> AffordanceManifest:
+def load_affordance_manifest(
+    path: Path, *, cache: ConfigCache | None = None
+) -> AffordanceManifest:
     """Load and validate an affordance manifest, returning structured entries.
 
     Args:
         path: Path to the YAML manifest file.
+        cache: Optional compiled-config cache; defaults to the cache named by
+            ``TOWNLET_CONFIG_CACHE_DIR``. Preconditions are compiled by the world
+            when the manifest is applied
+            (:func:`townlet.world.preconditions.compile_manifest_preconditions`).
 
     Raises:
         FileNotFoundError: If the manifest does not exist.
@@ -80,6 +88,21 @@ def load_affordance_manifest(path: Path) -> AffordanceManifest:
         raise FileNotFoundError(f"Affordance manifest not found: {path}")
 
     raw_bytes = path.read_bytes()
+    cache = cache if cache is not None else default_config_cache()
+    if cache is None:
+        return _parse_manifest(path, raw_bytes)
+
+    cached = cache.get("affordances", raw_bytes)
+    if isinstance(cached, AffordanceManifest):
+        logger.debug("Loaded affordance manifest %s from cache (sha256=%s)", path, cached.checksum)
+        return replace(cached, path=path)
+
+    manifest = _parse_manifest(path, raw_bytes)
+    cache.put("affordances", raw_bytes, manifest)
+    return manifest
+
+
+def _parse_manifest(path: Path, raw_bytes: bytes) -> AffordanceManifest:
     checksum = hashlib.sha256(raw_bytes).hexdigest()
     payload = yaml.safe_load(raw_bytes.decode("utf-8")) or []
     if not isinstance(payload, Iterable) or isinstance(payload, Mapping):
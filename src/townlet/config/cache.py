@@ -0,0 +1,127 @@
+"""Content-hash keyed on-disk cache for validated configs and affordance manifests.
+
+Worker fleets build many simulation loops from the same handful of YAML files,
+and each construction pays for YAML parsing, pydantic validation, and affordance
+precondition compilation. ``ConfigCache`` stores the validated results as
+pickles keyed by the SHA-256 of the raw file bytes combined with a fingerprint
+of the schema sources (``townlet/config`` and the precondition compiler), the
+pydantic version, and the Python version. Editing either the YAML or the models
+therefore invalidates stale entries without manual intervention.
+
+The cache is opt-in: loaders consult it only when ``TOWNLET_CONFIG_CACHE_DIR``
+is set or a cache instance is passed explicitly. Entries are unpickled, so the
+directory must only be writable by trusted operators.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import pickle
+import sys
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+import pydantic
+
+logger = logging.getLogger(__name__)
+
+CONFIG_CACHE_ENV = "TOWNLET_CONFIG_CACHE_DIR"
+
+_PACKAGE_ROOT = Path(__file__).resolve().parent.parent
+_CACHE_FORMAT_VERSION = 1
+
+
+@lru_cache(maxsize=1)
+def schema_fingerprint() -> str:
+    """Return a digest identifying the schema that produced cached entries."""
+
+    digest = hashlib.sha256()
+    digest.update(f"v{_CACHE_FORMAT_VERSION}".encode())
+    digest.update(f"python-{sys.version_info.major}.{sys.version_info.minor}".encode())
+    digest.update(f"pydantic-{pydantic.VERSION}".encode())
+    sources = sorted((_PACKAGE_ROOT / "config").glob("*.py"))
+    sources.append(_PACKAGE_ROOT / "world" / "preconditions.py")
+    for source in sources:
+        digest.update(source.relative_to(_PACKAGE_ROOT).as_posix().encode("utf-8"))
+        digest.update(source.read_bytes())
+    return digest.hexdigest()
+
+
+class ConfigCache:
+    """Directory of pickled load results addressed by content hash."""
+
+    def __init__(self, directory: Path) -> None:
+        self._directory = Path(directory).expanduser()
+
+    @property
+    def directory(self) -> Path:
+        return self._directory
+
+    def entry_path(self, kind: str, raw: bytes) -> Path:
+        """Return the entry location for ``raw`` file bytes of the given kind."""
+
+        digest = hashlib.sha256()
+        digest.update(kind.encode("utf-8"))
+        digest.update(schema_fingerprint().encode("utf-8"))
+        digest.update(raw)
+        return self._directory / f"{kind}-{digest.hexdigest()}.pickle"
+
+    def get(self, kind: str, raw: bytes) -> Any | None:
+        """Return the cached value for ``raw`` or ``None`` when absent/unreadable."""
+
+        path = self.entry_path(kind, raw)
+        try:
+            with path.open("rb") as handle:
+                return pickle.load(handle)
+        except FileNotFoundError:
+            return None
+        except Exception:  # pragma: no cover - corrupt or incompatible entry
+            logger.warning("config_cache_entry_unreadable path=%s", path, exc_info=True)
+            path.unlink(missing_ok=True)
+            return None
+
+    def put(self, kind: str, raw: bytes, value: Any) -> Path:
+        """Store ``value`` for ``raw`` atomically and return the entry path."""
+
+        path = self.entry_path(kind, raw)
+        self._directory.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        try:
+            with tmp_path.open("wb") as handle:
+                pickle.dump(value, handle, protocol=pickle.HIGHEST_PROTOCOL)
+            tmp_path.replace(path)
+        except OSError:  # pragma: no cover - read-only or full cache directory
+            tmp_path.unlink(missing_ok=True)
+            logger.warning("config_cache_write_failed path=%s", path, exc_info=True)
+        return path
+
+    def clear(self) -> int:
+        """Remove all cache entries, returning the number deleted."""
+
+        if not self._directory.exists():
+            return 0
+        removed = 0
+        for entry in self._directory.glob("*.pickle"):
+            entry.unlink(missing_ok=True)
+            removed += 1
+        return removed
+
+
+def default_config_cache() -> ConfigCache | None:
+    """Return the cache configured via ``TOWNLET_CONFIG_CACHE_DIR`` if any."""
+
+    directory = os.environ.get(CONFIG_CACHE_ENV, "").strip()
+    if not directory:
+        return None
+    return ConfigCache(Path(directory))
+
+
+__all__ = [
+    "CONFIG_CACHE_ENV",
+    "ConfigCache",
+    "default_config_cache",
+    "schema_fingerprint",
+]
@@ -7,6 +7,7 @@ across the system. It is intentionally free of heavy imports to keep the
 
 from __future__ import annotations
 
+from pathlib import Path
 from typing import Literal
 
 from pydantic import BaseModel, Field
@@ -44,6 +45,13 @@ class PolicyRuntimeConfig(BaseModel):
     """Configure runtime policy behaviour (e.g., option commit duration)."""
 
     option_commit_ticks: int = Field(15, ge=0, le=100_000)
+    inference_artifact: Path | None = Field(
+        None,
+        description=(
+            "TorchScript policy artifact from scripts/export_policy_inference.py; used instead of the eager "
+            "network when its input signature and action count match the runtime."
+        ),
+    )
 
 
 class ConsoleFlags(BaseModel):
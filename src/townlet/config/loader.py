@@ -14,6 +14,7 @@ from typing import Final, Literal
 import yaml
 from pydantic import BaseModel, ConfigDict, Field, ValidationError, model_validator
 
+from townlet.config.cache import ConfigCache, default_config_cache
 from townlet.config.conflict import ConflictConfig, QueueFairnessConfig
 from townlet.config.console_auth import ConsoleAuthConfig
 from townlet.config.flags import (
@@ -55,6 +56,7 @@ from townlet.config.world_config import (
     BehaviorConfig,
     EmploymentConfig,
     LifecycleConfig,
+    SystemSchedulerConfig,
 )
 
 TrainingSource = Literal["replay", "rollout", "mixed", "bc", "anneal"]
@@ -152,6 +154,23 @@ class BCTrainingSettings(BaseModel):
     epochs: int = Field(10, ge=1)
     weight_decay: float = Field(0.0, ge=0.0)
     device: str = "cpu"
+    num_workers: int = Field(0, ge=0, description="DataLoader worker processes")
+    sampling: Literal["uniform", "block", "balanced"] = "uniform"
+    block_size: int = Field(1024, ge=1, description="Frames per block for block sampling")
+
+
+class DistributedTrainingSettings(BaseModel):
+    """Local multi-process data-parallel training (``torch.distributed``)."""
+
+    world_size: int = Field(1, ge=1, le=256, description="Worker processes; 1 trains in-process")
+    backend: Literal["gloo"] = "gloo"
+    master_addr: str = "127.0.0.1"
+    master_port: int = Field(0, ge=0, le=65535, description="Rendezvous port; 0 picks a free port")
+    threads_per_rank: int | None = Field(None, ge=1, description="torch intra-op threads per worker")
+
+    @property
+    def enabled(self) -> bool:
+        return self.world_size > 1
 
 
 class AnnealStage(BaseModel):
@@ -188,7 +207,19 @@ class TrainingConfig(BaseModel):
         epochs=10,
         weight_decay=0.0,
         device="cpu",
+        num_workers=0,
+        sampling="uniform",
+        block_size=1024,
     ))
+    distributed: DistributedTrainingSettings = Field(
+        default_factory=lambda: DistributedTrainingSettings(
+            world_size=1,
+            backend="gloo",
+            master_addr="127.0.0.1",
+            master_port=0,
+            threads_per_rank=None,
+        )
+    )
     anneal_schedule: list[AnnealStage] = Field(default_factory=list)
     anneal_accuracy_threshold: float = Field(0.9, ge=0.0, le=1.0)
     anneal_enable_policy_blend: bool = False
@@ -259,6 +290,9 @@ class SimulationConfig(BaseModel):
             epochs=10,
             weight_decay=0.0,
             device="cpu",
+            num_workers=0,
+            sampling="uniform",
+            block_size=1024,
         ),
         anneal_schedule=[],
         anneal_accuracy_threshold=0.9,
@@ -282,7 +316,10 @@ class SimulationConfig(BaseModel):
         energy_threshold=0.4,
         job_arrival_buffer=20,
     ))
-    policy_runtime: PolicyRuntimeConfig = Field(default_factory=lambda: PolicyRuntimeConfig(option_commit_ticks=15))
+    policy_runtime: PolicyRuntimeConfig = Field(default_factory=lambda: PolicyRuntimeConfig(
+        option_commit_ticks=15,
+        inference_artifact=None,
+    ))
     employment: EmploymentConfig = EmploymentConfig()  # type: ignore[call-arg]
     personalities: PersonalityAssignmentConfig = Field(default_factory=lambda: PersonalityAssignmentConfig())
     telemetry: TelemetryConfig = Field(default_factory=lambda: TelemetryConfig())
@@ -290,6 +327,7 @@ class SimulationConfig(BaseModel):
     snapshot: SnapshotConfig = Field(default_factory=lambda: SnapshotConfig())
     perturbations: PerturbationSchedulerConfig = PerturbationSchedulerConfig()  # type: ignore[call-arg]
     lifecycle: LifecycleConfig = Field(default_factory=lambda: LifecycleConfig(respawn_delay_ticks=0))
+    system_scheduler: SystemSchedulerConfig = Field(default_factory=lambda: SystemSchedulerConfig(max_workers=0))
     runtime: RuntimeProviders = Field(default_factory=lambda: RuntimeProviders())
 
     model_config = ConfigDict(extra="allow")
@@ -458,14 +496,28 @@ class SimulationConfig(BaseModel):
             register_migration(legacy_config, self.config_id, handler)
 
 
-def load_config(path: Path) -> SimulationConfig:
-    """Load and validate a Townlet YAML configuration file."""
+def load_config(path: Path, *, cache: ConfigCache | None = None) -> SimulationConfig:
+    """Load and validate a Townlet YAML configuration file.
+
+    When ``cache`` is omitted the cache named by ``TOWNLET_CONFIG_CACHE_DIR`` is
+    used if set; validated configs are then reused for identical file contents.
+    """
     if not path.exists():
         raise FileNotFoundError(path)
 
-    data = yaml.safe_load(path.read_text())
+    raw = path.read_bytes()
+    cache = cache if cache is not None else default_config_cache()
+    if cache is not None:
+        cached = cache.get("config", raw)
+        if isinstance(cached, SimulationConfig):
+            return cached
+
+    data = yaml.safe_load(raw.decode("utf-8"))
     try:
-        return SimulationConfig.model_validate(data)
+        config = SimulationConfig.model_validate(data)
     except ValidationError as exc:  # pragma: no cover - formatting helper
         header = f"Invalid config at {path}:\n"
         raise ValueError(header + str(exc)) from exc
+    if cache is not None:
+        cache.put("config", raw, config)
+    return config
@@ -45,6 +45,13 @@ class SocialSnippetConfig(BaseModel):
         return self
 
 
+class ObservationBufferPoolConfig(BaseModel):
+    """Reuse preallocated per-slot output arrays instead of allocating per tick."""
+
+    enabled: bool = False
+    depth: int = Field(2, ge=2, le=4, description="Generations kept live (double/triple buffering)")
+
+
 class ObservationsConfig(BaseModel):
     """Bundle observation variants consumed by WorldObservationService."""
 
@@ -71,11 +78,19 @@ class ObservationsConfig(BaseModel):
             include_aggregates=True,
         )
     )
+    buffer_pool: ObservationBufferPoolConfig = Field(
+        default_factory=lambda: ObservationBufferPoolConfig(enabled=False, depth=2)
+    )
+    incremental: bool = Field(
+        default=False,
+        description="Reuse last tick's map windows, re-encoding only agents near dirty tiles",
+    )
 
 
 __all__ = [
     "CompactObservationConfig",
     "HybridObservationConfig",
+    "ObservationBufferPoolConfig",
     "ObservationsConfig",
     "SocialSnippetConfig",
 ]
@@ -24,6 +24,10 @@ class PPOConfig(BaseModel):
     value_clip: float = Field(0.2, ge=0.0, le=1.0, description="Clipping for value function updates")
     advantage_normalization: bool = True
     num_mini_batches: int = Field(4, ge=1, le=1024, description="Number of minibatches per epoch")
+    prefetch_minibatches: bool = Field(
+        False,
+        description="Gather the next PPO minibatch on a background thread during each gradient step",
+    )
 
 
 __all__ = ["PPOConfig"]
@@ -41,6 +41,10 @@ class RuntimeProviders(BaseModel):
     world: RuntimeProviderConfig = Field(default_factory=lambda: RuntimeProviderConfig(provider="default"))
     policy: RuntimeProviderConfig = Field(default_factory=lambda: RuntimeProviderConfig(provider="scripted"))
     telemetry: RuntimeProviderConfig = Field(default_factory=lambda: RuntimeProviderConfig(provider="stdout"))
+    pipelined: bool = Field(
+        default=False,
+        description="Emit tick T telemetry on a worker thread while tick T+1 policy inference runs",
+    )
 
     model_config = ConfigDict(extra="allow")
 
@@ -13,7 +13,7 @@ from typing import Literal
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 # Local literals to keep this module self-contained
-TelemetryTransportType = Literal["stdout", "file", "tcp", "http", "websocket", "prometheus"]
+TelemetryTransportType = Literal["stdout", "file", "tcp", "http", "websocket", "prometheus", "archive"]
 TelemetryBackpressureStrategy = Literal["drop_oldest", "block", "fan_out"]
 
 
@@ -78,6 +78,14 @@ class TelemetryBufferConfig(BaseModel):
     flush_interval_ticks: int = Field(default=1, ge=1, le=10_000)
 
 
+class TelemetryArchiveConfig(BaseModel):
+    """Segment rotation settings for the archive transport."""
+
+    segment_max_bytes: int = Field(default=64 * 1024 * 1024, ge=1_024, le=16 * 1024 * 1024 * 1024)
+    segment_max_ticks: int | None = Field(default=None, ge=1)
+    compression: Literal["none", "gzip"] = "none"
+
+
 class TelemetryTransportConfig(BaseModel):
     """Transport-specific telemetry configuration."""
 
@@ -96,6 +104,7 @@ class TelemetryTransportConfig(BaseModel):
     websocket_url: str | None = None
     retry: TelemetryRetryPolicy = TelemetryRetryPolicy()
     buffer: TelemetryBufferConfig = TelemetryBufferConfig()
+    archive: TelemetryArchiveConfig = TelemetryArchiveConfig()
     worker_poll_seconds: float = Field(default=0.5, ge=0.01, le=10.0)
 
     @model_validator(mode="after")
@@ -121,7 +130,7 @@ class TelemetryTransportConfig(BaseModel):
             self.dev_allow_plaintext = False
             return self
 
-        if transport_type == "file":
+        if transport_type in ("file", "archive"):
             if "enable_tls" in fields_set and self.enable_tls:
                 raise ValueError("telemetry.transport.enable_tls is only supported for tcp transport")
             if any(value is not None for value in (self.ca_file, self.cert_file, self.key_file)):
@@ -131,7 +140,7 @@ class TelemetryTransportConfig(BaseModel):
             if self.dev_allow_plaintext:
                 raise ValueError("telemetry.transport.dev_allow_plaintext is only supported for tcp transport")
             if self.file_path is None:
-                raise ValueError("telemetry.transport.file_path is required when type is 'file'")
+                raise ValueError(f"telemetry.transport.file_path is required when type is '{transport_type}'")
             if str(self.file_path).strip() == "":
                 raise ValueError("telemetry.transport.file_path must not be blank")
             self.enable_tls = False
@@ -331,6 +340,7 @@ __all__ = [
     "NarrationThrottleConfig",
     "PersonalityNarrationConfig",
     "RelationshipNarrationConfig",
+    "TelemetryArchiveConfig",
     "TelemetryBackpressureStrategy",
     "TelemetryBufferConfig",
     "TelemetryConfig",
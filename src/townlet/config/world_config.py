@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import Literal
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
 class AffordanceRuntimeConfig(BaseModel):
@@ -40,6 +40,33 @@ class EmploymentConfig(BaseModel):
     exit_queue_limit: int = Field(8, ge=0, le=100)
     exit_review_window: int = Field(1440, ge=1, le=100000)
     enforce_job_loop: bool = False
+    event_driven: bool = Field(
+        False,
+        description="Evaluate agents only at shift transitions and during shift windows instead of every tick",
+    )
+
+
+class SystemSchedulerConfig(BaseModel):
+    """World system scheduling (cadence overrides and parallel waves)."""
+
+    max_workers: int = Field(
+        0,
+        ge=0,
+        le=64,
+        description="Thread pool size for consecutive parallel-safe systems with disjoint state; 0 runs all inline",
+    )
+    every: dict[str, int] = Field(
+        default_factory=dict,
+        description="Per-system cadence overrides: run the named system only on ticks divisible by N",
+    )
+
+    @field_validator("every")
+    @classmethod
+    def _validate_every(cls, value: dict[str, int]) -> dict[str, int]:
+        for name, interval in value.items():
+            if interval < 1:
+                raise ValueError(f"system_scheduler.every.{name} must be >= 1")
+        return value
 
 
 class BehaviorConfig(BaseModel):
@@ -63,5 +90,6 @@ __all__ = [
     "BehaviorConfig",
     "EmploymentConfig",
     "LifecycleConfig",
+    "SystemSchedulerConfig",
 ]
 
@@ -5,7 +5,9 @@ from __future__ import annotations
 import copy
 import json
 import logging
-from collections.abc import Mapping
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterable, Mapping
 from dataclasses import asdict, dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING, Protocol, TypeVar
@@ -85,6 +87,105 @@ class EventStream:
 
 T = TypeVar("T")
 
+CACHED_QUERY_COMMANDS = frozenset(
+    {
+        "conflict_status",
+        "queue_inspect",
+        "rivalry_dump",
+        "telemetry_snapshot",
+        "health_status",
+        "employment_status",
+        "relationship_summary",
+        "relationship_detail",
+        "social_events",
+        "affordance_status",
+        "perturbation_queue",
+    }
+)
+"""Read-only commands whose responses are memoized per telemetry version."""
+
+_READ_ONLY_COMMANDS = CACHED_QUERY_COMMANDS | {"promotion_status", "snapshot_inspect", "snapshot_validate"}
+_UNKEYED_KWARGS = frozenset({"cmd_id", "issuer", "mode"})
+
+
+def _freeze(value: object) -> Hashable:
+    if isinstance(value, Mapping):
+        return tuple(sorted((str(key), _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, Hashable):
+        return value
+    raise TypeError(f"unhashable console argument: {type(value).__name__}")
+
+
+def command_cache_key(command: ConsoleCommand) -> Hashable | None:
+    """Return a cache key for ``command`` or ``None`` when its args are unhashable.
+
+    Envelope bookkeeping (``cmd_id``, ``issuer``, ``mode``) is excluded so
+    repeated polls from different operators share one entry.
+    """
+
+    kwargs = {key: value for key, value in command.kwargs.items() if key not in _UNKEYED_KWARGS}
+    try:
+        return (command.name, _freeze(command.args), _freeze(kwargs))
+    except TypeError:
+        return None
+
+
+class ConsoleResponseCache:
+    """Memoizes console responses until the telemetry version changes.
+
+    ``version`` is polled on every lookup; when it differs from the version
+    the entries were computed under, the whole cache is dropped. Mutating
+    commands call :meth:`invalidate` so their effects are visible to the next
+    query within the same tick. Entries are bounded LRU-style by
+    ``max_entries``. Cached payloads are shared between callers; dict
+    responses are returned as shallow copies so callers may annotate them.
+    """
+
+    def __init__(self, version: Callable[[], Hashable], *, max_entries: int = 256) -> None:
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        self._version_fn = version
+        self._max_entries = max_entries
+        self._entries: OrderedDict[Hashable, object] = OrderedDict()
+        self._version: Hashable | None = None
+        self._writes = 0
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+
+    def current_version(self) -> Hashable:
+        return (self._version_fn(), self._writes)
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._writes += 1
+            self._entries.clear()
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], T]) -> T:
+        with self._lock:
+            version = self.current_version()
+            if version != self._version:
+                self._entries.clear()
+                self._version = version
+            if key in self._entries:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                cached = self._entries[key]
+            else:
+                self.misses += 1
+                cached = compute()
+                self._entries[key] = cached
+                if len(self._entries) > self._max_entries:
+                    self._entries.popitem(last=False)
+        if isinstance(cached, dict):
+            return dict(cached)  # type: ignore[return-value]
+        return cached  # type: ignore[return-value]
+
+    def stats(self) -> dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self._entries)}
+
 
 class TelemetryBridge:
     """Provides access to the latest telemetry snapshots for console consumers."""
@@ -94,10 +195,28 @@ class TelemetryBridge:
         publisher: TelemetrySinkProtocol,
         *,
         provider_name: str | None = None,
+        version_hint: Callable[[], Hashable] | None = None,
+        cache_responses: bool = True,
     ) -> None:
         self._publisher = publisher
         self._provider_name = provider_name or ("stub" if is_stub_telemetry(publisher) else "unknown")
         self._dispatcher = getattr(publisher, "event_dispatcher", None)
+        self._version_hint = version_hint
+        self._cache_responses = cache_responses
+        self.response_cache = ConsoleResponseCache(self.version)
+
+    def version(self) -> tuple[Hashable, ...]:
+        """Return a token that changes whenever published telemetry may have changed.
+
+        Combines the publisher tick, the event dispatcher generation and the
+        optional ``version_hint`` (e.g. the world tick for world-backed queries).
+        """
+
+        tick_fn = getattr(self._publisher, "current_tick", None)
+        tick = tick_fn() if callable(tick_fn) else None
+        generation = getattr(self._dispatcher, "generation", None)
+        hint = self._version_hint() if self._version_hint is not None else None
+        return (tick, generation, hint)
 
     def _call_or_default(self, name: str, default: T) -> T:
         """Call a telemetry method if present; otherwise return default.
@@ -130,6 +249,13 @@ class TelemetryBridge:
         return {str(key): copy.deepcopy(value) for key, value in payload.items()}
 
     def snapshot(self) -> dict[str, object]:
+        """Return the aggregated console snapshot, memoized per telemetry version."""
+
+        if not self._cache_responses:
+            return self._build_snapshot()
+        return self.response_cache.get_or_compute(("__snapshot__",), self._build_snapshot)
+
+    def _build_snapshot(self) -> dict[str, object]:
         version, warning = _schema_metadata(self._publisher)
         global_context = self._global_context()
         command_metadata = {
@@ -345,7 +471,18 @@ def create_console_router(
     mode: str = "viewer",
     config: SimulationConfig | None = None,
     lifecycle: LifecycleManager | None = None,
+    cache_responses: bool = True,
+    precompute: Iterable[str] = (),
 ) -> ConsoleRouter:
+    """Build a router with the standard console handlers registered.
+
+    Read-only queries in :data:`CACHED_QUERY_COMMANDS` are memoized per
+    ``(command, args, telemetry version)`` when ``cache_responses`` is true;
+    any other command invalidates the cache after it runs. ``precompute``
+    names argument-less queries to rebuild once per tick (after
+    ``loop.health``) so operator polls are served from the cache.
+    """
+
     router = ConsoleRouter()
     allowed_snapshot_roots: tuple[Path, ...] = ()
     if config is not None:
@@ -369,7 +506,45 @@ def create_console_router(
             inferred_telemetry_provider,
         )
 
-    bridge = TelemetryBridge(publisher, provider_name=inferred_telemetry_provider)
+    world_tick: Callable[[], Hashable] | None = None
+    if world is not None:
+        bound_world = world
+
+        def world_tick() -> Hashable:
+            return bound_world.tick
+
+    bridge = TelemetryBridge(
+        publisher,
+        provider_name=inferred_telemetry_provider,
+        version_hint=world_tick,
+        cache_responses=cache_responses,
+    )
+    response_cache = bridge.response_cache
+
+    def _register(name: str, handler: ConsoleHandler) -> None:
+        if not cache_responses or handler is _forbidden:
+            router.register(name, handler)
+            return
+        if name in CACHED_QUERY_COMMANDS:
+
+            def _memoized(command: ConsoleCommand) -> object:
+                key = command_cache_key(command)
+                if key is None:
+                    return handler(command)
+                return response_cache.get_or_compute(key, lambda: handler(command))
+
+            router.register(name, _memoized)
+        elif name in _READ_ONLY_COMMANDS:
+            router.register(name, handler)
+        else:
+
+            def _mutating(command: ConsoleCommand) -> object:
+                try:
+                    return handler(command)
+                finally:
+                    response_cache.invalidate()
+
+            router.register(name, _mutating)
 
     def _forbidden(_: ConsoleCommand) -> object:
         return {
@@ -1303,51 +1478,66 @@ def create_console_router(
             result["output_path"] = str(saved_path)
         return result
 
-    router.register("conflict_status", conflict_status_handler)
-    router.register("queue_inspect", queue_inspect_handler)
-    router.register("rivalry_dump", rivalry_dump_handler)
-    router.register("telemetry_snapshot", telemetry_handler)
-    router.register("health_status", health_status_handler)
-    router.register("employment_status", employment_status_handler)
-    router.register("relationship_summary", relationship_summary_handler)
-    router.register("social_events", social_events_handler)
-    router.register("announce_story", announce_story_handler)
-    router.register("affordance_status", affordance_status_handler)
-    router.register("employment_exit", employment_exit_handler)
-    router.register("promotion_status", promotion_status_handler)
-    router.register("arrange_meet", arrange_meet_handler)
-    router.register("perturbation_queue", perturbation_queue_handler)
-    router.register("snapshot_inspect", snapshot_inspect_handler)
-    router.register("snapshot_validate", snapshot_validate_handler)
+    _register("conflict_status", conflict_status_handler)
+    _register("queue_inspect", queue_inspect_handler)
+    _register("rivalry_dump", rivalry_dump_handler)
+    _register("telemetry_snapshot", telemetry_handler)
+    _register("health_status", health_status_handler)
+    _register("employment_status", employment_status_handler)
+    _register("relationship_summary", relationship_summary_handler)
+    _register("social_events", social_events_handler)
+    _register("announce_story", announce_story_handler)
+    _register("affordance_status", affordance_status_handler)
+    _register("employment_exit", employment_exit_handler)
+    _register("promotion_status", promotion_status_handler)
+    _register("arrange_meet", arrange_meet_handler)
+    _register("perturbation_queue", perturbation_queue_handler)
+    _register("snapshot_inspect", snapshot_inspect_handler)
+    _register("snapshot_validate", snapshot_validate_handler)
     if mode == "admin":
-        router.register("relationship_detail", relationship_detail_handler)
-        router.register("possess", possess_handler)
-        router.register("kill", kill_handler)
-        router.register("toggle_mortality", toggle_mortality_handler)
-        router.register("set_exit_cap", set_exit_cap_handler)
-        router.register("set_spawn_delay", set_spawn_delay_handler)
-        router.register("perturbation_trigger", perturbation_trigger_handler)
-        router.register("perturbation_cancel", perturbation_cancel_handler)
-        router.register("snapshot_migrate", snapshot_migrate_handler)
-        router.register("promote_policy", promote_policy_handler)
-        router.register("rollback_policy", rollback_policy_handler)
-        router.register("policy_swap", policy_swap_handler)
+        _register("relationship_detail", relationship_detail_handler)
+        _register("possess", possess_handler)
+        _register("kill", kill_handler)
+        _register("toggle_mortality", toggle_mortality_handler)
+        _register("set_exit_cap", set_exit_cap_handler)
+        _register("set_spawn_delay", set_spawn_delay_handler)
+        _register("perturbation_trigger", perturbation_trigger_handler)
+        _register("perturbation_cancel", perturbation_cancel_handler)
+        _register("snapshot_migrate", snapshot_migrate_handler)
+        _register("promote_policy", promote_policy_handler)
+        _register("rollback_policy", rollback_policy_handler)
+        _register("policy_swap", policy_swap_handler)
     else:
         # Cast to ConsoleHandler to match protocol
         from typing import cast
         forbidden_handler = cast(ConsoleHandler, _forbidden)
-        router.register("relationship_detail", forbidden_handler)
-        router.register("possess", forbidden_handler)
-        router.register("kill", forbidden_handler)
-        router.register("toggle_mortality", forbidden_handler)
-        router.register("set_exit_cap", forbidden_handler)
-        router.register("set_spawn_delay", forbidden_handler)
-        router.register("perturbation_trigger", forbidden_handler)
-        router.register("perturbation_cancel", forbidden_handler)
-        router.register("snapshot_migrate", forbidden_handler)
-        router.register("promote_policy", forbidden_handler)
-        router.register("rollback_policy", forbidden_handler)
-        router.register("policy_swap", forbidden_handler)
+        _register("relationship_detail", forbidden_handler)
+        _register("possess", forbidden_handler)
+        _register("kill", forbidden_handler)
+        _register("toggle_mortality", forbidden_handler)
+        _register("set_exit_cap", forbidden_handler)
+        _register("set_spawn_delay", forbidden_handler)
+        _register("perturbation_trigger", forbidden_handler)
+        _register("perturbation_cancel", forbidden_handler)
+        _register("snapshot_migrate", forbidden_handler)
+        _register("promote_policy", forbidden_handler)
+        _register("rollback_policy", forbidden_handler)
+        _register("policy_swap", forbidden_handler)
+    precompute_names = tuple(name for name in precompute if name in CACHED_QUERY_COMMANDS)
+    dispatcher = getattr(publisher, "event_dispatcher", None)
+    register_subscriber = getattr(dispatcher, "register_subscriber", None)
+    if cache_responses and precompute_names and callable(register_subscriber):
+
+        def _precompute(event_name: str, _: Mapping[str, object]) -> None:
+            if event_name != "loop.health":
+                return
+            for name in precompute_names:
+                try:
+                    router.dispatch(ConsoleCommand(name=name, args=(), kwargs={}))
+                except Exception:  # pragma: no cover - warm-up is best-effort
+                    logger.debug("console_precompute_failed command=%s", name, exc_info=True)
+
+        register_subscriber(_precompute)
     return router
 
 
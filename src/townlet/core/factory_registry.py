@@ -9,6 +9,7 @@ from typing import Any, TypeVar
 
 from townlet.core.interfaces import PolicyBackendProtocol, TelemetrySinkProtocol
 from townlet.ports.world import WorldRuntime
+from townlet.utils.optional import module_available, torch_available
 
 ProviderFactory = Callable[..., object]
 T_concrete = TypeVar("T_concrete", bound=object)
@@ -76,40 +77,55 @@ def resolve_telemetry(name: str, **kwargs: Any) -> TelemetrySinkProtocol:
     return _ensure_protocol(instance, TelemetrySinkProtocol, name)  # type: ignore[type-abstract]
 
 
-# Register built-in providers
-from townlet.policy.fallback import StubPolicyBackend  # noqa: E402  pylint: disable=wrong-import-position
-from townlet.policy.models import torch_available  # noqa: E402  pylint: disable=wrong-import-position
-from townlet.policy.runner import PolicyRuntime  # noqa: E402  pylint: disable=wrong-import-position
-from townlet.telemetry.fallback import StubTelemetrySink  # noqa: E402  pylint: disable=wrong-import-position
-from townlet.telemetry.publisher import TelemetryPublisher  # noqa: E402  pylint: disable=wrong-import-position
+# Register built-in providers. Factories import their implementations on first
+# use so resolving the registry does not load PyTorch or the telemetry stack.
+def _policy_runtime(**kwargs: Any) -> PolicyBackendProtocol:
+    from townlet.policy.runner import PolicyRuntime
 
-_policy_registry.register("scripted", lambda **kwargs: PolicyRuntime(**kwargs))
-_policy_registry.register("default", lambda **kwargs: PolicyRuntime(**kwargs))
-_policy_registry.register("stub", lambda **kwargs: StubPolicyBackend(**kwargs))
+    return PolicyRuntime(**kwargs)
+
+
+def _stub_policy(**kwargs: Any) -> PolicyBackendProtocol:
+    from townlet.policy.fallback import StubPolicyBackend
+
+    return StubPolicyBackend(**kwargs)
+
+
+def _telemetry_publisher(**kwargs: Any) -> TelemetrySinkProtocol:
+    from townlet.telemetry.publisher import TelemetryPublisher
+
+    return TelemetryPublisher(**kwargs)
+
+
+def _stub_telemetry(**kwargs: Any) -> TelemetrySinkProtocol:
+    from townlet.telemetry.fallback import StubTelemetrySink
+
+    return StubTelemetrySink(**kwargs)  # type: ignore[abstract]
+
+
+_policy_registry.register("scripted", _policy_runtime)
+_policy_registry.register("default", _policy_runtime)
+_policy_registry.register("stub", _stub_policy)
 _policy_registry.register("pytorch", lambda **kwargs: _resolve_pytorch_policy(**kwargs))
-_telemetry_registry.register("stdout", lambda **kwargs: TelemetryPublisher(**kwargs))
-_telemetry_registry.register("default", lambda **kwargs: TelemetryPublisher(**kwargs))
-_telemetry_registry.register("stub", lambda **kwargs: StubTelemetrySink(**kwargs))  # type: ignore[abstract]
+_telemetry_registry.register("stdout", _telemetry_publisher)
+_telemetry_registry.register("default", _telemetry_publisher)
+_telemetry_registry.register("stub", _stub_telemetry)
 _telemetry_registry.register("http", lambda **kwargs: _resolve_http_telemetry(**kwargs))
 
 
 def _resolve_pytorch_policy(**kwargs: Any) -> PolicyBackendProtocol:
     if not torch_available():
         logger.warning("policy_provider_fallback provider=pytorch message='PyTorch not installed; using stub backend.'")
-        return StubPolicyBackend(**kwargs)
-    return PolicyRuntime(**kwargs)
+        return _stub_policy(**kwargs)
+    return _policy_runtime(**kwargs)
 
 
 def _resolve_http_telemetry(**kwargs: Any) -> TelemetrySinkProtocol:
     if not _httpx_available():
         logger.warning("telemetry_provider_fallback provider=http message='httpx not installed; using stub telemetry.'")
-        return StubTelemetrySink(**kwargs)  # type: ignore[abstract]
-    return TelemetryPublisher(**kwargs)
+        return _stub_telemetry(**kwargs)
+    return _telemetry_publisher(**kwargs)
 
 
 def _httpx_available() -> bool:
-    try:
-        import httpx  # noqa: F401
-    except ModuleNotFoundError:
-        return False
-    return True
+    return module_available("httpx")
@@ -30,6 +30,8 @@ from townlet.core.interfaces import (
     PolicyBackendProtocol,
     TelemetrySinkProtocol,
 )
+from townlet.core.tick_pipeline import TickPipeline
+from townlet.dto.actions import ActionBatch
 from townlet.dto.telemetry import TelemetryEventDTO, TelemetryMetadata
 from townlet.factories import create_policy, create_telemetry, create_world
 from townlet.lifecycle.manager import LifecycleManager
@@ -53,7 +55,7 @@ from townlet.utils import decode_rng_state
 from townlet.utils.coerce import coerce_float, coerce_int
 from townlet.dto.observations import ObservationEnvelope
 from townlet.world.affordances import AffordanceRuntimeContext, DefaultAffordanceRuntime
-from townlet.world.grid import WorldState
+from townlet.world.grid import WorldLayoutTemplate, WorldState
 from townlet.world.observations.interfaces import ObservationServiceProtocol
 
 if TYPE_CHECKING:
@@ -121,6 +123,19 @@ class TickArtifacts:
     rewards: dict[str, float]
 
 
+@dataclass(frozen=True)
+class _TickTelemetryRecord:
+    """Per-tick inputs of the telemetry stage, assembled on the loop thread."""
+
+    tick: int
+    tick_start: float
+    tick_event_payload: dict[str, object] | None
+    dto_envelope: ObservationEnvelope
+    stability_metrics: dict[str, object]
+    global_context: dict[str, object]
+    console_result_count: int
+
+
 class SimulationLoop:
     """Orchestrates the Townlet simulation tick-by-tick."""
 
@@ -157,6 +172,7 @@ class SimulationLoop:
         self._world_provider_locked = world_provider is not None
         self._world_options = dict(world_options or {})
         self._world_options_locked = world_options is not None
+        self._seed_salt: str | None = None
         self._policy_provider = (policy_provider or "scripted").strip()
         self._policy_provider_locked = policy_provider is not None
         self._policy_options = dict(policy_options or {})
@@ -183,6 +199,7 @@ class SimulationLoop:
         self._policy_controller: PolicyController | None = None
         self._console_router: ConsoleRouter | None = None
         self._health_monitor: HealthMonitor | None = None
+        self._world_template: WorldLayoutTemplate | None = None
         self._rivalry_history: list[dict[str, object]] = []
         self._policy_observation_envelope: ObservationEnvelope | None = None
         self._last_policy_metadata_event: dict[str, object] | None = None
@@ -203,6 +220,10 @@ class SimulationLoop:
             "auth_enabled": False,
         }
         self._apply_runtime_overrides_from_config()
+        runtime_section = getattr(self.config, "runtime", None)
+        self._tick_pipeline: TickPipeline | None = (
+            TickPipeline() if bool(getattr(runtime_section, "pipelined", False)) else None
+        )
         self._build_components()
 
     def __setattr__(self, name: str, value: object) -> None:  # pragma: no cover - delegation glue
@@ -229,26 +250,9 @@ class SimulationLoop:
                     close()
                 except Exception:  # pragma: no cover - best effort
                     logger.debug("Failed to close previous telemetry sink", exc_info=True)
-        self._rng_world = random.Random(self._derive_seed("world"))
-        self._rng_events = random.Random(self._derive_seed("events"))
-        self._rng_policy = random.Random(self._derive_seed("policy"))
-        self._rivalry_history = []
-        self._last_policy_metadata_event = None
-        self._last_policy_possession_agents = None
-        self._last_policy_anneal_event = None
-        world_components = self._resolve_world_components()
-        self.world = world_components.world
-        self.lifecycle = world_components.lifecycle
-        self.perturbations = world_components.perturbations
-        self._observation_service = world_components.observation_service
-        self._ticks_per_day = world_components.ticks_per_day
-        self._console_service = world_components.console_service
-        self._world_port = world_components.world_port
-        context = getattr(self._world_port, "context", None)
-        if context is not None:
-            self._world_context = context
-        self.runtime = self._world_port
-        self._resolved_providers["world"] = world_components.provider
+        self._world_template = None
+        self._reset_episode_buffers()
+        self._install_world_components(self._resolve_world_components())
 
         policy_components = self._resolve_policy_components()
         self._policy_port = policy_components.port
@@ -274,16 +278,75 @@ class SimulationLoop:
         self.stability = StabilityMonitor(config=self.config)
         log_path = Path("logs/promotion_history.jsonl")
         self.promotion = PromotionManager(config=self.config, log_path=log_path)
-        self.tick = 0
         controller = self._policy_controller
         if controller is not None:
-            controller.register_ctx_reset_callback(self.world.request_ctx_reset)
             if self.config.training.anneal_enable_policy_blend:
                 controller.enable_anneal_blend(True)
         else:  # pragma: no cover - defensive
-            self.policy.register_ctx_reset_callback(self.world.request_ctx_reset)
             if self.config.training.anneal_enable_policy_blend:
                 self.policy.enable_anneal_blend(True)
+        self._start_episode()
+        self._world_template = self.world.export_layout_template() if self._supports_fast_reset() else None
+
+    def _reset_components(self) -> None:
+        """Start a new episode while keeping policy, telemetry and monitors alive.
+
+        Only the world is rebuilt, from the cached layout template, so the
+        affordance manifest is not re-read and preconditions are not
+        recompiled. The policy network, telemetry transport/worker and
+        provider wiring are reused; their per-episode state is cleared.
+        """
+
+        self._reset_episode_buffers()
+        self._install_world_components(self._resolve_world_components())
+        controller = self._policy_controller
+        if controller is not None:
+            controller.reset_state()
+        else:  # pragma: no cover - defensive
+            self.policy.reset_state()
+        if self.telemetry_publisher is not None:
+            self.telemetry_publisher.reset_state()
+        self.rewards.reset_state()
+        self.stability.reset_state()
+        self.promotion.reset()
+        self._start_episode()
+
+    def _reset_episode_buffers(self) -> None:
+        self._rng_world = random.Random(self._derive_seed("world"))
+        self._rng_events = random.Random(self._derive_seed("events"))
+        self._rng_policy = random.Random(self._derive_seed("policy"))
+        self._rivalry_history = []
+        self._last_policy_metadata_event = None
+        self._last_policy_possession_agents = None
+        self._last_policy_anneal_event = None
+        self._last_health_payload = None
+        self._last_global_context = None
+
+    def _install_world_components(self, world_components: WorldComponents) -> None:
+        self.world = world_components.world
+        self.lifecycle = world_components.lifecycle
+        self.perturbations = world_components.perturbations
+        self._observation_service = world_components.observation_service
+        self._ticks_per_day = world_components.ticks_per_day
+        self._console_service = world_components.console_service
+        self._world_port = world_components.world_port
+        context = getattr(self._world_port, "context", None)
+        if context is not None:
+            self._world_context = context
+        self.runtime = self._world_port
+        self._resolved_providers["world"] = world_components.provider
+
+    def _start_episode(self) -> None:
+        """Bind per-world collaborators and seed the bootstrap observation."""
+
+        self.tick = 0
+        controller = self._policy_controller
+        if controller is not None:
+            controller.register_ctx_reset_callback(self.world.request_ctx_reset)
+        else:  # pragma: no cover - defensive
+            self.policy.register_ctx_reset_callback(self.world.request_ctx_reset)
+        if self._world_port is None or self._telemetry_port is None:  # pragma: no cover - defensive
+            raise RuntimeError("World and telemetry ports must be initialised before starting an episode")
         self._console_router = ConsoleRouter(
             world=self._world_port,
             telemetry=self._telemetry_port,
@@ -303,6 +366,9 @@ class SimulationLoop:
         bootstrap_envelope = self._build_bootstrap_policy_envelope()
         self._set_policy_observation_envelope(bootstrap_envelope)
 
+    def _supports_fast_reset(self) -> bool:
+        return self._world_components_override is None and self._world_provider in {"default", "facade"}
+
     def override_world_components(
         self,
         builder: Callable[[SimulationLoop], WorldComponents] | None,
@@ -363,11 +429,17 @@ class SimulationLoop:
         if cfg is not None and getattr(cfg, "hybrid", None) is not None:
             ticks_per_day = getattr(cfg.hybrid, "time_ticks_per_day", 1440)
         ticks_per_day = max(1, int(ticks_per_day))
+        world_kwargs = self._world_options
+        if self._seed_salt is not None and "rng" not in world_kwargs and self._world_provider in {"default", "facade"}:
+            world_kwargs = {**world_kwargs, "rng": random.Random(self._derive_seed("world_state"))}
+        template = getattr(self, "_world_template", None)
+        if template is not None and "layout_template" not in world_kwargs:
+            world_kwargs = {**world_kwargs, "layout_template": template}
         world_port = create_world(
             provider=self._world_provider,
             config=self.config,
             ticks_per_day=ticks_per_day,
-            world_kwargs=self._world_options,
+            world_kwargs=world_kwargs,
             affordance_runtime_factory=self._affordance_runtime_factory,
             affordance_runtime_config=self._runtime_config,
         )
@@ -492,9 +564,24 @@ class SimulationLoop:
 
         self._failure_handlers.append(handler)
 
-    def reset(self) -> None:
-        """Reset the simulation loop to its initial state."""
-        self._build_components()
+    def reset(self, *, seed: int | None = None, rebuild: bool = False) -> None:
+        """Reset the simulation loop to its initial state.
+
+        When ``seed`` is given every derived RNG stream (including the world's
+        own RNG) is re-salted with it, so equal seeds replay identically.
+        By default the world is rebuilt from the cached layout template while
+        the policy, telemetry and monitors are reset in place; pass
+        ``rebuild=True`` (or use a custom world provider) to reconstruct every
+        component from the config.
+        """
+        self.flush_pipeline()
+        self._close_world_context()
+        if seed is not None:
+            self._seed_salt = str(int(seed))
+        if rebuild or self._world_template is None or not self._supports_fast_reset():
+            self._build_components()
+            return
+        self._reset_components()
 
     def set_anneal_ratio(self, ratio: float | None) -> None:
         controller = self._policy_controller
@@ -509,6 +596,7 @@ class SimulationLoop:
     def save_snapshot(self, root: Path | None = None) -> Path:
         """Persist the current world relationships and tick to ``root``."""
 
+        self.flush_pipeline()
         target_root = Path(root).expanduser() if root is not None else self.config.snapshot_root()
         manager = SnapshotManager(root=target_root)
         controller = self._policy_controller
@@ -544,6 +632,7 @@ class SimulationLoop:
     def load_snapshot(self, path: Path) -> None:
         """Restore world relationships and tick from the snapshot at ``path``."""
 
+        self.flush_pipeline()
         manager = SnapshotManager(root=path.parent)
         state = manager.load(
             path,
@@ -611,6 +700,7 @@ class SimulationLoop:
         """Run the loop until ``max_ticks`` or indefinitely."""
         while max_ticks is None or self.tick < max_ticks:
             yield self.step()
+        self.flush_pipeline()
 
     def run_for_ticks(self, max_ticks: int, *, collect: bool = False) -> list[TickArtifacts]:
         """Advance the simulation by ``max_ticks`` and optionally collect artifacts."""
@@ -622,6 +712,7 @@ class SimulationLoop:
             result = self.step()
             if collect:
                 artifacts.append(result)
+        self.flush_pipeline()
         return artifacts
 
     def run_for(self, max_ticks: int) -> None:
@@ -629,30 +720,21 @@ class SimulationLoop:
 
         self.run_for_ticks(max_ticks, collect=False)
 
-    def step(self) -> TickArtifacts:
-        """Advance the simulation loop by one tick and return the DTO envelope and rewards."""
+    def step(self, *, action_overrides: Mapping[str, object] | None = None) -> TickArtifacts:
+        """Advance the simulation loop by one tick and return the DTO envelope and rewards.
+
+        ``action_overrides`` replaces the policy's decision for the listed agents
+        (used by external controllers such as the PettingZoo environments).
+        """
         tick_start = time.perf_counter()
         next_tick = self.tick + 1
-        raw_console_commands = list(self.telemetry.drain_console_buffer())
-        console_envelopes: list[ConsoleCommandEnvelope] = []
-        for command in raw_console_commands:
-            try:
-                envelope = self._coerce_console_command(command)
-            except ValueError:
-                logger.warning("Ignoring invalid console command payload: %r", command)
-                continue
-            console_envelopes.append(envelope)
+        pipeline = self._tick_pipeline
         runtime = self.runtime
         if runtime is None:  # pragma: no cover - defensive guard
             raise RuntimeError("WorldRuntime is not initialised")
-        if self._console_router is not None:
-            for envelope in console_envelopes:
-                self._console_router.enqueue(envelope)
-        elif console_envelopes:
-            logger.warning(
-                "ConsoleRouter unavailable; dropping %d buffered commands",
-                len(console_envelopes),
-            )
+        # Pipelined mode drains the console after policy inference, once the
+        # previous tick's telemetry stage (which feeds the buffer) has finished.
+        console_envelopes = self._drain_console_envelopes() if pipeline is None else []
 
         controller = self._policy_controller
         try:
@@ -662,25 +744,48 @@ class SimulationLoop:
                 bootstrap_envelope = self._build_bootstrap_policy_envelope()
                 self._set_policy_observation_envelope(bootstrap_envelope)
 
-            def _action_provider(world: WorldState, current_tick: int) -> Mapping[str, object]:
+            def _action_provider(world: WorldState, current_tick: int) -> Mapping[str, object] | ActionBatch:
                 envelope = self._ensure_policy_envelope()
+                decided: Mapping[str, object] | ActionBatch
                 if controller is not None:
-                    return controller.decide(
+                    decided = controller.decide(
+                        world,
+                        current_tick,
+                        envelope=envelope,
+                    )
+                else:
+                    decided = self.policy.decide(
                         world,
                         current_tick,
                         envelope=envelope,
                     )
-                return self.policy.decide(
-                    world,
-                    current_tick,
-                    envelope=envelope,
+                if not action_overrides:
+                    return decided
+                if isinstance(decided, ActionBatch):
+                    return decided.with_overrides(action_overrides)
+                merged = dict(decided)
+                merged.update(action_overrides)
+                return merged
+
+            if pipeline is None:
+                runtime_result = runtime.tick(
+                    tick=self.tick,
+                    console_operations=console_envelopes,
+                    action_provider=_action_provider,
+                )
+            else:
+                # Stages before tick_pipeline.barrier_stage() overlap the previous
+                # tick's telemetry stage; enter() waits for it from there on.
+                pipeline.enter("policy_decide")
+                policy_actions = _action_provider(self.world, self.tick)
+                pipeline.enter("console_drain")
+                console_envelopes = self._drain_console_envelopes()
+                pipeline.enter("world_tick")
+                runtime_result = runtime.tick(
+                    tick=self.tick,
+                    console_operations=console_envelopes,
+                    policy_actions=policy_actions,
                 )
-
-            runtime_result = runtime.tick(
-                tick=self.tick,
-                console_operations=console_envelopes,
-                action_provider=_action_provider,
-            )
             console_results = runtime_result.console_results
             events = runtime_result.events
             terminated = runtime_result.terminated
@@ -871,6 +976,7 @@ class SimulationLoop:
                 anneal_context=anneal_context,
                 rivalry_events=rivalry_events,
             )
+            tick_event_payload: dict[str, object] | None = None
             if self._telemetry_port is not None:
                 tick_event_payload = {
                     "tick": self.tick,
@@ -887,76 +993,143 @@ class SimulationLoop:
                     "possessed_agents": possessed_agents_list,
                     "social_events": self.rewards.latest_social_events(),
                     "runtime_variant": self._runtime_variant,
-                    "observations_dto": dto_envelope.model_dump(by_alias=True),
                     "global_context": global_context,
                 }
-                tick_event = TelemetryEventDTO(
-                    event_type="loop.tick",
-                    tick=self.tick,
-                    payload=tick_event_payload,
-                    metadata=TelemetryMetadata(),
-                )
-                self._telemetry_port.emit_event(tick_event)
-            stability_event = TelemetryEventDTO(
-                event_type="stability.metrics",
+            record = _TickTelemetryRecord(
                 tick=self.tick,
-                payload=stability_metrics,
-                metadata=TelemetryMetadata(),
-            )
-            if self._telemetry_port is not None:
-                self._telemetry_port.emit_event(stability_event)
-            else:  # pragma: no cover - defensive
-                self.telemetry.emit_event(stability_event)
-            self.lifecycle.finalize(self.world, tick=self.tick, terminated=terminated)
-            duration_ms = (time.perf_counter() - tick_start) * 1000.0
-            transport_status = self._build_transport_status(queue_length=len(console_results))
-            health_payload = self._build_health_payload(
-                duration_ms=duration_ms,
-                transport_status=transport_status,
+                tick_start=tick_start,
+                tick_event_payload=tick_event_payload,
+                dto_envelope=dto_envelope,
+                stability_metrics=stability_metrics,
                 global_context=global_context,
+                console_result_count=len(console_results),
             )
-            health_event = TelemetryEventDTO(
-                event_type="loop.health",
-                tick=self.tick,
-                payload=health_payload,
-                metadata=TelemetryMetadata(),
-            )
-            if self._telemetry_port is not None:
-                self._telemetry_port.emit_event(health_event)
-            else:  # pragma: no cover - defensive
-                self.telemetry.emit_event(health_event)
-            if logger.isEnabledFor(logging.INFO):
-                summary_mapping = health_payload.get("summary")
-                summary: Mapping[str, object]
-                if isinstance(summary_mapping, Mapping):
-                    summary = summary_mapping
-                else:
-                    summary = {}
-                logger.info(
-                    (
-                        "tick_health tick=%s duration_ms=%.2f queue=%s dropped=%s "
-                        "flush_ms=%s payloads_total=%s bytes_total=%s "
-                        "perturbations_pending=%s perturbations_active=%s exit_queue=%s"
-                    ),
-                    self.tick,
-                    duration_ms,
-                    summary.get("queue_length"),
-                    summary.get("dropped_messages"),
-                    summary.get("last_flush_duration_ms"),
-                    summary.get("payloads_flushed_total"),
-                    summary.get("bytes_flushed_total"),
-                    summary.get("perturbations_pending"),
-                    summary.get("perturbations_active"),
-                    summary.get("employment_exit_queue"),
-                )
+            if pipeline is not None and not any(terminated.values()):
+                # finalize only acts on terminated agents, so the world the
+                # deferred stage reads is left untouched by it here.
+                self.lifecycle.finalize(self.world, tick=self.tick, terminated=terminated)
+                pipeline.submit(self._emit_tick_telemetry, record)
+                duration_ms = (time.perf_counter() - tick_start) * 1000.0
+            else:
+                self._emit_tick_events(record)
+                self.lifecycle.finalize(self.world, tick=self.tick, terminated=terminated)
+                duration_ms = self._emit_tick_health(record)
             self._record_step_success(duration_ms)
             return TickArtifacts(envelope=dto_envelope, rewards=rewards)
         except Exception as exc:
+            if pipeline is not None:
+                pipeline.barrier(raise_errors=False)
             duration_ms = (time.perf_counter() - tick_start) * 1000.0
             self.tick = max(0, self.tick - 1)
             self._handle_step_failure(next_tick, duration_ms, exc)
             raise SimulationLoopError(next_tick, "Simulation step failed", cause=exc) from exc
 
+    def flush_pipeline(self) -> None:
+        """Wait for the previous tick's deferred telemetry stage (pipelined mode).
+
+        Callers that mutate the world or read telemetry between ``step`` calls
+        should flush first; ``run_for_ticks``, ``reset``, snapshots and
+        ``close`` do so automatically.
+        """
+
+        if self._tick_pipeline is not None:
+            self._tick_pipeline.barrier()
+
+    def _drain_console_envelopes(self) -> list[ConsoleCommandEnvelope]:
+        raw_console_commands = list(self.telemetry.drain_console_buffer())
+        console_envelopes: list[ConsoleCommandEnvelope] = []
+        for command in raw_console_commands:
+            try:
+                envelope = self._coerce_console_command(command)
+            except ValueError:
+                logger.warning("Ignoring invalid console command payload: %r", command)
+                continue
+            console_envelopes.append(envelope)
+        if self._console_router is not None:
+            for envelope in console_envelopes:
+                self._console_router.enqueue(envelope)
+        elif console_envelopes:
+            logger.warning(
+                "ConsoleRouter unavailable; dropping %d buffered commands",
+                len(console_envelopes),
+            )
+        return console_envelopes
+
+    def _emit_tick_telemetry(self, record: _TickTelemetryRecord) -> float:
+        """Run the whole telemetry stage for ``record`` (pipeline worker entry)."""
+
+        self._emit_tick_events(record)
+        return self._emit_tick_health(record)
+
+    def _emit_tick_events(self, record: _TickTelemetryRecord) -> None:
+        if self._telemetry_port is not None and record.tick_event_payload is not None:
+            tick_event_payload = dict(record.tick_event_payload)
+            tick_event_payload["observations_dto"] = record.dto_envelope.model_dump(by_alias=True)
+            tick_event = TelemetryEventDTO(
+                event_type="loop.tick",
+                tick=record.tick,
+                payload=tick_event_payload,
+                metadata=TelemetryMetadata(),
+            )
+            self._telemetry_port.emit_event(tick_event)
+        stability_event = TelemetryEventDTO(
+            event_type="stability.metrics",
+            tick=record.tick,
+            payload=record.stability_metrics,
+            metadata=TelemetryMetadata(),
+        )
+        if self._telemetry_port is not None:
+            self._telemetry_port.emit_event(stability_event)
+        else:  # pragma: no cover - defensive
+            self.telemetry.emit_event(stability_event)
+
+    def _emit_tick_health(self, record: _TickTelemetryRecord) -> float:
+        """Emit ``loop.health`` for ``record`` and return the tick duration in ms."""
+
+        duration_ms = (time.perf_counter() - record.tick_start) * 1000.0
+        transport_status = self._build_transport_status(queue_length=record.console_result_count)
+        health_payload = self._build_health_payload(
+            duration_ms=duration_ms,
+            transport_status=transport_status,
+            global_context=record.global_context,
+            tick=record.tick,
+        )
+        health_event = TelemetryEventDTO(
+            event_type="loop.health",
+            tick=record.tick,
+            payload=health_payload,
+            metadata=TelemetryMetadata(),
+        )
+        if self._telemetry_port is not None:
+            self._telemetry_port.emit_event(health_event)
+        else:  # pragma: no cover - defensive
+            self.telemetry.emit_event(health_event)
+        if logger.isEnabledFor(logging.INFO):
+            summary_mapping = health_payload.get("summary")
+            summary: Mapping[str, object]
+            if isinstance(summary_mapping, Mapping):
+                summary = summary_mapping
+            else:
+                summary = {}
+            logger.info(
+                (
+                    "tick_health tick=%s duration_ms=%.2f queue=%s dropped=%s "
+                    "flush_ms=%s payloads_total=%s bytes_total=%s "
+                    "perturbations_pending=%s perturbations_active=%s exit_queue=%s"
+                ),
+                record.tick,
+                duration_ms,
+                summary.get("queue_length"),
+                summary.get("dropped_messages"),
+                summary.get("last_flush_duration_ms"),
+                summary.get("payloads_flushed_total"),
+                summary.get("bytes_flushed_total"),
+                summary.get("perturbations_pending"),
+                summary.get("perturbations_active"),
+                summary.get("employment_exit_queue"),
+            )
+        return duration_ms
+
     def _record_step_success(self, duration_ms: float) -> None:
         """Update health metadata after a successful tick."""
         self._health.last_tick = self.tick
@@ -1091,6 +1264,7 @@ class SimulationLoop:
         duration_ms: float,
         transport_status: Mapping[str, object],
         global_context: Mapping[str, object] | None,
+        tick: int | None = None,
     ) -> dict[str, object]:
         """Compose the loop.health payload using DTO context data."""
 
@@ -1184,7 +1358,7 @@ class SimulationLoop:
                     employment_exit_queue = 0
 
         payload: dict[str, object] = {
-            "tick": self.tick,
+            "tick": self.tick if tick is None else tick,
             "status": "ok",
             "duration_ms": duration_ms,
             "failure_count": self._health.failure_count,
@@ -1621,6 +1795,11 @@ class SimulationLoop:
     def close(self) -> None:
         """Release resources held by the loop (telemetry, runtime, policy)."""
 
+        pipeline = self._tick_pipeline
+        if pipeline is not None:
+            self._tick_pipeline = None
+            pipeline.close()
+        self._close_world_context()
         telemetry = getattr(self, "telemetry", None)
         if telemetry is not None:
             close = getattr(telemetry, "close", None)
@@ -1630,6 +1809,13 @@ class SimulationLoop:
                 except Exception:  # pragma: no cover - defensive cleanup
                     logger.debug("Telemetry close raised during loop shutdown", exc_info=True)
 
+    def _close_world_context(self) -> None:
+        # Joins the system scheduler's worker pool; the context is rebuilt on
+        # reset, so its pool would otherwise leak.
+        close = getattr(self._world_context, "close", None)
+        if callable(close):
+            close()
+
     def __enter__(self) -> SimulationLoop:
         return self
 
@@ -1643,5 +1829,7 @@ class SimulationLoop:
         return False
 
     def _derive_seed(self, stream: str) -> int:
-        digest = hashlib.sha256(f"{self.config.config_id}:{stream}".encode())
+        salt = self._seed_salt
+        key = f"{self.config.config_id}:{stream}" if salt is None else f"{self.config.config_id}:{salt}:{stream}"
+        digest = hashlib.sha256(key.encode())
         return int.from_bytes(digest.digest()[:8], "big")
@@ -0,0 +1,116 @@
+"""Two-stage tick pipeline overlapping telemetry emission with policy inference.
+
+With ``runtime.pipelined`` enabled, :class:`~townlet.core.sim_loop.SimulationLoop`
+hands tick T's telemetry stage (``loop.tick``/``stability.metrics`` ingestion,
+aggregation and transport, then the ``loop.health`` payload) to a single worker
+thread and immediately starts tick T+1, whose policy inference runs while the
+stage completes. Stage dependencies are declared in :data:`TICK_STAGES`; the
+loop announces each stage with :meth:`TickPipeline.enter`, which waits for the
+in-flight telemetry stage from :func:`barrier_stage` onwards.
+
+Determinism is preserved because the deferred stage only consumes a per-tick
+record assembled on the loop thread, the world is not mutated until the
+barrier (policy inference reads it, as the telemetry publisher does), and a
+single worker keeps emission in tick order. Ticks that terminate agents are
+emitted inline, because ``LifecycleManager.finalize`` removes them from the
+world the telemetry stage reads.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class TickStage:
+    """Declared data dependencies of one stage of a simulation tick."""
+
+    name: str
+    reads: tuple[str, ...]
+    writes: tuple[str, ...]
+
+
+TICK_STAGES: tuple[TickStage, ...] = (
+    TickStage("policy_decide", reads=("world", "policy_envelope"), writes=("policy",)),
+    TickStage("console_drain", reads=("telemetry",), writes=("telemetry", "console_router")),
+    TickStage("world_tick", reads=("world", "console_router"), writes=("world",)),
+    TickStage("rewards_stability", reads=("world",), writes=("rewards", "stability", "promotion")),
+    TickStage("observe", reads=("world", "stability"), writes=("policy_envelope",)),
+    TickStage("telemetry_emit", reads=("tick_record", "world"), writes=("telemetry",)),
+)
+"""Per-tick stages in pipelined order.
+
+Tick T+1 runs its stages while tick T's ``telemetry_emit`` may still be in
+flight, up to the first stage that conflicts with it (see
+:func:`barrier_stage`); the loop waits for the deferred stage there.
+"""
+
+
+def overlaps_deferred_stage(stage: TickStage, deferred: TickStage) -> bool:
+    """Return whether ``stage`` may run while ``deferred`` is still in flight."""
+
+    conflicts = set(stage.writes) & (set(deferred.reads) | set(deferred.writes))
+    conflicts |= set(stage.reads) & set(deferred.writes)
+    return not conflicts
+
+
+def barrier_stage(deferred: str = "telemetry_emit") -> str:
+    """Return the first stage of the next tick that must wait for ``deferred``."""
+
+    stages = {stage.name: stage for stage in TICK_STAGES}
+    for stage in TICK_STAGES:
+        if stage.name == deferred or not overlaps_deferred_stage(stage, stages[deferred]):
+            return stage.name
+    return deferred
+
+
+class TickPipeline:
+    """Runs deferred tick stages on one worker thread in submission order."""
+
+    def __init__(self, *, thread_name_prefix: str = "townlet-tick", deferred: str = "telemetry_emit") -> None:
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=thread_name_prefix)
+        self._pending: Future[Any] | None = None
+        names = [stage.name for stage in TICK_STAGES]
+        self._joins_at = {name: index >= names.index(barrier_stage(deferred)) for index, name in enumerate(names)}
+
+    @property
+    def pending(self) -> bool:
+        return self._pending is not None
+
+    def submit(self, stage: Callable[..., Any], *args: Any) -> None:
+        """Wait for the in-flight stage, then schedule ``stage(*args)``."""
+
+        self.barrier()
+        self._pending = self._executor.submit(stage, *args)
+
+    def enter(self, stage: str) -> None:
+        """Mark the start of ``stage``, waiting first if it conflicts with the deferred stage."""
+
+        if self._joins_at[stage]:
+            self.barrier()
+
+    def barrier(self, *, raise_errors: bool = True) -> None:
+        """Block until the in-flight stage finishes, re-raising its error."""
+
+        pending, self._pending = self._pending, None
+        if pending is None:
+            return
+        try:
+            pending.result()
+        except Exception:
+            if raise_errors:
+                raise
+            logger.warning("Deferred tick stage failed", exc_info=True)
+
+    def close(self) -> None:
+        self.barrier(raise_errors=False)
+        self._executor.shutdown(wait=True)
+
+
+__all__ = ["TICK_STAGES", "TickPipeline", "TickStage", "barrier_stage", "overlaps_deferred_stage"]
@@ -318,4 +318,6 @@ def run_demo_dashboard(
         show_personality_narration=show_personality_narration,
         telemetry_provider=telemetry_provider,
         policy_provider=policy_provider,
+        # Timelines are authored in ticks; keep the sim paced to the renderer.
+        background_sim=False,
     )
@@ -28,6 +28,7 @@ from .world import (
     SimulationSnapshot,
     StabilitySnapshot,
     TelemetrySnapshot,
+    TimerSnapshot,
     WorldSnapshot,  # Legacy alias
 )
 
@@ -50,6 +51,7 @@ __all__ = [
     "StabilitySnapshot",
     "PromotionSnapshot",
     "TelemetrySnapshot",
+    "TimerSnapshot",
     # Metadata
     "IdentitySnapshot",
     "MigrationSnapshot",
@@ -0,0 +1,263 @@
+"""Batched action container shared by policies, ports and the world.
+
+:class:`ActionBatch` is a structured NumPy array of :data:`ACTION_DTYPE` rows
+plus the :class:`ActionSlots` tables needed to decode it. It lives with the
+DTOs so the simulation loop and ports can pass batches around without
+importing the world package; :func:`townlet.world.systems.affordances.process_action_batch`
+applies them.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator, Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+
+
+class ActionValidationError(ValueError):
+    """Raised when an incoming action fails schema validation."""
+
+
+#: Kind codes used by :data:`ACTION_DTYPE` rows; the index is the code.
+ACTION_KIND_CODES: tuple[str, ...] = (
+    "noop",
+    "move",
+    "request",
+    "start",
+    "release",
+    "chat",
+    "blocked",
+)
+ACTION_KIND_INDEX: Mapping[str, int] = {kind: code for code, kind in enumerate(ACTION_KIND_CODES)}
+NO_SLOT = -1
+
+#: Structured row layout for batched actions. ``target_object_slot`` indexes
+#: :attr:`ActionSlots.objects` (or :attr:`ActionSlots.agents` for ``chat``),
+#: ``dx``/``dy`` are relative moves and ``affordance_slot`` selects the
+#: affordance for ``start`` (or an optional hint for ``release``).
+ACTION_DTYPE = np.dtype(
+    [
+        ("agent_slot", np.int32),
+        ("kind_code", np.int8),
+        ("target_object_slot", np.int32),
+        ("dx", np.int16),
+        ("dy", np.int16),
+        ("duration", np.int32),
+        ("affordance_slot", np.int32),
+    ]
+)
+
+ACTION_BATCH_ERRORS: tuple[str, ...] = (
+    "",
+    "agent_slot out of range",
+    "unsupported kind code",
+    "duration must be >= 1",
+    "target slot out of range",
+    "affordance slot out of range",
+    "duplicate agent slot",
+)
+_OBJECT_TARGET_CODES = np.array(
+    [ACTION_KIND_INDEX[kind] for kind in ("request", "start", "release", "blocked")],
+    dtype=np.int8,
+)
+
+
+@dataclass(frozen=True)
+class ActionSlots:
+    """Slot tables translating batched action indices into world identifiers."""
+
+    agents: tuple[str, ...]
+    objects: tuple[str, ...] = ()
+    affordances: tuple[str, ...] = ()
+    _agent_index: Mapping[str, int] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self, "_agent_index", {agent_id: slot for slot, agent_id in enumerate(self.agents)}
+        )
+
+    @classmethod
+    def from_world(cls, world: Any) -> ActionSlots:
+        """Build slot tables from a world's agent, object and affordance registries."""
+
+        return cls(
+            agents=tuple(str(agent_id) for agent_id in getattr(world, "agents", {})),
+            objects=tuple(str(object_id) for object_id in getattr(world, "objects", {})),
+            affordances=tuple(str(name) for name in getattr(world, "affordances", {})),
+        )
+
+    def agent_slot(self, agent_id: str) -> int:
+        return self._agent_index.get(agent_id, NO_SLOT)
+
+    def slots_for(self, agent_ids: Iterable[str]) -> np.ndarray:
+        """Return agent slots for ``agent_ids`` (unknown ids map to ``NO_SLOT``)."""
+
+        index = self._agent_index
+        return np.fromiter(
+            (index.get(agent_id, NO_SLOT) for agent_id in agent_ids), dtype=np.int32
+        )
+
+
+class ActionBatch:
+    """Structured NumPy array of actions plus the slot tables needed to decode it.
+
+    Policies fill rows of :data:`ACTION_DTYPE` instead of building one payload
+    mapping per agent. ``overrides`` carries per-agent mapping actions (e.g.
+    console possession) that replace the batch rows for those agents.
+    """
+
+    __slots__ = ("array", "overrides", "slots")
+
+    def __init__(
+        self,
+        array: np.ndarray,
+        slots: ActionSlots,
+        *,
+        overrides: Mapping[str, object] | None = None,
+    ) -> None:
+        if array.dtype != ACTION_DTYPE or array.ndim != 1:
+            raise ActionValidationError("action batch must be a 1-D array of ACTION_DTYPE")
+        self.array = array
+        self.slots = slots
+        self.overrides: Mapping[str, object] = dict(overrides or {})
+
+    @classmethod
+    def allocate(cls, slots: ActionSlots, size: int | None = None) -> ActionBatch:
+        """Return a batch of ``noop`` rows, one per agent slot by default."""
+
+        count = len(slots.agents) if size is None else int(size)
+        array = np.zeros(count, dtype=ACTION_DTYPE)
+        array["agent_slot"] = np.arange(count, dtype=np.int32) if size is None else NO_SLOT
+        array["target_object_slot"] = NO_SLOT
+        array["affordance_slot"] = NO_SLOT
+        array["duration"] = 1
+        return cls(array, slots)
+
+    def __len__(self) -> int:
+        return int(self.array.shape[0])
+
+    def with_overrides(self, overrides: Mapping[str, object]) -> ActionBatch:
+        """Return a batch sharing this array with ``overrides`` layered on top."""
+
+        merged = dict(self.overrides)
+        merged.update(overrides)
+        return ActionBatch(self.array, self.slots, overrides=merged)
+
+    def validate(self) -> np.ndarray:
+        """Return per-row error codes indexing :data:`ACTION_BATCH_ERRORS` (0 = valid)."""
+
+        rows = self.array
+        errors = np.zeros(rows.shape[0], dtype=np.int8)
+        agent_slots = rows["agent_slot"]
+        kinds = rows["kind_code"]
+        targets = rows["target_object_slot"]
+        agent_count = len(self.slots.agents)
+
+        bad_agent = (agent_slots < 0) | (agent_slots >= agent_count)
+        bad_kind = (kinds < 0) | (kinds >= len(ACTION_KIND_CODES))
+        bad_duration = rows["duration"] < 1
+        needs_object = np.isin(kinds, _OBJECT_TARGET_CODES)
+        bad_object = needs_object & ((targets < 0) | (targets >= len(self.slots.objects)))
+        is_chat = kinds == ACTION_KIND_INDEX["chat"]
+        bad_listener = is_chat & ((targets < 0) | (targets >= agent_count))
+        is_start = kinds == ACTION_KIND_INDEX["start"]
+        affordances = rows["affordance_slot"]
+        bad_affordance = is_start & ((affordances < 0) | (affordances >= len(self.slots.affordances)))
+
+        # Later rows for the same agent win, mirroring mapping semantics.
+        reversed_slots = agent_slots[::-1]
+        _, first_reversed = np.unique(reversed_slots, return_index=True)
+        keep = np.zeros(rows.shape[0], dtype=bool)
+        keep[rows.shape[0] - 1 - first_reversed] = True
+
+        # Assign in reverse priority so the most fundamental error is reported.
+        errors[~keep] = 6
+        errors[bad_affordance] = 5
+        errors[bad_object | bad_listener] = 4
+        errors[bad_duration] = 3
+        errors[bad_kind] = 2
+        errors[bad_agent] = 1
+        return errors
+
+    def decode_row(self, index: int) -> dict[str, object]:
+        """Decode a row into the legacy mapping payload (moves carry ``delta``)."""
+
+        row = self.array[index]
+        kind_code = int(row["kind_code"])
+        kind = ACTION_KIND_CODES[kind_code] if 0 <= kind_code < len(ACTION_KIND_CODES) else "noop"
+        payload: dict[str, object] = {"kind": kind, "duration": int(row["duration"])}
+        target = int(row["target_object_slot"])
+        affordance = int(row["affordance_slot"])
+        if kind == "move":
+            payload["delta"] = (int(row["dx"]), int(row["dy"]))
+        elif kind == "chat" and 0 <= target < len(self.slots.agents):
+            payload["target"] = self.slots.agents[target]
+        elif 0 <= target < len(self.slots.objects):
+            payload["object"] = self.slots.objects[target]
+        if 0 <= affordance < len(self.slots.affordances):
+            payload["affordance"] = self.slots.affordances[affordance]
+        return payload
+
+    def as_mapping(self) -> Mapping[str, object]:
+        """Return a lazily decoded ``agent_id -> payload`` view including overrides.
+
+        The view snapshots the array, so policies may refill their buffers once
+        the tick has been applied.
+        """
+
+        return _ActionBatchView(ActionBatch(self.array.copy(), self.slots, overrides=self.overrides))
+
+
+class _ActionBatchView(Mapping[str, object]):
+    __slots__ = ("_batch", "_rows")
+
+    def __init__(self, batch: ActionBatch) -> None:
+        self._batch = batch
+        agents = batch.slots.agents
+        rows: dict[str, int] = {}
+        for index, slot in enumerate(batch.array["agent_slot"].tolist()):
+            if 0 <= slot < len(agents):
+                rows[agents[slot]] = index
+        for agent_id in batch.overrides:
+            rows.pop(agent_id, None)
+        self._rows = rows
+
+    def __getitem__(self, agent_id: str) -> object:
+        override = self._batch.overrides.get(agent_id)
+        if override is not None:
+            return override
+        return self._batch.decode_row(self._rows[agent_id])
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._rows
+        yield from self._batch.overrides
+
+    def __len__(self) -> int:
+        return len(self._rows) + len(self._batch.overrides)
+
+
+def split_action_input(
+    supplied: Mapping[str, object] | ActionBatch | None,
+) -> tuple[dict[str, object], ActionBatch | None]:
+    """Separate per-agent mapping actions from a batched action array."""
+
+    if supplied is None:
+        return {}, None
+    if isinstance(supplied, ActionBatch):
+        return dict(supplied.overrides), supplied
+    return dict(supplied), None
+
+
+__all__ = [
+    "ACTION_BATCH_ERRORS",
+    "ACTION_DTYPE",
+    "ACTION_KIND_CODES",
+    "ACTION_KIND_INDEX",
+    "NO_SLOT",
+    "ActionBatch",
+    "ActionSlots",
+    "ActionValidationError",
+    "split_action_input",
+]
@@ -142,6 +142,13 @@ class TelemetrySnapshot(BaseModel):
     relationship_snapshot: dict[str, dict[str, dict[str, float]]] = Field(default_factory=dict)
 
 
+class TimerSnapshot(BaseModel):
+    """State of the shared timing wheel (pending future-tick entries)."""
+
+    current_tick: int | None = None
+    entries: list[dict[str, Any]] = Field(default_factory=list)
+
+
 class IdentitySnapshot(BaseModel):
     """Identity metadata for snapshot compatibility checks."""
 
@@ -241,6 +248,10 @@ class SimulationSnapshot(BaseModel):
         default_factory=TelemetrySnapshot,
         description="Telemetry publisher state (cached metrics)"
     )
+    timers: TimerSnapshot = Field(
+        default_factory=TimerSnapshot,
+        description="Shared timing wheel state (scheduled expiries)"
+    )
 
     # RNG streams
     rng_state: str | None = Field(
@@ -325,6 +336,7 @@ __all__ = [
     "StabilitySnapshot",
     "PromotionSnapshot",
     "TelemetrySnapshot",
+    "TimerSnapshot",
     # Metadata
     "IdentitySnapshot",
     "MigrationSnapshot",
@@ -0,0 +1,13 @@
+"""PettingZoo-compatible environments over the Townlet simulation loop."""
+
+from .parallel import ENV_ACTIONS, SCRIPTED_ACTION, TownletParallelEnv, populate_from_config
+from .vector import SubprocVectorTownletEnv, VectorTownletEnv
+
+__all__ = [
+    "ENV_ACTIONS",
+    "SCRIPTED_ACTION",
+    "SubprocVectorTownletEnv",
+    "TownletParallelEnv",
+    "VectorTownletEnv",
+    "populate_from_config",
+]
@@ -0,0 +1,346 @@
+"""PettingZoo ``ParallelEnv`` adapter over :class:`SimulationLoop`."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping
+from pathlib import Path
+from typing import Any, ClassVar
+
+import numpy as np
+import numpy.typing as npt
+from gymnasium import spaces
+from pettingzoo import ParallelEnv  # type: ignore[import-untyped]
+
+from townlet.config import SimulationConfig, load_config
+from townlet.core.sim_loop import SimulationLoop
+
+ENV_ACTIONS: tuple[str, ...] = (
+    "wait",
+    "move_north",
+    "move_south",
+    "move_west",
+    "move_east",
+    "scripted",
+)
+"""Discrete action catalogue; ``scripted`` defers to the configured policy backend."""
+
+SCRIPTED_ACTION = ENV_ACTIONS.index("scripted")
+_MOVE_OFFSETS: dict[int, tuple[int, int]] = {
+    ENV_ACTIONS.index("move_north"): (0, -1),
+    ENV_ACTIONS.index("move_south"): (0, 1),
+    ENV_ACTIONS.index("move_west"): (-1, 0),
+    ENV_ACTIONS.index("move_east"): (1, 0),
+}
+_WAIT_ACTION = ENV_ACTIONS.index("wait")
+
+PopulateFn = Callable[[SimulationLoop], None]
+
+
+def populate_from_config(loop: SimulationLoop) -> None:
+    """Seed agents the same way rollout capture does (scenario, else defaults)."""
+
+    from townlet.policy.scenario_utils import apply_scenario, seed_default_agents
+
+    scenario_config = getattr(loop.config, "scenario", None)
+    if scenario_config:
+        apply_scenario(loop, scenario_config)
+    elif not loop.world.agents:
+        seed_default_agents(loop)
+
+
+class TownletParallelEnv(ParallelEnv):  # type: ignore[misc]
+    """Exposes one Townlet world as a PettingZoo parallel environment.
+
+    Agents are identified by their ``origin_agent_id`` so a respawned body
+    keeps its slot. Observations, masks and rewards are written into
+    preallocated slot-ordered arrays; :meth:`step_arrays` returns those
+    arrays directly (used by :class:`VectorTownletEnv`) while :meth:`step`
+    wraps them in the per-agent dicts required by the PettingZoo API.
+
+    Each observation is a dict with ``map`` ``(C, H, W)``, ``features``
+    ``(F,)`` and ``action_mask`` ``(len(ENV_ACTIONS),)``. Seeding goes
+    through :meth:`SimulationLoop.reset`, which salts every derived RNG
+    stream via ``_derive_seed``.
+    """
+
+    metadata: ClassVar[dict[str, Any]] = {"name": "townlet_parallel_v0", "render_modes": [], "is_parallelizable": True}
+
+    def __init__(
+        self,
+        config: SimulationConfig | str | Path,
+        *,
+        max_ticks: int = 1000,
+        populate: PopulateFn | None = populate_from_config,
+        loop_options: Mapping[str, Any] | None = None,
+    ) -> None:
+        if not isinstance(config, SimulationConfig):
+            config = load_config(Path(config))
+        if max_ticks <= 0:
+            raise ValueError("max_ticks must be positive")
+        options: dict[str, Any] = {"telemetry_provider": "stub"}
+        options.update(loop_options or {})
+        self.config = config
+        self.max_ticks = int(max_ticks)
+        self.render_mode = None
+        self._populate = populate
+        self._loop = SimulationLoop(config, **options)
+        self._start_tick = 0
+        self._prepare_world()
+
+        self.possible_agents: list[str] = self._origin_ids()
+        if not self.possible_agents:
+            raise ValueError("TownletParallelEnv requires at least one agent after population")
+        self.agents: list[str] = list(self.possible_agents)
+        self._slot_of = {agent: index for index, agent in enumerate(self.possible_agents)}
+        self._live_ids: list[str | None] = [None] * len(self.possible_agents)
+        self._active = np.ones(len(self.possible_agents), dtype=bool)
+
+        map_shape, feature_dim = self._probe_shapes()
+        count = len(self.possible_agents)
+        self.map_shape = map_shape
+        self.feature_dim = feature_dim
+        self._maps = np.zeros((count, *map_shape), dtype=np.float32)
+        self._features = np.zeros((count, feature_dim), dtype=np.float32)
+        self._masks = np.zeros((count, len(ENV_ACTIONS)), dtype=np.int8)
+        self._rewards = np.zeros(count, dtype=np.float32)
+        self._terminations = np.zeros(count, dtype=bool)
+        self._truncations = np.zeros(count, dtype=bool)
+
+        self._observation_space = spaces.Dict(
+            {
+                "map": spaces.Box(-np.inf, np.inf, shape=map_shape, dtype=np.float32),
+                "features": spaces.Box(-np.inf, np.inf, shape=(feature_dim,), dtype=np.float32),
+                "action_mask": spaces.Box(0, 1, shape=(len(ENV_ACTIONS),), dtype=np.int8),
+            }
+        )
+        self._action_space = spaces.Discrete(len(ENV_ACTIONS))
+        self._grid_size = self._resolve_grid_size()
+        self._refresh_arrays()
+
+    # ------------------------------------------------------------------
+    # PettingZoo API
+    # ------------------------------------------------------------------
+    def observation_space(self, agent: str) -> spaces.Space[Any]:
+        return self._observation_space
+
+    def action_space(self, agent: str) -> spaces.Space[Any]:
+        return self._action_space
+
+    @property
+    def loop(self) -> SimulationLoop:
+        return self._loop
+
+    def reset(
+        self,
+        seed: int | None = None,
+        options: dict[str, Any] | None = None,
+    ) -> tuple[dict[str, dict[str, npt.NDArray[Any]]], dict[str, dict[str, Any]]]:
+        self.reset_arrays(seed=seed)
+        return self._observation_dict(), {agent: {} for agent in self.agents}
+
+    def step(
+        self, actions: Mapping[str, int]
+    ) -> tuple[
+        dict[str, dict[str, npt.NDArray[Any]]],
+        dict[str, float],
+        dict[str, bool],
+        dict[str, bool],
+        dict[str, dict[str, Any]],
+    ]:
+        acting = list(self.agents)
+        action_array = np.full(len(self.possible_agents), SCRIPTED_ACTION, dtype=np.int64)
+        for agent, action in actions.items():
+            slot = self._slot_of.get(agent)
+            if slot is not None:
+                action_array[slot] = int(action)
+        self.step_arrays(action_array)
+
+        observations = self._observation_dict(acting)
+        rewards = {agent: float(self._rewards[self._slot_of[agent]]) for agent in acting}
+        terminations = {agent: bool(self._terminations[self._slot_of[agent]]) for agent in acting}
+        truncations = {agent: bool(self._truncations[self._slot_of[agent]]) for agent in acting}
+        infos: dict[str, dict[str, Any]] = {agent: {} for agent in acting}
+        self.agents = [
+            agent
+            for agent in acting
+            if not (terminations[agent] or truncations[agent])
+        ]
+        return observations, rewards, terminations, truncations, infos
+
+    def render(self) -> None:
+        return None
+
+    def close(self) -> None:
+        self._loop.close()
+
+    # ------------------------------------------------------------------
+    # Array API
+    # ------------------------------------------------------------------
+    def reset_arrays(self, *, seed: int | None = None) -> dict[str, npt.NDArray[Any]]:
+        """Reset the world and return the slot-ordered observation arrays."""
+
+        self._loop.reset(seed=seed)
+        self._prepare_world()
+        self._start_tick = self._loop.tick
+        self.agents = list(self.possible_agents)
+        self._active[:] = True
+        self._rewards[:] = 0.0
+        self._terminations[:] = False
+        self._truncations[:] = False
+        self._refresh_arrays()
+        return self.arrays()
+
+    def step_arrays(self, actions: npt.ArrayLike) -> dict[str, npt.NDArray[Any]]:
+        """Apply slot-ordered integer ``actions`` and return the updated arrays.
+
+        Slots that are done, or whose action is ``scripted``, fall through to
+        the loop's policy backend. The returned arrays are reused between
+        calls; copy them if they must outlive the next step.
+        """
+
+        action_array = np.asarray(actions, dtype=np.int64)
+        if action_array.shape != (len(self.possible_agents),):
+            raise ValueError(
+                f"Expected actions with shape ({len(self.possible_agents)},), got {action_array.shape}"
+            )
+        overrides: dict[str, object] = {}
+        for slot, live_id in enumerate(self._live_ids):
+            if live_id is None or not self._active[slot]:
+                continue
+            payload = self._action_payload(live_id, int(action_array[slot]))
+            if payload is not None:
+                overrides[live_id] = payload
+
+        artifacts = self._loop.step(action_overrides=overrides)
+        terminated = artifacts.envelope.terminated
+        truncate = self._loop.tick - self._start_tick >= self.max_ticks
+        self._rewards[:] = 0.0
+        for slot, live_id in enumerate(self._live_ids):
+            if live_id is None or not self._active[slot]:
+                self._terminations[slot] = False
+                self._truncations[slot] = False
+                continue
+            self._rewards[slot] = float(artifacts.rewards.get(live_id, 0.0))
+            self._terminations[slot] = bool(terminated.get(live_id, False))
+            self._truncations[slot] = truncate and not self._terminations[slot]
+        self._refresh_arrays()
+        done = self._terminations | self._truncations
+        self._active &= ~done
+        return self.arrays()
+
+    def arrays(self) -> dict[str, npt.NDArray[Any]]:
+        return {
+            "map": self._maps,
+            "features": self._features,
+            "action_mask": self._masks,
+            "rewards": self._rewards,
+            "terminations": self._terminations,
+            "truncations": self._truncations,
+        }
+
+    @property
+    def all_done(self) -> bool:
+        return not bool(self._active.any())
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+    def _prepare_world(self) -> None:
+        if self._populate is not None:
+            self._populate(self._loop)
+        # Rebuild observations so newly populated agents are encoded before the
+        # first step.
+        self._loop.world_context.observe()
+
+    def _origin_ids(self) -> list[str]:
+        return sorted(
+            str(snapshot.origin_agent_id or agent_id)
+            for agent_id, snapshot in self._loop.world.agents.items()
+        )
+
+    def _probe_shapes(self) -> tuple[tuple[int, ...], int]:
+        batch = self._loop.world_context.latest_observation_batch()
+        for entry in batch.values():
+            map_array = np.asarray(entry.get("map"))
+            feature_array = np.asarray(entry.get("features"))
+            return tuple(int(dim) for dim in map_array.shape), int(feature_array.shape[0])
+        raise ValueError("World produced no observations to derive spaces from")
+
+    def _resolve_grid_size(self) -> tuple[int, int]:
+        world_config = getattr(self.config, "world", None)
+        grid_size: Any = (48, 48)
+        if isinstance(world_config, Mapping):
+            grid_size = world_config.get("grid_size", grid_size)
+        return int(grid_size[0]), int(grid_size[1])
+
+    def _refresh_arrays(self) -> None:
+        world = self._loop.world
+        for slot in range(len(self._live_ids)):
+            self._live_ids[slot] = None
+        for agent_id, snapshot in world.agents.items():
+            index = self._slot_of.get(str(snapshot.origin_agent_id or agent_id))
+            if index is not None:
+                self._live_ids[index] = agent_id
+
+        batch = self._loop.world_context.latest_observation_batch()
+        blocked = world.objects_by_position_view()
+        width, height = self._grid_size
+        for slot, live_id in enumerate(self._live_ids):
+            entry = batch.get(live_id) if live_id is not None else None
+            if entry is None:
+                self._maps[slot].fill(0.0)
+                self._features[slot].fill(0.0)
+                self._masks[slot].fill(0)
+                self._masks[slot, SCRIPTED_ACTION] = 1
+                continue
+            np.copyto(self._maps[slot], entry["map"], casting="unsafe")
+            np.copyto(self._features[slot], entry["features"], casting="unsafe")
+            mask = self._masks[slot]
+            mask.fill(1)
+            position = world.agent_position(live_id) if live_id is not None else None
+            if position is None:
+                continue
+            for action, (dx, dy) in _MOVE_OFFSETS.items():
+                target = (position[0] + dx, position[1] + dy)
+                if (
+                    not (0 <= target[0] < width and 0 <= target[1] < height)
+                    or target in blocked
+                    or world.agents_at_tile(target)
+                ):
+                    mask[action] = 0
+
+    def _action_payload(self, agent_id: str, action: int) -> dict[str, object] | None:
+        if action == SCRIPTED_ACTION:
+            return None
+        if action == _WAIT_ACTION:
+            return {"kind": "wait"}
+        offset = _MOVE_OFFSETS.get(action)
+        if offset is None:
+            raise ValueError(f"Unknown action index {action}")
+        position = self._loop.world.agent_position(agent_id)
+        if position is None:
+            return None
+        return {"kind": "move", "position": (position[0] + offset[0], position[1] + offset[1])}
+
+    def _observation_dict(
+        self, agents: list[str] | None = None
+    ) -> dict[str, dict[str, npt.NDArray[Any]]]:
+        targets = self.agents if agents is None else agents
+        observations: dict[str, dict[str, npt.NDArray[Any]]] = {}
+        for agent in targets:
+            slot = self._slot_of[agent]
+            observations[agent] = {
+                "map": self._maps[slot].copy(),
+                "features": self._features[slot].copy(),
+                "action_mask": self._masks[slot].copy(),
+            }
+        return observations
+
+
+__all__ = [
+    "ENV_ACTIONS",
+    "SCRIPTED_ACTION",
+    "PopulateFn",
+    "TownletParallelEnv",
+    "populate_from_config",
+]
@@ -0,0 +1,264 @@
+"""Vectorised multi-world wrappers around :class:`TownletParallelEnv`."""
+
+from __future__ import annotations
+
+import multiprocessing as mp
+from collections.abc import Callable, Sequence
+from multiprocessing.connection import Connection
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+
+from townlet.envs.parallel import TownletParallelEnv
+
+EnvFactory = Callable[[], TownletParallelEnv]
+
+_ARRAY_KEYS = ("map", "features", "action_mask", "rewards", "terminations", "truncations")
+
+
+class _StackedBuffers:
+    """Preallocated ``(K·N, ...)`` arrays shared by both vector env flavours."""
+
+    def __init__(
+        self,
+        num_envs: int,
+        agents_per_env: int,
+        map_shape: tuple[int, ...],
+        feature_dim: int,
+        action_count: int,
+    ) -> None:
+        total = num_envs * agents_per_env
+        self.agents_per_env = agents_per_env
+        self.arrays: dict[str, npt.NDArray[Any]] = {
+            "map": np.zeros((total, *map_shape), dtype=np.float32),
+            "features": np.zeros((total, feature_dim), dtype=np.float32),
+            "action_mask": np.zeros((total, action_count), dtype=np.int8),
+            "rewards": np.zeros(total, dtype=np.float32),
+            "terminations": np.zeros(total, dtype=bool),
+            "truncations": np.zeros(total, dtype=bool),
+        }
+        self.reset_mask = np.zeros(num_envs, dtype=bool)
+
+    def write(self, index: int, source: dict[str, npt.NDArray[Any]], keys: Sequence[str] = _ARRAY_KEYS) -> None:
+        start = index * self.agents_per_env
+        stop = start + self.agents_per_env
+        for key in keys:
+            self.arrays[key][start:stop] = source[key]
+
+
+def _episode_seed(base: int | None, index: int, num_envs: int, episode: int) -> int | None:
+    if base is None:
+        return None
+    return int(base) + index + num_envs * episode
+
+
+def _auto_reset(
+    env: TownletParallelEnv,
+    stepped: dict[str, npt.NDArray[Any]],
+    seed: int | None,
+) -> tuple[dict[str, npt.NDArray[Any]], bool]:
+    """Return arrays to publish after a step, resetting ``env`` when it is done.
+
+    Rewards and done flags are those of the finishing step; observations and
+    masks come from the freshly reset world so the next action batch is valid.
+    """
+
+    if not env.all_done:
+        return stepped, False
+    final = {key: stepped[key].copy() for key in ("rewards", "terminations", "truncations")}
+    published = dict(env.reset_arrays(seed=seed))
+    published.update(final)
+    return published, True
+
+
+class VectorTownletEnv:
+    """Steps ``K`` Townlet worlds in-process and stacks their arrays.
+
+    Observations, action masks, rewards and done flags are returned as
+    ``(K·N, ...)`` arrays (world-major, slot-minor) without building
+    per-agent dicts. Finished worlds reset automatically; their reset is
+    flagged in ``arrays()["reset_mask"]``. With a base ``seed`` world ``k``
+    uses ``seed + k + K * episode`` for every reset, so runs replay exactly.
+    """
+
+    def __init__(self, env_fns: Sequence[EnvFactory]) -> None:
+        if not env_fns:
+            raise ValueError("VectorTownletEnv requires at least one environment")
+        self.envs = [factory() for factory in env_fns]
+        first = self.envs[0]
+        for env in self.envs[1:]:
+            if (
+                len(env.possible_agents) != len(first.possible_agents)
+                or env.map_shape != first.map_shape
+                or env.feature_dim != first.feature_dim
+            ):
+                raise ValueError("All worlds in a VectorTownletEnv must share agent count and observation shapes")
+        self.num_envs = len(self.envs)
+        self.agents_per_env = len(first.possible_agents)
+        self.possible_agents = list(first.possible_agents)
+        self.single_observation_space = first.observation_space(first.possible_agents[0])
+        self.single_action_space = first.action_space(first.possible_agents[0])
+        self._buffers = _StackedBuffers(
+            self.num_envs,
+            self.agents_per_env,
+            first.map_shape,
+            first.feature_dim,
+            int(self.single_action_space.n),  # type: ignore[attr-defined]
+        )
+        self._seed: int | None = None
+        self._episodes = [0] * self.num_envs
+
+    def reset(self, *, seed: int | None = None) -> dict[str, npt.NDArray[Any]]:
+        self._seed = seed
+        self._episodes = [0] * self.num_envs
+        self._buffers.reset_mask[:] = True
+        for index, env in enumerate(self.envs):
+            arrays = env.reset_arrays(seed=_episode_seed(seed, index, self.num_envs, 0))
+            self._buffers.write(index, arrays)
+        return self.arrays()
+
+    def step(self, actions: npt.ArrayLike) -> dict[str, npt.NDArray[Any]]:
+        """Apply a ``(K·N,)`` action array and return the stacked results."""
+
+        action_array = np.asarray(actions, dtype=np.int64).reshape(self.num_envs, self.agents_per_env)
+        for index, env in enumerate(self.envs):
+            stepped = env.step_arrays(action_array[index])
+            seed = _episode_seed(self._seed, index, self.num_envs, self._episodes[index] + 1)
+            published, was_reset = _auto_reset(env, stepped, seed)
+            if was_reset:
+                self._episodes[index] += 1
+            self._buffers.reset_mask[index] = was_reset
+            self._buffers.write(index, published)
+        return self.arrays()
+
+    def arrays(self) -> dict[str, npt.NDArray[Any]]:
+        return {**self._buffers.arrays, "reset_mask": self._buffers.reset_mask}
+
+    def close(self) -> None:
+        for env in self.envs:
+            env.close()
+
+
+def _worker(remote: Connection, parent_remote: Connection, factory: EnvFactory) -> None:
+    parent_remote.close()
+    env = factory()
+    try:
+        while True:
+            command, payload = remote.recv()
+            if command == "spec":
+                remote.send(
+                    (
+                        list(env.possible_agents),
+                        env.map_shape,
+                        env.feature_dim,
+                        env.observation_space(env.possible_agents[0]),
+                        env.action_space(env.possible_agents[0]),
+                    )
+                )
+            elif command == "reset":
+                remote.send(env.reset_arrays(seed=payload))
+            elif command == "step":
+                actions, seed = payload
+                stepped = env.step_arrays(actions)
+                remote.send(_auto_reset(env, stepped, seed))
+            elif command == "close":
+                break
+            else:
+                raise RuntimeError(f"Unknown vector env command: {command}")
+    except KeyboardInterrupt:
+        pass
+    finally:
+        env.close()
+        remote.close()
+
+
+class SubprocVectorTownletEnv(VectorTownletEnv):
+    """Runs each world in its own worker process, connected by pipes.
+
+    ``env_fns`` must be picklable (module-level functions or
+    :func:`functools.partial` objects) when the start method is ``spawn``.
+    Semantics match :class:`VectorTownletEnv`; steps are dispatched to all
+    workers before any result is collected so worlds advance concurrently.
+    """
+
+    def __init__(self, env_fns: Sequence[EnvFactory], *, start_method: str | None = None) -> None:
+        if not env_fns:
+            raise ValueError("SubprocVectorTownletEnv requires at least one environment")
+        context: Any = mp.get_context(start_method)
+        self._remotes: list[Connection] = []
+        self._processes: list[Any] = []
+        for factory in env_fns:
+            remote, work_remote = context.Pipe()
+            process = context.Process(target=_worker, args=(work_remote, remote, factory), daemon=True)
+            process.start()
+            work_remote.close()
+            self._remotes.append(remote)
+            self._processes.append(process)
+        self._closed = False
+
+        for remote in self._remotes:
+            remote.send(("spec", None))
+        specs = [remote.recv() for remote in self._remotes]
+        agents, map_shape, feature_dim, observation_space, action_space = specs[0]
+        for other in specs[1:]:
+            if len(other[0]) != len(agents) or other[1] != map_shape or other[2] != feature_dim:
+                self.close()
+                raise ValueError("All worlds in a VectorTownletEnv must share agent count and observation shapes")
+        self.envs = []
+        self.num_envs = len(self._remotes)
+        self.agents_per_env = len(agents)
+        self.possible_agents = list(agents)
+        self.single_observation_space = observation_space
+        self.single_action_space = action_space
+        self._buffers = _StackedBuffers(
+            self.num_envs,
+            self.agents_per_env,
+            map_shape,
+            feature_dim,
+            int(action_space.n),
+        )
+        self._seed = None
+        self._episodes = [0] * self.num_envs
+
+    def reset(self, *, seed: int | None = None) -> dict[str, npt.NDArray[Any]]:
+        self._seed = seed
+        self._episodes = [0] * self.num_envs
+        self._buffers.reset_mask[:] = True
+        for index, remote in enumerate(self._remotes):
+            remote.send(("reset", _episode_seed(seed, index, self.num_envs, 0)))
+        for index, remote in enumerate(self._remotes):
+            self._buffers.write(index, remote.recv())
+        return self.arrays()
+
+    def step(self, actions: npt.ArrayLike) -> dict[str, npt.NDArray[Any]]:
+        action_array = np.asarray(actions, dtype=np.int64).reshape(self.num_envs, self.agents_per_env)
+        for index, remote in enumerate(self._remotes):
+            seed = _episode_seed(self._seed, index, self.num_envs, self._episodes[index] + 1)
+            remote.send(("step", (action_array[index], seed)))
+        for index, remote in enumerate(self._remotes):
+            published, was_reset = remote.recv()
+            if was_reset:
+                self._episodes[index] += 1
+            self._buffers.reset_mask[index] = was_reset
+            self._buffers.write(index, published)
+        return self.arrays()
+
+    def close(self) -> None:
+        if getattr(self, "_closed", True):
+            return
+        self._closed = True
+        for remote in self._remotes:
+            try:
+                remote.send(("close", None))
+            except (BrokenPipeError, EOFError):
+                pass
+        for process in self._processes:
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+        for remote in self._remotes:
+            remote.close()
+
+
+__all__ = ["EnvFactory", "SubprocVectorTownletEnv", "VectorTownletEnv"]
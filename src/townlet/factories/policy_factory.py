@@ -8,9 +8,9 @@ from townlet.adapters.policy_scripted import ScriptedPolicyAdapter
 from townlet.core.interfaces import PolicyBackendProtocol
 from townlet.ports.policy import PolicyBackend
 from townlet.policy.fallback import StubPolicyBackend
-from townlet.policy.models import torch_available
 from townlet.policy.runner import PolicyRuntime
 from townlet.testing import DummyPolicyBackend
+from townlet.utils.optional import torch_available
 
 from .registry import register, resolve
 
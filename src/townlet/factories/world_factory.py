@@ -94,8 +94,10 @@ def _build_default_world(
         context.rng_manager = rng_manager
     perturbation_rng = rng_manager.stream("perturbations")
 
-    lifecycle = LifecycleManager(config=config)
-    perturbations = PerturbationScheduler(config=config, rng=perturbation_rng)
+    lifecycle = LifecycleManager(config=config, timers=context.timers)
+    perturbations = PerturbationScheduler(
+        config=config, rng=perturbation_rng, timers=context.timers
+    )
     ticks = _derive_ticks_per_day(config, ticks_per_day)
 
     return DefaultWorldAdapter(
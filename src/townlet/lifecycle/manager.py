@@ -7,8 +7,11 @@ from dataclasses import dataclass
 from typing import Any
 
 from townlet.config import SimulationConfig
+from townlet.utils.timers import TimerEntry, TimingWheel
 from townlet.world.grid import WorldState
 
+_RESPAWN_TOPIC = "lifecycle.respawn"
+
 
 @dataclass
 class _RespawnTicket:
@@ -18,16 +21,23 @@ class _RespawnTicket:
 
 
 class LifecycleManager:
-    """Centralises lifecycle checks as outlined in the conceptual design snapshot."""
+    """Centralises lifecycle checks as outlined in the conceptual design snapshot.
+
+    Respawn tickets are keyed by the replacement agent id and armed on a
+    :class:`TimingWheel`, so :meth:`process_respawns` only visits due tickets.
+    """
 
-    def __init__(self, config: SimulationConfig) -> None:
+    def __init__(self, config: SimulationConfig, *, timers: TimingWheel | None = None) -> None:
         self.config = config
         self.exits_today = 0
         self._employment_day = -1
         self.mortality_enabled = True
         self.respawn_delay_ticks = max(0, int(getattr(config.lifecycle, "respawn_delay_ticks", 0)))
-        self._pending_respawns: list[_RespawnTicket] = []
+        self._pending_respawns: dict[str, _RespawnTicket] = {}
+        self._due_respawns: list[str] = []
         self._termination_reasons: dict[str, str] = {}
+        self._timers = timers if timers is not None else TimingWheel()
+        self._timers.register_handler(_RESPAWN_TOPIC, self._on_respawn_due)
 
     def evaluate(self, world: WorldState, tick: int) -> dict[str, bool]:
         """Return a map of agent_id -> terminated flag."""
@@ -58,24 +68,25 @@ class LifecycleManager:
             blueprint["agent_id"] = new_agent_id
             delay = max(0, int(self.respawn_delay_ticks))
             scheduled_tick = tick + delay
-            self._pending_respawns.append(
-                _RespawnTicket(
-                    agent_id=agent_id,
-                    scheduled_tick=scheduled_tick,
-                    blueprint=blueprint,
-                )
+            self._pending_respawns[new_agent_id] = _RespawnTicket(
+                agent_id=agent_id,
+                scheduled_tick=scheduled_tick,
+                blueprint=blueprint,
             )
+            self._timers.schedule(_RESPAWN_TOPIC, new_agent_id, scheduled_tick)
 
     def process_respawns(self, world: WorldState, tick: int) -> None:
-        if not self._pending_respawns:
+        self._timers.advance(tick)
+        if not self._due_respawns:
             return
-        remaining: list[_RespawnTicket] = []
-        for ticket in self._pending_respawns:
-            if tick >= ticket.scheduled_tick:
+        due, self._due_respawns = self._due_respawns, []
+        for key in due:
+            ticket = self._pending_respawns.pop(key, None)
+            if ticket is not None:
                 world.respawn_agent(ticket.blueprint)
-            else:
-                remaining.append(ticket)
-        self._pending_respawns = remaining
+
+    def pending_respawn_count(self) -> int:
+        return len(self._pending_respawns)
 
     def set_respawn_delay(self, ticks: int) -> None:
         self.respawn_delay_ticks = max(0, int(ticks))
@@ -99,6 +110,9 @@ class LifecycleManager:
         self._employment_day = -1
         self._termination_reasons = {}
 
+    def _on_respawn_due(self, entry: TimerEntry) -> None:
+        self._due_respawns.append(entry.key)
+
     def termination_reasons(self) -> dict[str, str]:
         """Return termination reasons captured during the last evaluation."""
         return dict(self._termination_reasons)
@@ -161,6 +175,7 @@ class LifecycleManager:
         world.increment_employment_exits_today()
         snapshot.absent_shifts_7d = 0
         snapshot.exit_pending = False
+        world.employment.invalidate(agent_id)
         world._emit_event(
             "employment_exit_processed",
             {
@@ -1,16 +1,24 @@
-"""Policy integration layer."""
+"""Policy integration layer.
+
+Exports resolve lazily so importing :mod:`townlet.policy` (or a light submodule
+such as :mod:`townlet.policy.fallback`) does not pull in PyTorch.
+"""
 
 from __future__ import annotations
 
-from .api import DEFAULT_POLICY_PROVIDER, resolve_policy_backend
-from .bc import (
-    BCTrainer,
-    BCTrainingConfig,
-    BCTrajectoryDataset,
-    evaluate_bc_policy,
-    load_bc_samples,
-)
-from .runner import PolicyRuntime, TrainingHarness
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover - static re-exports
+    from .api import DEFAULT_POLICY_PROVIDER, resolve_policy_backend
+    from .bc import (
+        BCTrainer,
+        BCTrainingConfig,
+        BCTrajectoryDataset,
+        evaluate_bc_policy,
+        load_bc_samples,
+    )
+    from .runner import PolicyRuntime, TrainingHarness
 
 __all__ = [
     "DEFAULT_POLICY_PROVIDER",
@@ -23,3 +31,28 @@ __all__ = [
     "load_bc_samples",
     "resolve_policy_backend",
 ]
+
+_LAZY_EXPORTS = {
+    "DEFAULT_POLICY_PROVIDER": ".api",
+    "resolve_policy_backend": ".api",
+    "BCTrainer": ".bc",
+    "BCTrainingConfig": ".bc",
+    "BCTrajectoryDataset": ".bc",
+    "evaluate_bc_policy": ".bc",
+    "load_bc_samples": ".bc",
+    "PolicyRuntime": ".runner",
+    "TrainingHarness": ".runner",
+}
+
+
+def __getattr__(name: str) -> object:  # pragma: no cover - lazy import glue
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:  # pragma: no cover - module reflection helper
+    return sorted(__all__)
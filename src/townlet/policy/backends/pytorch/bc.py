@@ -3,21 +3,34 @@
 from __future__ import annotations
 
 import json
-from collections.abc import Mapping, Sequence
+from collections.abc import Iterable, Iterator, Mapping, Sequence
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Any, Literal, TypeAlias
 
 import numpy as np
 import torch
 from torch import nn
-from torch.utils.data import DataLoader, Dataset
+from torch.utils.data import (
+    BatchSampler,
+    DataLoader,
+    Dataset,
+    DistributedSampler,
+    RandomSampler,
+    Sampler,
+    WeightedRandomSampler,
+)
 
+from townlet.policy.bc_store import open_bc_store, read_bc_store_index
 from townlet.policy.models import (
     ConflictAwarePolicyConfig,
     ConflictAwarePolicyNetwork,
 )
 from townlet.policy.replay import ReplaySample, load_replay_sample
 
+BCItem: TypeAlias = tuple[torch.Tensor, torch.Tensor, torch.Tensor]
+BCSampling = Literal["uniform", "block", "balanced"]
+
 
 @dataclass
 class BCTrainingConfig:
@@ -26,6 +39,9 @@ class BCTrainingConfig:
     epochs: int = 5
     weight_decay: float = 0.0
     device: str = "cpu"
+    num_workers: int = 0
+    sampling: BCSampling = "uniform"
+    block_size: int = 1024
 
 
 @dataclass
@@ -59,6 +75,10 @@ class BCTrajectoryDataset(Dataset[tuple[torch.Tensor, torch.Tensor, torch.Tensor
         self.feature_dim = int(self._features.shape[1])
         self.action_dim = int(np.max(self._actions)) + 1 if self._actions.size else 1
 
+    @property
+    def actions(self) -> np.ndarray:
+        return self._actions
+
     def __len__(self) -> int:
         return int(self._actions.shape[0])
 
@@ -69,6 +89,110 @@ class BCTrajectoryDataset(Dataset[tuple[torch.Tensor, torch.Tensor, torch.Tensor
         return map_tensor, feature_tensor, action_tensor
 
 
+class MemmapBCDataset(Dataset[BCItem]):
+    """BC dataset streaming frames from a :mod:`townlet.policy.bc_store` store.
+
+    Columns are mapped lazily (and re-mapped in each ``DataLoader`` worker), so
+    only the pages a batch touches are read. Indexing with a sequence of frame
+    indices returns a whole batch from one sorted gather; the trainer feeds it
+    through a ``BatchSampler`` for that reason.
+    """
+
+    def __init__(self, index_path: Path) -> None:
+        index = read_bc_store_index(index_path)
+        if index is None:
+            raise ValueError(f"{index_path} is not a BC store index")
+        columns = index["columns"]
+        self.index_path = index_path
+        self.map_shape = tuple(columns["maps"]["shape"][1:])
+        self.feature_dim = int(columns["features"]["shape"][1])
+        self.action_dim = int(index["action_dim"])
+        self.action_counts = {int(action): int(count) for action, count in index["action_counts"].items()}
+        self._length = int(index["frames"])
+        self._columns: dict[str, np.memmap] | None = None
+
+    @property
+    def actions(self) -> np.ndarray:
+        return self._arrays()["actions"]
+
+    def _arrays(self) -> dict[str, np.memmap]:
+        if self._columns is None:
+            self._columns = open_bc_store(self.index_path)
+        return self._columns
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = dict(self.__dict__)
+        state["_columns"] = None
+        return state
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index: int | Sequence[int]) -> BCItem:
+        columns = self._arrays()
+        if isinstance(index, (int, np.integer)):
+            return (
+                torch.from_numpy(np.array(columns["maps"][index])),
+                torch.from_numpy(np.array(columns["features"][index])),
+                torch.tensor(int(columns["actions"][index]), dtype=torch.long),
+            )
+        rows = np.asarray(index, dtype=np.int64)
+        order = np.argsort(rows, kind="stable")
+        restore = np.empty_like(order)
+        restore[order] = np.arange(order.size)
+        sorted_rows = rows[order]
+        return (
+            torch.from_numpy(np.asarray(columns["maps"][sorted_rows])[restore]),
+            torch.from_numpy(np.asarray(columns["features"][sorted_rows])[restore]),
+            torch.from_numpy(np.asarray(columns["actions"][sorted_rows])[restore]),
+        )
+
+
+class BlockShuffleSampler(Sampler[int]):
+    """Shuffle contiguous blocks of frames, then the frames within each block.
+
+    Each block is read from one region of a memory-mapped store, trading a
+    little randomness for sequential I/O.
+    """
+
+    def __init__(self, length: int, block_size: int, generator: torch.Generator | None = None) -> None:
+        if block_size <= 0:
+            raise ValueError("block_size must be positive")
+        self.length = int(length)
+        self.block_size = int(block_size)
+        self.generator = generator
+
+    def __iter__(self) -> Iterator[int]:
+        generator = self.generator
+        if generator is None:
+            generator = torch.Generator()
+            generator.manual_seed(int(torch.empty((), dtype=torch.int64).random_().item()))
+        blocks = -(-self.length // self.block_size)
+        for block in torch.randperm(blocks, generator=generator).tolist():
+            start = block * self.block_size
+            size = min(self.block_size, self.length - start)
+            yield from (start + torch.randperm(size, generator=generator)).tolist()
+
+    def __len__(self) -> int:
+        return self.length
+
+
+def class_balanced_weights(actions: np.ndarray) -> torch.Tensor:
+    """Per-frame sampling weights giving every action the same total weight."""
+
+    labels = np.asarray(actions, dtype=np.int64)
+    counts = np.bincount(labels)
+    return torch.from_numpy(1.0 / counts[labels]).double()
+
+
+def load_bc_dataset(manifest_path: Path) -> BCTrajectoryDataset | MemmapBCDataset:
+    """Open a BC store index as a streaming dataset, or load a BC manifest."""
+
+    if read_bc_store_index(manifest_path) is not None:
+        return MemmapBCDataset(manifest_path)
+    return BCTrajectoryDataset(load_bc_samples(manifest_path))
+
+
 def load_bc_samples(manifest_path: Path) -> list[ReplaySample]:
     manifest_data = json.loads(manifest_path.read_text())
     manifest_dir = manifest_path.parent
@@ -124,11 +248,30 @@ class BCTrainer:
             weight_decay=config.weight_decay,
         )
 
-    def fit(self, dataset: BCTrajectoryDataset) -> Mapping[str, float]:
-        loader = DataLoader(dataset, batch_size=self.config.batch_size, shuffle=True)
+    def fit(self, dataset: BCTrajectoryDataset | MemmapBCDataset) -> Mapping[str, float]:
+        from townlet.policy.training import distributed
+
+        group = distributed.current_group()
+        sampler: Iterable[Any]
+        distributed_sampler: DistributedSampler[BCItem] | None = None
+        if group is None:
+            sampler = self._sampler(dataset)
+        else:
+            if self.config.sampling != "uniform":
+                raise ValueError(
+                    f"BC sampling '{self.config.sampling}' is not supported with distributed training; "
+                    "use sampling='uniform' (ranks shard the data with a DistributedSampler)"
+                )
+            # Padded sampler: every rank sees the same number of batches.
+            distributed_sampler = DistributedSampler(dataset, num_replicas=group[1], rank=group[0], shuffle=True)
+            sampler = distributed_sampler
+            distributed.broadcast_parameters(self.model)
+        loader = self._loader(dataset, sampler)
         self.model.train()
         last_loss = 0.0
-        for _ in range(self.config.epochs):
+        for epoch in range(self.config.epochs):
+            if distributed_sampler is not None:
+                distributed_sampler.set_epoch(epoch)
             for map_batch, feature_batch, action_batch in loader:
                 map_batch = map_batch.to(self.device)
                 feature_batch = feature_batch.to(self.device)
@@ -137,13 +280,20 @@ class BCTrainer:
                 loss = self.criterion(logits, action_batch)
                 self.optimizer.zero_grad()
                 loss.backward()
+                distributed.all_reduce_gradients(self.model.parameters())
                 self.optimizer.step()
                 last_loss = float(loss.item())
+        if group is not None:
+            last_loss = distributed.reduce_float(last_loss) / group[1]
         accuracy = self.evaluate(dataset)["accuracy"]
         return {"loss": last_loss, "accuracy": accuracy}
 
-    def evaluate(self, dataset: BCTrajectoryDataset) -> Mapping[str, float]:
-        loader = DataLoader(dataset, batch_size=self.config.batch_size, shuffle=False)
+    def evaluate(self, dataset: BCTrajectoryDataset | MemmapBCDataset) -> Mapping[str, float]:
+        from townlet.policy.training import distributed
+
+        group = distributed.current_group()
+        rank, world_size = group if group is not None else (0, 1)
+        loader = self._loader(dataset, range(rank, len(dataset), world_size))
         self.model.eval()
         correct = 0
         total = 0
@@ -156,16 +306,42 @@ class BCTrainer:
                 preds = logits.argmax(dim=-1)
                 correct += int((preds == action_batch).sum().item())
                 total += int(action_batch.shape[0])
+        correct = distributed.reduce_int(correct, "sum")
+        total = distributed.reduce_int(total, "sum")
         accuracy = float(correct / total) if total else 0.0
         return {"accuracy": accuracy, "samples": float(total)}
 
+    def _sampler(self, dataset: BCTrajectoryDataset | MemmapBCDataset) -> Sampler[int]:
+        if self.config.sampling == "block":
+            return BlockShuffleSampler(len(dataset), self.config.block_size)
+        if self.config.sampling == "balanced":
+            weights = class_balanced_weights(dataset.actions)
+            return WeightedRandomSampler(weights, num_samples=len(dataset))  # type: ignore[arg-type]
+        return RandomSampler(dataset)
+
+    def _loader(
+        self, dataset: BCTrajectoryDataset | MemmapBCDataset, sampler: Iterable[Any]
+    ) -> DataLoader[Any]:
+        workers = self.config.num_workers
+        options: dict[str, Any] = {"num_workers": workers, "persistent_workers": workers > 0}
+        if isinstance(dataset, MemmapBCDataset):
+            # One gather per batch instead of one read per frame.
+            batches = BatchSampler(sampler, batch_size=self.config.batch_size, drop_last=False)
+            return DataLoader(dataset, sampler=batches, batch_size=None, **options)
+        return DataLoader(dataset, batch_size=self.config.batch_size, sampler=sampler, **options)
+
 
 def evaluate_bc_policy(
     model: ConflictAwarePolicyNetwork,
-    dataset: BCTrajectoryDataset,
+    dataset: BCTrajectoryDataset | MemmapBCDataset,
     device: str = "cpu",
 ) -> Mapping[str, float]:
-    loader = DataLoader(dataset, batch_size=128, shuffle=False)
+    loader: DataLoader[Any]
+    if isinstance(dataset, MemmapBCDataset):
+        batches = BatchSampler(range(len(dataset)), batch_size=128, drop_last=False)
+        loader = DataLoader(dataset, sampler=batches, batch_size=None)
+    else:
+        loader = DataLoader(dataset, batch_size=128, shuffle=False)
     model.eval()
     device_obj = torch.device(device)
     model.to(device_obj)
@@ -190,7 +366,11 @@ __all__ = [
     "BCTrainer",
     "BCTrainingConfig",
     "BCTrajectoryDataset",
+    "BlockShuffleSampler",
+    "MemmapBCDataset",
+    "class_balanced_weights",
     "evaluate_bc_policy",
+    "load_bc_dataset",
     "load_bc_samples",
 ]
 
@@ -0,0 +1,208 @@
+"""Cached tensor data pipeline for PPO training (PyTorch backend).
+
+Replay batches are converted to contiguous (and, for CUDA, pinned) tensors once
+per training cycle, with advantages and returns computed once alongside them:
+both depend only on the stored rollouts, not on the policy being updated, so
+recomputing them every epoch repeats identical work. Minibatches are gathered
+from the cached tensors, optionally prefetching the next one on a background
+thread while the current gradient step runs.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import numpy as np
+import torch
+
+from townlet.policy.backends.pytorch import ppo_utils as ops
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from townlet.policy.replay import ReplayBatch
+
+
+@dataclass(frozen=True)
+class PPOBatchTensors:
+    """One replay batch flattened to ``(batch * timesteps, ...)`` tensors."""
+
+    batch_index: int
+    maps: torch.Tensor
+    features: torch.Tensor
+    actions: torch.Tensor
+    old_log_probs: torch.Tensor
+    advantages: torch.Tensor
+    returns: torch.Tensor
+    old_values: torch.Tensor
+    mini_batch_size: int
+
+    @property
+    def transitions(self) -> int:
+        return int(self.actions.shape[0])
+
+
+@dataclass(frozen=True)
+class PPOMiniBatch:
+    """Gathered minibatch rows from one :class:`PPOBatchTensors`."""
+
+    batch_index: int
+    maps: torch.Tensor
+    features: torch.Tensor
+    actions: torch.Tensor
+    old_log_probs: torch.Tensor
+    advantages: torch.Tensor
+    returns: torch.Tensor
+    old_values: torch.Tensor
+    padding: bool = False
+
+    @property
+    def size(self) -> int:
+        return int(self.actions.shape[0])
+
+
+class PPODataPipeline:
+    """Device-resident PPO training tensors built once per cycle."""
+
+    def __init__(
+        self,
+        batches: Sequence[ReplayBatch],
+        *,
+        device: torch.device,
+        gamma: float,
+        gae_lambda: float,
+        advantage_normalization: bool,
+        mini_batch_size: int,
+        num_mini_batches: int,
+        prefetch: bool = False,
+    ) -> None:
+        self.device = device
+        self.prefetch = prefetch
+        self._pin = device.type == "cuda"
+        self.batches: list[PPOBatchTensors] = []
+        rewards_all: list[torch.Tensor] = []
+        advantages_all: list[torch.Tensor] = []
+        for batch_index, batch in enumerate(batches, start=1):
+            rewards = self._to_device(batch.rewards, torch.float32)
+            value_preds = self._to_device(batch.value_preds, torch.float32)
+            gae = ops.compute_gae(
+                rewards=rewards,
+                value_preds=value_preds,
+                dones=self._to_device(batch.dones, torch.float32),
+                gamma=gamma,
+                gae_lambda=gae_lambda,
+            )
+            advantages = gae.advantages
+            if advantage_normalization:
+                advantages = ops.normalize_advantages(advantages.view(-1)).view_as(advantages)
+            batch_size, timesteps = rewards.shape
+            baseline = ops.value_baseline_from_old_preds(value_preds, timesteps)
+            actions = self._to_device(batch.actions, torch.int64).reshape(-1)
+            total = int(actions.shape[0])
+            desired_batches = min(num_mini_batches, total)
+            self.batches.append(
+                PPOBatchTensors(
+                    batch_index=batch_index,
+                    maps=self._to_device(batch.maps, torch.float32).reshape(
+                        batch_size * timesteps, *batch.maps.shape[2:]
+                    ),
+                    features=self._to_device(batch.features, torch.float32).reshape(
+                        batch_size * timesteps, batch.features.shape[2]
+                    ),
+                    actions=actions,
+                    old_log_probs=self._to_device(batch.old_log_probs, torch.float32).reshape(-1),
+                    advantages=advantages.reshape(-1),
+                    returns=gae.returns.reshape(-1),
+                    old_values=baseline.reshape(-1),
+                    mini_batch_size=max(1, min(mini_batch_size, max(1, total // max(1, desired_batches)))),
+                )
+            )
+            rewards_all.append(rewards.reshape(-1))
+            advantages_all.append(advantages.reshape(-1))
+        self.reward_advantage_corr = _correlation(rewards_all, advantages_all)
+
+    @property
+    def transitions(self) -> int:
+        return sum(batch.transitions for batch in self.batches)
+
+    @property
+    def planned_updates(self) -> int:
+        """Minibatches yielded per epoch (before any ``min_updates`` padding)."""
+
+        return sum(-(-batch.transitions // batch.mini_batch_size) for batch in self.batches)
+
+    def iter_minibatches(self, generator: torch.Generator, *, min_updates: int = 0) -> Iterator[PPOMiniBatch]:
+        """Yield shuffled minibatches for one epoch, batch by batch.
+
+        Each batch draws one ``randperm`` from ``generator`` before its
+        minibatches are gathered, so the shuffle order only depends on the
+        generator state. When fewer than ``min_updates`` minibatches are
+        planned, the plan is repeated from the start and the extra minibatches
+        are flagged as ``padding`` (distributed ranks use this to stay in
+        lockstep).
+        """
+
+        plan: list[tuple[PPOBatchTensors, torch.Tensor, bool]] = []
+        for batch in self.batches:
+            perm = torch.randperm(batch.transitions, device=batch.actions.device, generator=generator)
+            for start in range(0, batch.transitions, batch.mini_batch_size):
+                plan.append((batch, perm[start : start + batch.mini_batch_size], False))
+        planned = len(plan)
+        for position in range(planned, min_updates if planned else 0):
+            batch, idx, _ = plan[position % planned]
+            plan.append((batch, idx, True))
+        if not self.prefetch:
+            for batch, idx, padding in plan:
+                yield _gather(batch, idx, padding)
+            return
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="townlet-ppo-prefetch")
+        pending: Future[PPOMiniBatch] | None = None
+        try:
+            for position, (batch, idx, padding) in enumerate(plan):
+                current = pending.result() if pending is not None else _gather(batch, idx, padding)
+                pending = None
+                if position + 1 < len(plan):
+                    pending = executor.submit(_gather, *plan[position + 1])
+                yield current
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _to_device(self, array: np.ndarray, dtype: torch.dtype) -> torch.Tensor:
+        tensor = torch.from_numpy(np.ascontiguousarray(array)).to(dtype)
+        if self._pin:
+            tensor = tensor.pin_memory()
+        return tensor.to(self.device, non_blocking=True)
+
+
+def _gather(batch: PPOBatchTensors, idx: torch.Tensor, padding: bool = False) -> PPOMiniBatch:
+    return PPOMiniBatch(
+        batch_index=batch.batch_index,
+        maps=batch.maps[idx],
+        features=batch.features[idx],
+        actions=batch.actions[idx],
+        old_log_probs=batch.old_log_probs[idx],
+        advantages=batch.advantages[idx],
+        returns=batch.returns[idx],
+        old_values=batch.old_values[idx],
+        padding=padding,
+    )
+
+
+def _correlation(left: Sequence[torch.Tensor], right: Sequence[torch.Tensor]) -> float:
+    """Pearson correlation over concatenated tensors (0.0 when degenerate)."""
+
+    if not left or not right:
+        return 0.0
+    x = torch.cat(list(left)).double()
+    y = torch.cat(list(right)).double()
+    x = x - x.mean()
+    y = y - y.mean()
+    x_std = x.pow(2).mean().sqrt()
+    y_std = y.pow(2).mean().sqrt()
+    if x_std.item() <= 0.0 or y_std.item() <= 0.0:
+        return 0.0
+    return float(((x * y).mean() / (x_std * y_std)).clamp(-1.0, 1.0).item())
+
+
+__all__ = ["PPOBatchTensors", "PPODataPipeline", "PPOMiniBatch"]
@@ -22,7 +22,9 @@ if torch_available():  # pragma: no cover - exercised in ML-enabled envs
         BCTrainer,
         BCTrainingConfig,
         BCTrajectoryDataset,
+        MemmapBCDataset,
         evaluate_bc_policy,
+        load_bc_dataset,
         load_bc_samples,
     )
 else:  # pragma: no cover
@@ -34,11 +36,21 @@ else:  # pragma: no cover
         epochs: int = 5
         weight_decay: float = 0.0
         device: str = "cpu"
+        num_workers: int = 0
+        sampling: str = "uniform"
+        block_size: int = 1024
 
     class BCTrajectoryDataset:  # type: ignore[no-redef]
         def __init__(self, *_: Any, **__: Any) -> None:
             raise TorchNotAvailableError("PyTorch required for BC dataset")
 
+    class MemmapBCDataset:  # type: ignore[no-redef]
+        def __init__(self, *_: Any, **__: Any) -> None:
+            raise TorchNotAvailableError("PyTorch required for BC dataset")
+
+    def load_bc_dataset(manifest_path: Path) -> Any:  # type: ignore[misc]
+        raise TorchNotAvailableError("PyTorch required for BC dataset")
+
     class BCTrainer:  # type: ignore[no-redef]
         def __init__(self, *_: Any, **__: Any) -> None:
             raise TorchNotAvailableError("PyTorch required for BC training")
@@ -98,6 +110,8 @@ __all__ = [
     "BCTrainer",
     "BCTrainingConfig",
     "BCTrajectoryDataset",
+    "MemmapBCDataset",
     "evaluate_bc_policy",
+    "load_bc_dataset",
     "load_bc_samples",
 ]
@@ -0,0 +1,155 @@
+"""Pre-flattened, memory-mapped frame store for behaviour cloning.
+
+:class:`~townlet.policy.backends.pytorch.bc.BCTrajectoryDataset` loads every
+sample in a manifest, converts it frame by frame in Python and stacks the
+whole corpus in RAM. :func:`build_bc_store` performs that conversion once,
+one sample at a time, and appends the frames to raw little-endian column
+files:
+
+``maps.bin`` / ``features.bin`` / ``actions.bin``
+    ``float32`` maps in the layout BC trains on, ``float32`` features and
+    ``int64`` action ids, one row per frame.
+``bc_store.json``
+    Index recording each column's dtype and shape, the per-action frame
+    counts and the frame range contributed by every source sample.
+
+:class:`~townlet.policy.backends.pytorch.bc.MemmapBCDataset` maps the columns
+read-only, so corpora larger than RAM can be trained on and shared between
+runs. Point ``training.bc.manifest`` at ``bc_store.json`` to use it.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from townlet.policy.replay import ReplaySample, _entry_name, _load_manifest, load_replay_entry
+
+logger = logging.getLogger(__name__)
+
+BC_STORE_FORMAT = "townlet.bc_store"
+BC_STORE_FORMAT_VERSION = 1
+BC_STORE_INDEX_NAME = "bc_store.json"
+BC_STORE_COLUMNS: dict[str, str] = {"maps": "<f4", "features": "<f4", "actions": "<i8"}
+
+
+def bc_frames(sample: ReplaySample) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return ``(maps, features, actions)`` rows for one sample.
+
+    Matches the per-frame conversion of ``BCTrajectoryDataset``, which treats
+    each map frame as ``(H, W, C)`` and moves it to channels-first.
+    """
+
+    steps = int(sample.actions.shape[0])
+    maps = np.transpose(sample.map[:steps], (0, 3, 1, 2))
+    features = sample.features[:steps].reshape(steps, -1)
+    return (
+        np.ascontiguousarray(maps, dtype=np.float32),
+        np.ascontiguousarray(features, dtype=np.float32),
+        np.asarray(sample.actions, dtype=np.int64).reshape(steps),
+    )
+
+
+def build_bc_store(manifest_path: Path, output_dir: Path) -> Path:
+    """Convert the samples listed in ``manifest_path`` into a BC frame store.
+
+    Accepts any replay manifest (NPZ/JSON pairs, rollout shards or a replay
+    store). Each sample is loaded, converted and appended before the next is
+    read, so memory use does not grow with the corpus. Returns the index path.
+    """
+
+    entries = _load_manifest(manifest_path)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    handles = {name: (output_dir / f"{name}.bin").open("wb") for name in BC_STORE_COLUMNS}
+    frame_shapes: dict[str, tuple[int, ...]] = {}
+    action_counts: dict[int, int] = {}
+    sources: list[dict[str, Any]] = []
+    feature_names: list[str] | None = None
+    frames = 0
+    try:
+        for entry in entries:
+            sample = load_replay_entry(entry)
+            columns = dict(zip(BC_STORE_COLUMNS, bc_frames(sample), strict=True))
+            for name, rows in columns.items():
+                shape = tuple(int(size) for size in rows.shape[1:])
+                if frame_shapes.setdefault(name, shape) != shape:
+                    raise ValueError(
+                        f"{_entry_name(entry)}: {name} frames have shape {shape}, expected {frame_shapes[name]}"
+                    )
+                handles[name].write(rows.astype(BC_STORE_COLUMNS[name], copy=False).tobytes())
+            steps = int(columns["actions"].shape[0])
+            for action, count in zip(*np.unique(columns["actions"], return_counts=True), strict=True):
+                action_counts[int(action)] = action_counts.get(int(action), 0) + int(count)
+            if feature_names is None and isinstance(sample.metadata.get("feature_names"), list):
+                feature_names = list(sample.metadata["feature_names"])
+            sources.append({"source": _entry_name(entry), "start": frames, "stop": frames + steps})
+            frames += steps
+    finally:
+        for handle in handles.values():
+            handle.close()
+    if frames == 0:
+        raise ValueError("BC store requires at least one frame")
+
+    index = {
+        "format": BC_STORE_FORMAT,
+        "version": BC_STORE_FORMAT_VERSION,
+        "label": manifest_path.stem,
+        "frames": frames,
+        "columns": {
+            name: {"file": f"{name}.bin", "dtype": dtype, "shape": [frames, *frame_shapes[name]]}
+            for name, dtype in BC_STORE_COLUMNS.items()
+        },
+        "action_dim": max(action_counts) + 1,
+        "action_counts": {str(action): count for action, count in sorted(action_counts.items())},
+        "feature_names": feature_names,
+        "samples": sources,
+    }
+    index_path = output_dir / BC_STORE_INDEX_NAME
+    index_path.write_text(json.dumps(index, indent=2))
+    logger.info("bc_store_built path=%s frames=%d samples=%d", index_path, frames, len(sources))
+    return index_path
+
+
+def is_bc_store_index(payload: Any) -> bool:
+    return isinstance(payload, Mapping) and payload.get("format") == BC_STORE_FORMAT
+
+
+def read_bc_store_index(path: Path) -> dict[str, Any] | None:
+    """Return the parsed index when ``path`` is a BC store index, else ``None``."""
+
+    if path.suffix.lower() != ".json" or not path.is_file():
+        return None
+    payload = json.loads(path.read_text())
+    return dict(payload) if is_bc_store_index(payload) else None
+
+
+def open_bc_store(index_path: Path) -> dict[str, np.memmap]:
+    """Map the store's columns read-only."""
+
+    index = read_bc_store_index(index_path)
+    if index is None:
+        raise ValueError(f"{index_path} is not a BC store index")
+    return {
+        name: np.memmap(
+            index_path.parent / spec["file"], dtype=np.dtype(spec["dtype"]), mode="r", shape=tuple(spec["shape"])
+        )
+        for name, spec in index["columns"].items()
+    }
+
+
+__all__ = [
+    "BC_STORE_COLUMNS",
+    "BC_STORE_FORMAT",
+    "BC_STORE_FORMAT_VERSION",
+    "BC_STORE_INDEX_NAME",
+    "bc_frames",
+    "build_bc_store",
+    "is_bc_store_index",
+    "open_bc_store",
+    "read_bc_store_index",
+]
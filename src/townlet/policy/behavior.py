@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterable, Mapping
+from collections.abc import Iterable, Mapping, Sequence
 from dataclasses import dataclass
 from types import SimpleNamespace
 from typing import Any, Protocol, cast, runtime_checkable
 
+import numpy as np
+
 from townlet.agents.models import PersonalityProfiles
 from townlet.config import SimulationConfig
 from townlet.policy.dto_view import (
@@ -56,6 +58,113 @@ class IdleBehavior(BehaviorController):
         return AgentIntent(kind="wait")
 
 
+_NEEDS: tuple[str, str, str] = ("hunger", "hygiene", "energy")
+_AVOID_MOVES: tuple[tuple[int, int], ...] = ((1, 0), (-1, 0), (0, 1), (0, -1))
+
+
+def _position_key(position: Any) -> Any:
+    return tuple(position) if isinstance(position, list) else position
+
+
+class _TickViews:
+    """World views shared by every scripted decision made within one tick.
+
+    Indexes (agent snapshots, agents by position, first object per type, queue
+    occupants, rivalry verdicts) are built lazily on first use, so a single
+    :meth:`ScriptedBehavior.decide` only pays for what it touches while
+    :meth:`ScriptedBehavior.decide_all` amortises them across all agents.
+    """
+
+    __slots__ = (
+        "_agents_by_position",
+        "_objects_by_type",
+        "_queue_members",
+        "_snapshots",
+        "avoid",
+        "avoid_thresholds",
+        "current_tick",
+        "dto_world",
+        "need_flags",
+        "need_thresholds",
+        "queue_view",
+        "relationship_view",
+        "running_affordances",
+        "world",
+    )
+
+    def __init__(
+        self,
+        world: WorldState,
+        dto_world: DTOWorldView | None,
+        *,
+        queue_view: Any,
+        relationship_view: Any,
+        running_affordances: Mapping[str, Any] | None = None,
+        current_tick: int = 0,
+    ) -> None:
+        self.world = world
+        self.dto_world = dto_world
+        self.queue_view = queue_view
+        self.relationship_view = relationship_view
+        self.running_affordances: Mapping[str, Any] = running_affordances or {}
+        self.current_tick = current_tick
+        self.need_flags: dict[str, tuple[bool, bool, bool]] = {}
+        self.need_thresholds: dict[object, tuple[float, float, float]] = {}
+        self.avoid_thresholds: dict[str, float | None] = {}
+        self.avoid: dict[tuple[str, str], bool] = {}
+        self._snapshots: dict[str, Any] | None = None
+        self._agents_by_position: dict[Any, list[str]] | None = None
+        self._objects_by_type: dict[str, str] | None = None
+        self._queue_members: dict[str, tuple[str | None, tuple[str, ...]]] = {}
+
+    @property
+    def snapshots(self) -> Mapping[str, Any]:
+        """Agent snapshots keyed by id, in the order agents are iterated."""
+
+        if self._snapshots is None:
+            if self.dto_world is not None:
+                self._snapshots = dict(self.dto_world.iter_agent_snapshots())
+            else:
+                agents = getattr(self.world, "agents", None)
+                items = getattr(agents, "items", None)
+                self._snapshots = (
+                    {str(agent_id): snapshot for agent_id, snapshot in items()}
+                    if callable(items)
+                    else {}
+                )
+        return self._snapshots
+
+    def agents_at(self, position: Any) -> Sequence[str]:
+        index = self._agents_by_position
+        if index is None:
+            index = {}
+            for agent_id, snapshot in self.snapshots.items():
+                key = _position_key(getattr(snapshot, "position", None))
+                index.setdefault(key, []).append(agent_id)
+            self._agents_by_position = index
+        return index.get(_position_key(position), ())
+
+    def object_of_type(self, object_type: str) -> str | None:
+        index = self._objects_by_type
+        if index is None:
+            # TODO(WP3C): expose object roster via DTO to remove this legacy fallback.
+            index = {}
+            for object_id, obj in self.world.objects.items():
+                index.setdefault(obj.object_type, object_id)
+            self._objects_by_type = index
+        return index.get(object_type)
+
+    def queue_members(self, object_id: str) -> tuple[str | None, tuple[str, ...]]:
+        members = self._queue_members.get(object_id)
+        if members is None:
+            members = (
+                self.queue_view.active_agent(object_id),
+                tuple(self.queue_view.queue_snapshot(object_id)),
+            )
+            self._queue_members[object_id] = members
+        return members
+
+
 class ScriptedBehavior(BehaviorController):
     """Simple rule-based controller used before RL policies are available."""
 
@@ -70,6 +179,13 @@ class ScriptedBehavior(BehaviorController):
         self._need_scaling_enabled = config.reward_personality_scaling_enabled()
         base_threshold = float(config.conflict.rivalry.avoid_threshold)
         self._avoid_threshold_base = max(0.0, min(1.0, base_threshold))
+        # Config has extra="allow" for unknown fields like "world"
+        world_config = getattr(config, "world", None)
+        if world_config is not None and isinstance(world_config, Mapping):
+            grid_size = world_config.get("grid_size", (48, 48))
+        else:
+            grid_size = (48, 48)
+        self._grid_size = (int(grid_size[0]), int(grid_size[1]))
 
     def decide(
         self,
@@ -81,76 +197,96 @@ class ScriptedBehavior(BehaviorController):
         snapshot = self._agent_snapshot(world, agent_id, dto_world)
         if snapshot is None:
             return AgentIntent(kind="wait")
+        return self._decide(self._tick_views(world, dto_world), agent_id, snapshot)
 
-        queue_view = self._queue_view(world, dto_world)
-        running_affordances = self._running_affordances(world, dto_world)
-        relationship_view = self._relationship_view(world, dto_world)
-        current_tick = self._current_tick(world, dto_world)
-
-        self._cleanup_pending(agent_id, queue_view, running_affordances)
+    def decide_all(
+        self,
+        world: WorldState,
+        agent_ids: Iterable[str] | None = None,
+        *,
+        dto_world: DTOWorldView | None = None,
+    ) -> dict[str, AgentIntent]:
+        """Return intents for ``agent_ids`` (default: all agents) in one pass.
+
+        Equivalent to calling :meth:`decide` per agent, but queue, relationship
+        and runtime views are resolved once, need-threshold masks are computed
+        across all agents up front, and object/rival lookups go through shared
+        per-tick indexes instead of rescanning world state.
+        """
+
+        views = self._tick_views(world, dto_world)
+        table = views.snapshots
+        ids = list(table) if agent_ids is None else list(agent_ids)
+        snapshots: list[Any] = []
+        for agent_id in ids:
+            snapshot = table.get(agent_id)
+            if snapshot is None:
+                snapshot = self._agent_snapshot(world, agent_id, dto_world)
+            snapshots.append(snapshot)
+
+        present = [index for index, snapshot in enumerate(snapshots) if snapshot is not None]
+        if present:
+            needs = np.array(
+                [
+                    [snapshots[index].needs.get(need, 1.0) for need in _NEEDS]
+                    for index in present
+                ],
+                dtype=np.float64,
+            )
+            limits = np.array(
+                [self._need_thresholds(views, snapshots[index]) for index in present],
+                dtype=np.float64,
+            )
+            masks = (needs < limits).tolist()
+            for index, row in zip(present, masks, strict=True):
+                views.need_flags[ids[index]] = (row[0], row[1], row[2])
+
+        intents: dict[str, AgentIntent] = {}
+        for agent_id, snapshot in zip(ids, snapshots, strict=True):
+            if snapshot is None:
+                intents[agent_id] = AgentIntent(kind="wait")
+            else:
+                intents[agent_id] = self._decide(views, agent_id, snapshot)
+        return intents
+
+    def _decide(self, views: _TickViews, agent_id: str, snapshot: Any) -> AgentIntent:
+        self._cleanup_pending(agent_id, views.queue_view, views.running_affordances)
         pending = self.pending.get(agent_id)
         if pending:
             object_id = pending["object_id"]
             affordance_id = pending["affordance_id"]
-            active = queue_view.active_agent(object_id)
-            running = running_affordances.get(object_id)
+            active = views.queue_view.active_agent(object_id)
+            running = views.running_affordances.get(object_id)
             if running and getattr(running, "agent_id", None) == agent_id:
                 return AgentIntent(kind="wait")
             if active == agent_id:
                 return AgentIntent(
                     kind="start", object_id=object_id, affordance_id=affordance_id
                 )
-            if not self._rivals_in_queue(
-                world,
-                agent_id,
-                object_id,
-                queue_view=queue_view,
-                relationship_view=relationship_view,
-                dto_world=dto_world,
-            ):
+            if not self._queue_has_rival(views, agent_id, object_id):
                 return AgentIntent(kind="request", object_id=object_id)
             self.pending.pop(agent_id, None)
 
         # If pending intent was dropped due to rivalry, fall through to new plan.
 
         job_intent = self._maybe_move_to_job(
-            world,
+            views.world,
             agent_id,
             snapshot,
-            current_tick=current_tick,
+            current_tick=views.current_tick,
         )
         if job_intent:
             return job_intent
 
-        need_intent = self._satisfy_needs(
-            world,
-            agent_id,
-            snapshot,
-            queue_view=queue_view,
-            relationship_view=relationship_view,
-            dto_world=dto_world,
-        )
+        need_intent = self._satisfy_needs(views, agent_id, snapshot)
         if need_intent:
             return need_intent
 
-        chat_intent = self._maybe_chat(
-            world,
-            agent_id,
-            snapshot,
-            relationship_view=relationship_view,
-            dto_world=dto_world,
-            current_tick=current_tick,
-        )
+        chat_intent = self._maybe_chat(views, agent_id, snapshot)
         if chat_intent:
             return chat_intent
 
-        avoid_intent = self._avoid_rivals(
-            world,
-            agent_id,
-            snapshot,
-            relationship_view=relationship_view,
-            dto_world=dto_world,
-        )
+        avoid_intent = self._avoid_rivals(views, agent_id, snapshot)
         if avoid_intent:
             return avoid_intent
 
@@ -207,63 +343,27 @@ class ScriptedBehavior(BehaviorController):
 
     def _satisfy_needs(
         self,
-        world: WorldState,
+        views: _TickViews,
         agent_id: str,
-        snapshot: SimpleNamespace,
-        *,
-        queue_view: DTOQueueManagerView,
-        relationship_view: DTORelationshipView,
-        dto_world: DTOWorldView | None,
+        snapshot: Any,
     ) -> AgentIntent | None:
-        hunger = snapshot.needs.get("hunger", 1.0)
-        hygiene = snapshot.needs.get("hygiene", 1.0)
-        energy = snapshot.needs.get("energy", 1.0)
-
-        hunger_threshold = self._need_threshold(
-            snapshot, "hunger", self.thresholds.hunger_threshold
-        )
-        hygiene_threshold = self._need_threshold(
-            snapshot, "hygiene", self.thresholds.hygiene_threshold
-        )
-        energy_threshold = self._need_threshold(
-            snapshot, "energy", self.thresholds.energy_threshold
-        )
+        hungry, dirty, tired = self._need_flags(views, agent_id, snapshot)
 
-        if hunger < hunger_threshold:
-            intent = self._plan_meal(
-                world,
-                agent_id,
-                queue_view=queue_view,
-                relationship_view=relationship_view,
-                dto_world=dto_world,
-            )
+        if hungry:
+            intent = self._plan_meal(views, agent_id)
             if intent:
                 return intent
-        if hygiene < hygiene_threshold:
-            shower_id = self._find_object_of_type(world, "shower")
-            if shower_id and not self._rivals_in_queue(
-                world,
-                agent_id,
-                shower_id,
-                queue_view=queue_view,
-                relationship_view=relationship_view,
-                dto_world=dto_world,
-            ):
+        if dirty:
+            shower_id = views.object_of_type("shower")
+            if shower_id and not self._queue_has_rival(views, agent_id, shower_id):
                 self.pending[agent_id] = {
                     "object_id": shower_id,
                     "affordance_id": "use_shower",
                 }
                 return AgentIntent(kind="request", object_id=shower_id)
-        if energy < energy_threshold:
-            bed_id = self._find_object_of_type(world, "bed")
-            if bed_id and not self._rivals_in_queue(
-                world,
-                agent_id,
-                bed_id,
-                queue_view=queue_view,
-                relationship_view=relationship_view,
-                dto_world=dto_world,
-            ):
+        if tired:
+            bed_id = views.object_of_type("bed")
+            if bed_id and not self._queue_has_rival(views, agent_id, bed_id):
                 self.pending[agent_id] = {
                     "object_id": bed_id,
                     "affordance_id": "rest_sleep",
@@ -273,63 +373,38 @@ class ScriptedBehavior(BehaviorController):
 
     def _maybe_chat(
         self,
-        world: WorldState,
+        views: _TickViews,
         agent_id: str,
-        snapshot: SimpleNamespace,
-        *,
-        relationship_view: DTORelationshipView,
-        dto_world: DTOWorldView | None,
-        current_tick: int,
+        snapshot: Any,
     ) -> AgentIntent | None:
         relationships_stage = getattr(self.config.features.stages, "relationships", "OFF")
         if relationships_stage == "OFF":
             return None
-        tick = current_tick
+        tick = views.current_tick
+        if tick < self._chat_cooldowns.get(agent_id, 0):
+            return None
         chat_bias = self._behavior_bias(snapshot, "chat_preference")
         bias_factor = chat_bias if chat_bias > 0.0 else 1.0
         min_extroversion = min(1.0, max(0.0, self._chat_min_extroversion / bias_factor))
         cooldown_ticks = max(1, round(self._chat_cooldown_ticks / bias_factor))
 
-        hunger_threshold = self._need_threshold(
-            snapshot, "hunger", self.thresholds.hunger_threshold
-        )
-        hygiene_threshold = self._need_threshold(
-            snapshot, "hygiene", self.thresholds.hygiene_threshold
-        )
-        energy_threshold = self._need_threshold(
-            snapshot, "energy", self.thresholds.energy_threshold
-        )
-
-        if tick < self._chat_cooldowns.get(agent_id, 0):
-            return None
         personality = getattr(snapshot, "personality", None)
         extroversion = float(getattr(personality, "extroversion", 0.0)) if personality else 0.0
         if extroversion < min_extroversion:
             return None
-        if snapshot.needs.get("hunger", 1.0) < hunger_threshold:
-            return None
-        if snapshot.needs.get("hygiene", 1.0) < hygiene_threshold:
-            return None
-        if snapshot.needs.get("energy", 1.0) < energy_threshold:
+        if any(self._need_flags(views, agent_id, snapshot)):
             return None
 
         position = getattr(snapshot, "position", None)
         if position is None:
             return None
 
+        relationship_view = views.relationship_view
         candidates: list[tuple[float, str, float]] = []
-        for other_id, other in self._iter_agent_snapshots(world, dto_world):
+        for other_id in views.agents_at(position):
             if other_id == agent_id:
                 continue
-            if getattr(other, "position", None) != position:
-                continue
-            if self.should_avoid(
-                world,
-                agent_id,
-                other_id,
-                relationship_view=relationship_view,
-                dto_world=dto_world,
-            ):
+            if self._avoids(views, agent_id, other_id):
                 continue
             tie = relationship_view.relationship_tie(agent_id, other_id)
             trust = float(getattr(tie, "trust", 0.0)) if tie else 0.0
@@ -359,49 +434,28 @@ class ScriptedBehavior(BehaviorController):
 
     def _avoid_rivals(
         self,
-        world: WorldState,
+        views: _TickViews,
         agent_id: str,
-        snapshot: SimpleNamespace,
-        *,
-        relationship_view: DTORelationshipView,
-        dto_world: DTOWorldView | None,
+        snapshot: Any,
     ) -> AgentIntent | None:
         position = getattr(snapshot, "position", None)
         if position is None:
             return None
         cx, cy = position
         rivals_present = any(
-            other_id != agent_id
-            and getattr(other, "position", None) == position
-            and self.should_avoid(
-                world,
-                agent_id,
-                other_id,
-                relationship_view=relationship_view,
-                dto_world=dto_world,
-            )
-            for other_id, other in self._iter_agent_snapshots(world, dto_world)
+            other_id != agent_id and self._avoids(views, agent_id, other_id)
+            for other_id in views.agents_at(position)
         )
         if not rivals_present:
             return None
 
-        # Config has extra="allow" for unknown fields like "world"
-        world_config = getattr(self.config, "world", None)
-        if world_config is not None and isinstance(world_config, Mapping):
-            grid_size = world_config.get("grid_size", (48, 48))
-        else:
-            grid_size = (48, 48)
-        width, height = int(grid_size[0]), int(grid_size[1])
-        occupied_positions = {
-            getattr(agent, "position", None)
-            for _, agent in self._iter_agent_snapshots(world, dto_world)
-        }
-        for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1)):
+        width, height = self._grid_size
+        for dx, dy in _AVOID_MOVES:
             nx, ny = cx + dx, cy + dy
             if not (0 <= nx < width and 0 <= ny < height):
                 continue
             candidate = (nx, ny)
-            if candidate in occupied_positions:
+            if views.agents_at(candidate):
                 continue
             return AgentIntent(kind="move", position=candidate)
         return None
@@ -416,57 +470,35 @@ class ScriptedBehavior(BehaviorController):
         relationship_view: DTORelationshipView,
         dto_world: DTOWorldView | None = None,
     ) -> bool:
-        active = queue_view.active_agent(object_id)
-        if (
-            active
-            and active != agent_id
-            and self.should_avoid(
-                world,
-                agent_id,
-                active,
-                relationship_view=relationship_view,
-                dto_world=dto_world,
-            )
-        ):
+        views = _TickViews(
+            world,
+            dto_world,
+            queue_view=queue_view,
+            relationship_view=relationship_view,
+        )
+        return self._queue_has_rival(views, agent_id, object_id)
+
+    def _queue_has_rival(self, views: _TickViews, agent_id: str, object_id: str) -> bool:
+        active, queue = views.queue_members(object_id)
+        if active and active != agent_id and self._avoids(views, agent_id, active):
             return True
-        queue = queue_view.queue_snapshot(object_id)
         for rival_id in queue:
             if rival_id == agent_id:
                 continue
-            if self.should_avoid(
-                world,
-                agent_id,
-                rival_id,
-                relationship_view=relationship_view,
-                dto_world=dto_world,
-            ):
+            if self._avoids(views, agent_id, rival_id):
                 return True
         return False
 
-    def _plan_meal(
-        self,
-        world: WorldState,
-        agent_id: str,
-        *,
-        queue_view: DTOQueueManagerView,
-        relationship_view: DTORelationshipView,
-        dto_world: DTOWorldView | None,
-    ) -> AgentIntent | None:
-        fridge_id = self._find_object_of_type(world, "fridge")
-        stove_id = self._find_object_of_type(world, "stove")
+    def _plan_meal(self, views: _TickViews, agent_id: str) -> AgentIntent | None:
+        fridge_id = views.object_of_type("fridge")
+        stove_id = views.object_of_type("stove")
+        objects = views.world.objects
         if fridge_id:
-            fridge = world.objects.get(fridge_id)
+            fridge = objects.get(fridge_id)
             if (
                 fridge
                 and fridge.stock.get("meals", 0) > 0
-                and not self._rivals_in_queue(
-                    world,
-                    agent_id,
-                    fridge_id,
-                    queue_view=queue_view,
-                    relationship_view=relationship_view,
-                    dto_world=dto_world,
-                )
+                and not self._queue_has_rival(views, agent_id, fridge_id)
             ):
                 self.pending[agent_id] = {
                     "object_id": fridge_id,
@@ -474,18 +506,11 @@ class ScriptedBehavior(BehaviorController):
                 }
                 return AgentIntent(kind="request", object_id=fridge_id)
         if stove_id:
-            stove = world.objects.get(stove_id)
+            stove = objects.get(stove_id)
             if (
                 stove
                 and stove.stock.get("raw_ingredients", 0) > 0
-                and not self._rivals_in_queue(
-                    world,
-                    agent_id,
-                    stove_id,
-                    queue_view=queue_view,
-                    relationship_view=relationship_view,
-                    dto_world=dto_world,
-                )
+                and not self._queue_has_rival(views, agent_id, stove_id)
             ):
                 self.pending[agent_id] = {
                     "object_id": stove_id,
@@ -494,15 +519,6 @@ class ScriptedBehavior(BehaviorController):
                 return AgentIntent(kind="request", object_id=stove_id)
         return None
 
-    def _find_object_of_type(
-        self, world: WorldState, object_type: str
-    ) -> str | None:
-        # TODO(WP3C): expose object roster via DTO to remove this legacy fallback.
-        for object_id, obj in world.objects.items():
-            if obj.object_type == object_type:
-                return object_id
-        return None
-
     def _behavior_bias(self, snapshot: SimpleNamespace, key: str, default: float = 1.0) -> float:
         if not self._personality_bias_enabled:
             return default
@@ -546,6 +562,37 @@ class ScriptedBehavior(BehaviorController):
         threshold = base * multiplier
         return max(0.0, min(1.0, threshold))
 
+    def _need_thresholds(self, views: _TickViews, snapshot: Any) -> tuple[float, float, float]:
+        """Return (hunger, hygiene, energy) thresholds, memoised per profile."""
+
+        key = getattr(snapshot, "personality_profile", None) if self._need_scaling_enabled else None
+        cached = views.need_thresholds.get(key)
+        if cached is None:
+            cached = (
+                self._need_threshold(snapshot, "hunger", self.thresholds.hunger_threshold),
+                self._need_threshold(snapshot, "hygiene", self.thresholds.hygiene_threshold),
+                self._need_threshold(snapshot, "energy", self.thresholds.energy_threshold),
+            )
+            views.need_thresholds[key] = cached
+        return cached
+
+    def _need_flags(
+        self, views: _TickViews, agent_id: str, snapshot: Any
+    ) -> tuple[bool, bool, bool]:
+        """Return whether hunger, hygiene and energy are below their thresholds."""
+
+        flags = views.need_flags.get(agent_id)
+        if flags is None:
+            hunger, hygiene, energy = self._need_thresholds(views, snapshot)
+            needs = snapshot.needs
+            flags = (
+                needs.get("hunger", 1.0) < hunger,
+                needs.get("hygiene", 1.0) < hygiene,
+                needs.get("energy", 1.0) < energy,
+            )
+            views.need_flags[agent_id] = flags
+        return flags
+
     def should_avoid(
         self,
         world: WorldState,
@@ -560,17 +607,53 @@ class ScriptedBehavior(BehaviorController):
         view = relationship_view if relationship_view is not None else (
             dto_world if dto_world is not None else world
         )
-        if snapshot is None:
-            checker = getattr(view, "rivalry_should_avoid", None)
-            if callable(checker):
-                return bool(checker(agent_id, other_id))
-            return world.rivalry_should_avoid(agent_id, other_id)
+        threshold = None if snapshot is None else self._avoid_threshold(snapshot)
+        return self._rivalry_exceeds(world, view, agent_id, other_id, threshold)
+
+    def _avoids(self, views: _TickViews, agent_id: str, other_id: str) -> bool:
+        """Per-tick memoised :meth:`should_avoid` using the shared views."""
+
+        key = (agent_id, other_id)
+        cached = views.avoid.get(key)
+        if cached is not None:
+            return cached
+        if agent_id in views.avoid_thresholds:
+            threshold = views.avoid_thresholds[agent_id]
+        else:
+            snapshot = views.snapshots.get(agent_id)
+            if snapshot is None:
+                snapshot = self._agent_snapshot(views.world, agent_id, views.dto_world)
+            threshold = None if snapshot is None else self._avoid_threshold(snapshot)
+            views.avoid_thresholds[agent_id] = threshold
+        view = views.relationship_view
+        if view is None:
+            view = views.dto_world if views.dto_world is not None else views.world
+        result = self._rivalry_exceeds(views.world, view, agent_id, other_id, threshold)
+        views.avoid[key] = result
+        return result
+
+    def _avoid_threshold(self, snapshot: Any) -> float:
         threshold = self._avoid_threshold_base
         if self._personality_bias_enabled:
             bias = self._behavior_bias(snapshot, "conflict_tolerance")
             if bias != 1.0:
                 threshold = threshold / bias if bias > 0.0 else threshold
                 threshold = max(0.0, min(1.0, threshold))
+        return threshold
+
+    def _rivalry_exceeds(
+        self,
+        world: WorldState,
+        view: Any,
+        agent_id: str,
+        other_id: str,
+        threshold: float | None,
+    ) -> bool:
+        if threshold is None:
+            checker = getattr(view, "rivalry_should_avoid", None)
+            if callable(checker):
+                return bool(checker(agent_id, other_id))
+            return world.rivalry_should_avoid(agent_id, other_id)
         rivalry_getter = getattr(view, "rivalry_value", None)
         if callable(rivalry_getter):
             try:
@@ -584,6 +667,16 @@ class ScriptedBehavior(BehaviorController):
     # ------------------------------------------------------------------
     # DTO helper views
     # ------------------------------------------------------------------
+    def _tick_views(self, world: WorldState, dto_world: DTOWorldView | None) -> _TickViews:
+        return _TickViews(
+            world,
+            dto_world,
+            queue_view=self._queue_view(world, dto_world),
+            relationship_view=self._relationship_view(world, dto_world),
+            running_affordances=self._running_affordances(world, dto_world),
+            current_tick=self._current_tick(world, dto_world),
+        )
+
     def _queue_view(
         self,
         world: WorldState,
@@ -651,26 +744,6 @@ class ScriptedBehavior(BehaviorController):
             return cast(SimpleNamespace, result)
         return None
 
-    def _iter_agent_snapshots(
-        self,
-        world: WorldState,
-        dto_world: DTOWorldView | None,
-    ) -> Iterable[tuple[str, SimpleNamespace]]:
-        if dto_world is not None:
-            yield from dto_world.iter_agent_snapshots()
-            return
-        agents = getattr(world, "agents", None)
-        if agents is None:
-            return
-        items = getattr(agents, "items", None)
-        if callable(items):
-            for agent_id, snapshot in items():
-                # WorldState.agents returns AgentSnapshot dataclass, convert to SimpleNamespace
-                if snapshot is not None and hasattr(snapshot, "__dict__"):
-                    yield str(agent_id), SimpleNamespace(**snapshot.__dict__)
-                else:
-                    yield str(agent_id), cast(SimpleNamespace, snapshot)
-
 
 def build_behavior(config: SimulationConfig) -> BehaviorController:
     return ScriptedBehavior(config)
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import random
-from collections.abc import Callable
+from collections.abc import Callable, Iterable, Mapping
 from dataclasses import dataclass, field
 
 from townlet.policy.behavior import AgentIntent, BehaviorController
@@ -118,19 +118,44 @@ class BehaviorBridge:
         guardrail_fn: Callable[[WorldState, str, AgentIntent], AgentIntent],
         *,
         dto_world: DTOWorldView,
+        scripted: AgentIntent | None = None,
     ) -> tuple[AgentIntent, bool]:
-        """Determine an agent intent and enforce option commit guardrails."""
+        """Determine an agent intent and enforce option commit guardrails.
+
+        ``scripted`` supplies an intent already planned for this tick (see
+        :meth:`plan_intents`); otherwise the behaviour is consulted directly.
+        """
 
         if dto_world is None:  # pragma: no cover - defensive guard
             raise ValueError("BehaviorBridge.decide_agent requires a DTO world view")
 
-        scripted = self.behavior.decide(world, agent_id, dto_world=dto_world)
+        if scripted is None:
+            scripted = self.behavior.decide(world, agent_id, dto_world=dto_world)
         blended = self._select_intent_with_blend(world, agent_id, scripted)
         guarded = guardrail_fn(world, agent_id, blended)
         intent, enforced = self._enforce_option_commit(agent_id, tick, guarded)
         self._record_option(agent_id, intent)
         return intent, enforced
 
+    def plan_intents(
+        self,
+        world: WorldState,
+        agent_ids: Iterable[str],
+        *,
+        dto_world: DTOWorldView,
+    ) -> Mapping[str, AgentIntent]:
+        """Batch-plan scripted intents when the behaviour supports ``decide_all``.
+
+        Returns an empty mapping for behaviours that only implement
+        ``decide``; callers then fall back to per-agent decisions.
+        """
+
+        decide_all = getattr(self.behavior, "decide_all", None)
+        if not callable(decide_all):
+            return {}
+        planned: Mapping[str, AgentIntent] = decide_all(world, agent_ids, dto_world=dto_world)
+        return planned
+
     def update_transition_entry(
         self,
         agent_id: str,
@@ -0,0 +1,317 @@
+"""Parallel, cached evaluation engine for trajectory curation and dataset audits.
+
+``scripts/curate_trajectories.py`` and ``scripts/audit_bc_datasets.py`` both
+walk capture directories full of NPZ/JSON pairs and rollout shards. This
+module fans that work out across a process pool and remembers the results in
+a sidecar index (``.townlet_sample_cache.json`` in the capture directory by
+default).
+
+Work is grouped by the files it reads: an NPZ/JSON pair, or a shard plus its
+metadata file shared by every agent inside it. Each group's index record holds
+the files' sizes and mtimes, the SHA-256 of their concatenated bytes and the
+per-sample metrics computed from them:
+
+* sizes and mtimes unchanged -- the record is reused without opening a file,
+  so re-curating with different thresholds only reads metadata;
+* sizes or mtimes changed -- a worker re-hashes the group. If the hash still
+  matches, the content did not change and only missing metrics are computed;
+  otherwise every sample in the group is evaluated again.
+
+Results are yielded in input order as soon as they are available so callers
+can stream them into :class:`ManifestStreamWriter`.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from types import TracebackType
+from typing import Any
+
+import numpy as np
+
+from townlet.policy.replay import ReplaySample, load_replay_entry
+from townlet.policy.rollout_shards import ShardSampleRef
+
+logger = logging.getLogger(__name__)
+
+CACHE_FORMAT = "townlet.sample_cache"
+CACHE_FORMAT_VERSION = 1
+DEFAULT_CACHE_NAME = ".townlet_sample_cache.json"
+_HASH_CHUNK = 1 << 20
+
+CurationEntry = tuple[Path, Path] | ShardSampleRef
+SampleMetrics = dict[str, float]
+FileStat = tuple[int, int]
+
+
+def sample_metrics(sample: ReplaySample) -> SampleMetrics:
+    """Curation metrics for one sample (timesteps, reward totals, dones)."""
+
+    rewards = sample.rewards.astype(float)
+    recorded = sample.metadata.get("timesteps")
+    timesteps = int(recorded) if recorded is not None else int(rewards.shape[0])
+    reward_sum = float(np.sum(rewards))
+    return {
+        "timesteps": timesteps,
+        "reward_sum": reward_sum,
+        "mean_reward": float(reward_sum / timesteps) if timesteps else 0.0,
+        "done_count": int(np.count_nonzero(sample.dones)),
+    }
+
+
+def entry_files(entry: CurationEntry) -> tuple[Path, Path]:
+    if isinstance(entry, ShardSampleRef):
+        return entry.shard_path, entry.meta_path
+    return entry
+
+
+def entry_key(entry: CurationEntry) -> str:
+    if isinstance(entry, ShardSampleRef):
+        return str(entry.index)
+    return "sample"
+
+
+def content_digest(paths: Sequence[Path]) -> str:
+    """SHA-256 of the files' bytes concatenated in order, read in chunks."""
+
+    digest = hashlib.sha256()
+    for path in paths:
+        with path.open("rb") as handle:
+            for chunk in iter(lambda: handle.read(_HASH_CHUNK), b""):
+                digest.update(chunk)
+    return digest.hexdigest()
+
+
+def file_stats(paths: Sequence[Path]) -> list[FileStat]:
+    stats = []
+    for path in paths:
+        info = path.stat()
+        stats.append((int(info.st_size), int(info.st_mtime_ns)))
+    return stats
+
+
+class SampleCache:
+    """Sidecar index of per-group file fingerprints, digests and sample metrics."""
+
+    def __init__(self, path: Path | None) -> None:
+        self.path = path
+        self.groups: dict[str, dict[str, Any]] = {}
+        self.dirty = False
+        if path is not None and path.exists():
+            try:
+                payload = json.loads(path.read_text())
+            except (OSError, ValueError):
+                logger.warning("sample_cache_unreadable path=%s; rebuilding", path)
+                payload = None
+            if (
+                isinstance(payload, Mapping)
+                and payload.get("format") == CACHE_FORMAT
+                and payload.get("version") == CACHE_FORMAT_VERSION
+                and isinstance(payload.get("groups"), Mapping)
+            ):
+                self.groups = {str(key): dict(value) for key, value in payload["groups"].items()}
+
+    @classmethod
+    def for_directory(cls, directory: Path, *, enabled: bool = True) -> SampleCache:
+        return cls(directory / DEFAULT_CACHE_NAME if enabled else None)
+
+    def group_key(self, paths: Sequence[Path]) -> str:
+        base = self.path.parent if self.path is not None else Path.cwd()
+        return "|".join(os.path.relpath(path.resolve(), base.resolve()) for path in paths)
+
+    def record(self, paths: Sequence[Path]) -> dict[str, Any] | None:
+        return self.groups.get(self.group_key(paths))
+
+    def update(
+        self, paths: Sequence[Path], stats: Sequence[FileStat], digest: str, metrics: Mapping[str, SampleMetrics]
+    ) -> dict[str, Any]:
+        key = self.group_key(paths)
+        previous = self.groups.get(key)
+        merged: dict[str, SampleMetrics] = {}
+        if previous is not None and previous.get("sha256") == digest:
+            merged.update(previous.get("metrics", {}))
+        merged.update(metrics)
+        record = {"stat": [list(stat) for stat in stats], "sha256": digest, "metrics": merged}
+        self.groups[key] = record
+        self.dirty = True
+        return record
+
+    def save(self) -> None:
+        if self.path is None or not self.dirty:
+            return
+        payload = {"format": CACHE_FORMAT, "version": CACHE_FORMAT_VERSION, "groups": self.groups}
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        tmp_path.write_text(json.dumps(payload, separators=(",", ":")))
+        tmp_path.replace(self.path)
+        self.dirty = False
+
+
+GroupTask = tuple[tuple[str, ...], str | None, bool, list[tuple[str, Any]], list[str]]
+GroupWorker = Callable[
+    [tuple[str, ...], str | None, bool, list[tuple[str, Any]], list[str]],
+    tuple[list[FileStat], str, dict[str, Any]],
+]
+
+
+def iter_group_results(
+    groups: Sequence[tuple[tuple[Path, ...], Sequence[tuple[str, Any]]]],
+    worker: GroupWorker,
+    *,
+    cache: SampleCache,
+    workers: int = 1,
+) -> Iterator[tuple[tuple[Path, ...], dict[str, Any]]]:
+    """Yield ``(paths, record)`` for every group in order, refreshing stale ones.
+
+    ``groups`` pairs the files of each group with the ``(key, payload)`` items
+    needing a result. Groups whose record is fresh and complete are answered
+    from ``cache``; the rest are handed to ``worker(paths, cached_sha,
+    stat_fresh, items, missing_keys)``, which hashes the group unless its
+    stats are fresh and computes results for ``missing_keys`` (every item when
+    the content hash changed).
+    """
+
+    pending: list[GroupTask | None] = []
+    for paths, items in groups:
+        record = cache.record(paths)
+        names = tuple(str(path) for path in paths)
+        if record is None:
+            pending.append((names, None, False, list(items), [key for key, _ in items]))
+            continue
+        fresh = record.get("stat") == [list(stat) for stat in file_stats(paths)]
+        missing = [key for key, _ in items if key not in record.get("metrics", {})]
+        if fresh and not missing:
+            pending.append(None)
+            continue
+        pending.append((names, str(record.get("sha256")), fresh, list(items), missing))
+
+    tasks = [task for task in pending if task is not None]
+    pool: ProcessPoolExecutor | None = None
+    futures: list[Future[tuple[list[FileStat], str, dict[str, Any]]]] = []
+    if workers > 1 and len(tasks) > 1:
+        pool = ProcessPoolExecutor(max_workers=min(workers, len(tasks)))
+        futures = [pool.submit(worker, *task) for task in tasks]
+    logger.info("sample_cache groups=%d refreshed=%d workers=%d", len(groups), len(tasks), workers)
+    try:
+        position = 0
+        for (paths, _), task in zip(groups, pending, strict=True):
+            if task is not None:
+                if pool is not None:
+                    stats, digest, results = futures[position].result()
+                else:
+                    stats, digest, results = worker(*task)
+                position += 1
+                cache.update(paths, stats, digest, results)
+            record = cache.record(paths)
+            assert record is not None
+            yield paths, record
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+        cache.save()
+
+
+def evaluate_entries(
+    entries: Iterable[CurationEntry], *, cache: SampleCache, workers: int = 1
+) -> Iterator[tuple[CurationEntry, SampleMetrics]]:
+    """Yield ``(entry, metrics)`` group by group, using the cache and a process pool.
+
+    Groups are visited in order of first appearance, which keeps input order
+    for the directory layouts curation walks (pairs, then shard by shard).
+    """
+
+    grouped: dict[tuple[Path, ...], list[tuple[str, CurationEntry]]] = {}
+    for entry in entries:
+        grouped.setdefault(entry_files(entry), []).append((entry_key(entry), entry))
+    for paths, record in iter_group_results(list(grouped.items()), _metrics_worker, cache=cache, workers=workers):
+        for key, entry in grouped[paths]:
+            yield entry, dict(record["metrics"][key])
+
+
+def digest_groups(
+    groups: Sequence[tuple[Path, ...]], *, cache: SampleCache, workers: int = 1
+) -> Iterator[tuple[tuple[Path, ...], str]]:
+    """Yield ``(paths, sha256)`` for every group, hashing only stale files."""
+
+    for paths, record in iter_group_results(
+        [(paths, []) for paths in groups], _metrics_worker, cache=cache, workers=workers
+    ):
+        yield paths, str(record["sha256"])
+
+
+def _metrics_worker(
+    paths: tuple[str, ...],
+    cached_sha: str | None,
+    stat_fresh: bool,
+    items: list[tuple[str, Any]],
+    missing_keys: list[str],
+) -> tuple[list[FileStat], str, dict[str, Any]]:
+    files = [Path(path) for path in paths]
+    stats = file_stats(files)
+    digest = cached_sha if stat_fresh and cached_sha is not None else content_digest(files)
+    todo = [item for item in items if item[0] in missing_keys] if digest == cached_sha else items
+    return stats, digest, {key: sample_metrics(load_replay_entry(entry)) for key, entry in todo}
+
+
+class ManifestStreamWriter:
+    """Write manifest entries as they arrive; output matches ``json.dumps(entries, indent=2)``.
+
+    Entries go to a temporary file that replaces ``output`` on :meth:`close`,
+    so readers never observe a half-written manifest.
+    """
+
+    def __init__(self, output: Path) -> None:
+        output.parent.mkdir(parents=True, exist_ok=True)
+        self.output = output
+        self._tmp_path = output.with_name(output.name + ".tmp")
+        self._handle = self._tmp_path.open("w", encoding="utf-8")
+        self.count = 0
+
+    def write(self, entry: Mapping[str, Any]) -> None:
+        body = json.dumps(entry, indent=2).replace("\n", "\n  ")
+        self._handle.write(("[\n  " if self.count == 0 else ",\n  ") + body)
+        self._handle.flush()
+        self.count += 1
+
+    def close(self) -> None:
+        if self._handle.closed:
+            return
+        self._handle.write("\n]" if self.count else "[]")
+        self._handle.close()
+        self._tmp_path.replace(self.output)
+
+    def __enter__(self) -> ManifestStreamWriter:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self._handle.close()
+            self._tmp_path.unlink(missing_ok=True)
+
+
+__all__ = [
+    "CACHE_FORMAT",
+    "DEFAULT_CACHE_NAME",
+    "CurationEntry",
+    "ManifestStreamWriter",
+    "SampleCache",
+    "content_digest",
+    "digest_groups",
+    "entry_files",
+    "entry_key",
+    "evaluate_entries",
+    "iter_group_results",
+    "sample_metrics",
+]
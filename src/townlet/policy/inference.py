@@ -0,0 +1,288 @@
+"""Optimised CPU inference artifacts for :class:`ConflictAwarePolicyNetwork`.
+
+Live play and rollout capture only ever run the policy forward, one agent at
+a time, so per-call overhead dominates. :func:`export_inference_artifact`
+turns a trained network into a frozen TorchScript module (optionally with its
+``Linear`` layers dynamically quantised to int8) and stores it in a single
+file alongside a ``signature.json`` entry recording:
+
+* the input signature (``map_shape``, ``feature_dim``) and ``action_dim``;
+* the accuracy check against the fp32 network the artifact was built from
+  (maximum absolute logit/value error and greedy-action agreement); export
+  fails when the error exceeds the tolerance;
+* eager vs artifact latency per batch size, as measured on the export host.
+
+Point ``policy_runtime.inference_artifact`` at the file and
+:class:`~townlet.policy.runner.PolicyRuntime` runs it instead of the eager
+network whenever the observation shapes and action count match the signature.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import time
+import warnings
+from collections.abc import Iterator, Mapping, Sequence
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from townlet.policy.models import ConflictAwarePolicyConfig, TorchNotAvailableError, torch_available
+
+try:
+    import torch
+    import torch.nn as nn
+except ModuleNotFoundError:  # pragma: no cover - environment guard
+    torch = None  # type: ignore[assignment]
+    nn = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+INFERENCE_FORMAT = "townlet.policy_inference"
+INFERENCE_FORMAT_VERSION = 1
+SIGNATURE_FILE = "signature.json"
+DEFAULT_TOLERANCE = 1e-4
+DEFAULT_QUANTIZED_TOLERANCE = 5e-2
+
+
+class InferenceAccuracyError(ValueError):
+    """Raised when an inference artifact drifts beyond tolerance from its fp32 source."""
+
+
+@dataclass(frozen=True)
+class InferenceSignature:
+    """Input signature plus export-time accuracy and latency measurements."""
+
+    feature_dim: int
+    map_shape: tuple[int, int, int]
+    action_dim: int
+    hidden_dim: int
+    quantized: bool
+    accuracy: dict[str, float] = field(default_factory=dict)
+    latency_ms: dict[str, dict[str, dict[str, float]]] = field(default_factory=dict)
+    torch_version: str = ""
+
+    def accepts(self, map_shape: Sequence[int], feature_dim: int, action_dim: int) -> bool:
+        return (
+            tuple(map_shape) == self.map_shape
+            and int(feature_dim) == self.feature_dim
+            and int(action_dim) == self.action_dim
+        )
+
+    def to_json(self) -> str:
+        payload = {"format": INFERENCE_FORMAT, "version": INFERENCE_FORMAT_VERSION, **asdict(self)}
+        payload["map_shape"] = list(self.map_shape)
+        return json.dumps(payload, indent=2, sort_keys=True)
+
+    @classmethod
+    def from_json(cls, text: str | bytes) -> InferenceSignature:
+        payload = json.loads(text)
+        if not isinstance(payload, Mapping) or payload.get("format") != INFERENCE_FORMAT:
+            raise ValueError("Not a Townlet policy inference signature")
+        if payload.get("version") != INFERENCE_FORMAT_VERSION:
+            raise ValueError(f"Unsupported inference artifact version: {payload.get('version')}")
+        channels, height, width = (int(size) for size in payload["map_shape"])
+        return cls(
+            feature_dim=int(payload["feature_dim"]),
+            map_shape=(channels, height, width),
+            action_dim=int(payload["action_dim"]),
+            hidden_dim=int(payload["hidden_dim"]),
+            quantized=bool(payload["quantized"]),
+            accuracy={str(key): float(value) for key, value in payload.get("accuracy", {}).items()},
+            latency_ms=dict(payload.get("latency_ms", {})),
+            torch_version=str(payload.get("torch_version", "")),
+        )
+
+
+@dataclass
+class InferenceArtifact:
+    module: Any
+    signature: InferenceSignature
+
+
+def _require_torch() -> None:
+    if not torch_available():
+        raise TorchNotAvailableError("PyTorch is required to build or load policy inference artifacts.")
+
+
+@contextmanager
+def _quiet_torchscript() -> Iterator[None]:
+    # TorchScript emits deprecation FutureWarnings on every trace/save/load.
+    with warnings.catch_warnings():
+        warnings.filterwarnings("ignore", category=FutureWarning, module=r"torch\.jit")
+        yield
+
+
+def compile_inference_module(network: Any, config: ConflictAwarePolicyConfig, *, quantize: bool = False) -> Any:
+    """Trace and freeze ``network`` for CPU inference, quantising ``Linear`` layers if asked."""
+
+    _require_torch()
+    source = network.to("cpu").eval()
+    if quantize:
+        source = torch.ao.quantization.quantize_dynamic(source, {nn.Linear}, dtype=torch.qint8)  # type: ignore[no-untyped-call]
+    example = (torch.zeros(1, *config.map_shape), torch.zeros(1, config.feature_dim))
+    with _quiet_torchscript(), torch.no_grad():
+        traced = torch.jit.trace(source, example)  # type: ignore[no-untyped-call]
+        return torch.jit.freeze(traced.eval())
+
+
+def check_accuracy(
+    reference: Any, candidate: Any, maps: Any, features: Any, *, tolerance: float
+) -> dict[str, float]:
+    """Compare ``candidate`` to the fp32 ``reference`` on a batch of inputs.
+
+    Raises :class:`InferenceAccuracyError` when the largest absolute logit or
+    value difference exceeds ``tolerance``.
+    """
+
+    _require_torch()
+    with torch.no_grad():
+        ref_logits, ref_value = reference(maps, features)
+        logits, value = candidate(maps, features)
+    report = {
+        "samples": float(maps.shape[0]),
+        "tolerance": float(tolerance),
+        "max_logit_error": float((logits - ref_logits).abs().max()),
+        "max_value_error": float((value - ref_value).abs().max()),
+        "action_agreement": float((logits.argmax(-1) == ref_logits.argmax(-1)).float().mean()),
+    }
+    worst = max(report["max_logit_error"], report["max_value_error"])
+    if worst > tolerance:
+        raise InferenceAccuracyError(
+            f"Inference artifact error {worst:.3g} exceeds tolerance {tolerance:.3g} "
+            f"(action agreement {report['action_agreement']:.3f})"
+        )
+    return report
+
+
+def benchmark_latency(
+    module: Any,
+    map_shape: Sequence[int],
+    feature_dim: int,
+    *,
+    batch_sizes: Sequence[int] = (1,),
+    iterations: int = 200,
+    warmup: int = 20,
+) -> dict[str, dict[str, float]]:
+    """Time forward passes of ``module``; returns mean/p50/p95 milliseconds per batch size."""
+
+    _require_torch()
+    results: dict[str, dict[str, float]] = {}
+    for batch_size in batch_sizes:
+        maps = torch.randn(batch_size, *map_shape)
+        features = torch.randn(batch_size, feature_dim)
+        timings = np.empty(iterations, dtype=np.float64)
+        with torch.no_grad():
+            for _ in range(warmup):
+                module(maps, features)
+            for index in range(iterations):
+                start = time.perf_counter()
+                module(maps, features)
+                timings[index] = time.perf_counter() - start
+        timings *= 1_000.0
+        results[str(batch_size)] = {
+            "mean_ms": float(timings.mean()),
+            "p50_ms": float(np.percentile(timings, 50)),
+            "p95_ms": float(np.percentile(timings, 95)),
+        }
+    return results
+
+
+def export_inference_artifact(
+    network: Any,
+    config: ConflictAwarePolicyConfig,
+    output: Path,
+    *,
+    quantize: bool = False,
+    tolerance: float | None = None,
+    inputs: tuple[np.ndarray, np.ndarray] | None = None,
+    check_samples: int = 256,
+    batch_sizes: Sequence[int] = (1,),
+    benchmark_iterations: int = 200,
+    seed: int = 0,
+) -> InferenceSignature:
+    """Compile ``network``, verify it against the fp32 model and write ``output``.
+
+    ``inputs`` supplies ``(maps, features)`` arrays for the accuracy check
+    (e.g. frames from a replay manifest); otherwise ``check_samples`` standard
+    normal inputs are drawn with ``seed``. Pass ``benchmark_iterations=0`` to
+    skip timing.
+    """
+
+    _require_torch()
+    reference = network.to("cpu").eval()
+    module = compile_inference_module(reference, config, quantize=quantize)
+    if inputs is not None:
+        maps = torch.as_tensor(np.asarray(inputs[0], dtype=np.float32))
+        features = torch.as_tensor(np.asarray(inputs[1], dtype=np.float32))
+    else:
+        generator = torch.Generator().manual_seed(seed)
+        maps = torch.randn(check_samples, *config.map_shape, generator=generator)
+        features = torch.randn(check_samples, config.feature_dim, generator=generator)
+    if tolerance is None:
+        tolerance = DEFAULT_QUANTIZED_TOLERANCE if quantize else DEFAULT_TOLERANCE
+    accuracy = check_accuracy(reference, module, maps, features, tolerance=tolerance)
+
+    latency: dict[str, dict[str, dict[str, float]]] = {}
+    if benchmark_iterations > 0:
+        for name, candidate in (("eager", reference), ("artifact", module)):
+            latency[name] = benchmark_latency(
+                candidate,
+                config.map_shape,
+                config.feature_dim,
+                batch_sizes=batch_sizes,
+                iterations=benchmark_iterations,
+            )
+
+    signature = InferenceSignature(
+        feature_dim=config.feature_dim,
+        map_shape=config.map_shape,
+        action_dim=config.action_dim,
+        hidden_dim=config.hidden_dim,
+        quantized=quantize,
+        accuracy=accuracy,
+        latency_ms=latency,
+        torch_version=str(torch.__version__),
+    )
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with _quiet_torchscript():
+        torch.jit.save(module, str(output), _extra_files={SIGNATURE_FILE: signature.to_json()})
+    logger.info(
+        "policy_inference_exported path=%s quantized=%s max_logit_error=%.3g",
+        output,
+        quantize,
+        accuracy["max_logit_error"],
+    )
+    return signature
+
+
+def load_inference_artifact(path: Path) -> InferenceArtifact:
+    """Load an artifact written by :func:`export_inference_artifact` onto the CPU."""
+
+    _require_torch()
+    extra_files = {SIGNATURE_FILE: ""}
+    with _quiet_torchscript():
+        module = torch.jit.load(str(path), map_location="cpu", _extra_files=extra_files)  # type: ignore[no-untyped-call]
+    if not extra_files[SIGNATURE_FILE]:
+        raise ValueError(f"{path} has no {SIGNATURE_FILE}; not a Townlet policy inference artifact")
+    module.eval()
+    return InferenceArtifact(module=module, signature=InferenceSignature.from_json(extra_files[SIGNATURE_FILE]))
+
+
+__all__ = [
+    "DEFAULT_QUANTIZED_TOLERANCE",
+    "DEFAULT_TOLERANCE",
+    "INFERENCE_FORMAT",
+    "InferenceAccuracyError",
+    "InferenceArtifact",
+    "InferenceSignature",
+    "benchmark_latency",
+    "check_accuracy",
+    "compile_inference_module",
+    "export_inference_artifact",
+    "load_inference_artifact",
+]
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+from townlet.utils.optional import torch_available as torch_available
+
 try:
     import torch
     import torch.nn as nn
@@ -12,11 +14,6 @@ except ModuleNotFoundError:  # pragma: no cover - environment guard
     nn = None  # type: ignore[assignment]
 
 
-def torch_available() -> bool:
-    """Return True if PyTorch is available in the runtime."""
-    return torch is not None
-
-
 class TorchNotAvailableError(RuntimeError):
     """Raised when a Torch-dependent component is used without PyTorch."""
 
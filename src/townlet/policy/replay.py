@@ -6,14 +6,19 @@ import json
 from collections.abc import Iterator, Mapping, Sequence
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any, TypeAlias
 
 import numpy as np
 import yaml
 
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from townlet.policy.replay_store import ReplayStoreRef
+    from townlet.policy.rollout_shards import ShardSampleRef
+
 REQUIRED_CONFLICT_FEATURES: tuple[str, ...] = ("rivalry_max", "rivalry_avoid_count")
 STEP_ARRAY_FIELDS: tuple[str, ...] = ("actions", "old_log_probs", "rewards", "dones")
 TRAINING_ARRAY_FIELDS: tuple[str, ...] = (*STEP_ARRAY_FIELDS, "value_preds")
+ReplayEntry: TypeAlias = "tuple[Path, Path | None] | ShardSampleRef | ReplayStoreRef"
 
 
 @dataclass
@@ -157,6 +162,26 @@ def load_replay_sample(
     )
 
 
+def load_replay_entry(entry: ReplayEntry) -> ReplaySample:
+    """Load a manifest entry: an NPZ/JSON pair, or a sample inside a rollout shard or replay store."""
+
+    if isinstance(entry, tuple):
+        return load_replay_sample(*entry)
+    from townlet.policy.replay_store import ReplayStoreRef, load_store_sample
+    from townlet.policy.rollout_shards import load_shard_sample
+
+    if isinstance(entry, ReplayStoreRef):
+        return load_store_sample(entry)
+
+    sample = load_shard_sample(entry)
+    _ensure_conflict_features(sample.metadata)
+    return sample
+
+
+def _entry_name(entry: ReplayEntry) -> str:
+    return entry[0].name if isinstance(entry, tuple) else entry.name
+
+
 @dataclass
 class ReplayBatch:
     """Mini-batch representation composed from replay samples."""
@@ -279,7 +304,7 @@ def build_batch(samples: Sequence[ReplaySample]) -> ReplayBatch:
 class ReplayDatasetConfig:
     """Configuration for building replay datasets."""
 
-    entries: list[tuple[Path, Path | None]]
+    entries: list[ReplayEntry]
     batch_size: int = 1
     shuffle: bool = False
     seed: int | None = None
@@ -321,6 +346,18 @@ class ReplayDatasetConfig:
     ) -> ReplayDatasetConfig:
         manifest_path = capture_dir / "rollout_sample_manifest.json"
         if not manifest_path.exists():
+            shard_index = capture_dir / "rollout_sample_shards.json"
+            if shard_index.exists():
+                config = cls.from_manifest(
+                    shard_index,
+                    batch_size=batch_size,
+                    shuffle=shuffle,
+                    seed=seed,
+                    drop_last=drop_last,
+                    streaming=streaming,
+                )
+                config.label = capture_dir.name
+                return config
             raise FileNotFoundError(manifest_path)
         entries = _load_manifest(manifest_path)
         metrics_path = capture_dir / "rollout_sample_metrics.json"
@@ -360,7 +397,7 @@ def _resolve_manifest_path(path_spec: Path, base: Path) -> Path:
     return (base / path_spec).resolve()
 
 
-def _load_manifest(manifest_path: Path) -> list[tuple[Path, Path | None]]:
+def _load_manifest(manifest_path: Path) -> list[ReplayEntry]:
     if not manifest_path.exists():
         raise FileNotFoundError(manifest_path)
     data: Any
@@ -369,6 +406,14 @@ def _load_manifest(manifest_path: Path) -> list[tuple[Path, Path | None]]:
         data = json.loads(text)
     else:
         data = yaml.safe_load(text)
+    from townlet.policy.replay_store import is_store_index, load_store_index
+
+    if is_store_index(data):
+        # Memory-mapped replay store (see townlet.policy.replay_store).
+        store_entries: list[ReplayEntry] = list(load_store_index(manifest_path))
+        if not store_entries:
+            raise ValueError("Replay manifest contains no entries")
+        return store_entries
     if isinstance(data, dict):
         samples = data.get("samples")
         if not isinstance(samples, list):
@@ -378,9 +423,23 @@ def _load_manifest(manifest_path: Path) -> list[tuple[Path, Path | None]]:
         manifest_entries = data
     else:
         raise ValueError("Replay manifest must be a list or mapping with 'samples'")
-    entries: list[tuple[Path, Path | None]] = []
+    entries: list[ReplayEntry] = []
     base = manifest_path.parent
     for item in manifest_entries:
+        if isinstance(item, dict) and "index" in item:
+            # Sample packed into a rollout shard (see townlet.policy.rollout_shards).
+            from townlet.policy.rollout_shards import ShardSampleRef
+
+            if "sample" not in item or "meta" not in item:
+                raise ValueError("Shard manifest entry requires 'sample' and 'meta' fields")
+            entries.append(
+                ShardSampleRef(
+                    shard_path=_resolve_manifest_path(Path(item["sample"]), base).resolve(),
+                    meta_path=_resolve_manifest_path(Path(item["meta"]), base).resolve(),
+                    index=int(item["index"]),
+                )
+            )
+            continue
         if isinstance(item, str):
             sample_spec = Path(item)
             sample = _resolve_manifest_path(sample_spec, base)
@@ -425,22 +484,22 @@ class ReplayDataset:
                 tuple[tuple[int, ...], tuple[int, ...], tuple[tuple[int, ...], ...]],
                 list[int],
             ] = {}
-            for idx, (sample_path, meta_path) in enumerate(self._entries):
-                s = load_replay_sample(sample_path, meta_path)
+            for idx, entry in enumerate(self._entries):
+                s = load_replay_entry(entry)
                 sig = (
                     tuple(s.map.shape),
                     tuple(s.features.shape),
                     tuple(getattr(s, f).shape for f in TRAINING_ARRAY_FIELDS),
                 )
                 stream_signatures.setdefault(sig, []).append(idx)
-                self._ensure_sample_metrics(s, (sample_path, meta_path))
+                self._ensure_sample_metrics(s, entry)
             # Deterministic order by signature
             self._buckets = [
                 stream_signatures[key] for key in sorted(stream_signatures.keys())
             ]
         else:
             self._cached_samples = [
-                load_replay_sample(sample, meta) for sample, meta in self._entries
+                load_replay_entry(entry) for entry in self._entries
             ]
             for sample, entry in zip(self._cached_samples, self._entries):
                 self._ensure_sample_metrics(sample, entry)
@@ -480,8 +539,17 @@ class ReplayDataset:
         return total
 
     def __iter__(self) -> Iterator[ReplayBatch]:
+        return self.iter_shard(0, 1)
+
+    def iter_shard(self, rank: int, world_size: int) -> Iterator[ReplayBatch]:
+        """Yield every ``world_size``-th batch starting at ``rank``.
+
+        Skipped batches are never built, so streaming datasets only load the
+        samples belonging to this shard.
+        """
         if not self._buckets:
             return
+        position = 0
         for bucket in self._buckets:
             indices = list(bucket)
             if self._rng is not None:
@@ -490,23 +558,26 @@ class ReplayDataset:
                 batch_indices = indices[start : start + self.config.batch_size]
                 if len(batch_indices) < self.config.batch_size and self.config.drop_last:
                     continue
+                position += 1
+                if (position - 1) % world_size != rank:
+                    continue
                 samples = [self._fetch_sample(index) for index in batch_indices]
                 yield build_batch(samples)
 
     def _fetch_sample(self, index: int) -> ReplaySample:
         if self._cached_samples is not None:
             return self._cached_samples[index]
-        sample = load_replay_sample(*self._entries[index])
+        sample = load_replay_entry(self._entries[index])
         self._ensure_sample_metrics(sample, self._entries[index])
         return sample
 
     def _ensure_sample_metrics(
-        self, sample: ReplaySample, entry: tuple[Path, Path | None]
+        self, sample: ReplaySample, entry: ReplayEntry
     ) -> None:
         existing = sample.metadata.get("metrics")
         if isinstance(existing, dict) and existing:
             return
-        metrics = self.metrics_map.get(entry[0].name)
+        metrics = self.metrics_map.get(_entry_name(entry))
         if metrics is not None:
             sample.metadata["metrics"] = metrics
 
@@ -67,6 +67,11 @@ class InMemoryReplayDataset:
         return [buckets[key] for key in sorted(buckets.keys())]
 
     def __iter__(self) -> Iterator[ReplayBatch]:
+        return self.iter_shard(0, 1)
+
+    def iter_shard(self, rank: int, world_size: int) -> Iterator[ReplayBatch]:
+        """Yield every ``world_size``-th batch starting at ``rank``."""
+        position = 0
         for bucket in self._buckets:
             if not bucket:
                 continue
@@ -74,6 +79,9 @@ class InMemoryReplayDataset:
                 chunk = bucket[start : start + self.batch_size]
                 if len(chunk) < self.batch_size and self.config.drop_last:
                     continue
+                position += 1
+                if (position - 1) % world_size != rank:
+                    continue
                 yield build_batch(chunk)
 
     def __len__(self) -> int:
@@ -0,0 +1,216 @@
+"""Read-only, memory-mapped replay store shared by concurrent training runs.
+
+Replay manifests point at many small NPZ/JSON pairs (or rollout shards) that
+every training process decompresses into its own memory. When several runs
+train on the same corpus at once -- a hyperparameter sweep, for example --
+that cost is paid once per process. :func:`build_replay_store` loads the
+corpus once and writes it as uncompressed ``.npy`` columns instead:
+
+``segment_NNN/<column>.npy``
+    ``map``, ``features``, ``actions``, ``old_log_probs``, ``rewards``,
+    ``dones`` and ``value_preds`` concatenated along the time axis, plus
+    ``step_offsets``/``value_offsets`` locating each sample's rows. Samples
+    whose per-step shapes differ land in separate segments.
+``segment_NNN/meta.json``
+    Per-sample metadata (metrics from the manifest's metrics map included).
+``replay_store.json``
+    Index listing one ``samples`` entry (``store``/``index``) per sample,
+    readable by :meth:`ReplayDatasetConfig.from_manifest
+    <townlet.policy.replay.ReplayDatasetConfig.from_manifest>`.
+
+Readers open the columns with ``mmap_mode="r"`` and hand out views, so every
+process shares the operating system's page cache rather than holding a copy.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from collections.abc import Mapping
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from townlet.policy.replay import (
+    TRAINING_ARRAY_FIELDS,
+    ReplayDatasetConfig,
+    ReplaySample,
+    _entry_name,
+    load_replay_entry,
+)
+
+logger = logging.getLogger(__name__)
+
+STORE_FORMAT = "townlet.replay_store"
+STORE_FORMAT_VERSION = 1
+STORE_INDEX_NAME = "replay_store.json"
+_COLUMN_FIELDS: tuple[str, ...] = ("map", "features", *TRAINING_ARRAY_FIELDS)
+
+_SegmentKey = tuple[tuple[str, tuple[int, ...], str], ...]
+
+
+@dataclass(frozen=True)
+class ReplayStoreRef:
+    """Location of one sample inside a replay store segment."""
+
+    segment_dir: Path
+    index: int
+
+    @property
+    def name(self) -> str:
+        return f"{self.segment_dir.name}#{self.index}"
+
+
+def build_replay_store(config: ReplayDatasetConfig, output_dir: Path) -> Path:
+    """Write every entry of ``config`` into a memory-mappable store.
+
+    Samples are read twice (once to size the columns, once to fill them) so
+    peak memory stays at one sample rather than the whole corpus. Returns the
+    path of the store index.
+    """
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    metrics_map = config.metrics_map or {}
+    segments: dict[_SegmentKey, list[tuple[int, int, int]]] = {}
+    for position, entry in enumerate(config.entries):
+        sample = load_replay_entry(entry)
+        segments.setdefault(_segment_key(sample), []).append(
+            (position, int(sample.actions.shape[0]), int(sample.value_preds.shape[0]))
+        )
+    if not segments:
+        raise ValueError("Replay store requires at least one entry")
+
+    locations: dict[int, tuple[str, int]] = {}
+    summaries: list[dict[str, Any]] = []
+    for number, (key, members) in enumerate(sorted(segments.items(), key=lambda item: item[1][0][0])):
+        name = f"segment_{number:03d}"
+        segment_dir = output_dir / name
+        segment_dir.mkdir(exist_ok=True)
+        step_offsets = np.concatenate([[0], np.cumsum([steps for _, steps, _ in members])]).astype(np.int64)
+        value_offsets = np.concatenate([[0], np.cumsum([values for _, _, values in members])]).astype(np.int64)
+        columns: dict[str, np.memmap] = {}
+        for field, trailing, dtype in key:
+            rows = int(value_offsets[-1] if field == "value_preds" else step_offsets[-1])
+            columns[field] = np.lib.format.open_memmap(
+                segment_dir / f"{field}.npy", mode="w+", dtype=np.dtype(dtype), shape=(rows, *trailing)
+            )
+        metadata: list[dict[str, Any]] = []
+        for slot, (position, _, _) in enumerate(members):
+            entry = config.entries[position]
+            sample = load_replay_entry(entry)
+            for field, column in columns.items():
+                offsets = value_offsets if field == "value_preds" else step_offsets
+                column[offsets[slot] : offsets[slot + 1]] = getattr(sample, field)
+            sample_metadata = dict(sample.metadata)
+            metrics = metrics_map.get(_entry_name(entry))
+            if metrics is not None and not sample_metadata.get("metrics"):
+                sample_metadata["metrics"] = dict(metrics)
+            metadata.append(sample_metadata)
+            locations[position] = (name, slot)
+        for column in columns.values():
+            column.flush()
+        del columns
+        np.save(segment_dir / "step_offsets.npy", step_offsets)
+        np.save(segment_dir / "value_offsets.npy", value_offsets)
+        (segment_dir / "meta.json").write_text(json.dumps({"samples": metadata}, default=_json_default))
+        summaries.append({"name": name, "samples": len(members), "steps": int(step_offsets[-1])})
+
+    index = {
+        "format": STORE_FORMAT,
+        "version": STORE_FORMAT_VERSION,
+        "label": config.label,
+        "segments": summaries,
+        "samples": [
+            {"store": locations[position][0], "index": locations[position][1], "source": _entry_name(entry)}
+            for position, entry in enumerate(config.entries)
+        ],
+    }
+    index_path = output_dir / STORE_INDEX_NAME
+    index_path.write_text(json.dumps(index, indent=2))
+    logger.info(
+        "replay_store_built path=%s samples=%d segments=%d", index_path, len(config.entries), len(summaries)
+    )
+    return index_path
+
+
+def is_store_index(payload: Any) -> bool:
+    return isinstance(payload, Mapping) and payload.get("format") == STORE_FORMAT
+
+
+def load_store_index(index_path: Path) -> list[ReplayStoreRef]:
+    """Return a reference for every sample listed in a store index."""
+
+    payload = json.loads(index_path.read_text())
+    if not is_store_index(payload):
+        raise ValueError(f"{index_path} is not a replay store index")
+    base = index_path.parent
+    return [
+        ReplayStoreRef(segment_dir=(base / str(entry["store"])).resolve(), index=int(entry["index"]))
+        for entry in payload.get("samples", [])
+    ]
+
+
+def load_store_sample(ref: ReplayStoreRef) -> ReplaySample:
+    """Return one sample as read-only views into the memory-mapped columns."""
+
+    columns, metadata = _open_segment(str(ref.segment_dir), (ref.segment_dir / "meta.json").stat().st_mtime_ns)
+    offsets = columns["step_offsets"]
+    if not 0 <= ref.index < offsets.shape[0] - 1:
+        raise IndexError(f"replay store segment {ref.segment_dir} has no sample {ref.index}")
+    start, stop = int(offsets[ref.index]), int(offsets[ref.index + 1])
+    value_start, value_stop = (int(value) for value in columns["value_offsets"][ref.index : ref.index + 2])
+    return ReplaySample(
+        map=columns["map"][start:stop],
+        features=columns["features"][start:stop],
+        actions=columns["actions"][start:stop],
+        old_log_probs=columns["old_log_probs"][start:stop],
+        value_preds=columns["value_preds"][value_start:value_stop],
+        rewards=columns["rewards"][start:stop],
+        dones=columns["dones"][start:stop],
+        metadata=dict(metadata[ref.index]),
+    )
+
+
+@lru_cache(maxsize=16)
+def _open_segment(path: str, mtime_ns: int) -> tuple[dict[str, np.ndarray], list[dict[str, Any]]]:
+    segment_dir = Path(path)
+    columns = {
+        field: np.load(segment_dir / f"{field}.npy", mmap_mode="r")
+        for field in (*_COLUMN_FIELDS, "step_offsets", "value_offsets")
+    }
+    payload = json.loads((segment_dir / "meta.json").read_text())
+    samples = payload.get("samples") if isinstance(payload, Mapping) else None
+    if not isinstance(samples, list):
+        raise ValueError(f"Replay store segment {path} missing 'samples' metadata")
+    return columns, samples
+
+
+def _segment_key(sample: ReplaySample) -> _SegmentKey:
+    return tuple(
+        (field, tuple(getattr(sample, field).shape[1:]), getattr(sample, field).dtype.str) for field in _COLUMN_FIELDS
+    )
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, (set, tuple)):
+        return list(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+__all__ = [
+    "STORE_FORMAT",
+    "STORE_FORMAT_VERSION",
+    "STORE_INDEX_NAME",
+    "ReplayStoreRef",
+    "build_replay_store",
+    "is_store_index",
+    "load_store_index",
+    "load_store_sample",
+]
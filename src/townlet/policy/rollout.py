@@ -16,6 +16,8 @@ from townlet.policy.replay_buffer import (
     InMemoryReplayDataset,
     InMemoryReplayDatasetConfig,
 )
+from townlet.policy.rollout_shards import ShardedRolloutWriter
+from townlet.policy.trajectory_store import TrajectoryStore
 from townlet.dto.observations import DTO_SCHEMA_VERSION
 
 
@@ -35,10 +37,14 @@ class AgentRollout:
 
 
 class RolloutBuffer:
-    """Collects trajectory frames and exposes helpers to save or replay them."""
+    """Collects trajectory frames and exposes helpers to save or replay them.
+
+    Frames are appended into a columnar :class:`TrajectoryStore`, so
+    :meth:`to_samples` returns views rather than re-stacking per-frame dicts.
+    """
 
     def __init__(self) -> None:
-        self._frames: list[dict[str, Any]] = []
+        self._store = TrajectoryStore()
         self._tick_count = 0
         self._queue_conflict_count = 0
         self._queue_conflict_intensity = 0.0
@@ -74,35 +80,45 @@ class RolloutBuffer:
                 self._chat_failure_count += 1
 
     def extend(self, frames: Iterable[Mapping[str, Any]]) -> None:
-        for frame in frames:
-            self._frames.append(dict(frame))
+        self._store.extend(frames)
 
     def __len__(self) -> int:
-        return len(self._frames)
+        return len(self._store)
+
+    @property
+    def store(self) -> TrajectoryStore:
+        return self._store
 
     def by_agent(self) -> dict[str, AgentRollout]:
-        grouped: dict[str, AgentRollout] = {}
-        for frame in self._frames:
-            agent_id = str(frame.get("agent_id", "unknown"))
-            grouped.setdefault(agent_id, AgentRollout(agent_id)).append(frame)
-        return grouped
+        return {
+            agent_id: AgentRollout(agent_id, columns.frames())
+            for agent_id, columns in self._store.agents().items()
+        }
 
     def to_samples(self) -> dict[str, ReplaySample]:
         return {
-            agent_id: rollout.to_replay_sample()
-            for agent_id, rollout in self.by_agent().items()
+            agent_id: columns.to_replay_sample()
+            for agent_id, columns in self._store.agents().items()
         }
 
     def save(
-        self, output_dir: Path, prefix: str = "rollout_sample", compress: bool = True
+        self,
+        output_dir: Path,
+        prefix: str = "rollout_sample",
+        compress: bool = True,
+        *,
+        sharded: bool = False,
     ) -> None:
+        if sharded:
+            self.save_shards(output_dir, prefix=prefix, compress=compress)
+            return
         output_dir.mkdir(parents=True, exist_ok=True)
         save_fn = np.savez_compressed if compress else np.savez
 
         manifest_entries: list[dict[str, str]] = []
         metrics_map: dict[str, dict[str, float]] = {}
-        for index, (agent_id, rollout) in enumerate(self.by_agent().items(), start=1):
-            sample = rollout.to_replay_sample()
+        for index, (agent_id, columns) in enumerate(self._store.agents().items(), start=1):
+            sample = columns.to_replay_sample()
             stem = f"{prefix}_{agent_id}_{index:03d}"
             sample_path = output_dir / f"{stem}.npz"
             save_fn(
@@ -117,13 +133,13 @@ class RolloutBuffer:
             )
             meta_path = output_dir / f"{stem}.json"
             meta = sample.metadata.copy()
-            meta.update({"agent_id": agent_id, "frame_count": len(rollout.frames)})
+            meta.update({"agent_id": agent_id, "frame_count": len(columns)})
             sample_metrics = compute_sample_metrics(sample)
             meta["metrics"] = sample_metrics
             metrics_map[sample_path.name] = sample_metrics
             meta_path.write_text(json.dumps(meta, indent=2))
             dto_path = output_dir / f"{stem}_dto.json"
-            dto_payload = rollout.to_dto_artifact()
+            dto_payload = build_dto_rollout_artifact(agent_id, columns.frames())
             dto_path.write_text(json.dumps(dto_payload, indent=2))
             manifest_entries.append(
                 {"sample": sample_path.name, "meta": meta_path.name, "dto": dto_path.name}
@@ -134,12 +150,37 @@ class RolloutBuffer:
         metrics_path = output_dir / f"{prefix}_metrics.json"
         metrics_path.write_text(json.dumps(metrics_map, indent=2))
 
+    def save_shards(
+        self,
+        output_dir: Path,
+        prefix: str = "rollout_sample",
+        *,
+        compress: bool = True,
+        agents_per_shard: int = 64,
+        max_workers: int = 2,
+    ) -> Path:
+        """Write the buffer as binary rollout shards and return the shard index path."""
+
+        with ShardedRolloutWriter(
+            output_dir,
+            prefix=prefix,
+            agents_per_shard=agents_per_shard,
+            compress=compress,
+            max_workers=max_workers,
+        ) as writer:
+            for agent_id, columns in self._store.agents().items():
+                sample = columns.to_replay_sample()
+                sample.metadata.update({"agent_id": agent_id, "frame_count": len(columns)})
+                sample.metadata["metrics"] = compute_sample_metrics(sample)
+                writer.add(agent_id, sample, frames=columns.frames())
+        return writer.index_path
+
     def build_dataset(
         self,
         batch_size: int = 1,
         drop_last: bool = False,
     ) -> InMemoryReplayDataset:
-        if not self._frames:
+        if not len(self._store):
             raise ValueError("Rollout buffer contains no frames; cannot build dataset")
         samples = []
         for sample in self.to_samples().values():
@@ -171,7 +212,7 @@ class RolloutBuffer:
         return dataset
 
     def is_empty(self) -> bool:
-        return not self._frames
+        return not len(self._store)
 
     def set_tick_count(self, ticks: int) -> None:
         self._tick_count = max(0, int(ticks))
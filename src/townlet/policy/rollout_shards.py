@@ -0,0 +1,292 @@
+"""Sharded binary rollout artifacts.
+
+:meth:`RolloutBuffer.save <townlet.policy.rollout.RolloutBuffer.save>` writes,
+per agent, an NPZ, an indented metadata JSON and a ``*_dto.json`` holding every
+frame (map tensors included) as JSON lists. For large captures the DTO dumps
+dominate disk use and load time. The sharded layout packs many agents'
+trajectories into each shard instead:
+
+``<prefix>_shard_NNN.npz``
+    Columnar arrays (``map``, ``features``, ``actions``, ``old_log_probs``,
+    ``rewards``, ``dones``, ``value_preds``) concatenated along the time axis,
+    plus ``step_offsets``/``value_offsets`` locating each agent's rows.
+``<prefix>_shard_NNN.meta.json[.gz]``
+    Compact (optionally gzip-compressed) per-agent metadata plus the
+    non-tensor per-frame fields (ticks and action payloads) that the DTO
+    export carried.
+``<prefix>_shards.json``
+    Index listing every shard and one ``samples`` entry per agent
+    (``sample``/``meta``/``index``), readable by
+    :meth:`ReplayDatasetConfig.from_manifest <townlet.policy.replay.ReplayDatasetConfig.from_manifest>`.
+
+Shards are written by a background thread pool while the caller keeps adding
+samples; :meth:`ShardedRolloutWriter.close` waits for them and writes the index.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+from collections.abc import Mapping, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from types import TracebackType
+from typing import Any
+
+import numpy as np
+
+from townlet.policy.replay import STEP_ARRAY_FIELDS, ReplaySample
+
+SHARD_FORMAT = "townlet.rollout_shards"
+SHARD_FORMAT_VERSION = 1
+_COLUMN_FIELDS: tuple[str, ...] = ("map", "features", *STEP_ARRAY_FIELDS)
+
+
+@dataclass(frozen=True)
+class ShardSampleRef:
+    """Location of one agent's trajectory inside a rollout shard."""
+
+    shard_path: Path
+    meta_path: Path
+    index: int
+
+    @property
+    def name(self) -> str:
+        return f"{self.shard_path.name}#{self.index}"
+
+
+class ShardedRolloutWriter:
+    """Packs replay samples into shards written on a background thread pool."""
+
+    def __init__(
+        self,
+        output_dir: Path,
+        *,
+        prefix: str = "rollout_sample",
+        agents_per_shard: int = 64,
+        compress: bool = True,
+        max_workers: int = 2,
+    ) -> None:
+        if agents_per_shard <= 0:
+            raise ValueError("agents_per_shard must be positive")
+        if max_workers <= 0:
+            raise ValueError("max_workers must be positive")
+        self.output_dir = output_dir
+        self.prefix = prefix
+        self.agents_per_shard = agents_per_shard
+        self.compress = compress
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="townlet-shards")
+        self._pending: list[tuple[str, ReplaySample, dict[str, Any]]] = []
+        self._signature: tuple[tuple[int, ...], ...] | None = None
+        self._futures: list[Future[dict[str, Any]]] = []
+        self._closed = False
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+    def add(
+        self,
+        agent_id: str,
+        sample: ReplaySample,
+        *,
+        frames: Sequence[Mapping[str, Any]] | None = None,
+    ) -> None:
+        """Queue ``sample`` for the current shard.
+
+        ``frames`` optionally supplies the per-frame ticks and action payloads
+        recorded alongside the arrays. Samples whose map or feature shape
+        differs from the current shard start a new shard.
+        """
+
+        if self._closed:
+            raise RuntimeError("ShardedRolloutWriter is closed")
+        signature = (tuple(sample.map.shape[1:]), tuple(sample.features.shape[1:]))
+        if self._pending and signature != self._signature:
+            self._flush()
+        self._signature = signature
+        record: dict[str, Any] = {"agent_id": str(agent_id), "metadata": sample.metadata}
+        if frames is not None:
+            record["ticks"] = [int(frame.get("tick", 0) or 0) for frame in frames]
+            record["actions"] = [frame.get("action") for frame in frames]
+        # Columns must not change under the writer thread (store-backed samples
+        # are views that the next append may overwrite), so copy them here.
+        snapshot = ReplaySample(
+            map=np.array(sample.map),
+            features=np.array(sample.features),
+            actions=np.array(sample.actions),
+            old_log_probs=np.array(sample.old_log_probs),
+            value_preds=np.array(sample.value_preds),
+            rewards=np.array(sample.rewards),
+            dones=np.array(sample.dones),
+            metadata=sample.metadata,
+        )
+        self._pending.append((str(agent_id), snapshot, record))
+        if len(self._pending) >= self.agents_per_shard:
+            self._flush()
+
+    def close(self) -> Path:
+        """Wait for outstanding shards and write the index; return its path."""
+
+        if self._closed:
+            return self.index_path
+        self._flush()
+        self._closed = True
+        try:
+            shards = [future.result() for future in self._futures]
+        finally:
+            self._executor.shutdown(wait=True)
+        samples: list[dict[str, Any]] = []
+        for shard in shards:
+            for index, agent_id in enumerate(shard["agents"]):
+                samples.append(
+                    {"sample": shard["file"], "meta": shard["meta"], "index": index, "agent_id": agent_id}
+                )
+        payload = {
+            "format": SHARD_FORMAT,
+            "version": SHARD_FORMAT_VERSION,
+            "shards": shards,
+            "samples": samples,
+        }
+        self.index_path.write_text(json.dumps(payload, indent=2))
+        return self.index_path
+
+    @property
+    def index_path(self) -> Path:
+        return self.output_dir / f"{self.prefix}_shards.json"
+
+    def __enter__(self) -> ShardedRolloutWriter:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self._closed = True
+            self._executor.shutdown(wait=True)
+
+    def _flush(self) -> None:
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, []
+        stem = f"{self.prefix}_shard_{len(self._futures):03d}"
+        self._futures.append(self._executor.submit(self._write_shard, stem, pending))
+
+    def _write_shard(self, stem: str, entries: list[tuple[str, ReplaySample, dict[str, Any]]]) -> dict[str, Any]:
+        samples = [sample for _, sample, _ in entries]
+        arrays: dict[str, np.ndarray] = {
+            name: np.concatenate([getattr(sample, name) for sample in samples]) for name in _COLUMN_FIELDS
+        }
+        arrays["value_preds"] = np.concatenate([sample.value_preds for sample in samples])
+        arrays["step_offsets"] = np.cumsum([0] + [sample.actions.shape[0] for sample in samples], dtype=np.int64)
+        arrays["value_offsets"] = np.cumsum([0] + [sample.value_preds.shape[0] for sample in samples], dtype=np.int64)
+        shard_path = self.output_dir / f"{stem}.npz"
+        save_fn = np.savez_compressed if self.compress else np.savez
+        save_fn(shard_path, **arrays)  # type: ignore[arg-type]
+        meta_path = self.output_dir / (f"{stem}.meta.json.gz" if self.compress else f"{stem}.meta.json")
+        meta_bytes = json.dumps(
+            {"format": SHARD_FORMAT, "version": SHARD_FORMAT_VERSION, "agents": [record for _, _, record in entries]},
+            separators=(",", ":"),
+            default=_json_default,
+        ).encode("utf-8")
+        meta_path.write_bytes(gzip.compress(meta_bytes) if self.compress else meta_bytes)
+        return {
+            "file": shard_path.name,
+            "meta": meta_path.name,
+            "agents": [agent_id for agent_id, _, _ in entries],
+            "steps": int(arrays["step_offsets"][-1]),
+        }
+
+
+def is_shard_index(payload: Any) -> bool:
+    return isinstance(payload, Mapping) and payload.get("format") == SHARD_FORMAT
+
+
+def load_shard_index(index_path: Path) -> list[ShardSampleRef]:
+    """Return a reference for every sample listed in a shard index."""
+
+    payload = json.loads(index_path.read_text())
+    if not is_shard_index(payload):
+        raise ValueError(f"{index_path} is not a rollout shard index")
+    base = index_path.parent
+    return [
+        ShardSampleRef(
+            shard_path=base / str(entry["sample"]),
+            meta_path=base / str(entry["meta"]),
+            index=int(entry["index"]),
+        )
+        for entry in payload.get("samples", [])
+    ]
+
+
+def load_shard_sample(ref: ShardSampleRef) -> ReplaySample:
+    """Load one agent's sample; the shard's arrays are cached across calls."""
+
+    arrays = _read_shard(str(ref.shard_path), ref.shard_path.stat().st_mtime_ns)
+    agents = _read_shard_meta(str(ref.meta_path), ref.meta_path.stat().st_mtime_ns)
+    offsets = arrays["step_offsets"]
+    if not 0 <= ref.index < offsets.shape[0] - 1:
+        raise IndexError(f"shard {ref.shard_path} has no sample {ref.index}")
+    start, stop = int(offsets[ref.index]), int(offsets[ref.index + 1])
+    value_start, value_stop = (int(value) for value in arrays["value_offsets"][ref.index : ref.index + 2])
+    return ReplaySample(
+        map=arrays["map"][start:stop],
+        features=arrays["features"][start:stop],
+        actions=arrays["actions"][start:stop],
+        old_log_probs=arrays["old_log_probs"][start:stop],
+        value_preds=arrays["value_preds"][value_start:value_stop],
+        rewards=arrays["rewards"][start:stop],
+        dones=arrays["dones"][start:stop],
+        metadata=dict(agents[ref.index].get("metadata", {})),
+    )
+
+
+def load_shard_record(ref: ShardSampleRef) -> dict[str, Any]:
+    """Return the per-agent metadata record (ticks, actions) for ``ref``."""
+
+    agents = _read_shard_meta(str(ref.meta_path), ref.meta_path.stat().st_mtime_ns)
+    return dict(agents[ref.index])
+
+
+@lru_cache(maxsize=4)
+def _read_shard(path: str, mtime_ns: int) -> dict[str, np.ndarray]:
+    with np.load(path) as payload:
+        return {name: payload[name] for name in payload.files}
+
+
+@lru_cache(maxsize=4)
+def _read_shard_meta(path: str, mtime_ns: int) -> list[dict[str, Any]]:
+    raw = Path(path).read_bytes()
+    if path.endswith(".gz"):
+        raw = gzip.decompress(raw)
+    payload = json.loads(raw)
+    agents = payload.get("agents") if isinstance(payload, Mapping) else None
+    if not isinstance(agents, list):
+        raise ValueError(f"Rollout shard metadata {path} missing 'agents' list")
+    return agents
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, (set, tuple)):
+        return list(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+__all__ = [
+    "SHARD_FORMAT",
+    "SHARD_FORMAT_VERSION",
+    "ShardSampleRef",
+    "ShardedRolloutWriter",
+    "is_shard_index",
+    "load_shard_index",
+    "load_shard_record",
+    "load_shard_sample",
+]
@@ -7,6 +7,7 @@ import logging
 import warnings
 from collections.abc import Callable, Mapping
 from dataclasses import dataclass
+from pathlib import Path
 from typing import TYPE_CHECKING, Any, cast
 
 import numpy as np
@@ -15,19 +16,18 @@ from townlet.config import SimulationConfig
 from townlet.policy.behavior import AgentIntent, BehaviorController, build_behavior
 from townlet.policy.behavior_bridge import BehaviorBridge
 from townlet.utils.coerce import coerce_float, coerce_int
-from townlet.policy.models import (
-    ConflictAwarePolicyConfig,
-    ConflictAwarePolicyNetwork,
-    TorchNotAvailableError,
-    torch_available,
-)
+from townlet.utils.optional import module_available
 from townlet.policy.trajectory_service import TrajectoryService
 from townlet.world.grid import WorldState
 
 from .dto_view import DTOQueueManagerView, DTORelationshipView, DTOWorldView
 
 if TYPE_CHECKING:  # pragma: no cover
+    from torch.jit import ScriptModule
+
     from townlet.dto.observations import ObservationEnvelope
+    from townlet.policy.inference import InferenceArtifact
+    from townlet.policy.models import ConflictAwarePolicyNetwork
 
 # NOTE: Training orchestrator is imported lazily by TrainingHarness to avoid
 # importing Torch-dependent modules during test collection in non-ML envs.
@@ -107,15 +107,19 @@ class PolicyRuntime:
         self._tick: int = 0
         self._action_lookup: dict[str, int] = {}
         self._action_inverse: dict[int, str] = {}
-        self._policy_net: ConflictAwarePolicyNetwork | None = None
+        self._policy_net: ConflictAwarePolicyNetwork | ScriptModule | None = None
         self._policy_map_shape: tuple[int, int, int] | None = None
         self._policy_feature_dim: int | None = None
         self._policy_action_dim: int = 0
         self._latest_policy_snapshot: dict[str, dict[str, object]] = {}
         policy_cfg = getattr(config, "policy_runtime", None)
         commit_ticks = 15
+        self._inference_artifact_path: Path | None = None
         if policy_cfg is not None:
             commit_ticks = int(getattr(policy_cfg, "option_commit_ticks", commit_ticks))
+            self._inference_artifact_path = getattr(policy_cfg, "inference_artifact", None)
+        self._inference_artifact: InferenceArtifact | None = None
+        self._inference_artifact_failed = False
         option_commit_ticks = max(commit_ticks, 0)
         self._behavior_bridge = BehaviorBridge(
             behavior=behavior_controller,
@@ -208,6 +212,11 @@ class PolicyRuntime:
         self._tick = tick
         self._trajectory_service.begin_tick(tick)
         actions: dict[str, object] = {}
+        planned = self._behavior_bridge.plan_intents(
+            world,
+            [agent_id for agent_id in world.agents if not self._behavior_bridge.is_possessed(agent_id)],
+            dto_world=dto_world,
+        )
         for agent_id in world.agents:
             if self._behavior_bridge.is_possessed(agent_id):
                 actions[agent_id] = {"kind": "wait"}
@@ -226,6 +235,7 @@ class PolicyRuntime:
                 tick=tick,
                 guardrail_fn=_guard,
                 dto_world=dto_world,
+                scripted=planned.get(agent_id),
             )
             if selected_intent.kind == "wait":
                 wait_payload: dict[str, object] = {"kind": "wait"}
@@ -442,7 +452,7 @@ class PolicyRuntime:
         self._behavior_bridge.reset_state()
 
     def _annotate_with_policy_outputs(self, frame: dict[str, object]) -> None:
-        if not torch_available():  # pragma: no cover - torch optional
+        if not module_available("torch"):  # pragma: no cover - torch optional
             frame.setdefault("log_prob", 0.0)
             frame.setdefault("value_pred", 0.0)
             return
@@ -561,7 +571,7 @@ class PolicyRuntime:
         feature_dim: int,
         action_dim: int,
     ) -> bool:
-        if not torch_available():  # pragma: no cover - torch optional
+        if not module_available("torch"):  # pragma: no cover - torch optional
             return False
 
         rebuild = False
@@ -575,29 +585,75 @@ class PolicyRuntime:
             rebuild = True
 
         if rebuild:
-            try:
-                import torch
+            from townlet.policy.models import TorchNotAvailableError
 
-                torch.manual_seed(0)
-                policy = self._build_policy_network(
-                    feature_dim=feature_dim,
-                    map_shape=map_shape,
-                    action_dim=action_dim,
-                )
-            except TorchNotAvailableError:  # pragma: no cover - guard
-                return False
+            artifact = self._load_inference_artifact()
+            policy: ConflictAwarePolicyNetwork | ScriptModule
+            if artifact is not None and artifact.signature.accepts(map_shape, feature_dim, action_dim):
+                policy = artifact.module
+            else:
+                if artifact is not None:
+                    logger.warning(
+                        "policy_inference_artifact_mismatch path=%s expected=%s/%d/%d observed=%s/%d/%d; using eager network",
+                        self._inference_artifact_path,
+                        artifact.signature.map_shape,
+                        artifact.signature.feature_dim,
+                        artifact.signature.action_dim,
+                        tuple(map_shape),
+                        feature_dim,
+                        action_dim,
+                    )
+                try:
+                    import torch
+
+                    torch.manual_seed(0)
+                    policy = self._build_policy_network(
+                        feature_dim=feature_dim,
+                        map_shape=map_shape,
+                        action_dim=action_dim,
+                    )
+                except TorchNotAvailableError:  # pragma: no cover - guard
+                    return False
             self._policy_net = policy
             self._policy_map_shape = map_shape
             self._policy_feature_dim = feature_dim
             self._policy_action_dim = action_dim
         return self._policy_net is not None
 
+    def _load_inference_artifact(self) -> InferenceArtifact | None:
+        """Load the configured inference artifact once; failures fall back to eager."""
+
+        if self._inference_artifact is not None or self._inference_artifact_failed:
+            return self._inference_artifact
+        if self._inference_artifact_path is None:
+            return None
+        from townlet.policy.inference import load_inference_artifact
+
+        try:
+            self._inference_artifact = load_inference_artifact(Path(self._inference_artifact_path))
+        except (OSError, RuntimeError, ValueError) as exc:
+            self._inference_artifact_failed = True
+            logger.warning(
+                "policy_inference_artifact_unavailable path=%s error=%s; using eager network",
+                self._inference_artifact_path,
+                exc,
+            )
+            return None
+        logger.info(
+            "policy_inference_artifact_loaded path=%s quantized=%s",
+            self._inference_artifact_path,
+            self._inference_artifact.signature.quantized,
+        )
+        return self._inference_artifact
+
     def _build_policy_network(
         self,
         feature_dim: int,
         map_shape: tuple[int, int, int],
         action_dim: int,
     ) -> ConflictAwarePolicyNetwork:
+        from townlet.policy.models import ConflictAwarePolicyConfig, ConflictAwarePolicyNetwork
+
         config = ConflictAwarePolicyConfig(
             feature_dim=feature_dim,
             map_shape=map_shape,
@@ -0,0 +1,262 @@
+"""Local multi-process data-parallel training (``torch.distributed``, gloo).
+
+When ``training.distributed.world_size`` is greater than one, the training
+orchestrators launch that many worker processes on this host instead of
+training in-process. Each worker builds the same policy (parameters are
+broadcast from rank 0), trains on its own shard of the replay batches, and
+averages gradients with the other ranks before every optimiser step, so all
+ranks hold identical weights throughout.
+
+Only rank 0 prints, writes the JSONL training log and reports its result back
+to the launching process; epoch summaries are reduced across ranks first.
+Checkpointing and promotion stay with the caller, exactly as for in-process
+training.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import pickle
+import socket
+import tempfile
+from collections.abc import Iterable, Mapping
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Literal
+
+if TYPE_CHECKING:
+    import torch
+
+    from townlet.config import SimulationConfig
+    from townlet.policy.replay import ReplayBatch
+
+logger = logging.getLogger(__name__)
+
+TrainingKind = Literal["ppo", "bc"]
+
+_SUM_KEYS = frozenset({"updates", "transitions", "clip_triggered_minibatches", "adv_zero_std_batches"})
+_MAX_KEYS = frozenset({"grad_norm_max", "kl_divergence_max", "clip_fraction_max", "epoch_duration_sec"})
+_MIN_KEYS = frozenset({"adv_min_std"})
+
+
+def current_group() -> tuple[int, int] | None:
+    """Return ``(rank, world_size)`` when a process group is active."""
+
+    try:
+        import torch.distributed as dist
+    except ImportError:  # pragma: no cover - torch optional
+        return None
+    if not dist.is_available() or not dist.is_initialized():
+        return None
+    return dist.get_rank(), dist.get_world_size()
+
+
+def is_main_process() -> bool:
+    group = current_group()
+    return group is None or group[0] == 0
+
+
+def shard_batches(dataset: Any) -> list[ReplayBatch]:
+    """Materialise this rank's share of ``dataset``'s batches.
+
+    Batches are dealt round-robin; every rank must receive at least one.
+    """
+
+    group = current_group()
+    if group is None:
+        return list(dataset)
+    rank, world_size = group
+    if len(dataset) < world_size:
+        raise ValueError(
+            f"Replay dataset has {len(dataset)} batch(es); distributed training needs at least world_size={world_size}"
+        )
+    return list(dataset.iter_shard(rank, world_size))
+
+
+def broadcast_parameters(module: torch.nn.Module) -> None:
+    """Copy rank 0's parameters and buffers to every rank."""
+
+    if current_group() is None:
+        return
+    import torch.distributed as dist
+
+    for tensor in [*module.parameters(), *module.buffers()]:
+        dist.broadcast(tensor.data, src=0)
+
+
+def all_reduce_gradients(parameters: Iterable[torch.nn.Parameter]) -> None:
+    """Average gradients across ranks through one flattened buffer."""
+
+    group = current_group()
+    if group is None:
+        return
+    import torch
+    import torch.distributed as dist
+
+    params = [param for param in parameters if param.requires_grad]
+    if not params:
+        return
+    grads = [param.grad if param.grad is not None else torch.zeros_like(param) for param in params]
+    flat = torch.cat([grad.reshape(-1) for grad in grads])
+    dist.all_reduce(flat, op=dist.ReduceOp.SUM)
+    flat.div_(group[1])
+    offset = 0
+    for param in params:
+        count = param.numel()
+        param.grad = flat[offset : offset + count].view_as(param).clone()
+        offset += count
+
+
+def reduce_int(value: int, op: Literal["sum", "max"]) -> int:
+    """Reduce an integer across ranks (identity outside a process group)."""
+
+    if current_group() is None:
+        return int(value)
+    import torch
+    import torch.distributed as dist
+
+    tensor = torch.tensor([int(value)], dtype=torch.int64)
+    dist.all_reduce(tensor, op=dist.ReduceOp.SUM if op == "sum" else dist.ReduceOp.MAX)
+    return int(tensor.item())
+
+
+def reduce_float(value: float) -> float:
+    """Sum a float across ranks (identity outside a process group)."""
+
+    if current_group() is None:
+        return float(value)
+    import torch
+    import torch.distributed as dist
+
+    tensor = torch.tensor([float(value)], dtype=torch.float64)
+    dist.all_reduce(tensor, op=dist.ReduceOp.SUM)
+    return float(tensor.item())
+
+
+def reduce_epoch_summary(summary: Mapping[str, Any], *, cumulative_steps: int) -> dict[str, Any]:
+    """Combine per-rank PPO epoch summaries into one.
+
+    Counters are summed, ``*_max`` fields take the maximum, the minimum
+    advantage std takes the minimum and the remaining numeric fields are
+    averaged; non-numeric fields come from rank 0. ``steps`` is recomputed
+    from the combined transition count.
+    """
+
+    if current_group() is None:
+        return dict(summary)
+    import torch.distributed as dist
+
+    gathered: list[Mapping[str, Any] | None] = [None] * dist.get_world_size()
+    dist.all_gather_object(gathered, dict(summary))
+    summaries = [entry for entry in gathered if entry is not None]
+    reduced: dict[str, Any] = dict(summaries[0])
+    for key, value in summaries[0].items():
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            continue
+        values = [float(entry[key]) for entry in summaries if isinstance(entry.get(key), (int, float))]
+        if key in _SUM_KEYS:
+            reduced[key] = float(sum(values))
+        elif key in _MAX_KEYS:
+            reduced[key] = float(max(values))
+        elif key in _MIN_KEYS:
+            reduced[key] = float(min(values))
+        else:
+            reduced[key] = float(sum(values) / len(values))
+    if "transitions" in reduced:
+        reduced["steps"] = float(cumulative_steps + reduced["transitions"])
+    return reduced
+
+
+def run_distributed(
+    config: SimulationConfig,
+    kind: TrainingKind,
+    *,
+    metadata: Mapping[str, Any] | None = None,
+    **kwargs: Any,
+) -> tuple[dict[str, Any], dict[str, Any], str | None]:
+    """Train with ``config.training.distributed.world_size`` local workers.
+
+    Returns rank 0's result (``model_dump`` of the strategy DTO), its updated
+    context metadata and the social reward stage it applied.
+    """
+
+    from townlet.policy.models import TorchNotAvailableError, torch_available
+
+    if not torch_available():
+        raise TorchNotAvailableError("PyTorch is required for distributed training")
+    import torch.multiprocessing as mp
+
+    settings = config.training.distributed
+    port = settings.master_port or _free_port(settings.master_addr)
+    threads = settings.threads_per_rank or max(1, (os.cpu_count() or 1) // settings.world_size)
+    with tempfile.TemporaryDirectory(prefix="townlet-dist-") as tmp:
+        result_path = Path(tmp) / "rank0.pkl"
+        spec = {
+            "config": config,
+            "kind": kind,
+            "metadata": dict(metadata or {}),
+            "kwargs": kwargs,
+            "init_method": f"tcp://{settings.master_addr}:{port}",
+            "backend": settings.backend,
+            "world_size": settings.world_size,
+            "threads": threads,
+            "result_path": str(result_path),
+        }
+        logger.info("distributed_training_start kind=%s world_size=%d port=%d", kind, settings.world_size, port)
+        mp.start_processes(  # type: ignore[attr-defined,no-untyped-call]
+            _worker, args=(spec,), nprocs=settings.world_size, join=True, start_method="spawn"
+        )
+        with result_path.open("rb") as handle:
+            result, updated_metadata, stage = pickle.load(handle)
+    return result, updated_metadata, stage
+
+
+def _worker(rank: int, spec: dict[str, Any]) -> None:
+    import torch
+    import torch.distributed as dist
+
+    from townlet.policy.training.contexts import TrainingContext
+    from townlet.policy.training.strategies import BCStrategy, PPOStrategy
+
+    torch.set_num_threads(int(spec["threads"]))
+    dist.init_process_group(
+        backend=spec["backend"],
+        init_method=spec["init_method"],
+        rank=rank,
+        world_size=int(spec["world_size"]),
+    )
+    try:
+        torch.manual_seed(torch.initial_seed() + rank)
+        config = spec["config"]
+        context = TrainingContext.from_config(config)
+        context.metadata.update(spec["metadata"])
+        if spec["kind"] == "ppo":
+            dto: Any = PPOStrategy().run(context, **spec["kwargs"])
+        else:
+            dto = BCStrategy().run(context)
+        if rank == 0:
+            stage = getattr(config.features.stages, "social_rewards", None)
+            with Path(spec["result_path"]).open("wb") as handle:
+                pickle.dump((dto.model_dump(), dict(context.metadata), stage), handle)
+        dist.barrier()
+    finally:
+        dist.destroy_process_group()
+
+
+def _free_port(host: str) -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind((host, 0))
+        return int(sock.getsockname()[1])
+
+
+__all__ = [
+    "all_reduce_gradients",
+    "broadcast_parameters",
+    "current_group",
+    "is_main_process",
+    "reduce_epoch_summary",
+    "reduce_float",
+    "reduce_int",
+    "run_distributed",
+    "shard_batches",
+]
@@ -11,7 +11,7 @@ PolicyTrainingOrchestrator with a clean strategy-based architecture.
 from __future__ import annotations
 
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Literal
 
 if TYPE_CHECKING:
     from townlet.config import SimulationConfig
@@ -72,6 +72,10 @@ class TrainingOrchestrator:
             self.config.training.bc.manifest = manifest
 
         try:
+            if self._launch_distributed():
+                from townlet.dto.policy import BCTrainingResultDTO
+
+                return BCTrainingResultDTO.model_validate(self._run_distributed("bc"))
             strategy = BCStrategy()
             return strategy.run(self.context)
         finally:
@@ -105,6 +109,21 @@ class TrainingOrchestrator:
         """
         from townlet.policy.training.strategies import PPOStrategy
 
+        if self._launch_distributed():
+            from townlet.dto.policy import PPOTrainingResultDTO
+
+            result = self._run_distributed(
+                "ppo",
+                dataset_config=dataset_config,
+                in_memory_dataset=in_memory_dataset,
+                epochs=epochs,
+                log_path=log_path,
+                log_frequency=log_frequency,
+                max_log_entries=max_log_entries,
+                device_str=device_str,
+            )
+            return PPOTrainingResultDTO.model_validate(result)
+
         strategy = PPOStrategy()
         return strategy.run(
             self.context,
@@ -181,8 +200,6 @@ class TrainingOrchestrator:
         Returns:
             PPO training result with losses and metrics.
         """
-        from townlet.policy.training.strategies import PPOStrategy
-
         # Get next cycle_id and apply social reward stage before capture
         # This matches old orchestrator behavior (training_orchestrator.py:214-215)
         next_cycle = int(self.context.metadata.get("cycle_id", -1)) + 1
@@ -201,9 +218,7 @@ class TrainingOrchestrator:
         dataset = buffer.build_dataset(batch_size=batch_size)
 
         # Run PPO on captured data
-        strategy = PPOStrategy()
-        return strategy.run(
-            self.context,
+        return self.run_ppo(
             dataset_config=None,
             in_memory_dataset=dataset,
             epochs=epochs,
@@ -212,6 +227,24 @@ class TrainingOrchestrator:
             max_log_entries=max_log_entries,
         )
 
+    def _launch_distributed(self) -> bool:
+        """Whether to train in worker processes rather than in-process."""
+        from townlet.policy.training import distributed
+
+        return self.config.training.distributed.enabled and distributed.current_group() is None
+
+    def _run_distributed(self, kind: Literal["ppo", "bc"], **kwargs: object) -> dict[str, object]:
+        """Train in local worker processes and adopt rank 0's context state."""
+        from townlet.policy.training import distributed
+
+        result, metadata, stage = distributed.run_distributed(
+            self.config, kind, metadata=self.context.metadata, **kwargs
+        )
+        self.context.metadata.update(metadata)
+        if stage is not None:
+            setattr(self.config.features.stages, "social_rewards", stage)  # noqa: B010
+        return result
+
     def _select_social_reward_stage(self, cycle_id: int) -> str | None:
         """Select social reward stage from schedule based on cycle_id.
 
@@ -13,7 +13,7 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from townlet.config import SimulationConfig
-    from townlet.policy.replay import ReplayBatch, ReplayDataset, ReplayDatasetConfig, ReplaySample
+    from townlet.policy.replay import ReplayBatch, ReplayDataset, ReplayDatasetConfig, ReplayEntry, ReplaySample
 
 # Default manifest location (relative to repo root)
 DEFAULT_REPLAY_MANIFEST = Path("docs/samples/replay_manifest.json")
@@ -124,7 +124,7 @@ class ReplayDatasetService:
         Raises:
             ValueError: If no pairs provided.
         """
-        entries = list(pairs)
+        entries: list[ReplayEntry] = list(pairs)
         if not entries:
             raise ValueError("Replay batch requires at least one entry")
 
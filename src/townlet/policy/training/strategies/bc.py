@@ -10,6 +10,7 @@ RL fine-tuning. This strategy is used standalone or as part of anneal schedules.
 from __future__ import annotations
 
 import time
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -45,7 +46,7 @@ class BCStrategy:
             ValueError: If BC manifest is not configured or invalid.
         """
         from townlet.dto.policy import BCTrainingResultDTO
-        from townlet.policy.bc import BCTrainer, BCTrajectoryDataset, load_bc_samples
+        from townlet.policy.bc import BCTrainer, load_bc_dataset
         from townlet.policy.bc import BCTrainingConfig as BCTrainingParams
         from townlet.policy.models import (
             ConflictAwarePolicyConfig,
@@ -71,9 +72,8 @@ class BCStrategy:
                 "Configure training.bc.manifest in your config."
             )
 
-        # Load BC dataset
-        samples = load_bc_samples(manifest_path)
-        dataset = BCTrajectoryDataset(samples)
+        # Load BC dataset (a BC store index streams from memory-mapped frames)
+        dataset = load_bc_dataset(Path(manifest_path))
 
         # Build training parameters
         params = BCTrainingParams(
@@ -82,6 +82,9 @@ class BCStrategy:
             epochs=bc_settings.epochs,
             weight_decay=bc_settings.weight_decay,
             device=bc_settings.device,
+            num_workers=bc_settings.num_workers,
+            sampling=bc_settings.sampling,
+            block_size=bc_settings.block_size,
         )
 
         # Build policy config
@@ -11,16 +11,14 @@ within anneal schedules.
 from __future__ import annotations
 
 import math
-import statistics
 import time
 from typing import TYPE_CHECKING
 
-import numpy as np
-
 if TYPE_CHECKING:
     from pathlib import Path
 
     from townlet.dto.policy import PPOTrainingResultDTO
+    from townlet.policy.backends.pytorch.ppo_data import PPODataPipeline
     from townlet.policy.replay import ReplayBatch, ReplayDataset
     from townlet.policy.replay_buffer import InMemoryReplayDataset
     from townlet.policy.training.contexts import TrainingContext
@@ -91,6 +89,8 @@ class PPOStrategy:
 
         import torch
 
+        from townlet.policy.training import distributed
+
         start_time = time.perf_counter()
 
         # Resolve dataset
@@ -111,7 +111,8 @@ class PPOStrategy:
         if len(dataset) == 0:
             raise ValueError("Replay dataset yielded no batches")
 
-        batches: list[ReplayBatch] = list(dataset)
+        # Under a distributed process group each rank trains on its own shard.
+        batches: list[ReplayBatch] = distributed.shard_batches(dataset)
         if not batches:
             raise ValueError("Replay dataset yielded no batches")
 
@@ -122,7 +123,7 @@ class PPOStrategy:
         if map_shape is None:
             raise ValueError("Replay batch missing map shape metadata")
         action_dim_meta = example.metadata.get("action_dim")
-        max_action = max(int(batch.actions.max()) for batch in batches)
+        max_action = distributed.reduce_int(max(int(batch.actions.max()) for batch in batches), "max")
         action_dim = int(action_dim_meta) if action_dim_meta is not None else max_action + 1
         if action_dim <= 0:
             raise ValueError("Derived action_dim must be positive")
@@ -142,6 +143,7 @@ class PPOStrategy:
         policy = self._build_policy_network(feature_dim, map_shape, action_dim)
         policy.train()
         policy.to(device)
+        distributed.broadcast_parameters(policy)
 
         # Create optimizer
         optimizer = torch.optim.Adam(policy.parameters(), lr=ppo_cfg.learning_rate)
@@ -150,6 +152,32 @@ class PPOStrategy:
         # Dataset label for logging
         dataset_label_str = self._get_dataset_label(dataset, dataset_config)
 
+        # Convert batches and compute advantages/returns once for the whole cycle;
+        # they depend only on the stored rollouts, not on the updated policy.
+        from townlet.policy.backends.pytorch.ppo_data import PPODataPipeline
+
+        pipeline = PPODataPipeline(
+            batches,
+            device=device,
+            gamma=ppo_cfg.gamma,
+            gae_lambda=ppo_cfg.gae_lambda,
+            advantage_normalization=ppo_cfg.advantage_normalization,
+            mini_batch_size=ppo_cfg.mini_batch_size,
+            num_mini_batches=ppo_cfg.num_mini_batches,
+            prefetch=ppo_cfg.prefetch_minibatches,
+        )
+        # Ranks must perform the same number of gradient all-reduces per epoch.
+        min_updates = distributed.reduce_int(pipeline.planned_updates, "max")
+        conflict_acc: dict[str, float] = {}
+        advantage_health = {"adv_zero_std_batches": 0.0, "min_adv_std": math.inf}
+        for batch, tensors in zip(batches, pipeline.batches, strict=True):
+            for key, value in self._summarize_batch(batch, tensors.batch_index).items():
+                if key.startswith("conflict."):
+                    conflict_acc[key] = conflict_acc.get(key, 0.0) + value
+            self._ensure_finite("advantages", tensors.advantages, tensors.batch_index, dataset_label_str)
+            self._ensure_finite("returns", tensors.returns, tensors.batch_index, dataset_label_str)
+            self._update_advantage_health(tensors.advantages, tensors.batch_index, advantage_health)
+
         # Training state
         data_mode, rollout_ticks = self._get_data_mode(
             dataset, in_memory_dataset, dataset_config
@@ -191,11 +219,11 @@ class PPOStrategy:
 
             epoch_result = self._train_epoch(
                 epoch=epoch,
-                batches=batches,
+                pipeline=pipeline,
+                min_updates=min_updates,
                 policy=policy,
                 optimizer=optimizer,
                 generator=generator,
-                device=device,
                 ppo_cfg=ppo_cfg,
                 dataset_label_str=dataset_label_str,
                 cycle_id=cycle_id,
@@ -206,17 +234,22 @@ class PPOStrategy:
                 log_stream_offset=log_stream_offset,
                 dataset=dataset,
                 cumulative_steps=cumulative_steps,
+                conflict_acc=conflict_acc,
+                advantage_health=advantage_health,
             )
 
+            epoch_result["epoch_duration_sec"] = float(time.perf_counter() - epoch_start)
+            epoch_result = distributed.reduce_epoch_summary(epoch_result, cumulative_steps=cumulative_steps)
+
             # Update cumulative steps with transitions processed in this epoch
             cumulative_steps += int(epoch_result["transitions"])
 
-            epoch_result["epoch_duration_sec"] = float(time.perf_counter() - epoch_start)
-
-            print(f"PPO epoch {epoch + 1}:", epoch_result)
+            main_process = distributed.is_main_process()
+            if main_process:
+                print(f"PPO epoch {epoch + 1}:", epoch_result)
 
             # Logging
-            if log_path is not None and (epoch + 1) % log_frequency == 0:
+            if main_process and log_path is not None and (epoch + 1) % log_frequency == 0:
                 if log_handle is None:
                     log_handle = self._open_log(log_path)
 
@@ -427,11 +460,11 @@ class PPOStrategy:
         self,
         *,
         epoch: int,
-        batches: list[ReplayBatch],
+        pipeline: PPODataPipeline,
+        min_updates: int,
         policy: object,
         optimizer: object,
         generator: object,
-        device: object,
         ppo_cfg: object,
         dataset_label_str: str,
         cycle_id: int,
@@ -442,6 +475,8 @@ class PPOStrategy:
         log_stream_offset: int,
         dataset: object,
         cumulative_steps: int,
+        conflict_acc: dict[str, float],
+        advantage_health: dict[str, float],
     ) -> dict[str, float]:
         """Train single epoch and return metrics."""
         import torch
@@ -450,197 +485,119 @@ class PPOStrategy:
 
         # Import PPO ops
         from townlet.policy.backends.pytorch import ppo_utils as ops
+        from townlet.policy.training import distributed
 
-        conflict_acc: dict[str, float] = {}
-        metrics = {
-            "policy_loss": 0.0,
-            "value_loss": 0.0,
-            "entropy": 0.0,
-            "total_loss": 0.0,
-            "clip_frac": 0.0,
-            "adv_mean": 0.0,
-            "adv_std": 0.0,
-            "grad_norm": 0.0,
-            "kl_divergence": 0.0,
-        }
-        mini_batch_updates = 0
+        # Per-update statistics stay on device until the epoch ends so the
+        # update loop never synchronises on ``.item()``.
+        update_stats: list[torch.Tensor] = []
+        update_batches: list[int] = []
+        real_updates = 0
         transitions_processed = 0
 
-        entropy_values: list[float] = []
-        grad_norm_max = 0.0
-        kl_max = 0.0
-        reward_buffer: list[float] = []
-        advantage_buffer: list[float] = []
-        health_tracking = {
-            "adv_zero_std_batches": 0.0,
-            "clip_triggered_minibatches": 0.0,
-            "max_clip_fraction": 0.0,
-            "min_adv_std": math.inf,
-        }
-
-        for batch_index, batch in enumerate(batches, start=1):
-            # Summarize batch
-            batch_summary = self._summarize_batch(batch, batch_index)
-            for key, value in batch_summary.items():
-                if key.startswith("conflict."):
-                    conflict_acc[key] = conflict_acc.get(key, 0.0) + value
-
-            # Convert to tensors
-            maps = torch.from_numpy(batch.maps).float().to(device, non_blocking=True)
-            features = torch.from_numpy(batch.features).float().to(device, non_blocking=True)
-            actions = torch.from_numpy(batch.actions).long().to(device, non_blocking=True)
-            old_log_probs = torch.from_numpy(batch.old_log_probs).float().to(device, non_blocking=True)
-            rewards = torch.from_numpy(batch.rewards).float().to(device, non_blocking=True)
-            dones = torch.from_numpy(batch.dones.astype(np.float32)).float().to(device, non_blocking=True)
-            value_preds_old = torch.from_numpy(batch.value_preds).float().to(device, non_blocking=True)
-
-            # Compute GAE
-            gae = ops.compute_gae(
-                rewards=rewards,
-                value_preds=value_preds_old,
-                dones=dones,
-                gamma=ppo_cfg.gamma,
-                gae_lambda=ppo_cfg.gae_lambda,
+        for minibatch in pipeline.iter_minibatches(generator, min_updates=min_updates):
+            logits, values = policy(minibatch.maps, minibatch.features)
+            dist = Categorical(logits=logits)
+            new_log_probs = dist.log_prob(minibatch.actions)
+            entropy = dist.entropy().mean()
+
+            policy_loss, clip_frac = ops.policy_surrogate(
+                new_log_probs=new_log_probs,
+                old_log_probs=minibatch.old_log_probs,
+                advantages=minibatch.advantages,
+                clip_param=ppo_cfg.clip_param,
             )
-            advantages = gae.advantages
-            returns = gae.returns
-
-            if ppo_cfg.advantage_normalization:
-                advantages = ops.normalize_advantages(advantages.view(-1)).view_as(advantages)
-
-            flat_advantages = advantages.reshape(-1)
-            flat_returns = returns.reshape(-1)
-
-            # Validate finite values
-            self._ensure_finite("advantages", flat_advantages, batch_index, dataset_label_str)
-            self._ensure_finite("returns", flat_returns, batch_index, dataset_label_str)
-            self._update_advantage_health(flat_advantages, batch_index, health_tracking)
-
-            reward_buffer.extend(batch.rewards.astype(float).reshape(-1).tolist())
-            advantage_buffer.extend(advantages.cpu().numpy().astype(float).reshape(-1).tolist())
-
-            # Flatten batch for mini-batching
-            batch_size, timestep_length = rewards.shape
-            baseline = ops.value_baseline_from_old_preds(value_preds_old, timestep_length)
-            flat_maps = maps.reshape(batch_size * timestep_length, *maps.shape[2:])
-            flat_features = features.reshape(batch_size * timestep_length, features.shape[2])
-            flat_actions = actions.reshape(-1)
-            flat_old_log_probs = old_log_probs.reshape(-1)
-            flat_old_values = baseline.reshape(-1)
-
-            total_transitions = flat_actions.shape[0]
-            desired_batches = min(ppo_cfg.num_mini_batches, total_transitions)
-            mini_batch_size = min(
-                ppo_cfg.mini_batch_size,
-                max(1, total_transitions // desired_batches),
+            value_loss = ops.clipped_value_loss(
+                new_values=values,
+                returns=minibatch.returns,
+                old_values=minibatch.old_values,
+                value_clip=ppo_cfg.value_clip,
             )
-            if mini_batch_size <= 0:
-                mini_batch_size = 1
 
-            perm = torch.randperm(
-                total_transitions,
-                device=flat_actions.device,
-                generator=generator,
-            )
+            total_loss = policy_loss + ppo_cfg.value_loss_coef * value_loss - ppo_cfg.entropy_coef * entropy
+
+            optimizer.zero_grad()
+            total_loss.backward()
+            distributed.all_reduce_gradients(policy.parameters())
 
-            # Mini-batch updates
-            for start in range(0, total_transitions, mini_batch_size):
-                idx = perm[start : start + mini_batch_size]
-                mb_maps = flat_maps[idx]
-                mb_features = flat_features[idx]
-                mb_actions = flat_actions[idx]
-                mb_old_log_probs = flat_old_log_probs[idx]
-                mb_advantages = flat_advantages[idx]
-                mb_returns = flat_returns[idx]
-                mb_old_values = flat_old_values[idx]
-
-                logits, values = policy(mb_maps, mb_features)
-                dist = Categorical(logits=logits)
-                new_log_probs = dist.log_prob(mb_actions)
-                entropy = dist.entropy().mean()
-
-                policy_loss, clip_frac = ops.policy_surrogate(
-                    new_log_probs=new_log_probs,
-                    old_log_probs=mb_old_log_probs,
-                    advantages=mb_advantages,
-                    clip_param=ppo_cfg.clip_param,
+            if ppo_cfg.max_grad_norm > 0.0:
+                grad_norm = clip_grad_norm_(
+                    policy.parameters(),
+                    ppo_cfg.max_grad_norm,
                 )
-                value_loss = ops.clipped_value_loss(
-                    new_values=values,
-                    returns=mb_returns,
-                    old_values=mb_old_values,
-                    value_clip=ppo_cfg.value_clip,
+            else:
+                sq_sum = 0.0
+                for param in policy.parameters():
+                    if param.grad is not None:
+                        sq_sum += float(torch.sum(param.grad.detach() ** 2).item())
+                grad_norm = torch.tensor(sq_sum**0.5)
+
+            optimizer.step()
+
+            update_stats.append(
+                torch.stack(
+                    [
+                        policy_loss.detach(),
+                        value_loss.detach(),
+                        entropy.detach(),
+                        total_loss.detach(),
+                        clip_frac.detach(),
+                        minibatch.advantages.mean(),
+                        minibatch.advantages.std(unbiased=False),
+                        grad_norm.detach().to(policy_loss.device, policy_loss.dtype),
+                        torch.mean(minibatch.old_log_probs - new_log_probs.detach()),
+                    ]
                 )
+            )
+            update_batches.append(minibatch.batch_index)
+            if not minibatch.padding:
+                real_updates += 1
+                transitions_processed += minibatch.size
 
-                total_loss = policy_loss + ppo_cfg.value_loss_coef * value_loss - ppo_cfg.entropy_coef * entropy
-
-                optimizer.zero_grad()
-                total_loss.backward()
-
-                if ppo_cfg.max_grad_norm > 0.0:
-                    grad_norm = clip_grad_norm_(
-                        policy.parameters(),
-                        ppo_cfg.max_grad_norm,
-                    ).item()
-                else:
-                    sq_sum = 0.0
-                    for param in policy.parameters():
-                        if param.grad is not None:
-                            sq_sum += float(torch.sum(param.grad.detach() ** 2).item())
-                    grad_norm = float(sq_sum**0.5)
-
-                optimizer.step()
-
-                # Accumulate metrics
-                metrics["policy_loss"] += float(policy_loss.item())
-                metrics["value_loss"] += float(value_loss.item())
-                entropy_value = float(entropy.item())
-                metrics["entropy"] += entropy_value
-                entropy_values.append(entropy_value)
-                metrics["total_loss"] += float(total_loss.item())
-                clip_value = float(clip_frac.item())
-                metrics["clip_frac"] += clip_value
-                metrics["adv_mean"] += float(mb_advantages.mean().item())
-                batch_adv_std = float(mb_advantages.std(unbiased=False).item())
-                if math.isnan(batch_adv_std) or math.isinf(batch_adv_std):
-                    raise ValueError(
-                        f"PPO mini-batch advantages produced invalid std "
-                        f"(dataset={dataset_label_str}, batch={batch_index})"
-                    )
-                metrics["adv_std"] += batch_adv_std
-                metrics["grad_norm"] += float(grad_norm)
-                kl_value = float(torch.mean(mb_old_log_probs - new_log_probs).item())
-                metrics["kl_divergence"] += kl_value
-                grad_norm_max = max(grad_norm_max, float(grad_norm))
-                kl_max = max(kl_max, abs(kl_value))
-                if clip_value > 0.0:
-                    health_tracking["clip_triggered_minibatches"] += 1.0
-                health_tracking["max_clip_fraction"] = max(health_tracking["max_clip_fraction"], clip_value)
-                mini_batch_updates += 1
-                transitions_processed += int(idx.shape[0])
-
+        mini_batch_updates = len(update_stats)
         if mini_batch_updates == 0:
             raise ValueError("No PPO mini-batch updates were performed")
 
+        stats = torch.stack(update_stats).double().cpu()
+        (
+            policy_losses,
+            value_losses,
+            entropies,
+            total_losses,
+            clip_fracs,
+            adv_means,
+            adv_stds,
+            grad_norms,
+            kl_values,
+        ) = stats.unbind(dim=1)
+        invalid_std = ~torch.isfinite(adv_stds)
+        if bool(invalid_std.any()):
+            batch_index = update_batches[int(torch.nonzero(invalid_std)[0, 0])]
+            raise ValueError(
+                f"PPO mini-batch advantages produced invalid std "
+                f"(dataset={dataset_label_str}, batch={batch_index})"
+            )
+
         # Average metrics
-        averaged_metrics = {key: value / mini_batch_updates for key, value in metrics.items()}
+        averaged_metrics = {
+            "policy_loss": float(policy_losses.mean()),
+            "value_loss": float(value_losses.mean()),
+            "entropy": float(entropies.mean()),
+            "total_loss": float(total_losses.mean()),
+            "clip_frac": float(clip_fracs.mean()),
+            "adv_mean": float(adv_means.mean()),
+            "adv_std": float(adv_stds.mean()),
+            "grad_norm": float(grad_norms.mean()),
+            "kl_divergence": float(kl_values.mean()),
+        }
 
         # Compute additional stats
-        if entropy_values:
-            epoch_entropy_mean = statistics.fmean(entropy_values)
-            epoch_entropy_std = statistics.pstdev(entropy_values) if len(entropy_values) > 1 else 0.0
-        else:
-            epoch_entropy_mean = 0.0
-            epoch_entropy_std = 0.0
-
-        reward_adv_corr = 0.0
-        if reward_buffer and advantage_buffer:
-            reward_arr = np.asarray(reward_buffer, dtype=np.float64)
-            adv_arr = np.asarray(advantage_buffer, dtype=np.float64)
-            reward_std = reward_arr.std(ddof=0)
-            adv_std = adv_arr.std(ddof=0)
-            if reward_std > 0 and adv_std > 0:
-                reward_adv_corr = float(np.corrcoef(reward_arr, adv_arr)[0, 1])
+        epoch_entropy_mean = float(entropies.mean())
+        epoch_entropy_std = float(entropies.std(unbiased=False)) if mini_batch_updates > 1 else 0.0
+        health_tracking = dict(advantage_health)
+        health_tracking["clip_triggered_minibatches"] = float((clip_fracs > 0.0).sum())
+        health_tracking["max_clip_fraction"] = max(0.0, float(clip_fracs.max()))
+        grad_norm_max = max(0.0, float(grad_norms.max()))
+        kl_max = float(kl_values.abs().max())
 
         lr = float(optimizer.param_groups[0]["lr"])
 
@@ -654,7 +611,8 @@ class PPOStrategy:
 
         epoch_summary = {
             "epoch": float(epoch + 1),
-            "updates": float(mini_batch_updates),
+            # Padding minibatches keep ranks in lockstep but are not counted.
+            "updates": float(real_updates),
             "transitions": float(transitions_processed),
             "loss_policy": averaged_metrics["policy_loss"],
             "loss_value": averaged_metrics["value_loss"],
@@ -678,7 +636,7 @@ class PPOStrategy:
             "batch_entropy_std": float(epoch_entropy_std),
             "grad_norm_max": float(grad_norm_max),
             "kl_divergence_max": float(kl_max),
-            "reward_advantage_corr": float(reward_adv_corr),
+            "reward_advantage_corr": float(pipeline.reward_advantage_corr),
             "rollout_ticks": float(rollout_ticks),
             "log_stream_offset": float(log_stream_offset),
         }
@@ -686,7 +644,7 @@ class PPOStrategy:
         # Add conflict stats (batch-level averages)
         if conflict_acc:
             for key, value in conflict_acc.items():
-                epoch_summary[f"{key}_avg"] = value / len(batches)
+                epoch_summary[f"{key}_avg"] = value / len(pipeline.batches)
 
         # Add dataset-level social/conflict metrics for anneal guardrails
         # These are read from dataset attributes (captured during rollout or replay)
@@ -720,7 +678,7 @@ class PPOStrategy:
             epoch_summary.update(anneal_fields)
 
         # Warn about advantage issues
-        if health_tracking["adv_zero_std_batches"]:
+        if health_tracking["adv_zero_std_batches"] and distributed.is_main_process():
             batch_count = int(health_tracking["adv_zero_std_batches"])
             print(f"[WARN] Advantage std near zero in {batch_count} batch(es) (dataset={dataset_label_str}, epoch={epoch + 1})")
 
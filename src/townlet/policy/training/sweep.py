@@ -0,0 +1,380 @@
+"""Parallel hyperparameter and anneal-schedule sweeps.
+
+A sweep spec names a training mode (``ppo``, ``anneal`` or ``bc``), a grid of
+dotted config paths to values and/or a random search space, and how many
+trials to run at once. Each trial applies its overrides to a copy of the base
+:class:`~townlet.config.SimulationConfig` (re-validated, so bad values fail
+that trial only) and trains in its own worker process.
+
+Replay-backed modes convert the replay manifest into a memory-mapped
+:mod:`replay store <townlet.policy.replay_store>` once before the first trial
+starts; every worker maps the same read-only files instead of decompressing
+its own copy. Results are appended to ``sweep_results.jsonl`` as trials finish
+and ranked by the objective metric in ``sweep_summary.json``.
+"""
+
+from __future__ import annotations
+
+import itertools
+import json
+import logging
+import math
+import multiprocessing
+import os
+import random
+import time
+from collections.abc import Mapping, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Literal
+
+import yaml
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+
+if TYPE_CHECKING:
+    from townlet.config import SimulationConfig
+
+logger = logging.getLogger(__name__)
+
+SweepMode = Literal["ppo", "anneal", "bc"]
+RESULTS_FILENAME = "sweep_results.jsonl"
+SUMMARY_FILENAME = "sweep_summary.json"
+_DEFAULT_OBJECTIVES: dict[str, tuple[str, bool]] = {
+    "ppo": ("loss_total", False),
+    "anneal": ("loss_total", False),
+    "bc": ("accuracy", True),
+}
+_DISTRIBUTIONS = frozenset({"choice", "uniform", "loguniform", "int"})
+
+
+class RandomSearchSpec(BaseModel):
+    """Random search: ``samples`` draws from ``space`` (``path: {kind: args}``)."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    samples: int = Field(0, ge=0)
+    seed: int = 0
+    space: dict[str, dict[str, list[Any]]] = Field(default_factory=dict)
+
+    @model_validator(mode="after")
+    def _validate_space(self) -> RandomSearchSpec:
+        for path, distribution in self.space.items():
+            if len(distribution) != 1 or next(iter(distribution)) not in _DISTRIBUTIONS:
+                raise ValueError(f"{path}: distribution must be one of {sorted(_DISTRIBUTIONS)}")
+            kind, args = next(iter(distribution.items()))
+            if kind == "choice" and not args:
+                raise ValueError(f"{path}: choice requires at least one value")
+            if kind != "choice" and len(args) != 2:
+                raise ValueError(f"{path}: {kind} requires [low, high]")
+            if kind == "loguniform" and min(args) <= 0:
+                raise ValueError(f"{path}: loguniform bounds must be positive")
+        return self
+
+
+class SweepSpec(BaseModel):
+    """Sweep definition loaded from YAML/JSON."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    base_config: Path | None = None
+    mode: SweepMode = "ppo"
+    epochs: int = Field(1, ge=1)
+    batch_size: int = Field(1, ge=1)
+    seed: int = 0
+    replay_manifest: Path | None = None
+    grid: dict[str, list[Any]] = Field(default_factory=dict)
+    random: RandomSearchSpec = Field(default_factory=lambda: RandomSearchSpec(samples=0, seed=0))
+    objective: str | None = None
+    maximize: bool | None = None
+    workers: int | None = Field(None, ge=1)
+    threads_per_trial: int | None = Field(None, ge=1)
+
+    @classmethod
+    def load(cls, path: Path) -> SweepSpec:
+        text = path.read_text()
+        payload = json.loads(text) if path.suffix.lower() == ".json" else yaml.safe_load(text)
+        spec = cls.model_validate(payload or {})
+        if spec.base_config is not None and not spec.base_config.is_absolute():
+            candidate = path.parent / spec.base_config
+            if candidate.exists():
+                spec.base_config = candidate
+        return spec
+
+    def objective_metric(self) -> tuple[str, bool]:
+        metric, maximize = _DEFAULT_OBJECTIVES[self.mode]
+        return self.objective or metric, maximize if self.maximize is None else self.maximize
+
+
+@dataclass(frozen=True)
+class SweepTrial:
+    trial_id: str
+    overrides: dict[str, Any]
+
+
+def expand_trials(spec: SweepSpec) -> list[SweepTrial]:
+    """Return the grid's cartesian product crossed with the random draws.
+
+    With no grid a single empty combination is used; with no random space
+    each grid point yields exactly one trial.
+    """
+
+    keys = list(spec.grid)
+    combos = [dict(zip(keys, values, strict=True)) for values in itertools.product(*(spec.grid[key] for key in keys))]
+    rng = random.Random(spec.random.seed)
+    draws: list[dict[str, Any]] = [{}]
+    if spec.random.samples and spec.random.space:
+        draws = [
+            {path: _draw(rng, distribution) for path, distribution in spec.random.space.items()}
+            for _ in range(spec.random.samples)
+        ]
+    overrides = [{**combo, **draw} for combo in combos for draw in draws]
+    return [SweepTrial(trial_id=f"trial_{number:04d}", overrides=values) for number, values in enumerate(overrides)]
+
+
+def apply_overrides(config: SimulationConfig, overrides: Mapping[str, Any]) -> SimulationConfig:
+    """Return a re-validated copy of ``config`` with dotted-path overrides applied.
+
+    Unset optional sections (``ppo`` defaults to ``None``) are created from
+    their defaults. Raises ``ValueError`` for paths that do not name a config
+    field and ``pydantic.ValidationError`` for invalid values.
+    """
+
+    payload = config.model_dump()
+    for path, value in overrides.items():
+        node = payload
+        *parents, leaf = path.split(".")
+        for part in parents:
+            if node.get(part) is None:
+                node[part] = {}
+            node = node[part]
+            if not isinstance(node, dict):
+                raise ValueError(f"Override path '{path}' does not name a config field")
+        node[leaf] = value
+    updated = type(config).model_validate(payload)
+    for path in overrides:
+        _check_path(updated, path)
+    return updated
+
+
+class SweepRunner:
+    """Run a sweep's trials in a process pool and collect their results."""
+
+    def __init__(self, config: SimulationConfig, spec: SweepSpec, output_dir: Path) -> None:
+        self.config = config
+        self.spec = spec
+        self.output_dir = output_dir
+        self.trials = expand_trials(spec)
+        if not self.trials:
+            raise ValueError("Sweep spec produced no trials")
+
+    @property
+    def results_path(self) -> Path:
+        return self.output_dir / RESULTS_FILENAME
+
+    @property
+    def summary_path(self) -> Path:
+        return self.output_dir / SUMMARY_FILENAME
+
+    def prepare_replay_store(self) -> Path | None:
+        """Build (or reuse) the shared replay store for replay-backed modes."""
+
+        if self.spec.mode == "bc":
+            return None
+        manifest = self.spec.replay_manifest or self.config.training.replay_manifest
+        if manifest is None:
+            raise ValueError("Sweep mode requires spec.replay_manifest or training.replay_manifest")
+        manifest = Path(manifest)
+        from townlet.policy.replay import ReplayDatasetConfig
+        from townlet.policy.replay_store import build_replay_store, is_store_index
+
+        if manifest.suffix.lower() == ".json" and is_store_index(json.loads(manifest.read_text())):
+            return manifest
+        if manifest.is_dir():
+            dataset_config = ReplayDatasetConfig.from_capture_dir(manifest)
+        else:
+            dataset_config = ReplayDatasetConfig.from_manifest(manifest)
+        return build_replay_store(dataset_config, self.output_dir / "replay_store")
+
+    def run(self) -> dict[str, Any]:
+        """Run every trial; returns the summary also written to disk."""
+
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        store_index = self.prepare_replay_store()
+        workers = min(self.spec.workers or os.cpu_count() or 1, len(self.trials))
+        threads = self.spec.threads_per_trial or max(1, (os.cpu_count() or 1) // workers)
+        payloads: list[dict[str, Any]] = [
+            {
+                "config": self.config,
+                "mode": self.spec.mode,
+                "trial_id": trial.trial_id,
+                "overrides": trial.overrides,
+                "epochs": self.spec.epochs,
+                "batch_size": self.spec.batch_size,
+                "seed": self.spec.seed,
+                "store_index": str(store_index) if store_index is not None else None,
+                "trial_dir": str(self.output_dir / "trials" / trial.trial_id),
+                "threads": threads,
+            }
+            for trial in self.trials
+        ]
+        logger.info("sweep_start mode=%s trials=%d workers=%d threads=%d", self.spec.mode, len(payloads), workers, threads)
+        records: list[dict[str, Any]] = []
+        start = time.perf_counter()
+        with self.results_path.open("w", encoding="utf-8") as handle:
+            if workers == 1:
+                for payload in payloads:
+                    records.append(self._record(handle, run_trial(payload)))
+            else:
+                context = multiprocessing.get_context("spawn")
+                with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+                    futures: dict[Future[dict[str, Any]], dict[str, Any]] = {
+                        pool.submit(run_trial, payload): payload for payload in payloads
+                    }
+                    for future in as_completed(futures):
+                        try:
+                            record = future.result()
+                        except Exception as exc:  # worker crashed before reporting
+                            failed = futures[future]
+                            record = _failed(str(failed["trial_id"]), failed["overrides"], exc, 0.0)
+                        records.append(self._record(handle, record))
+        summary = self._summarise(records, store_index, time.perf_counter() - start)
+        self.summary_path.write_text(json.dumps(summary, indent=2, default=str))
+        return summary
+
+    def _record(self, handle: Any, record: dict[str, Any]) -> dict[str, Any]:
+        handle.write(json.dumps(record, default=str) + "\n")
+        handle.flush()
+        logger.info("sweep_trial trial=%s status=%s", record["trial_id"], record["status"])
+        return record
+
+    def _summarise(self, records: Sequence[dict[str, Any]], store_index: Path | None, duration: float) -> dict[str, Any]:
+        metric, maximize = self.spec.objective_metric()
+        scored = [
+            record
+            for record in records
+            if record["status"] == "ok" and isinstance(record["metrics"].get(metric), (int, float))
+            and math.isfinite(float(record["metrics"][metric]))
+        ]
+        scored.sort(key=lambda record: float(record["metrics"][metric]), reverse=maximize)
+        return {
+            "mode": self.spec.mode,
+            "objective": metric,
+            "maximize": maximize,
+            "trials": len(records),
+            "completed": sum(1 for record in records if record["status"] == "ok"),
+            "failed": sum(1 for record in records if record["status"] != "ok"),
+            "replay_store": str(store_index) if store_index is not None else None,
+            "duration_sec": duration,
+            "best": scored[0] if scored else None,
+            "ranking": [
+                {"trial_id": record["trial_id"], metric: record["metrics"][metric], "overrides": record["overrides"]}
+                for record in scored
+            ],
+        }
+
+
+def run_trial(payload: Mapping[str, Any]) -> dict[str, Any]:
+    """Train one trial; failures are reported in the record, never raised."""
+
+    trial_id = str(payload["trial_id"])
+    overrides = dict(payload["overrides"])
+    start = time.perf_counter()
+    try:
+        import torch
+
+        from townlet.policy.replay import ReplayDatasetConfig
+        from townlet.policy.training.orchestrator import TrainingOrchestrator
+
+        torch.set_num_threads(int(payload["threads"]))
+        torch.manual_seed(int(payload["seed"]))
+        config = apply_overrides(payload["config"], overrides)
+        trial_dir = Path(payload["trial_dir"])
+        trial_dir.mkdir(parents=True, exist_ok=True)
+        orchestrator = TrainingOrchestrator(config)
+        dataset_config = None
+        if payload["store_index"] is not None:
+            dataset_config = ReplayDatasetConfig.from_manifest(
+                Path(payload["store_index"]), batch_size=int(payload["batch_size"])
+            )
+        mode = payload["mode"]
+        if mode == "ppo":
+            ppo = orchestrator.run_ppo(
+                dataset_config=dataset_config,
+                epochs=int(payload["epochs"]),
+                log_path=trial_dir / "ppo_log.jsonl",
+                device_str="cpu",
+            )
+            metrics = ppo.model_dump(exclude_none=True)
+        elif mode == "anneal":
+            anneal = orchestrator.run_anneal(dataset_config=dataset_config, log_dir=trial_dir)
+            metrics = _anneal_metrics(anneal.model_dump())
+        else:
+            metrics = orchestrator.run_bc().model_dump(exclude_none=True)
+    except Exception as exc:
+        logger.warning("sweep_trial_failed trial=%s error=%s", trial_id, exc)
+        return _failed(trial_id, overrides, exc, time.perf_counter() - start)
+    return {
+        "trial_id": trial_id,
+        "status": "ok",
+        "overrides": overrides,
+        "metrics": metrics,
+        "duration_sec": time.perf_counter() - start,
+    }
+
+
+def _anneal_metrics(summary: Mapping[str, Any]) -> dict[str, Any]:
+    stages = list(summary.get("stages", []))
+    metrics: dict[str, Any] = {"status": summary.get("status"), "stages": len(stages)}
+    for stage in stages:
+        for key in ("accuracy", "loss_total", "loss_policy", "loss_value", "queue_conflict_events"):
+            if stage.get(key) is not None:
+                metrics[key] = stage[key]
+    return metrics
+
+
+def _failed(trial_id: str, overrides: Mapping[str, Any], exc: BaseException, duration: float) -> dict[str, Any]:
+    return {
+        "trial_id": trial_id,
+        "status": "error",
+        "overrides": dict(overrides),
+        "metrics": {},
+        "duration_sec": duration,
+        "error": f"{type(exc).__name__}: {exc}",
+    }
+
+
+def _draw(rng: random.Random, distribution: Mapping[str, Sequence[Any]]) -> Any:
+    kind, args = next(iter(distribution.items()))
+    if kind == "choice":
+        return rng.choice(list(args))
+    low, high = args
+    if kind == "int":
+        return rng.randint(int(low), int(high))
+    if kind == "loguniform":
+        return math.exp(rng.uniform(math.log(float(low)), math.log(float(high))))
+    return rng.uniform(float(low), float(high))
+
+
+def _check_path(config: BaseModel, path: str) -> None:
+    node: Any = config
+    for part in path.split("."):
+        if isinstance(node, BaseModel) and part in type(node).model_fields:
+            node = getattr(node, part)
+        elif isinstance(node, Mapping) and part in node:
+            node = node[part]
+        else:
+            raise ValueError(f"Override path '{path}' does not name a config field")
+
+
+__all__ = [
+    "RESULTS_FILENAME",
+    "SUMMARY_FILENAME",
+    "RandomSearchSpec",
+    "SweepRunner",
+    "SweepSpec",
+    "SweepTrial",
+    "apply_overrides",
+    "expand_trials",
+    "run_trial",
+]
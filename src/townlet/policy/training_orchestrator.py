@@ -14,7 +14,7 @@ import numpy as np
 
 from townlet.config import PPOConfig, SimulationConfig
 from townlet.core.utils import policy_provider_name
-from townlet.policy.bc import BCTrainer, BCTrajectoryDataset, load_bc_samples
+from townlet.policy.bc import BCTrainer, BCTrajectoryDataset, MemmapBCDataset, load_bc_dataset
 from townlet.policy.fallback import is_stub_policy
 from townlet.policy.bc import BCTrainingConfig as BCTrainingParams
 from townlet.policy.models import (
@@ -27,6 +27,7 @@ from townlet.policy.replay import (
     ReplayBatch,
     ReplayDataset,
     ReplayDatasetConfig,
+    ReplayEntry,
     ReplaySample,
     build_batch,
     load_replay_sample,
@@ -126,7 +127,7 @@ class PolicyTrainingOrchestrator:
         return summary
 
     def run_replay_batch(self, pairs: Iterable[tuple[Path, Path | None]]) -> dict[str, float]:
-        entries = list(pairs)
+        entries: list[ReplayEntry] = list(pairs)
         if not entries:
             raise ValueError("Replay batch requires at least one entry")
         config = ReplayDatasetConfig(entries=entries, batch_size=len(entries))
@@ -237,9 +238,8 @@ class PolicyTrainingOrchestrator:
             in_memory_dataset=dataset,
         )
 
-    def _load_bc_dataset(self, manifest: Path) -> BCTrajectoryDataset:
-        samples = load_bc_samples(manifest)
-        return BCTrajectoryDataset(samples)
+    def _load_bc_dataset(self, manifest: Path) -> BCTrajectoryDataset | MemmapBCDataset:
+        return load_bc_dataset(manifest)
 
     def run_bc_training(
         self,
@@ -255,6 +255,9 @@ class PolicyTrainingOrchestrator:
         if manifest_path is None:
             raise ValueError("BC manifest is required for behaviour cloning")
 
+        if self._launch_distributed():
+            return self._run_distributed_bc(manifest_path, config)
+
         dataset = self._load_bc_dataset(manifest_path)
         params = config or BCTrainingParams(
             learning_rate=bc_settings.learning_rate,
@@ -262,6 +265,9 @@ class PolicyTrainingOrchestrator:
             epochs=bc_settings.epochs,
             weight_decay=bc_settings.weight_decay,
             device=bc_settings.device,
+            num_workers=bc_settings.num_workers,
+            sampling=bc_settings.sampling,
+            block_size=bc_settings.block_size,
         )
 
         policy_cfg = ConflictAwarePolicyConfig(
@@ -387,6 +393,17 @@ class PolicyTrainingOrchestrator:
         if not torch_available():
             raise TorchNotAvailableError("PyTorch is required for PPO training. Install torch to proceed.")
 
+        if self._launch_distributed():
+            return self._run_distributed_ppo(
+                dataset_config=dataset_config,
+                in_memory_dataset=in_memory_dataset,
+                epochs=epochs,
+                log_path=log_path,
+                log_frequency=log_frequency,
+                max_log_entries=max_log_entries,
+                device_str=device_str,
+            )
+
         if in_memory_dataset is not None:
             dataset: InMemoryReplayDataset | ReplayDataset = in_memory_dataset
         else:
@@ -853,6 +870,69 @@ class PolicyTrainingOrchestrator:
             self._ppo_state["log_stream_offset"] = log_stream_offset
         return last_summary
 
+    def _launch_distributed(self) -> bool:
+        from townlet.policy.training import distributed
+
+        return self.config.training.distributed.enabled and distributed.current_group() is None
+
+    def _run_distributed_ppo(
+        self,
+        *,
+        dataset_config: ReplayDatasetConfig | None,
+        in_memory_dataset: InMemoryReplayDataset | None,
+        **kwargs: object,
+    ) -> dict[str, float]:
+        """Run PPO on ``training.distributed.world_size`` local workers.
+
+        The strategy-based PPO loop runs in each worker; this orchestrator's
+        persistent counters are handed over and read back afterwards.
+        """
+        from townlet.policy.training import distributed
+
+        if in_memory_dataset is None and dataset_config is None:
+            raise ValueError("dataset_config is required when in_memory_dataset is not provided")
+        metadata = {
+            "cycle_id": int(self._ppo_state.get("cycle_id", -1)),
+            "log_stream_offset": int(self._ppo_state.get("log_stream_offset", 0)),
+            "cumulative_steps": int(self._ppo_state.get("step", 0)),
+        }
+        result, metadata, stage = distributed.run_distributed(
+            self.config,
+            "ppo",
+            metadata=metadata,
+            dataset_config=dataset_config,
+            in_memory_dataset=in_memory_dataset,
+            **kwargs,
+        )
+        self._ppo_state["cycle_id"] = int(metadata["cycle_id"])
+        self._ppo_state["log_stream_offset"] = int(metadata["log_stream_offset"])
+        self._ppo_state["step"] = int(metadata["cumulative_steps"])
+        self._ppo_state["learning_rate"] = float(result["lr"])
+        if stage is not None:
+            setattr(self.config.features.stages, "social_rewards", stage)  # noqa: B010
+        return {key: value for key, value in result.items() if value is not None and key != "duration_sec"}
+
+    def _run_distributed_bc(self, manifest_path: Path, params: BCTrainingParams | None) -> dict[str, float]:
+        from townlet.policy.training import distributed
+
+        config = self.config.model_copy(deep=True)
+        bc_settings = config.training.bc
+        bc_settings.manifest = manifest_path
+        if params is not None:
+            bc_settings.learning_rate = params.learning_rate
+            bc_settings.batch_size = params.batch_size
+            bc_settings.epochs = params.epochs
+            bc_settings.weight_decay = params.weight_decay
+            bc_settings.device = params.device
+            bc_settings.num_workers = params.num_workers
+            bc_settings.sampling = params.sampling
+            bc_settings.block_size = params.block_size
+        result, _, _ = distributed.run_distributed(config, "bc")
+        metrics: dict[str, float | str] = {"loss": float(result["loss"]), "accuracy": float(result["accuracy"])}
+        metrics["mode"] = "bc"
+        metrics["manifest"] = str(manifest_path)
+        return metrics  # type: ignore[return-value]
+
     def evaluate_anneal_results(self, results: list[dict[str, object]]) -> str:
         status = "PASS"
         for stage in results:
@@ -0,0 +1,245 @@
+"""Columnar, preallocated storage for captured rollout trajectories.
+
+Trajectory frames arrive from :class:`~townlet.policy.trajectory_service.TrajectoryService`
+as one dict per agent per tick, carrying nested observation payloads and a
+per-frame metadata copy. :class:`TrajectoryStore` appends each frame's map,
+features, action id, log-prob, value, reward and done straight into growable
+per-agent NumPy columns and keeps only the latest metadata per agent (one copy
+per episode). :meth:`AgentTrajectoryColumns.to_replay_sample` returns views of
+those columns, so building replay samples copies nothing.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Iterable, Mapping
+from typing import Any
+
+import numpy as np
+
+from townlet.policy.replay import TRAINING_ARRAY_FIELDS, ReplaySample
+
+
+class AgentTrajectoryColumns:
+    """Growable per-agent trajectory columns."""
+
+    def __init__(
+        self,
+        agent_id: str,
+        *,
+        map_shape: tuple[int, ...],
+        feature_dim: int,
+        capacity: int = 64,
+    ) -> None:
+        self.agent_id = agent_id
+        self._size = 0
+        capacity = max(1, int(capacity))
+        self._map = np.zeros((capacity, *map_shape), dtype=np.float32)
+        self._features = np.zeros((capacity, feature_dim), dtype=np.float32)
+        self._ticks = np.zeros(capacity, dtype=np.int64)
+        self._actions = np.zeros(capacity, dtype=np.int64)
+        self._log_probs = np.zeros(capacity, dtype=np.float32)
+        # One spare slot: the bootstrap value (a repeat of the last prediction)
+        # lives at ``size`` so ``value_preds`` stays a view.
+        self._values = np.zeros(capacity + 1, dtype=np.float32)
+        self._rewards = np.zeros(capacity, dtype=np.float32)
+        self._dones = np.zeros(capacity, dtype=np.bool_)
+        self._action_payloads: list[Any] = []
+        self._action_lookup: dict[str, int] | None = None
+        self._metadata: Mapping[str, Any] = {}
+        self._anneal_context: Mapping[str, Any] | None = None
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def capacity(self) -> int:
+        return int(self._ticks.shape[0])
+
+    @property
+    def nbytes(self) -> int:
+        arrays = (
+            self._map,
+            self._features,
+            self._ticks,
+            self._actions,
+            self._log_probs,
+            self._values,
+            self._rewards,
+            self._dones,
+        )
+        return sum(array.nbytes for array in arrays)
+
+    def append(self, frame: Mapping[str, Any]) -> None:
+        """Write ``frame`` into the next row, growing the columns when full."""
+
+        map_array = np.asarray(frame["map"], dtype=np.float32)
+        feature_array = np.asarray(frame["features"], dtype=np.float32)
+        if map_array.shape != self._map.shape[1:] or feature_array.shape != self._features.shape[1:]:
+            raise ValueError(
+                f"frame for agent '{self.agent_id}' has map {map_array.shape} / features "
+                f"{feature_array.shape}; expected {self._map.shape[1:]} / {self._features.shape[1:]}"
+            )
+        if self._size == self.capacity:
+            self._grow()
+        row = self._size
+        self._map[row] = map_array
+        self._features[row] = feature_array
+        try:
+            self._ticks[row] = int(frame.get("tick", 0))
+        except (TypeError, ValueError):
+            self._ticks[row] = 0
+        self._actions[row] = self._action_id(frame)
+        self._log_probs[row] = float(frame.get("log_prob", 0.0))
+        value = float(frame.get("value_pred", 0.0))
+        self._values[row] = value
+        self._values[row + 1] = value
+        self._rewards[row] = float((frame.get("rewards") or [0.0])[-1])
+        self._dones[row] = bool((frame.get("dones") or [False])[-1])
+        self._action_payloads.append(frame.get("action"))
+        metadata = frame.get("metadata")
+        self._metadata = metadata if isinstance(metadata, Mapping) else {}
+        self._anneal_context = frame.get("anneal_context")
+        self._size += 1
+
+    def to_replay_sample(self) -> ReplaySample:
+        """Return a replay sample whose arrays are views of the columns.
+
+        The views stay valid until the next :meth:`append`, which may
+        overwrite the bootstrap value or reallocate the columns.
+        """
+
+        if self._size == 0:
+            raise ValueError("frames sequence cannot be empty")
+        size = self._size
+        actions = self._actions[:size]
+        value_preds = self._values[: size + 1]
+        action_lookup = dict(self._action_lookup or {})
+        metadata = dict(self._metadata)
+        dto_meta = metadata.get("dto")
+        if isinstance(dto_meta, dict) and "schema_version" in dto_meta:
+            metadata.setdefault("dto_schema_version", dto_meta.get("schema_version"))
+        if self._anneal_context:
+            metadata.setdefault("anneal_context", dict(self._anneal_context))
+        metadata.update(
+            {
+                "training_arrays": list(TRAINING_ARRAY_FIELDS),
+                "timesteps": size,
+                "value_pred_steps": len(value_preds),
+                "action_lookup": action_lookup,
+                "action_dim": int(actions.max() + 1) if actions.size else 1,
+            }
+        )
+        return ReplaySample(
+            map=self._map[:size],
+            features=self._features[:size],
+            actions=actions,
+            old_log_probs=self._log_probs[:size],
+            value_preds=value_preds,
+            rewards=self._rewards[:size],
+            dones=self._dones[:size],
+            metadata=metadata,
+        )
+
+    def frames(self) -> list[dict[str, Any]]:
+        """Rebuild frame dicts (sharing the episode metadata) for DTO exports."""
+
+        anneal_context = dict(self._anneal_context or {})
+        return [
+            {
+                "tick": int(self._ticks[row]),
+                "agent_id": self.agent_id,
+                "map": self._map[row],
+                "features": self._features[row],
+                "metadata": self._metadata,
+                "anneal_context": anneal_context,
+                "action": self._action_payloads[row],
+                "action_id": int(self._actions[row]),
+                "rewards": [float(self._rewards[row])],
+                "dones": [bool(self._dones[row])],
+                "log_prob": float(self._log_probs[row]),
+                "value_pred": float(self._values[row]),
+            }
+            for row in range(self._size)
+        ]
+
+    def _action_id(self, frame: Mapping[str, Any]) -> int:
+        if self._action_lookup is None:
+            raw_lookup = dict(frame.get("action_lookup") or {})
+            if raw_lookup and all(isinstance(key, int) for key in raw_lookup):
+                self._action_lookup = {value: int(key) for key, value in raw_lookup.items()}
+            else:
+                self._action_lookup = raw_lookup
+        if frame.get("action_id") is not None:
+            return int(frame["action_id"])
+        action = frame.get("action") or {}
+        try:
+            key = json.dumps(action, sort_keys=True)
+        except TypeError:
+            key = str(action)
+        if key not in self._action_lookup:
+            self._action_lookup[key] = len(self._action_lookup)
+        return self._action_lookup[key]
+
+    def _grow(self) -> None:
+        capacity = self.capacity * 2
+
+        def _resize(array: np.ndarray, length: int) -> np.ndarray:
+            grown = np.zeros((length, *array.shape[1:]), dtype=array.dtype)
+            grown[: array.shape[0]] = array
+            return grown
+
+        self._map = _resize(self._map, capacity)
+        self._features = _resize(self._features, capacity)
+        self._ticks = _resize(self._ticks, capacity)
+        self._actions = _resize(self._actions, capacity)
+        self._log_probs = _resize(self._log_probs, capacity)
+        self._values = _resize(self._values, capacity + 1)
+        self._rewards = _resize(self._rewards, capacity)
+        self._dones = _resize(self._dones, capacity)
+
+
+class TrajectoryStore:
+    """Columnar trajectory storage keyed by agent."""
+
+    def __init__(self, *, initial_capacity: int = 64) -> None:
+        self._initial_capacity = max(1, int(initial_capacity))
+        self._agents: dict[str, AgentTrajectoryColumns] = {}
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def nbytes(self) -> int:
+        return sum(columns.nbytes for columns in self._agents.values())
+
+    def append(self, frame: Mapping[str, Any]) -> None:
+        agent_id = str(frame.get("agent_id", "unknown"))
+        columns = self._agents.get(agent_id)
+        if columns is None:
+            columns = AgentTrajectoryColumns(
+                agent_id,
+                map_shape=np.shape(frame["map"]),
+                feature_dim=int(np.size(frame["features"])),
+                capacity=self._initial_capacity,
+            )
+            self._agents[agent_id] = columns
+        columns.append(frame)
+        self._size += 1
+
+    def extend(self, frames: Iterable[Mapping[str, Any]]) -> None:
+        for frame in frames:
+            self.append(frame)
+
+    def agents(self) -> dict[str, AgentTrajectoryColumns]:
+        """Return per-agent columns in first-seen order."""
+
+        return dict(self._agents)
+
+    def clear(self) -> None:
+        self._agents.clear()
+        self._size = 0
+
+
+__all__ = ["AgentTrajectoryColumns", "TrajectoryStore"]
@@ -18,6 +18,7 @@ from townlet.dto.observations import ObservationEnvelope
 if TYPE_CHECKING:  # pragma: no cover - typing only
     from townlet.console.command import ConsoleCommandEnvelope
     from townlet.core.interfaces import TelemetrySinkProtocol
+    from townlet.dto.actions import ActionBatch
     from townlet.dto.world import SimulationSnapshot
     from townlet.world.grid import WorldState
     from townlet.world.runtime import RuntimeStepResult
@@ -70,7 +71,7 @@ class WorldRuntime(Protocol):
             ObservationEnvelope: Typed DTO containing agent observations and global context.
         """
 
-    def apply_actions(self, actions: Mapping[str, Any]) -> None:
+    def apply_actions(self, actions: Mapping[str, Any] | ActionBatch) -> None:
         """Stage policy actions that should execute on the next tick."""
 
     def tick(
@@ -78,8 +79,8 @@ class WorldRuntime(Protocol):
         *,
         tick: int,
         console_operations: Iterable[ConsoleCommandEnvelope] | None = None,
-        action_provider: Callable[[WorldState, int], Mapping[str, Any]] | None = None,
-        policy_actions: Mapping[str, Any] | None = None,
+        action_provider: Callable[[WorldState, int], Mapping[str, Any] | ActionBatch] | None = None,
+        policy_actions: Mapping[str, Any] | ActionBatch | None = None,
     ) -> RuntimeStepResult:
         """Advance the world by one tick and return observable artefacts."""
 
@@ -31,6 +31,15 @@ class RewardEngine:
         self._profile_cache: dict[str, PersonalityProfile] = {}
         self._latest_social_events: list[dict[str, object]] = []
 
+    def reset_state(self) -> None:
+        """Clear per-episode bookkeeping (termination blocks, totals, caches)."""
+
+        self._termination_block.clear()
+        self._episode_totals.clear()
+        self._latest_breakdown.clear()
+        self._profile_cache.clear()
+        self._latest_social_events.clear()
+
     def compute(
         self,
         world: WorldState,
@@ -18,8 +18,15 @@ from townlet.config import (
     SimulationConfig,
 )
 from townlet.utils import decode_rng_state, encode_rng_state
+from townlet.utils.timers import TimerEntry, TimingWheel
 from townlet.world.grid import WorldState
 
+_START_TOPIC = "perturbation.start"
+_END_TOPIC = "perturbation.end"
+_SPEC_COOLDOWN_TOPIC = "perturbation.spec_cooldown"
+_AGENT_COOLDOWN_TOPIC = "perturbation.agent_cooldown"
+_WINDOW_TOPIC = "perturbation.window"
+
 
 @dataclass
 class ScheduledPerturbation:
@@ -35,13 +42,19 @@ class ScheduledPerturbation:
 
 
 class PerturbationScheduler:
-    """Injects bounded random events into the world."""
+    """Injects bounded random events into the world.
+
+    Event starts/ends, cooldown expiry, and window bookkeeping are scheduled on a
+    :class:`TimingWheel` (the world's shared wheel when passed via ``timers``),
+    so each tick only touches entries that fall due.
+    """
 
     def __init__(
         self,
         config: SimulationConfig,
         *,
         rng: random.Random | None = None,
+        timers: TimingWheel | None = None,
     ) -> None:
         self.config = config
         self.settings: PerturbationSchedulerConfig = config.perturbations
@@ -57,8 +70,18 @@ class PerturbationScheduler:
         self._active: dict[str, ScheduledPerturbation] = {}
         self._event_cooldowns: dict[str, int] = {}
         self._agent_cooldowns: dict[str, int] = {}
-        self._window_events: list[tuple[int, str]] = []
+        self._window_events: dict[str, tuple[int, str]] = {}
+        self._window_counts: dict[str, int] = {}
+        self._window_seq: int = 0
         self._next_id: int = 1
+        self._due_starts: list[str] = []
+        self._due_ends: list[str] = []
+        self._timers = timers if timers is not None else TimingWheel()
+        self._timers.register_handler(_START_TOPIC, self._on_start_due)
+        self._timers.register_handler(_END_TOPIC, self._on_end_due)
+        self._timers.register_handler(_SPEC_COOLDOWN_TOPIC, self._on_spec_cooldown_due)
+        self._timers.register_handler(_AGENT_COOLDOWN_TOPIC, self._on_agent_cooldown_due)
+        self._timers.register_handler(_WINDOW_TOPIC, self._on_window_due)
 
     def pending_count(self) -> int:
         return len(self._pending)
@@ -70,53 +93,36 @@ class PerturbationScheduler:
     # Tick lifecycle
     # ------------------------------------------------------------------
     def tick(self, world: WorldState, current_tick: int) -> None:
+        # Cooldown and window timers are plain bookkeeping and fire inside
+        # ``advance``; starts/ends are queued so world effects keep their order.
+        self._timers.advance(current_tick)
+        if self.settings.window_ticks <= 0:
+            self._clear_window_events()
         self._expire_active(current_tick, world)
-        self._expire_cooldowns(current_tick)
-        self._expire_window_events(current_tick)
         self._drain_pending(world, current_tick)
         self._maybe_schedule(world, current_tick)
 
     def _expire_active(self, current_tick: int, world: WorldState) -> None:
-        to_remove: list[str] = []
-        for event_id, event in list(self._active.items()):
-            if current_tick >= event.ends_at:
-                to_remove.append(event_id)
-        for event_id in to_remove:
-            event = self._active.pop(event_id)
-            self._on_event_concluded(world, event)
-
-    def _expire_cooldowns(self, current_tick: int) -> None:
-        self._event_cooldowns = {
-            name: tick
-            for name, tick in self._event_cooldowns.items()
-            if tick > current_tick
-        }
-        self._agent_cooldowns = {
-            agent: tick
-            for agent, tick in self._agent_cooldowns.items()
-            if tick > current_tick
-        }
-
-    def _expire_window_events(self, current_tick: int) -> None:
-        window = self.settings.window_ticks
-        if window <= 0:
-            self._window_events.clear()
+        self._timers.advance(current_tick)
+        if not self._due_ends:
             return
-        cutoff = current_tick - window
-        self._window_events = [
-            (tick, name) for tick, name in self._window_events if tick > cutoff
-        ]
+        due, self._due_ends = self._due_ends, []
+        for event_id in due:
+            event = self._active.pop(event_id, None)
+            if event is not None:
+                self._on_event_concluded(world, event)
 
     def _drain_pending(self, world: WorldState, current_tick: int) -> None:
-        if not self._pending:
+        self._timers.advance(current_tick)
+        if not self._due_starts:
             return
-        ready: list[ScheduledPerturbation] = []
-        for event in list(self._pending):
-            if event.started_at <= current_tick:
-                ready.append(event)
-        for event in ready:
-            self._pending.remove(event)
-            self._activate(world, event)
+        due, self._due_starts = self._due_starts, []
+        for event_id in due:
+            for index, event in enumerate(self._pending):
+                if event.event_id == event_id:
+                    del self._pending[index]
+                    self._activate(world, event)
+                    break
 
     def _maybe_schedule(self, world: WorldState, current_tick: int) -> None:
         if not self.specs:
@@ -170,10 +176,8 @@ class PerturbationScheduler:
         )
         if event is None:
             raise ValueError("Unable to schedule perturbation; insufficient targets")
-        if start_tick > current_tick:
-            self._pending.append(event)
-        else:
-            self._pending.append(event)
+        self._add_pending(event)
+        if start_tick <= current_tick:
             self._drain_pending(world, current_tick)
         return event
 
@@ -181,6 +185,7 @@ class PerturbationScheduler:
         for index, event in enumerate(list(self._pending)):
             if event.event_id == event_id:
                 self._pending.pop(index)
+                self._timers.cancel(_START_TOPIC, event_id)
                 world._emit_event(
                     "perturbation_cancelled",
                     {
@@ -195,6 +200,7 @@ class PerturbationScheduler:
         if active_event is None:
             return False
         del self._active[event_id]
+        self._timers.cancel(_END_TOPIC, event_id)
         world._emit_event(
             "perturbation_cancelled",
             {
@@ -208,21 +214,21 @@ class PerturbationScheduler:
         return True
 
     def _activate(self, world: WorldState, event: ScheduledPerturbation) -> None:
-        self._active[event.event_id] = event
+        self._set_active(event)
         spec = self.spec_for(event.spec_name)
         cooldown = (
             spec.cooldown_ticks if spec else 0
         ) + self.settings.global_cooldown_ticks
         if cooldown > 0:
-            self._event_cooldowns[event.spec_name] = event.ends_at + cooldown
+            self._set_spec_cooldown(event.spec_name, event.ends_at + cooldown)
         for agent in event.targets:
             per_agent_cd = self.settings.per_agent_cooldown_ticks
             if per_agent_cd > 0:
                 expiry = event.ends_at + per_agent_cd
                 current = self._agent_cooldowns.get(agent, 0)
                 if expiry > current:
-                    self._agent_cooldowns[agent] = expiry
-        self._window_events.append((event.started_at, event.spec_name))
+                    self._set_agent_cooldown(agent, expiry)
+        self._record_window_event(event.started_at, event.spec_name)
         self._apply_event(world, event)
         world._emit_event(
             "perturbation_started",
@@ -326,9 +332,7 @@ class PerturbationScheduler:
         if cooldown_until > current_tick:
             return False
         if self.settings.max_events_per_window > 0:
-            recent_count = sum(
-                1 for _, spec_name in self._window_events if spec_name == name
-            )
+            recent_count = self._window_counts.get(name, 0)
             if recent_count >= self.settings.max_events_per_window:
                 return False
         if spec.probability_per_day <= 0.0:
@@ -419,10 +423,9 @@ class PerturbationScheduler:
     ) -> None:
         for event in events:
             if isinstance(event, ScheduledPerturbation):
-                self._pending.append(event)
+                self._add_pending(event)
             else:
-                converted = self._coerce_event(event)
-                self._pending.append(converted)
+                self._add_pending(self._coerce_event(event))
 
     @property
     def pending(self) -> list[ScheduledPerturbation]:
@@ -444,49 +447,36 @@ class PerturbationScheduler:
             },
             "event_cooldowns": dict(self._event_cooldowns),
             "agent_cooldowns": dict(self._agent_cooldowns),
-            "window_events": list(self._window_events),
+            "window_events": list(self._window_events.values()),
             "next_id": self._next_id,
             "rng_state": encode_rng_state(self._random.getstate()),
         }
 
     def import_state(self, payload: Mapping[str, Any]) -> None:
-        self._pending = [
-            self._coerce_event(entry)
-            for entry in payload.get("pending", [])
-            if isinstance(entry, Mapping)
-        ]
+        self._clear_timers()
+        for entry in payload.get("pending", []):
+            if isinstance(entry, Mapping):
+                self._add_pending(self._coerce_event(entry))
         active_payload = payload.get("active", {})
-        self._active = {}
         if isinstance(active_payload, Mapping):
             for event_id, entry in active_payload.items():
                 if isinstance(entry, Mapping):
-                    event = self._coerce_event(entry)
-                    self._active[str(event_id)] = event
+                    self._set_active(self._coerce_event(entry), key=str(event_id))
         event_cooldowns = payload.get("event_cooldowns", {})
         if isinstance(event_cooldowns, Mapping):
-            self._event_cooldowns = {
-                str(name): int(tick) for name, tick in event_cooldowns.items()
-            }
-        else:
-            self._event_cooldowns = {}
+            for name, tick in event_cooldowns.items():
+                self._set_spec_cooldown(str(name), int(tick))
 
         agent_cooldowns = payload.get("agent_cooldowns", {})
         if isinstance(agent_cooldowns, Mapping):
-            self._agent_cooldowns = {
-                str(agent): int(tick) for agent, tick in agent_cooldowns.items()
-            }
-        else:
-            self._agent_cooldowns = {}
+            for agent, tick in agent_cooldowns.items():
+                self._set_agent_cooldown(str(agent), int(tick))
 
         window_events = payload.get("window_events", [])
         if isinstance(window_events, list):
-            self._window_events = [
-                (int(tick), str(name))
-                for tick, name in window_events
-                if isinstance(tick, int)
-            ]
-        else:
-            self._window_events = []
+            for tick, name in window_events:
+                if isinstance(tick, int):
+                    self._record_window_event(tick, str(name))
 
         next_id = payload.get("next_id")
         self._next_id = int(next_id) if isinstance(next_id, int) and next_id > 0 else 1
@@ -496,12 +486,86 @@ class PerturbationScheduler:
             self.set_rng_state(decode_rng_state(rng_payload))
 
     def reset_state(self) -> None:
+        self._clear_timers()
+        self._next_id = 1
+
+    # ------------------------------------------------------------------
+    # Timer bookkeeping
+    # ------------------------------------------------------------------
+    def _add_pending(self, event: ScheduledPerturbation) -> None:
+        self._pending.append(event)
+        self._timers.schedule(_START_TOPIC, event.event_id, event.started_at)
+
+    def _set_active(self, event: ScheduledPerturbation, *, key: str | None = None) -> None:
+        event_key = key if key is not None else event.event_id
+        self._active[event_key] = event
+        self._timers.schedule(_END_TOPIC, event_key, event.ends_at)
+
+    def _set_spec_cooldown(self, name: str, expiry: int) -> None:
+        self._event_cooldowns[name] = expiry
+        self._timers.schedule(_SPEC_COOLDOWN_TOPIC, name, expiry)
+
+    def _set_agent_cooldown(self, agent_id: str, expiry: int) -> None:
+        self._agent_cooldowns[agent_id] = expiry
+        self._timers.schedule(_AGENT_COOLDOWN_TOPIC, agent_id, expiry)
+
+    def _record_window_event(self, tick: int, name: str) -> None:
+        self._window_seq += 1
+        key = str(self._window_seq)
+        self._window_events[key] = (tick, name)
+        self._window_counts[name] = self._window_counts.get(name, 0) + 1
+        window = self.settings.window_ticks
+        if window > 0:
+            self._timers.schedule(_WINDOW_TOPIC, key, tick + window)
+
+    def _clear_window_events(self) -> None:
+        if not self._window_events:
+            return
+        self._window_events.clear()
+        self._window_counts.clear()
+        self._timers.cancel_topic(_WINDOW_TOPIC)
+
+    def _clear_timers(self) -> None:
         self._pending.clear()
         self._active.clear()
         self._event_cooldowns.clear()
         self._agent_cooldowns.clear()
         self._window_events.clear()
-        self._next_id = 1
+        self._window_counts.clear()
+        self._window_seq = 0
+        self._due_starts.clear()
+        self._due_ends.clear()
+        for topic in (
+            _START_TOPIC,
+            _END_TOPIC,
+            _SPEC_COOLDOWN_TOPIC,
+            _AGENT_COOLDOWN_TOPIC,
+            _WINDOW_TOPIC,
+        ):
+            self._timers.cancel_topic(topic)
+
+    def _on_start_due(self, entry: TimerEntry) -> None:
+        self._due_starts.append(entry.key)
+
+    def _on_end_due(self, entry: TimerEntry) -> None:
+        self._due_ends.append(entry.key)
+
+    def _on_spec_cooldown_due(self, entry: TimerEntry) -> None:
+        self._event_cooldowns.pop(entry.key, None)
+
+    def _on_agent_cooldown_due(self, entry: TimerEntry) -> None:
+        self._agent_cooldowns.pop(entry.key, None)
+
+    def _on_window_due(self, entry: TimerEntry) -> None:
+        record = self._window_events.pop(entry.key, None)
+        if record is None:
+            return
+        name = record[1]
+        remaining = self._window_counts.get(name, 0) - 1
+        if remaining > 0:
+            self._window_counts[name] = remaining
+        else:
+            self._window_counts.pop(name, None)
 
     # ------------------------------------------------------------------
     # Helpers
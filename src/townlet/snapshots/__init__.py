@@ -1,18 +1,27 @@
-"""Snapshot and restore helpers."""
+"""Snapshot and restore helpers.
+
+The migration registry is light and imported eagerly; the snapshot manager and
+world/telemetry restore helpers resolve lazily because they depend on the full
+world model.
+"""
 
 from __future__ import annotations
 
-from townlet.dto.world import SimulationSnapshot
+from typing import TYPE_CHECKING
 
 from .migrations import clear_registry as clear_migration_registry
 from .migrations import register_migration
 from .migrations import registry as migration_registry
-from .state import (
-    SnapshotManager,
-    apply_snapshot_to_telemetry,
-    apply_snapshot_to_world,
-    snapshot_from_world,
-)
+
+if TYPE_CHECKING:  # pragma: no cover - static re-exports
+    from townlet.dto.world import SimulationSnapshot
+
+    from .state import (
+        SnapshotManager,
+        apply_snapshot_to_telemetry,
+        apply_snapshot_to_world,
+        snapshot_from_world,
+    )
 
 __all__ = [
     "SimulationSnapshot",
@@ -24,3 +33,28 @@ __all__ = [
     "register_migration",
     "snapshot_from_world",
 ]
+
+_STATE_EXPORTS = frozenset(
+    {
+        "SnapshotManager",
+        "apply_snapshot_to_telemetry",
+        "apply_snapshot_to_world",
+        "snapshot_from_world",
+    }
+)
+
+
+def __getattr__(name: str) -> object:  # pragma: no cover - lazy import glue
+    if name == "SimulationSnapshot":
+        from townlet.dto.world import SimulationSnapshot as _SimulationSnapshot
+
+        return _SimulationSnapshot
+    if name in _STATE_EXPORTS:
+        from . import state
+
+        return getattr(state, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:  # pragma: no cover - module reflection helper
+    return sorted(__all__)
@@ -28,6 +28,7 @@ from townlet.dto.world import (
     SimulationSnapshot,
     StabilitySnapshot,
     TelemetrySnapshot,
+    TimerSnapshot,
 )
 from townlet.lifecycle.manager import LifecycleManager
 from townlet.scheduler.perturbations import PerturbationScheduler
@@ -289,6 +290,15 @@ def snapshot_from_world(
             context_seed = str(int(base_seed))
             encoded_rngs["context_seed"] = context_seed
 
+    timers_snapshot = TimerSnapshot()
+    world_timers = getattr(world, "timers", None)
+    if world_timers is not None:
+        timers_dict = world_timers.export_state()
+        timers_snapshot = TimerSnapshot(
+            current_tick=int(timers_dict.get("current_tick", world.tick)),
+            entries=list(timers_dict.get("entries", [])),
+        )
+
     # Build SimulationSnapshot DTO
     snapshot = SimulationSnapshot(
         config_id=config.config_id,
@@ -310,6 +320,7 @@ def snapshot_from_world(
         stability=stability_snapshot,
         promotion=promotion_snapshot,
         telemetry=telemetry_snapshot,
+        timers=timers_snapshot,
         rng_state=rng_payload,
         rng_streams=encoded_rngs,
         console_buffer=console_buffer,
@@ -392,6 +403,14 @@ def apply_snapshot_to_world(
     world._pending_events.clear()
     world._recent_meal_participants.clear()
 
+    # Restore the shared timing wheel before subsystems re-arm their own timers
+    world_timers = getattr(world, "timers", None)
+    if world_timers is not None:
+        timers_dict = snapshot.timers.model_dump()
+        if timers_dict.get("current_tick") is None:
+            timers_dict["current_tick"] = snapshot.tick
+        world_timers.import_state(timers_dict)
+
     # Restore queue state from QueueSnapshot DTO
     queue_dict = snapshot.queues.model_dump()
     world.queue_manager.import_state(queue_dict)
@@ -9,10 +9,10 @@ Extracted from: monitor.py lines 166-190, 423-449
 
 from __future__ import annotations
 
-from collections import deque
 from typing import Any
 
 from townlet.utils.coerce import coerce_int
+from townlet.utils.rolling import RollingStats
 
 
 class OptionThrashDetector:
@@ -26,7 +26,8 @@ class OptionThrashDetector:
     Window: 1000 ticks
 
     State:
-        - option_samples: Rolling deque of (tick, switch_count) tuples
+        - option_samples: Rolling window of (tick, switch_count) samples with
+          a running (exact for integer counts) sum
 
     Example:
         ```python
@@ -69,7 +70,7 @@ class OptionThrashDetector:
         self._window_ticks = window_ticks
         self._max_thrash_rate = max_thrash_rate
         self._min_samples = min_samples
-        self._option_samples: deque[tuple[int, int]] = deque()
+        self._option_samples = RollingStats()
         self._last_mean = 0.0
         self._last_sample_count = 0
 
@@ -91,21 +92,18 @@ class OptionThrashDetector:
             Dict with option_thrash_mean and option_samples
         """
         # Add new option samples
+        samples = self._option_samples
         if option_switch_counts:
             for count in option_switch_counts.values():
-                switch_count = coerce_int(count)
-                self._option_samples.append((tick, switch_count))
+                samples.add(tick, coerce_int(count))
 
         # Remove samples outside window
-        cutoff = tick - self._window_ticks
-        while self._option_samples and self._option_samples[0][0] < cutoff:
-            self._option_samples.popleft()
-
-        # Calculate mean
-        if self._option_samples:
-            values = [switch_count for _, switch_count in self._option_samples]
-            self._last_mean = sum(values) / len(values)
-            self._last_sample_count = len(values)
+        samples.evict_before(tick - self._window_ticks)
+
+        # Read mean from the running sum
+        if samples:
+            self._last_mean = samples.mean()
+            self._last_sample_count = len(samples)
         else:
             self._last_mean = 0.0
             self._last_sample_count = 0
@@ -142,7 +140,7 @@ class OptionThrashDetector:
             Dict with option_samples, last_mean, last_sample_count
         """
         return {
-            "option_samples": list(self._option_samples),
+            "option_samples": [(t, int(c)) for t, c in self._option_samples],
             "last_mean": self._last_mean,
             "last_sample_count": self._last_sample_count,
         }
@@ -155,13 +153,17 @@ class OptionThrashDetector:
         """
         samples = state.get("option_samples")
         if isinstance(samples, list):
-            self._option_samples = deque(
-                (int(t), int(c))
-                for t, c in samples
-                if isinstance(t, int) and isinstance(c, int)
+            # Integer counts sum exactly, so recomputing the accumulators on
+            # import is bitwise identical to the live window.
+            self._option_samples.load(
+                [
+                    (int(t), int(c))
+                    for t, c in samples
+                    if isinstance(t, int) and isinstance(c, int)
+                ]
             )
         else:
-            self._option_samples = deque()
+            self._option_samples.clear()
 
         mean = state.get("last_mean")
         if isinstance(mean, (int, float)):
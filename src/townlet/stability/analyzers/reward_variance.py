@@ -9,9 +9,10 @@ Extracted from: monitor.py lines 192-201, 388-412
 
 from __future__ import annotations
 
-from collections import deque
 from typing import Any
 
+from townlet.utils.rolling import RollingStats
+
 
 class RewardVarianceAnalyzer:
     """Analyzes reward variance across a rolling window.
@@ -24,7 +25,8 @@ class RewardVarianceAnalyzer:
     Window: 1000 ticks
 
     State:
-        - reward_samples: Rolling deque of (tick, reward) tuples
+        - reward_samples: Rolling window of (tick, reward) samples with
+          running sum/variance accumulators (O(1) per sample add/evict)
 
     Example:
         ```python
@@ -67,7 +69,7 @@ class RewardVarianceAnalyzer:
         self._window_ticks = window_ticks
         self._max_variance = max_variance
         self._min_samples = min_samples
-        self._reward_samples: deque[tuple[int, float]] = deque()
+        self._reward_samples = RollingStats()
         self._last_variance = 0.0
         self._last_mean = 0.0
         self._last_sample_count = 0
@@ -90,24 +92,20 @@ class RewardVarianceAnalyzer:
             Dict with variance, mean, and sample count
         """
         # Add new reward samples
+        samples = self._reward_samples
         if rewards:
             for reward in rewards.values():
                 if isinstance(reward, (int, float)):
-                    self._reward_samples.append((tick, float(reward)))
+                    samples.add(tick, float(reward))
 
         # Remove samples outside window
-        cutoff = tick - self._window_ticks
-        while self._reward_samples and self._reward_samples[0][0] < cutoff:
-            self._reward_samples.popleft()
-
-        # Calculate variance
-        if len(self._reward_samples) >= 2:
-            values = [r for _, r in self._reward_samples]
-            mean = sum(values) / len(values)
-            variance = sum((v - mean) ** 2 for v in values) / len(values)
-            self._last_variance = variance
-            self._last_mean = mean
-            self._last_sample_count = len(values)
+        samples.evict_before(tick - self._window_ticks)
+
+        # Read variance from the running accumulators
+        if len(samples) >= 2:
+            self._last_variance = samples.variance()
+            self._last_mean = samples.mean()
+            self._last_sample_count = len(samples)
         else:
             self._last_variance = 0.0
             self._last_mean = 0.0
@@ -144,10 +142,12 @@ class RewardVarianceAnalyzer:
         """Export state for snapshotting.
 
         Returns:
-            Dict with reward_samples, last_variance, last_mean, last_sample_count
+            Dict with reward_samples, reward_stats (window accumulators),
+            last_variance, last_mean, last_sample_count
         """
         return {
-            "reward_samples": list(self._reward_samples),
+            "reward_samples": self._reward_samples.samples(),
+            "reward_stats": self._reward_samples.export_state(),
             "last_variance": self._last_variance,
             "last_mean": self._last_mean,
             "last_sample_count": self._last_sample_count,
@@ -161,13 +161,17 @@ class RewardVarianceAnalyzer:
         """
         samples = state.get("reward_samples")
         if isinstance(samples, list):
-            self._reward_samples = deque(
+            restored = [
                 (int(t), float(r))
                 for t, r in samples
                 if isinstance(t, int) and isinstance(r, (int, float))
-            )
+            ]
+            stats = state.get("reward_stats")
+            # Accumulators only describe the exported window if nothing was dropped.
+            accumulators = stats if isinstance(stats, dict) and len(restored) == len(samples) else None
+            self._reward_samples.load(restored, accumulators)
         else:
-            self._reward_samples = deque()
+            self._reward_samples.clear()
 
         variance = state.get("last_variance")
         if isinstance(variance, (int, float)):
@@ -183,7 +183,7 @@ class StarvationDetector:
         """
         return {
             "starvation_streaks": dict(self._starvation_streaks),
-            "starvation_active": list(self._starvation_active),
+            "starvation_active": sorted(self._starvation_active),
             "starvation_incidents": list(self._starvation_incidents),
         }
 
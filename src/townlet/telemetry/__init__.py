@@ -1,8 +1,31 @@
-"""Telemetry publication surfaces."""
+"""Telemetry publication surfaces.
+
+Exports resolve lazily so light consumers (archive readers, transports) can be
+imported without loading the publisher and the world model behind it.
+"""
 
 from __future__ import annotations
 
-from .event_dispatcher import TelemetryEventDispatcher
-from .publisher import TelemetryPublisher
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover - static re-exports
+    from .event_dispatcher import TelemetryEventDispatcher
+    from .publisher import TelemetryPublisher
 
 __all__ = ["TelemetryEventDispatcher", "TelemetryPublisher"]
+
+
+def __getattr__(name: str) -> object:  # pragma: no cover - lazy import glue
+    if name == "TelemetryEventDispatcher":
+        from .event_dispatcher import TelemetryEventDispatcher as _TelemetryEventDispatcher
+
+        return _TelemetryEventDispatcher
+    if name == "TelemetryPublisher":
+        from .publisher import TelemetryPublisher as _TelemetryPublisher
+
+        return _TelemetryPublisher
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:  # pragma: no cover - module reflection helper
+    return sorted(__all__)
@@ -0,0 +1,509 @@
+"""Segmented, tick-indexed telemetry archive and its streaming reader.
+
+The archive is a directory of rotated NDJSON segments. Every segment has a
+sidecar index with one ``tick<TAB>offset<TAB>length<TAB>type`` line per record,
+where ``offset`` is the record's position in the uncompressed segment stream.
+Closed segments are summarised in ``manifest.json`` so readers can skip whole
+segments outside a requested tick range without opening them.
+
+:class:`TelemetryArchiveReader` also accepts a plain (optionally gzipped)
+NDJSON file, streaming it line by line so legacy ``FileTransport`` logs and
+PPO training logs share the same code path.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import logging
+from collections.abc import Collection, Iterator, Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, Any, Literal, NamedTuple
+
+from townlet.telemetry.transport import BaseTransport, TelemetryTransportError
+
+logger = logging.getLogger(__name__)
+
+ArchiveCompression = Literal["none", "gzip"]
+_ByteStream = IO[bytes] | gzip.GzipFile
+
+MANIFEST_NAME = "manifest.json"
+MANIFEST_VERSION = 1
+_SEGMENT_PREFIX = "segment-"
+_INDEX_SUFFIX = ".idx"
+_NO_TICK = "-"
+
+__all__ = [
+    "ArchiveEntry",
+    "ArchiveSegment",
+    "ArchiveTransport",
+    "TelemetryArchiveReader",
+    "record_event_type",
+]
+
+
+def record_event_type(record: Mapping[str, Any]) -> str:
+    """Return the event type used to index ``record``.
+
+    Stream payloads carry ``payload_type`` (``snapshot``/``diff``); console and
+    health events use ``event`` or ``kind``.
+    """
+
+    for key in ("payload_type", "event", "kind"):
+        value = record.get(key)
+        if isinstance(value, str) and value:
+            return value
+    return "unknown"
+
+
+def _record_tick(record: dict[str, Any]) -> int | None:
+    value = record.get("tick")
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, int):
+        return value
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return None
+
+
+def _decode_index_fields(payload: bytes) -> tuple[int | None, str]:
+    try:
+        record = json.loads(payload)
+    except ValueError as exc:
+        raise TelemetryTransportError(f"ArchiveTransport expects JSON payloads: {exc}") from exc
+    if isinstance(record, dict):
+        return _record_tick(record), record_event_type(record)
+    return None, "unknown"
+
+
+def _segment_name(index: int, compression: ArchiveCompression) -> str:
+    suffix = ".jsonl.gz" if compression == "gzip" else ".jsonl"
+    return f"{_SEGMENT_PREFIX}{index:06d}{suffix}"
+
+
+def _index_path(segment_path: Path) -> Path:
+    name = segment_path.name.removesuffix(".gz").removesuffix(".jsonl")
+    return segment_path.with_name(name + _INDEX_SUFFIX)
+
+
+def _segment_number(path: Path) -> int | None:
+    stem = path.name.removesuffix(".gz").removesuffix(".jsonl").removesuffix(_INDEX_SUFFIX)
+    if not stem.startswith(_SEGMENT_PREFIX):
+        return None
+    try:
+        return int(stem[len(_SEGMENT_PREFIX) :])
+    except ValueError:
+        return None
+
+
+@dataclass(frozen=True)
+class ArchiveSegment:
+    """Metadata for one archive segment."""
+
+    path: Path
+    index: int
+    first_tick: int | None
+    last_tick: int | None
+    records: int
+    compression: ArchiveCompression
+
+    def overlaps(self, start_tick: int | None, end_tick: int | None) -> bool:
+        if self.first_tick is None or self.last_tick is None:
+            return True
+        if start_tick is not None and self.last_tick < start_tick:
+            return False
+        if end_tick is not None and self.first_tick > end_tick:
+            return False
+        return True
+
+    def to_manifest(self) -> dict[str, object]:
+        return {
+            "name": self.path.name,
+            "index": self.index,
+            "first_tick": self.first_tick,
+            "last_tick": self.last_tick,
+            "records": self.records,
+            "compression": self.compression,
+        }
+
+
+class ArchiveEntry(NamedTuple):
+    """A decoded archive record together with its human-readable location."""
+
+    location: str
+    tick: int | None
+    event_type: str
+    record: dict[str, Any]
+
+
+class ArchiveTransport(BaseTransport):
+    """Writes telemetry payloads into rotated, indexed archive segments.
+
+    A new segment is opened on every ``start()`` and whenever the current one
+    reaches ``segment_max_bytes`` (uncompressed) or already covers
+    ``segment_max_ticks`` ticks. Plain segments are flushed per payload so
+    they can be read while the simulation runs; gzip segments are only
+    complete once rotated or stopped.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        *,
+        segment_max_bytes: int = 64 * 1024 * 1024,
+        segment_max_ticks: int | None = None,
+        compression: ArchiveCompression = "none",
+    ) -> None:
+        if segment_max_bytes <= 0:
+            raise TelemetryTransportError("archive segment_max_bytes must be positive")
+        if segment_max_ticks is not None and segment_max_ticks <= 0:
+            raise TelemetryTransportError("archive segment_max_ticks must be positive")
+        if compression not in ("none", "gzip"):
+            raise TelemetryTransportError(f"Unsupported archive compression: {compression}")
+        self._directory = Path(directory).expanduser()
+        self._segment_max_bytes = int(segment_max_bytes)
+        self._segment_max_ticks = segment_max_ticks
+        self._compression: ArchiveCompression = compression
+        self._segments: list[ArchiveSegment] = []
+        self._handle: _ByteStream | None = None
+        self._index_handle: IO[str] | None = None
+        self._segment_path: Path | None = None
+        self._segment_index = -1
+        self._offset = 0
+        self._records = 0
+        self._first_tick: int | None = None
+        self._last_tick: int | None = None
+
+    @property
+    def directory(self) -> Path:
+        return self._directory
+
+    def start(self) -> None:
+        if self._handle is not None:
+            return
+        self._directory.mkdir(parents=True, exist_ok=True)
+        # Resume numbering after any segments left by earlier runs.
+        self._segments = TelemetryArchiveReader(self._directory).segments
+        self._segment_index = max((segment.index for segment in self._segments), default=-1)
+        self._open_segment()
+
+    def stop(self) -> None:
+        if self._handle is None:
+            return
+        self._close_segment()
+        self._write_manifest()
+
+    def send(self, payload: bytes, *, tick: int | None = None, event_type: str | None = None) -> None:
+        if self._handle is None or self._index_handle is None:
+            raise TelemetryTransportError("ArchiveTransport used before start()")
+        if not payload.endswith(b"\n"):
+            payload += b"\n"
+        if tick is None or event_type is None:
+            # Only direct callers omit the metadata; the publisher passes both.
+            tick, event_type = _decode_index_fields(payload)
+        if self._should_rotate(tick):
+            self._close_segment()
+            self._write_manifest()
+            self._open_segment()
+            assert self._handle is not None and self._index_handle is not None
+        self._handle.write(payload)
+        tick_field = _NO_TICK if tick is None else str(tick)
+        self._index_handle.write(f"{tick_field}\t{self._offset}\t{len(payload)}\t{event_type}\n")
+        if self._compression == "none":
+            self._handle.flush()
+            self._index_handle.flush()
+        self._offset += len(payload)
+        self._records += 1
+        if tick is not None:
+            self._first_tick = tick if self._first_tick is None else min(self._first_tick, tick)
+            self._last_tick = tick if self._last_tick is None else max(self._last_tick, tick)
+
+    def _should_rotate(self, tick: int | None) -> bool:
+        if self._records == 0:
+            return False
+        if self._offset >= self._segment_max_bytes:
+            return True
+        if self._segment_max_ticks is not None and tick is not None and self._first_tick is not None:
+            return tick - self._first_tick >= self._segment_max_ticks
+        return False
+
+    def _open_segment(self) -> None:
+        self._segment_index += 1
+        path = self._directory / _segment_name(self._segment_index, self._compression)
+        if self._compression == "gzip":
+            self._handle = gzip.open(path, "wb")
+        else:
+            self._handle = path.open("wb")
+        self._index_handle = _index_path(path).open("w", encoding="utf-8")
+        self._segment_path = path
+        self._offset = 0
+        self._records = 0
+        self._first_tick = None
+        self._last_tick = None
+
+    def _close_segment(self) -> None:
+        if self._handle is not None:
+            self._handle.close()
+        if self._index_handle is not None:
+            self._index_handle.close()
+        self._handle = None
+        self._index_handle = None
+        if self._segment_path is not None:
+            self._segments.append(
+                ArchiveSegment(
+                    path=self._segment_path,
+                    index=self._segment_index,
+                    first_tick=self._first_tick,
+                    last_tick=self._last_tick,
+                    records=self._records,
+                    compression=self._compression,
+                )
+            )
+        self._segment_path = None
+
+    def _write_manifest(self) -> None:
+        manifest = {
+            "version": MANIFEST_VERSION,
+            "segments": [segment.to_manifest() for segment in self._segments],
+        }
+        path = self._directory / MANIFEST_NAME
+        tmp = path.with_suffix(path.suffix + ".tmp")
+        tmp.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+        tmp.replace(path)
+
+
+def _open_stream(path: Path) -> _ByteStream:
+    if path.suffix == ".gz":
+        return gzip.open(path, "rb")
+    return path.open("rb")
+
+
+def _decode(line: bytes, location: str) -> dict[str, Any]:
+    try:
+        payload = json.loads(line)
+    except json.JSONDecodeError as err:
+        raise ValueError(f"{location}: invalid JSON - {err}") from err
+    if not isinstance(payload, dict):
+        raise ValueError(f"{location}: expected JSON object")
+    return payload
+
+
+def _iter_index(index_path: Path) -> Iterator[tuple[int | None, int, int, str]]:
+    with index_path.open("r", encoding="utf-8") as handle:
+        for line in handle:
+            parts = line.rstrip("\n").split("\t")
+            if len(parts) != 4:
+                # A torn final line from a live writer; stop at the last complete entry.
+                return
+            tick_field, offset, length, event_type = parts
+            tick = None if tick_field == _NO_TICK else int(tick_field)
+            yield tick, int(offset), int(length), event_type
+
+
+class TelemetryArchiveReader:
+    """Lazily stream records from an archive directory or an NDJSON file.
+
+    ``iter_records`` filters by an inclusive tick range and a set of event
+    types. Archive segments outside the range are skipped via the manifest,
+    and within a segment only indexed records that match are decoded. Plain
+    NDJSON files have no index and are scanned line by line.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self._path = Path(path).expanduser()
+        if not self._path.exists():
+            raise FileNotFoundError(self._path)
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    @property
+    def is_archive(self) -> bool:
+        return self._path.is_dir()
+
+    @property
+    def segments(self) -> list[ArchiveSegment]:
+        """Return segment metadata, ordered by segment number."""
+
+        if not self.is_archive:
+            return []
+        known: dict[int, ArchiveSegment] = {}
+        manifest_path = self._path / MANIFEST_NAME
+        if manifest_path.exists():
+            manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+            for item in manifest.get("segments", []):
+                known[int(item["index"])] = ArchiveSegment(
+                    path=self._path / str(item["name"]),
+                    index=int(item["index"]),
+                    first_tick=item.get("first_tick"),
+                    last_tick=item.get("last_tick"),
+                    records=int(item.get("records", 0)),
+                    compression=item.get("compression", "none"),
+                )
+        for path in self._path.glob(f"{_SEGMENT_PREFIX}*.jsonl*"):
+            number = _segment_number(path)
+            if number is None or number in known:
+                continue
+            known[number] = self._scan_segment(path, number)
+        return [known[number] for number in sorted(known)]
+
+    def _scan_segment(self, path: Path, number: int) -> ArchiveSegment:
+        first_tick: int | None = None
+        last_tick: int | None = None
+        records = 0
+        index_path = _index_path(path)
+        if index_path.exists():
+            for tick, *_ in _iter_index(index_path):
+                records += 1
+                if tick is not None:
+                    first_tick = tick if first_tick is None else min(first_tick, tick)
+                    last_tick = tick if last_tick is None else max(last_tick, tick)
+        return ArchiveSegment(
+            path=path,
+            index=number,
+            first_tick=first_tick,
+            last_tick=last_tick,
+            records=records,
+            compression="gzip" if path.suffix == ".gz" else "none",
+        )
+
+    def iter_records(
+        self,
+        *,
+        start_tick: int | None = None,
+        end_tick: int | None = None,
+        event_types: Collection[str] | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        for entry in self.iter_entries(start_tick=start_tick, end_tick=end_tick, event_types=event_types):
+            yield entry.record
+
+    def iter_entries(
+        self,
+        *,
+        start_tick: int | None = None,
+        end_tick: int | None = None,
+        event_types: Collection[str] | None = None,
+    ) -> Iterator[ArchiveEntry]:
+        """Yield matching records with their location and index metadata.
+
+        Records without a ``tick`` are only yielded when no tick range is set.
+        """
+
+        types = frozenset(event_types) if event_types is not None else None
+        if not self.is_archive:
+            yield from self._iter_plain(self._path, start_tick, end_tick, types)
+            return
+        for segment in self.segments:
+            if not segment.overlaps(start_tick, end_tick):
+                continue
+            index_path = _index_path(segment.path)
+            if index_path.exists():
+                yield from self._iter_indexed(segment.path, index_path, start_tick, end_tick, types)
+            else:
+                logger.warning("telemetry_archive_missing_index segment=%s", segment.path)
+                yield from self._iter_plain(segment.path, start_tick, end_tick, types)
+
+    def snapshot_at(self, tick: int | None = None) -> dict[str, Any] | None:
+        """Rebuild the full stream snapshot as of ``tick`` (latest when ``None``).
+
+        Stream payloads are one ``snapshot`` followed by ``diff`` payloads, so
+        the nearest snapshot at or before ``tick`` is located from the index and
+        only the diffs after it are decoded and applied.
+        """
+
+        start_tick = self._last_snapshot_tick(tick) if self.is_archive else None
+        state: dict[str, Any] | None = None
+        for entry in self.iter_entries(start_tick=start_tick, end_tick=tick, event_types=("snapshot", "diff")):
+            record = entry.record
+            if entry.event_type == "snapshot":
+                state = dict(record)
+                continue
+            if state is None:
+                continue
+            changes = record.get("changes")
+            if isinstance(changes, dict):
+                state.update(changes)
+            for key in record.get("removed", ()) or ():
+                state.pop(str(key), None)
+            state["tick"] = record.get("tick", state.get("tick"))
+        return state
+
+    def _last_snapshot_tick(self, end_tick: int | None) -> int | None:
+        latest: int | None = None
+        for segment in self.segments:
+            if not segment.overlaps(None, end_tick):
+                continue
+            index_path = _index_path(segment.path)
+            if not index_path.exists():
+                return None
+            for tick, _offset, _length, event_type in _iter_index(index_path):
+                if event_type != "snapshot" or tick is None:
+                    continue
+                if end_tick is None or tick <= end_tick:
+                    latest = tick if latest is None else max(latest, tick)
+        return latest
+
+    def _iter_indexed(
+        self,
+        segment_path: Path,
+        index_path: Path,
+        start_tick: int | None,
+        end_tick: int | None,
+        types: frozenset[str] | None,
+    ) -> Iterator[ArchiveEntry]:
+        with _open_stream(segment_path) as handle:
+            position = 0
+            for ordinal, (tick, offset, length, event_type) in enumerate(_iter_index(index_path), start=1):
+                if not _matches(tick, event_type, start_tick, end_tick, types):
+                    continue
+                try:
+                    if offset != position:
+                        handle.seek(offset)
+                    line = handle.read(length)
+                except EOFError:
+                    # Unfinished gzip segment still held open by a writer.
+                    return
+                position = offset + len(line)
+                if len(line) < length:
+                    return
+                location = f"{segment_path}:{ordinal}"
+                yield ArchiveEntry(location, tick, event_type, _decode(line, location))
+
+    def _iter_plain(
+        self,
+        path: Path,
+        start_tick: int | None,
+        end_tick: int | None,
+        types: frozenset[str] | None,
+    ) -> Iterator[ArchiveEntry]:
+        with _open_stream(path) as handle:
+            for line_number, line in enumerate(handle, start=1):
+                if not line.strip():
+                    continue
+                location = f"{path}:{line_number}"
+                record = _decode(line, location)
+                tick = _record_tick(record)
+                event_type = record_event_type(record)
+                if _matches(tick, event_type, start_tick, end_tick, types):
+                    yield ArchiveEntry(location, tick, event_type, record)
+
+
+def _matches(
+    tick: int | None,
+    event_type: str,
+    start_tick: int | None,
+    end_tick: int | None,
+    types: frozenset[str] | None,
+) -> bool:
+    if types is not None and event_type not in types:
+        return False
+    if start_tick is None and end_tick is None:
+        return True
+    if tick is None:
+        return False
+    if start_tick is not None and tick < start_tick:
+        return False
+    return end_tick is None or tick <= end_tick
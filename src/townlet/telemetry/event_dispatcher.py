@@ -28,6 +28,7 @@ class TelemetryEventDispatcher:
         self._latest_health: dict[str, Any] | None = None
         self._latest_failure: dict[str, Any] | None = None
         self._subscribers: list[Callable[[str, Mapping[str, Any]], None]] = []
+        self._generation = 0
 
     # ------------------------------------------------------------------
     # Public API
@@ -36,6 +37,7 @@ class TelemetryEventDispatcher:
         """Normalise ``payload``, update caches, and notify subscribers."""
 
         event_payload = self._coerce_payload(payload)
+        self._generation += 1
         self._update_caches(name, event_payload)
         for subscriber in list(self._subscribers):
             try:
@@ -74,6 +76,12 @@ class TelemetryEventDispatcher:
     def possessed_agents(self) -> list[str]:
         return list(self._possessed_agents)
 
+    @property
+    def generation(self) -> int:
+        """Number of events dispatched so far; changes whenever cached state may have."""
+
+        return self._generation
+
     @property
     def latest_tick(self) -> dict[str, Any] | None:
         return None if self._latest_tick is None else dict(self._latest_tick)
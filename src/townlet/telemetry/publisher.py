@@ -22,6 +22,7 @@ from townlet.telemetry.aggregation import (
     StreamPayloadBuilder,
     TelemetryAggregator,
 )
+from townlet.telemetry.archive import record_event_type
 from townlet.telemetry.event_dispatcher import TelemetryEventDispatcher
 from townlet.telemetry.events import (
     RELATIONSHIP_FRIENDSHIP_EVENT,
@@ -71,78 +72,14 @@ class TelemetryPublisher(_TelemetrySinkBase):
         self._relationship_narration_cfg = self.config.telemetry.relationship_narration
         self._personality_narration_cfg = self.config.telemetry.personality_narration
         self._latest_console_events: deque[object] = deque(maxlen=50)
-        self._latest_queue_metrics: dict[str, int] | None = None
-        self._latest_embedding_metrics: dict[str, float] | None = None
-        self._latest_events: list[dict[str, object]] = []
-        self._latest_policy_metadata_event: dict[str, object] | None = None
-        self._latest_policy_anneal_event: dict[str, object] | None = None
-        self._latest_policy_metadata_snapshot: dict[str, object] | None = None
         self._event_subscribers: list[Callable[[list[dict[str, object]]], None]] = []
-        self._latest_employment_metrics: dict[str, object] = {}
-        self._latest_conflict_snapshot: dict[str, object] = {
-            "queues": {"cooldown_events": 0, "ghost_step_events": 0, "rotation_events": 0},
-            "queue_history": [],
-            "rivalry": {},
-            "rivalry_events": [],
-        }
-        self._latest_relationship_metrics: dict[str, object] | None = None
-        self._latest_job_snapshot: dict[str, object] = {}
-        self._latest_economy_snapshot: dict[str, object] = {}
-        self._latest_relationship_snapshot: dict[str, dict[str, dict[str, float]]] = {}
-        self._latest_relationship_updates: list[dict[str, object]] = []
-        self._previous_relationship_snapshot: dict[str, dict[str, dict[str, float]]] = {}
-        self._narration_limiter = NarrationRateLimiter(self.config.telemetry.narration)
-        self._latest_narrations: list[dict[str, object]] = []
-        self._latest_anneal_status: dict[str, object] | None = None
-        self._latest_relationship_overlay: dict[str, list[dict[str, object]]] = {}
-        self._latest_policy_snapshot: dict[str, dict[str, object]] = {}
-        self._kpi_history: dict[str, list[float]] = {
-            "queue_conflict_intensity": [],
-            "employment_lateness": [],
-            "late_help_events": [],
-        }
-        self._latest_affordance_manifest: dict[str, object] = {}
-        self._latest_affordance_runtime: dict[str, object] = {
-            "tick": 0,
-            "running": {},
-            "running_count": 0,
-            "active_reservations": {},
-            "event_counts": {
-                "start": 0,
-                "finish": 0,
-                "fail": 0,
-                "precondition_fail": 0,
-            },
-        }
-        self._latest_reward_breakdown: dict[str, dict[str, float]] = {}
-        self._latest_stability_inputs: dict[str, object] = {}
-        self._latest_stability_metrics: dict[str, object] = {}
-        self._latest_perturbations: dict[str, object] = {}
-        self._latest_policy_identity: dict[str, object] | None = None
-        self._latest_snapshot_migrations: list[str] = []
-        self._queue_fairness_history: list[dict[str, object]] = []
-        self._rivalry_event_history: list[dict[str, object]] = []
-        self._latest_possessed_agents: list[str] = []
-        self._latest_precondition_failures: list[dict[str, object]] = []
-        self._latest_console_results: list[dict[str, Any]] = []
-        self._last_console_results_tick: int | None = None
         self._console_results_history: deque[dict[str, Any]] = deque(maxlen=200)
         self._console_audit_path = Path("logs/console/commands.jsonl")
-        self._latest_health_status: dict[str, object] = {}
-        self._latest_economy_settings: dict[str, float] = {
-            str(key): float(value) for key, value in self.config.economy.items()
-        }
-        self._latest_price_spikes: dict[str, dict[str, object]] = {}
-        self._latest_utilities: dict[str, bool] = {"power": True, "water": True}
         self._console_auth = ConsoleAuthenticator(config.console_auth)
-        self._social_event_history: deque[dict[str, object]] = deque(maxlen=60)
-        self._latest_relationship_summary: dict[str, object] = {}
-        self._latest_personality_snapshot: dict[str, object] = {}
-        self._current_tick: int = 0
         self._pending_manual_narrations: list[dict[str, object]] = []
         self._manual_narration_lock = threading.Lock()
         self._runtime_variant: str | None = None
-        self._latest_observation_envelope: dict[str, Any] | None = None
+        self._init_episode_state()
         self._event_dispatcher = TelemetryEventDispatcher()
         self._event_dispatcher.register_subscriber(self._handle_event)
         self._global_context_warning_fields: set[str] = set()
@@ -193,7 +130,9 @@ class TelemetryPublisher(_TelemetrySinkBase):
             buffer=self._transport_buffer,
             retry_policy=self._transport_retry,
             status=self._transport_status,
-            send_callable=lambda payload: self._transport_client.send(payload),
+            send_callable=lambda payload, tick, event_type: self._transport_client.send(
+                payload, tick=tick, event_type=event_type
+            ),
             reset_callable=self._reset_transport_client,
             poll_interval_seconds=poll_interval,
             flush_interval_ticks=int(transport_cfg.buffer.flush_interval_ticks),
@@ -223,6 +162,82 @@ class TelemetryPublisher(_TelemetrySinkBase):
         self._transform_pipeline = self._transform_config.build_pipeline()
         self._worker_manager.start()
 
+    def _init_episode_state(self) -> None:
+        self._latest_queue_metrics: dict[str, int] | None = None
+        self._latest_embedding_metrics: dict[str, float] | None = None
+        self._latest_events: list[dict[str, object]] = []
+        self._latest_policy_metadata_event: dict[str, object] | None = None
+        self._latest_policy_anneal_event: dict[str, object] | None = None
+        self._latest_policy_metadata_snapshot: dict[str, object] | None = None
+        self._latest_employment_metrics: dict[str, object] = {}
+        self._latest_conflict_snapshot: dict[str, object] = {
+            "queues": {"cooldown_events": 0, "ghost_step_events": 0, "rotation_events": 0},
+            "queue_history": [],
+            "rivalry": {},
+            "rivalry_events": [],
+        }
+        self._latest_relationship_metrics: dict[str, object] | None = None
+        self._latest_job_snapshot: dict[str, object] = {}
+        self._latest_economy_snapshot: dict[str, object] = {}
+        self._latest_relationship_snapshot: dict[str, dict[str, dict[str, float]]] = {}
+        self._latest_relationship_updates: list[dict[str, object]] = []
+        self._previous_relationship_snapshot: dict[str, dict[str, dict[str, float]]] = {}
+        self._narration_limiter = NarrationRateLimiter(self.config.telemetry.narration)
+        self._latest_narrations: list[dict[str, object]] = []
+        self._latest_anneal_status: dict[str, object] | None = None
+        self._latest_relationship_overlay: dict[str, list[dict[str, object]]] = {}
+        self._latest_policy_snapshot: dict[str, dict[str, object]] = {}
+        self._kpi_history: dict[str, list[float]] = {
+            "queue_conflict_intensity": [],
+            "employment_lateness": [],
+            "late_help_events": [],
+        }
+        self._latest_affordance_manifest: dict[str, object] = {}
+        self._latest_affordance_runtime: dict[str, object] = {
+            "tick": 0,
+            "running": {},
+            "running_count": 0,
+            "active_reservations": {},
+            "event_counts": {
+                "start": 0,
+                "finish": 0,
+                "fail": 0,
+                "precondition_fail": 0,
+            },
+        }
+        self._latest_reward_breakdown: dict[str, dict[str, float]] = {}
+        self._latest_stability_inputs: dict[str, object] = {}
+        self._latest_stability_metrics: dict[str, object] = {}
+        self._latest_perturbations: dict[str, object] = {}
+        self._latest_policy_identity: dict[str, object] | None = None
+        self._latest_snapshot_migrations: list[str] = []
+        self._queue_fairness_history: list[dict[str, object]] = []
+        self._rivalry_event_history: list[dict[str, object]] = []
+        self._latest_possessed_agents: list[str] = []
+        self._latest_precondition_failures: list[dict[str, object]] = []
+        self._latest_console_results: list[dict[str, Any]] = []
+        self._last_console_results_tick: int | None = None
+        self._latest_health_status: dict[str, object] = {}
+        self._latest_economy_settings: dict[str, float] = {
+            str(key): float(value) for key, value in self.config.economy.items()
+        }
+        self._latest_price_spikes: dict[str, dict[str, object]] = {}
+        self._latest_utilities: dict[str, bool] = {"power": True, "water": True}
+        self._social_event_history: deque[dict[str, object]] = deque(maxlen=60)
+        self._latest_relationship_summary: dict[str, object] = {}
+        self._latest_personality_snapshot: dict[str, object] = {}
+        self._current_tick: int = 0
+        self._latest_observation_envelope: dict[str, Any] | None = None
+
+    def reset_state(self) -> None:
+        """Clear per-episode telemetry state while keeping transport, worker and console wiring.
+
+        The diff baseline is dropped too, so the next payload is a full snapshot.
+        """
+
+        self._init_episode_state()
+        self._payload_builder.reset()
+
     def _build_transforms_from_config(self) -> list[object]:
         """Instantiate telemetry transforms based on configuration."""
 
@@ -930,6 +945,9 @@ class TelemetryPublisher(_TelemetrySinkBase):
                 key_file=getattr(cfg, "key_file", None),
                 allow_plaintext=bool(getattr(cfg, "allow_plaintext", False)),
                 websocket_url=getattr(cfg, "websocket_url", None),
+                archive_segment_max_bytes=int(cfg.archive.segment_max_bytes),
+                archive_segment_max_ticks=cfg.archive.segment_max_ticks,
+                archive_compression=cfg.archive.compression,
             )
             start = getattr(client, "start", None)
             if callable(start):
@@ -957,7 +975,7 @@ class TelemetryPublisher(_TelemetrySinkBase):
         ).encode("utf-8")
         if not encoded.endswith(b"\n"):
             encoded += b"\n"
-        self._worker_manager.enqueue(encoded, tick=int(tick))
+        self._worker_manager.enqueue(encoded, tick=int(tick), event_type=record_event_type(payload))
 
     def stop_worker(self, *, wait: bool = True, timeout: float = 2.0) -> None:
         """Stop the background flush worker without closing transports."""
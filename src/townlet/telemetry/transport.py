@@ -10,7 +10,7 @@ from collections import deque
 from contextlib import AbstractContextManager
 from pathlib import Path
 from types import TracebackType
-from typing import IO, BinaryIO, Literal, TypeVar
+from typing import IO, BinaryIO, Literal, NamedTuple, TypeVar
 from urllib import error as urllib_error
 from urllib import request as urllib_request
 
@@ -33,7 +33,19 @@ class BaseTransport(AbstractContextManager["BaseTransport"]):
     def stop(self) -> None:
         """Tear down resources (default no-op)."""
 
-    def send(self, payload: bytes) -> None:  # pragma: no cover - interface stub
+    def send(
+        self,
+        payload: bytes,
+        *,
+        tick: int | None = None,
+        event_type: str | None = None,
+    ) -> None:  # pragma: no cover - interface stub
+        """Deliver ``payload``.
+
+        ``tick`` and ``event_type`` are supplied by the publisher, which already
+        knows them, so transports that index payloads never decode them again.
+        """
+
         raise NotImplementedError
 
     # Context manager helpers -------------------------------------------------
@@ -69,7 +81,7 @@ class StdoutTransport(BaseTransport):
             self._stream.flush()
         self._stream = None
 
-    def send(self, payload: bytes) -> None:
+    def send(self, payload: bytes, *, tick: int | None = None, event_type: str | None = None) -> None:
         if self._stream is None:
             raise TelemetryTransportError("StdoutTransport used before start()")
         self._stream.write(payload)
@@ -92,7 +104,7 @@ class FileTransport(BaseTransport):
             self._handle.close()
         self._handle = None
 
-    def send(self, payload: bytes) -> None:
+    def send(self, payload: bytes, *, tick: int | None = None, event_type: str | None = None) -> None:
         if self._handle is None:
             raise TelemetryTransportError("FileTransport used before start()")
         self._handle.write(payload)
@@ -184,7 +196,7 @@ class TcpTransport(BaseTransport):
         self._ssl_context = context
         return context
 
-    def send(self, payload: bytes) -> None:
+    def send(self, payload: bytes, *, tick: int | None = None, event_type: str | None = None) -> None:
         if self._socket is None:
             self._connect()
         assert self._socket is not None
@@ -217,7 +229,7 @@ class HttpTransport(BaseTransport):
         self._timeout: float | None = timeout if timeout > 0 else None
         self._opener = urllib_request.build_opener()
 
-    def send(self, payload: bytes) -> None:
+    def send(self, payload: bytes, *, tick: int | None = None, event_type: str | None = None) -> None:
         request = urllib_request.Request(
             self._url,
             data=payload,
@@ -253,7 +265,7 @@ class WebsocketTransport(BaseTransport):
             logger.info("WebsocketTransport stop requested url=%s (stub)", self._url)
         self._started = False
 
-    def send(self, payload: bytes) -> None:
+    def send(self, payload: bytes, *, tick: int | None = None, event_type: str | None = None) -> None:
         raise TelemetryTransportError("WebsocketTransport is not implemented yet")
 
 
@@ -281,7 +293,7 @@ class PrometheusTextfileTransport(BaseTransport):
             self._write_metrics()
         self._started = False
 
-    def send(self, payload: bytes) -> None:
+    def send(self, payload: bytes, *, tick: int | None = None, event_type: str | None = None) -> None:
         if not self._started:
             raise TelemetryTransportError("PrometheusTextfileTransport used before start()")
         size = len(payload)
@@ -299,23 +311,38 @@ class PrometheusTextfileTransport(BaseTransport):
         tmp.replace(self._path)
 
 
+class BufferedPayload(NamedTuple):
+    """Encoded payload queued in :class:`TransportBuffer` with its metadata."""
+
+    payload: bytes
+    tick: int | None
+    event_type: str | None
+
+
 class TransportBuffer:
-    """Accumulates payloads prior to flushing to the transport."""
+    """Accumulates payloads prior to flushing to the transport.
+
+    Each payload is kept alongside its tick and event type so the flush path
+    can hand them to the transport without decoding the payload.
+    """
 
     def __init__(self, *, max_batch_size: int, max_buffer_bytes: int) -> None:
-        self._queue: deque[bytes] = deque()
+        self._queue: deque[BufferedPayload] = deque()
         self._total_bytes = 0
         self.max_batch_size = max_batch_size
         self.max_buffer_bytes = max_buffer_bytes
 
-    def append(self, payload: bytes) -> None:
-        self._queue.append(payload)
+    def append(self, payload: bytes, *, tick: int | None = None, event_type: str | None = None) -> None:
+        self._queue.append(BufferedPayload(payload, tick, event_type))
         self._total_bytes += len(payload)
 
     def popleft(self) -> bytes:
-        payload = self._queue.popleft()
-        self._total_bytes -= len(payload)
-        return payload
+        return self.popleft_entry().payload
+
+    def popleft_entry(self) -> BufferedPayload:
+        entry = self._queue.popleft()
+        self._total_bytes -= len(entry.payload)
+        return entry
 
     def clear(self) -> None:
         self._queue.clear()
@@ -336,8 +363,8 @@ class TransportBuffer:
 
         dropped = 0
         while self._queue and self._total_bytes > self.max_buffer_bytes:
-            payload = self._queue.popleft()
-            self._total_bytes -= len(payload)
+            entry = self._queue.popleft()
+            self._total_bytes -= len(entry.payload)
             dropped += 1
         return dropped
 
@@ -356,6 +383,9 @@ def create_transport(
     key_file: Path | None,
     allow_plaintext: bool,
     websocket_url: str | None = None,
+    archive_segment_max_bytes: int = 64 * 1024 * 1024,
+    archive_segment_max_ticks: int | None = None,
+    archive_compression: Literal["none", "gzip"] = "none",
 ) -> BaseTransport:
     """Factory helper for `TelemetryPublisher`."""
 
@@ -421,6 +451,21 @@ def create_transport(
         prometheus_transport = PrometheusTextfileTransport(file_path)
         prometheus_transport.start()
         return prometheus_transport
+    if transport_type == "archive":
+        if file_path is None:
+            raise TelemetryTransportError(
+                "telemetry.transport.file_path is required for archive transport"
+            )
+        from townlet.telemetry.archive import ArchiveTransport
+
+        archive_transport = ArchiveTransport(
+            file_path,
+            segment_max_bytes=archive_segment_max_bytes,
+            segment_max_ticks=archive_segment_max_ticks,
+            compression=archive_compression,
+        )
+        archive_transport.start()
+        return archive_transport
     raise TelemetryTransportError(
         f"Unsupported telemetry transport type: {transport_type}"
     )
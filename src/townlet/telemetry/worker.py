@@ -10,7 +10,7 @@ from collections.abc import Callable
 from typing import Any, Literal
 
 from townlet.config.telemetry import TelemetryRetryPolicy
-from townlet.telemetry.transport import TransportBuffer
+from townlet.telemetry.transport import BufferedPayload, TransportBuffer
 
 logger = logging.getLogger(__name__)
 
@@ -26,7 +26,7 @@ class TelemetryWorkerManager:
         buffer: TransportBuffer,
         retry_policy: TelemetryRetryPolicy,
         status: dict[str, Any],
-        send_callable: Callable[[bytes], None],
+        send_callable: Callable[[bytes, int | None, str | None], None],
         reset_callable: Callable[[], None],
         poll_interval_seconds: float,
         flush_interval_ticks: int,
@@ -92,11 +92,11 @@ class TelemetryWorkerManager:
         self._drain_on_close()
 
     # Queue management -----------------------------------------------------------
-    def enqueue(self, payload: bytes, *, tick: int) -> None:
+    def enqueue(self, payload: bytes, *, tick: int, event_type: str | None = None) -> None:
         tick = int(tick)
-        overflow_payloads: deque[bytes] = deque()
+        overflow_payloads: deque[BufferedPayload] = deque()
         with self._buffer_not_full:
-            self._buffer.append(payload)
+            self._buffer.append(payload, tick=tick, event_type=event_type)
             self._latest_enqueue_tick = max(self._latest_enqueue_tick, tick)
             self._status["queue_length"] = len(self._buffer)
             # Track peak queue length and total buffered bytes
@@ -143,7 +143,7 @@ class TelemetryWorkerManager:
             self._maybe_restart()
 
     # Internal helpers -----------------------------------------------------------
-    def _apply_backpressure_locked(self, overflow: deque[bytes]) -> None:
+    def _apply_backpressure_locked(self, overflow: deque[BufferedPayload]) -> None:
         if not self._buffer.is_over_capacity():
             return
         strategy = self._backpressure_strategy
@@ -181,12 +181,12 @@ class TelemetryWorkerManager:
                 self._buffer_not_full.notify_all()
         elif strategy == "fan_out":
             while self._buffer.is_over_capacity():
-                overflow.append(self._buffer.popleft())
+                overflow.append(self._buffer.popleft_entry())
                 self._status["queue_length"] = len(self._buffer)
                 self._buffer_not_full.notify_all()
 
-    def _send_in_caller(self, payload: bytes, tick: int) -> None:
-        if not self._send_with_retry(payload, tick):
+    def _send_in_caller(self, entry: BufferedPayload, tick: int) -> None:
+        if not self._send_with_retry(entry, tick):
             self._status["dropped_messages"] += 1
             logger.error("Dropping telemetry payload after fan-out send failures")
 
@@ -207,13 +207,13 @@ class TelemetryWorkerManager:
             with self._buffer_not_full:
                 if not len(self._buffer):
                     break
-                payload = self._buffer.popleft()
+                entry = self._buffer.popleft_entry()
                 self._status["queue_length"] = len(self._buffer)
                 self._buffer_not_full.notify_all()
             flushed_any = True
             flushed_count += 1
-            flushed_bytes += len(payload)
-            if not self._send_with_retry(payload, tick_hint):
+            flushed_bytes += len(entry.payload)
+            if not self._send_with_retry(entry, tick_hint):
                 self._status["dropped_messages"] += 1
                 logger.error("Dropping telemetry payload after repeated send failures")
                 with self._buffer_not_full:
@@ -239,13 +239,13 @@ class TelemetryWorkerManager:
                 self._status["bytes_flushed_total"] = int(flushed_bytes)
             self._last_flush_tick = tick_hint
 
-    def _send_with_retry(self, payload: bytes, tick: int) -> bool:
+    def _send_with_retry(self, entry: BufferedPayload, tick: int) -> bool:
         attempts = 0
         max_attempts = max(0, int(self._retry_policy.max_attempts))
         backoff = max(0.0, float(self._retry_policy.backoff_seconds))
         while True:
             try:
-                self._send_callable(payload)
+                self._send_callable(entry.payload, entry.tick, entry.event_type)
                 self._status["connected"] = True
                 self._status["last_success_tick"] = int(tick)
                 # Reset failure streak on success
@@ -5,6 +5,7 @@ from dataclasses import dataclass, field
 from typing import Any, cast
 
 from townlet.console.command import ConsoleCommandEnvelope
+from townlet.dto.actions import ActionBatch
 from townlet.dto.observations import (
     AgentObservationDTO,
     GlobalObservationDTO,
@@ -42,16 +43,16 @@ class DummyWorldRuntime:
         *,
         tick: int,
         console_operations: Iterable[ConsoleCommandEnvelope] | None = None,
-        action_provider: Callable[[WorldState, int], Mapping[str, Any]] | None = None,
-        policy_actions: Mapping[str, Any] | None = None,
+        action_provider: Callable[[WorldState, int], Mapping[str, Any] | ActionBatch] | None = None,
+        policy_actions: Mapping[str, Any] | ActionBatch | None = None,
     ) -> RuntimeStepResult:
         commands = list(console_operations or ())
 
         actions: dict[str, Any] = {}
         if action_provider is not None:
-            actions.update(action_provider(_DUMMY_WORLD_STATE, tick))
-        if policy_actions:
-            actions.update(policy_actions)
+            actions.update(_as_mapping(action_provider(_DUMMY_WORLD_STATE, tick)))
+        if policy_actions is not None:
+            actions.update(_as_mapping(policy_actions))
         self._last_actions = actions
         self._tick = tick
         return RuntimeStepResult(
@@ -94,8 +95,8 @@ class DummyWorldRuntime:
             termination_reasons=dict.fromkeys(selected, ""),
         )
 
-    def apply_actions(self, actions: Mapping[str, Any]) -> None:
-        self._last_actions = dict(actions)
+    def apply_actions(self, actions: Mapping[str, Any] | ActionBatch) -> None:
+        self._last_actions = _as_mapping(actions)
 
     def bind_world(self, world: WorldState) -> None:
         """Rebind to a new world (no-op for dummy runtime)."""
@@ -135,4 +136,10 @@ class _StubWorldState:
 _DUMMY_WORLD_STATE = cast("WorldState", _StubWorldState())
 
 
+def _as_mapping(actions: Mapping[str, Any] | ActionBatch) -> dict[str, Any]:
+    if isinstance(actions, ActionBatch):
+        return dict(actions.as_mapping())
+    return dict(actions)
+
+
 # Late imports to avoid circular dependencies during stub construction.
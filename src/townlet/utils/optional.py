@@ -0,0 +1,23 @@
+"""Helpers for probing optional dependencies without importing them."""
+
+from __future__ import annotations
+
+import importlib.util
+
+
+def module_available(name: str) -> bool:
+    """Return True if ``name`` can be imported, without importing it."""
+
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):  # pragma: no cover - broken installs
+        return False
+
+
+def torch_available() -> bool:
+    """Return True if PyTorch is installed, without importing it."""
+
+    return module_available("torch")
+
+
+__all__ = ["module_available", "torch_available"]
@@ -0,0 +1,218 @@
+"""Tick-windowed rolling statistics with O(1) add/evict."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Mapping
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+
+
+class RollingStats:
+    """Ring-buffered ``(tick, value)`` samples with running window moments.
+
+    Samples live in preallocated NumPy ring buffers that double when full.
+    The window keeps a Kahan-compensated sum (so integer-valued samples
+    produce exact means) and sliding Welford moments for the variance. Both
+    are updated in O(1) on :meth:`add` and :meth:`evict_before`; to bound
+    floating-point drift from repeated removals the moments are recomputed
+    from the buffer once the number of evictions since the last recompute
+    exceeds the larger of the live sample count and ``_MIN_RESYNC`` (1024),
+    so small windows are not rescanned on almost every eviction and the cost
+    stays amortised O(1).
+
+    :meth:`export_state` includes the accumulators, so an exported and
+    re-imported window continues with bitwise-identical statistics.
+    """
+
+    _MIN_RESYNC = 1024
+
+    def __init__(self, *, capacity: int = 64) -> None:
+        self._capacity = max(1, int(capacity))
+        self._ticks: npt.NDArray[np.int64] = np.zeros(self._capacity, dtype=np.int64)
+        self._values: npt.NDArray[np.float64] = np.zeros(self._capacity, dtype=np.float64)
+        self._head = 0
+        self._count = 0
+        self._sum = 0.0
+        self._sum_comp = 0.0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._evictions = 0
+
+    # ------------------------------------------------------------------
+    # Container protocol
+    # ------------------------------------------------------------------
+    def __len__(self) -> int:
+        return self._count
+
+    def __bool__(self) -> bool:
+        return self._count > 0
+
+    def __iter__(self) -> Iterator[tuple[int, float]]:
+        for offset in range(self._count):
+            index = (self._head + offset) % self._capacity
+            yield int(self._ticks[index]), float(self._values[index])
+
+    def oldest_tick(self) -> int | None:
+        if not self._count:
+            return None
+        return int(self._ticks[self._head])
+
+    # ------------------------------------------------------------------
+    # Mutation
+    # ------------------------------------------------------------------
+    def add(self, tick: int, value: float) -> None:
+        if self._count == self._capacity:
+            self._grow()
+        index = (self._head + self._count) % self._capacity
+        self._ticks[index] = tick
+        self._values[index] = value
+        self._count += 1
+        self._kahan_add(value)
+        delta = value - self._mean
+        self._mean += delta / self._count
+        self._m2 += delta * (value - self._mean)
+
+    def evict_before(self, cutoff: int) -> int:
+        """Drop samples whose tick is ``< cutoff``; return the number removed."""
+
+        removed = 0
+        while self._count and self._ticks[self._head] < cutoff:
+            value = float(self._values[self._head])
+            self._head = (self._head + 1) % self._capacity
+            self._count -= 1
+            removed += 1
+            self._kahan_add(-value)
+            if self._count == 0:
+                self._mean = 0.0
+                self._m2 = 0.0
+                continue
+            delta = value - self._mean
+            self._mean -= delta / self._count
+            self._m2 -= delta * (value - self._mean)
+        if removed:
+            if self._count == 0:
+                self._sum = 0.0
+                self._sum_comp = 0.0
+                self._evictions = 0
+            else:
+                self._evictions += removed
+                if self._evictions > max(self._count, self._MIN_RESYNC):
+                    self._resync()
+        return removed
+
+    def clear(self) -> None:
+        self._head = 0
+        self._count = 0
+        self._sum = 0.0
+        self._sum_comp = 0.0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._evictions = 0
+
+    # ------------------------------------------------------------------
+    # Statistics
+    # ------------------------------------------------------------------
+    def total(self) -> float:
+        return self._sum
+
+    def mean(self) -> float:
+        return self._sum / self._count if self._count else 0.0
+
+    def variance(self) -> float:
+        """Population variance of the window (0.0 for fewer than two samples)."""
+
+        if self._count < 2:
+            return 0.0
+        return max(self._m2, 0.0) / self._count
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+    def samples(self) -> list[tuple[int, float]]:
+        return list(self)
+
+    def export_state(self) -> dict[str, Any]:
+        return {
+            "sum": self._sum,
+            "sum_comp": self._sum_comp,
+            "mean": self._mean,
+            "m2": self._m2,
+            "evictions": self._evictions,
+        }
+
+    def load(
+        self,
+        samples: list[tuple[int, float]],
+        accumulators: Mapping[str, Any] | None = None,
+    ) -> None:
+        """Replace the window with ``samples`` (oldest first).
+
+        ``accumulators`` from :meth:`export_state` are restored verbatim when
+        present; otherwise the moments are recomputed from the samples.
+        """
+
+        self._capacity = max(64, 1 << max(len(samples) - 1, 0).bit_length())
+        self._ticks = np.zeros(self._capacity, dtype=np.int64)
+        self._values = np.zeros(self._capacity, dtype=np.float64)
+        self._head = 0
+        self._count = len(samples)
+        for index, (tick, value) in enumerate(samples):
+            self._ticks[index] = tick
+            self._values[index] = value
+        if accumulators is not None and _valid_accumulators(accumulators):
+            self._sum = float(accumulators["sum"])
+            self._sum_comp = float(accumulators["sum_comp"])
+            self._mean = float(accumulators["mean"])
+            self._m2 = float(accumulators["m2"])
+            self._evictions = int(accumulators["evictions"])
+        else:
+            self._resync()
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+    def _kahan_add(self, value: float) -> None:
+        adjusted = value - self._sum_comp
+        total = self._sum + adjusted
+        self._sum_comp = (total - self._sum) - adjusted
+        self._sum = total
+
+    def _ordered_values(self) -> npt.NDArray[np.float64]:
+        return np.roll(self._values, -self._head)[: self._count]
+
+    def _resync(self) -> None:
+        self._evictions = 0
+        if not self._count:
+            self._sum = self._sum_comp = self._mean = self._m2 = 0.0
+            return
+        values = self._ordered_values()
+        self._sum = 0.0
+        self._sum_comp = 0.0
+        for value in values.tolist():
+            self._kahan_add(value)
+        self._mean = self._sum / self._count
+        self._m2 = float(np.sum((values - self._mean) ** 2))
+
+    def _grow(self) -> None:
+        order = (self._head + np.arange(self._count)) % self._capacity
+        capacity = self._capacity * 2
+        ticks = np.zeros(capacity, dtype=np.int64)
+        values = np.zeros(capacity, dtype=np.float64)
+        ticks[: self._count] = self._ticks[order]
+        values[: self._count] = self._values[order]
+        self._ticks = ticks
+        self._values = values
+        self._capacity = capacity
+        self._head = 0
+
+
+def _valid_accumulators(payload: Mapping[str, Any]) -> bool:
+    floats = ("sum", "sum_comp", "mean", "m2")
+    return all(isinstance(payload.get(key), (int, float)) for key in floats) and isinstance(
+        payload.get("evictions"), int
+    )
+
+
+__all__ = ["RollingStats"]
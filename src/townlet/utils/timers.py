@@ -0,0 +1,320 @@
+"""Hierarchical tick-indexed timing wheel shared by simulation subsystems."""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable, Iterator, Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class TimerEntry:
+    """A single scheduled callback identified by ``(topic, key)``."""
+
+    topic: str
+    key: str
+    due_tick: int
+    payload: dict[str, Any] = field(default_factory=dict)
+    seq: int = 0
+    _slot: tuple[int, int] | None = field(default=None, repr=False, compare=False)
+
+
+TimerHandler = Callable[[TimerEntry], None]
+
+_OVERDUE = (-1, 0)
+_OVERFLOW = (-2, 0)
+
+
+class TimingWheel:
+    """Tick-indexed hierarchical timing wheel.
+
+    Entries are keyed by ``(topic, key)``; scheduling an existing key replaces
+    the previous deadline, so subsystems can re-arm timers idempotently (for
+    example when importing their own snapshot state). Level ``n`` buckets span
+    ``slots ** n`` ticks and are cascaded into finer levels as the wheel turns,
+    so :meth:`advance` touches only entries that are due (plus amortised
+    cascades) instead of scanning every pending timer.
+
+    Handlers are registered per topic and run in ``(due_tick, seq)`` order.
+    Entries scheduled for a tick the wheel has already reached are held as
+    overdue and fire on the next :meth:`advance` call, including a repeat call
+    for the same tick, which lets subsystems flush same-tick timers at their
+    own point in the tick sequence.
+    """
+
+    def __init__(self, *, slots: int = 64, levels: int = 4, current_tick: int = 0) -> None:
+        if slots < 2:
+            raise ValueError("slots must be >= 2")
+        if levels < 1:
+            raise ValueError("levels must be >= 1")
+        self._slots = int(slots)
+        self._levels = int(levels)
+        self._spans = tuple(self._slots**level for level in range(self._levels + 1))
+        self._wheels: list[list[dict[tuple[str, str], TimerEntry]]] = [
+            [{} for _ in range(self._slots)] for _ in range(self._levels)
+        ]
+        self._overdue: dict[tuple[str, str], TimerEntry] = {}
+        self._overflow: dict[tuple[str, str], TimerEntry] = {}
+        self._entries: dict[str, dict[str, TimerEntry]] = {}
+        self._handlers: dict[str, TimerHandler] = {}
+        self._now = int(current_tick)
+        self._seq = 0
+        self._size = 0
+
+    # ------------------------------------------------------------------
+    # Registration
+    # ------------------------------------------------------------------
+    def register_handler(self, topic: str, handler: TimerHandler) -> None:
+        """Route fired entries for ``topic`` to ``handler`` (replacing any previous one)."""
+
+        self._handlers[topic] = handler
+
+    def unregister_handler(self, topic: str) -> None:
+        self._handlers.pop(topic, None)
+
+    # ------------------------------------------------------------------
+    # Scheduling
+    # ------------------------------------------------------------------
+    @property
+    def current_tick(self) -> int:
+        return self._now
+
+    def __len__(self) -> int:
+        return self._size
+
+    def schedule(
+        self,
+        topic: str,
+        key: str,
+        due_tick: int,
+        payload: Mapping[str, Any] | None = None,
+    ) -> TimerEntry:
+        """Schedule (or re-arm) ``(topic, key)`` to fire at ``due_tick``."""
+
+        self.cancel(topic, key)
+        self._seq += 1
+        entry = TimerEntry(
+            topic=topic,
+            key=key,
+            due_tick=int(due_tick),
+            payload=dict(payload or {}),
+            seq=self._seq,
+        )
+        self._entries.setdefault(topic, {})[key] = entry
+        self._size += 1
+        if entry.due_tick <= self._now:
+            self._store(entry, _OVERDUE)
+        else:
+            self._place(entry)
+        return entry
+
+    def cancel(self, topic: str, key: str) -> bool:
+        topic_entries = self._entries.get(topic)
+        if not topic_entries:
+            return False
+        entry = topic_entries.pop(key, None)
+        if entry is None:
+            return False
+        if not topic_entries:
+            del self._entries[topic]
+        self._unlink(entry)
+        self._size -= 1
+        return True
+
+    def cancel_topic(self, topic: str) -> int:
+        """Cancel every entry scheduled under ``topic``; return the number removed."""
+
+        topic_entries = self._entries.pop(topic, None)
+        if not topic_entries:
+            return 0
+        for entry in topic_entries.values():
+            self._unlink(entry)
+        self._size -= len(topic_entries)
+        return len(topic_entries)
+
+    def due_tick(self, topic: str, key: str) -> int | None:
+        entry = self._entries.get(topic, {}).get(key)
+        return entry.due_tick if entry is not None else None
+
+    def entries(self, topic: str) -> Iterator[TimerEntry]:
+        """Iterate pending entries for ``topic`` in scheduling order."""
+
+        yield from sorted(self._entries.get(topic, {}).values(), key=lambda item: item.seq)
+
+    # ------------------------------------------------------------------
+    # Tick progression
+    # ------------------------------------------------------------------
+    def advance(self, tick: int) -> int:
+        """Advance the wheel to ``tick`` and fire due entries; return the fire count."""
+
+        target = int(tick)
+        due: list[TimerEntry] = []
+        if self._overdue:
+            due.extend(self._overdue.values())
+            self._overdue.clear()
+        if target > self._now:
+            if self._size - len(due) == 0:
+                self._now = target
+            else:
+                while self._now < target:
+                    self._now += 1
+                    self._turn(self._now, due)
+        if not due:
+            return 0
+        due.sort(key=lambda item: (item.due_tick, item.seq))
+        fired = 0
+        for entry in due:
+            topic_entries = self._entries.get(entry.topic)
+            if topic_entries is None or topic_entries.get(entry.key) is not entry:
+                continue
+            del topic_entries[entry.key]
+            if not topic_entries:
+                del self._entries[entry.topic]
+            entry._slot = None
+            self._size -= 1
+            handler = self._handlers.get(entry.topic)
+            if handler is None:
+                logger.debug("timing_wheel.unhandled topic=%s key=%s", entry.topic, entry.key)
+                continue
+            handler(entry)
+            fired += 1
+        return fired
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+    def export_state(self) -> dict[str, Any]:
+        ordered = sorted(
+            (entry for topic in self._entries.values() for entry in topic.values()),
+            key=lambda item: item.seq,
+        )
+        return {
+            "current_tick": self._now,
+            "entries": [
+                {
+                    "topic": entry.topic,
+                    "key": entry.key,
+                    "due_tick": entry.due_tick,
+                    "payload": dict(entry.payload),
+                }
+                for entry in ordered
+            ],
+        }
+
+    def import_state(self, payload: Mapping[str, Any]) -> None:
+        """Replace all pending entries with ``payload`` (handlers are retained)."""
+
+        self.reset(current_tick=int(payload.get("current_tick", 0)))
+        entries = payload.get("entries", [])
+        if not isinstance(entries, list):
+            return
+        for raw in entries:
+            if not isinstance(raw, Mapping):
+                continue
+            topic = raw.get("topic")
+            key = raw.get("key")
+            if topic is None or key is None:
+                continue
+            entry_payload = raw.get("payload")
+            self.schedule(
+                str(topic),
+                str(key),
+                int(raw.get("due_tick", self._now)),
+                entry_payload if isinstance(entry_payload, Mapping) else None,
+            )
+
+    def rebase(self, current_tick: int) -> None:
+        """Move the wheel clock to ``current_tick`` while keeping pending entries.
+
+        Used when the owning world rewinds its tick counter (for example on an
+        in-place reset); entries already due relative to the new clock fire on
+        the next :meth:`advance`.
+        """
+
+        self.import_state({**self.export_state(), "current_tick": int(current_tick)})
+
+    def reset(self, *, current_tick: int = 0) -> None:
+        for level in self._wheels:
+            for bucket in level:
+                bucket.clear()
+        self._overdue.clear()
+        self._overflow.clear()
+        self._entries.clear()
+        self._now = int(current_tick)
+        self._seq = 0
+        self._size = 0
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+    def _turn(self, tick: int, due: list[TimerEntry]) -> None:
+        slots = self._slots
+        if self._overflow and tick % self._spans[self._levels] == 0:
+            pending = list(self._overflow.values())
+            self._overflow.clear()
+            for entry in pending:
+                self._place(entry, due)
+        # Cascade coarse buckets whose span starts at ``tick``, highest level first.
+        for level in range(self._levels - 1, 0, -1):
+            if tick % self._spans[level] != 0:
+                continue
+            bucket = self._wheels[level][(tick // self._spans[level]) % slots]
+            if not bucket:
+                continue
+            pending = list(bucket.values())
+            bucket.clear()
+            for entry in pending:
+                self._place(entry, due)
+        bucket = self._wheels[0][tick % slots]
+        if bucket:
+            due.extend(bucket.values())
+            for entry in bucket.values():
+                entry._slot = None
+            bucket.clear()
+
+    def _place(self, entry: TimerEntry, due: list[TimerEntry] | None = None) -> None:
+        delta = entry.due_tick - self._now
+        if delta <= 0:
+            if due is not None and delta == 0:
+                entry._slot = None
+                due.append(entry)
+            else:
+                self._store(entry, _OVERDUE)
+            return
+        for level in range(self._levels):
+            if delta < self._spans[level + 1]:
+                slot = (entry.due_tick // self._spans[level]) % self._slots
+                self._store(entry, (level, slot))
+                return
+        self._store(entry, _OVERFLOW)
+
+    def _store(self, entry: TimerEntry, location: tuple[int, int]) -> None:
+        entry._slot = location
+        ident = (entry.topic, entry.key)
+        if location == _OVERDUE:
+            self._overdue[ident] = entry
+        elif location == _OVERFLOW:
+            self._overflow[ident] = entry
+        else:
+            level, slot = location
+            self._wheels[level][slot][ident] = entry
+
+    def _unlink(self, entry: TimerEntry) -> None:
+        location = entry._slot
+        entry._slot = None
+        if location is None:
+            return
+        ident = (entry.topic, entry.key)
+        if location == _OVERDUE:
+            self._overdue.pop(ident, None)
+        elif location == _OVERFLOW:
+            self._overflow.pop(ident, None)
+        else:
+            level, slot = location
+            self._wheels[level][slot].pop(ident, None)
+
+
+__all__ = ["TimerEntry", "TimerHandler", "TimingWheel"]
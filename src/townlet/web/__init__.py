@@ -1,5 +1,25 @@
-"""Web-facing utilities and gateway for Townlet telemetry."""
+"""Web-facing utilities and gateway for Townlet telemetry.
 
-from .gateway import TelemetryGateway, create_app
+FastAPI and prometheus_client are only imported when the gateway is accessed.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover - static re-exports
+    from .gateway import TelemetryGateway, create_app
 
 __all__ = ["TelemetryGateway", "create_app"]
+
+
+def __getattr__(name: str) -> object:  # pragma: no cover - lazy import glue
+    if name in __all__:
+        from . import gateway
+
+        return getattr(gateway, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:  # pragma: no cover - module reflection helper
+    return sorted(__all__)
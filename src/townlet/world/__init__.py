@@ -1,30 +1,38 @@
-"""World modelling primitives."""
+"""World modelling primitives.
+
+Exports resolve lazily so light submodules (e.g. ``townlet.world.preconditions``)
+can be imported by tooling without constructing the full world model graph.
+"""
 
 from __future__ import annotations
 
-from .agents import AgentSnapshot, EmploymentEngine
-from .core import WorldContext
-from .economy import EconomyService
-from .grid import WorldState
-from .observations.cache import (
-    build_local_cache as observation_build_local_cache,
-)
-from .observations.context import (
-    agent_context as observation_agent_context,
-)
-from .observations.context import (
-    snapshot_precondition_context,
-)
-from .observations.views import (
-    find_nearest_object_of_type as observation_find_nearest_object_of_type,
-)
-from .observations.views import (
-    local_view as observation_local_view,
-)
-from .perturbations import PerturbationService
-from .queue import QueueManager
-from .relationships import RelationshipLedger, RelationshipParameters, RelationshipTie
-from .runtime import RuntimeStepResult, WorldRuntime
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover - static re-exports
+    from .agents import AgentSnapshot, EmploymentEngine
+    from .core import WorldContext
+    from .economy import EconomyService
+    from .grid import WorldState
+    from .observations.cache import (
+        build_local_cache as observation_build_local_cache,
+    )
+    from .observations.context import (
+        agent_context as observation_agent_context,
+    )
+    from .observations.context import (
+        snapshot_precondition_context,
+    )
+    from .observations.views import (
+        find_nearest_object_of_type as observation_find_nearest_object_of_type,
+    )
+    from .observations.views import (
+        local_view as observation_local_view,
+    )
+    from .perturbations import PerturbationService
+    from .queue import QueueManager
+    from .relationships import RelationshipLedger, RelationshipParameters, RelationshipTie
+    from .runtime import RuntimeStepResult, WorldRuntime
 
 __all__ = [
     "AgentSnapshot",
@@ -45,3 +53,38 @@ __all__ = [
     "observation_local_view",
     "snapshot_precondition_context",
 ]
+
+# export name -> (module, attribute)
+_LAZY_EXPORTS: dict[str, tuple[str, str]] = {
+    "AgentSnapshot": (".agents", "AgentSnapshot"),
+    "EmploymentEngine": (".agents", "EmploymentEngine"),
+    "WorldContext": (".core", "WorldContext"),
+    "EconomyService": (".economy", "EconomyService"),
+    "WorldState": (".grid", "WorldState"),
+    "observation_build_local_cache": (".observations.cache", "build_local_cache"),
+    "observation_agent_context": (".observations.context", "agent_context"),
+    "snapshot_precondition_context": (".observations.context", "snapshot_precondition_context"),
+    "observation_find_nearest_object_of_type": (".observations.views", "find_nearest_object_of_type"),
+    "observation_local_view": (".observations.views", "local_view"),
+    "PerturbationService": (".perturbations", "PerturbationService"),
+    "QueueManager": (".queue", "QueueManager"),
+    "RelationshipLedger": (".relationships", "RelationshipLedger"),
+    "RelationshipParameters": (".relationships", "RelationshipParameters"),
+    "RelationshipTie": (".relationships", "RelationshipTie"),
+    "RuntimeStepResult": (".runtime", "RuntimeStepResult"),
+    "WorldRuntime": (".runtime", "WorldRuntime"),
+}
+
+
+def __getattr__(name: str) -> object:  # pragma: no cover - lazy import glue
+    target = _LAZY_EXPORTS.get(name)
+    if target is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attribute = target
+    value = getattr(import_module(module_name, __name__), attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:  # pragma: no cover - module reflection helper
+    return sorted(__all__)
@@ -6,6 +6,17 @@ from collections.abc import Iterable, Mapping, MutableMapping, Sequence
 from dataclasses import dataclass
 from typing import Any
 
+from townlet.dto.actions import (
+    ACTION_BATCH_ERRORS,
+    ACTION_DTYPE,
+    ACTION_KIND_CODES,
+    ACTION_KIND_INDEX,
+    NO_SLOT,
+    ActionBatch,
+    ActionSlots,
+    ActionValidationError,
+    split_action_input,
+)
 from townlet.world.events import Event
 from townlet.world.state import WorldState
 
@@ -16,10 +27,6 @@ SUPPORTED_KINDS: frozenset[str] = frozenset(
 )
 
 
-class ActionValidationError(ValueError):
-    """Raised when an incoming action fails schema validation."""
-
-
 @dataclass(slots=True)
 class Action:
     """Normalised action structure consumed by the world."""
@@ -174,9 +181,17 @@ def _normalise_float(value: Any, field: str) -> float:
 
 
 __all__ = [
+    "ACTION_BATCH_ERRORS",
+    "ACTION_DTYPE",
+    "ACTION_KIND_CODES",
+    "ACTION_KIND_INDEX",
+    "NO_SLOT",
     "Action",
+    "ActionBatch",
     "ActionKind",
+    "ActionSlots",
     "ActionValidationError",
     "apply_actions",
+    "split_action_input",
     "validate_actions",
 ]
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import logging
 import time
-from collections.abc import Callable, Iterable, Mapping, MutableMapping
+from collections.abc import Callable, Iterable, Mapping, MutableMapping, Sequence
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, Literal, Protocol, TypedDict, cast
 
@@ -444,7 +444,7 @@ class DefaultAffordanceRuntime:
         metadata: dict[str, object] = {}
         running = self.running_affordances.pop(object_id, None)
         affordance_id = requested_affordance_id
-        waiting_before_release: list[str] = queue_manager.queue_snapshot(object_id)
+        waiting_before_release = queue_manager.queue_view(object_id)
         if running is not None:
             affordance_id = running.affordance_id
             if success:
@@ -542,7 +542,7 @@ class DefaultAffordanceRuntime:
         self,
         relationships: RelationshipServiceProtocol,
         source_agent: str,
-        waiting: list[str],
+        waiting: Sequence[str],
     ) -> str | None:
         if not waiting:
             return None
@@ -637,7 +637,7 @@ def advance_running_affordances(runtime: DefaultAffordanceRuntime, *, tick: int)
     if debug_enabled:
         entry_running = len(runtime.running_affordances)
         entry_queued = sum(
-            len(queue_manager.queue_snapshot(object_id))
+            queue_manager.queue_length(object_id)
             for object_id in objects.keys()
         )
         logger.debug(
@@ -653,7 +653,7 @@ def advance_running_affordances(runtime: DefaultAffordanceRuntime, *, tick: int)
             continue
         ctx.apply_affordance_effects(running.agent_id, running.effects)
         runtime.running_affordances.pop(object_id, None)
-        waiting = queue_manager.queue_snapshot(object_id)
+        waiting = queue_manager.queue_view(object_id)
         spec = ctx.affordances.get(running.affordance_id)
         hook_names = tuple(spec.hooks.get("after", ())) if spec else ()
         if debug_enabled:
@@ -710,7 +710,7 @@ def advance_running_affordances(runtime: DefaultAffordanceRuntime, *, tick: int)
         duration_ms = (time.perf_counter() - start_time) * 1000.0
         running_count = len(runtime.running_affordances)
         queued_agents = sum(
-            len(queue_manager.queue_snapshot(object_id))
+            queue_manager.queue_length(object_id)
             for object_id in objects.keys()
         )
         logger.debug(
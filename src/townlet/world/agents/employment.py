@@ -64,6 +64,9 @@ class EmploymentService:
     def get_context(self, agent_id: str) -> dict[str, Any]:
         return self.runtime.get_context(agent_id)
 
+    def invalidate(self, agent_id: str | None = None) -> None:
+        self.runtime.invalidate(agent_id)
+
     def reset_context(self, agent_id: str) -> dict[str, Any]:
         return self.runtime.reset_context(agent_id)
 
@@ -73,6 +73,7 @@ class NightlyResetService:
                     "late_counter_recorded": False,
                 }
             )
+            self.employment_service.invalidate(snapshot.agent_id)
 
             reset_agents.append(snapshot.agent_id)
             self.emit_event(
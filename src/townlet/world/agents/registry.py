@@ -48,6 +48,7 @@ class AgentRegistry(MutableMapping[str, AgentSnapshot]):
         self._records: dict[str, AgentRecord] = {}
         self._on_add = on_add
         self._on_remove = on_remove
+        self._version = 0
         if initial is not None:
             for item in initial:
                 snapshot = self._coerce_snapshot(item)
@@ -112,6 +113,12 @@ class AgentRegistry(MutableMapping[str, AgentSnapshot]):
         if on_remove is not None:
             self._on_remove = on_remove
 
+    @property
+    def version(self) -> int:
+        """Counter bumped whenever a snapshot is added, replaced or removed."""
+
+        return self._version
+
     def values_map(self) -> dict[str, AgentSnapshot]:
         """Return a shallow copy of the snapshot mapping."""
 
@@ -158,6 +165,7 @@ class AgentRegistry(MutableMapping[str, AgentSnapshot]):
             record.snapshot = snapshot
             record.touch(tick=tick, metadata=metadata)
         self._snapshots[agent_id] = snapshot
+        self._version += 1
         if self._on_add is not None:
             self._on_add(snapshot)
         return record
@@ -167,6 +175,7 @@ class AgentRegistry(MutableMapping[str, AgentSnapshot]):
         snapshot = self._snapshots.pop(agent_id, None)
         if record is None or snapshot is None:
             return
+        self._version += 1
         if emit_callback and self._on_remove is not None:
             self._on_remove(snapshot)
 
@@ -162,6 +162,11 @@ class RelationshipService:
     def get_rivalry_ledger(self, agent_id: str) -> RivalryLedger:
         return self._get_rivalry_ledger(agent_id)
 
+    def has_decay_work(self) -> bool:
+        """Return whether :meth:`decay` would touch any rivalry or relationship ledger."""
+
+        return bool(self._rivalry_ledgers or self._relationship_ledgers)
+
     def decay(self) -> None:
         if self._rivalry_ledgers:
             emptied: list[str] = []
@@ -10,7 +10,8 @@ from typing import TYPE_CHECKING, Any, cast
 
 from townlet.console.command import ConsoleCommandEnvelope
 from townlet.dto.observations import ObservationEnvelope
-from townlet.world.actions import Action, apply_actions
+from townlet.utils.timers import TimingWheel
+from townlet.world.actions import Action, ActionBatch, apply_actions
 from townlet.world.core.runtime_adapter import ensure_world_adapter
 from townlet.world.dto import build_observation_envelope
 from townlet.world.observations.context import (
@@ -18,8 +19,9 @@ from townlet.world.observations.context import (
 )
 from townlet.world.rng import RngStreamManager, seed_from_state
 from townlet.world.systems import default_systems
-from townlet.world.systems.affordances import process_actions
+from townlet.world.systems.affordances import process_action_batch, process_actions
 from townlet.world.systems.base import SystemContext, SystemStep
+from townlet.world.systems.scheduler import SystemScheduler
 from townlet.world.observations.interfaces import AdapterSource
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -64,17 +66,32 @@ class WorldContext:
     sync_reservation_callback: Callable[[str], None]
     observation_service: ObservationServiceProtocol | None = None
     systems: tuple[SystemStep, ...] | None = None
+    scheduler: SystemScheduler | None = None
     rng_manager: RngStreamManager | None = None
+    timers: TimingWheel | None = None
     _pending_actions: dict[str, object] = field(default_factory=dict, init=False, repr=False)
+    _pending_batch: ActionBatch | None = field(default=None, init=False, repr=False)
+    _last_observation_batch: Mapping[str, Mapping[str, Any]] = field(
+        default_factory=dict, init=False, repr=False
+    )
 
     def __post_init__(self) -> None:
         if self.systems is None:
             self.systems = default_systems()
+        if self.scheduler is None:
+            self.scheduler = self._build_scheduler()
         if self.rng_manager is None:
             seed = getattr(self.state, "rng_seed", None)
             if seed is None:
                 seed = seed_from_state(self.state.get_rng_state())
             self.rng_manager = RngStreamManager.from_seed(seed)
+        if self.timers is None:
+            shared = getattr(self.state, "timers", None)
+            self.timers = (
+                shared
+                if isinstance(shared, TimingWheel)
+                else TimingWheel(current_tick=int(getattr(self.state, "tick", 0)))
+            )
 
     # ------------------------------------------------------------------
     # Views into underlying state
@@ -123,12 +140,18 @@ class WorldContext:
             if callable(drain):
                 drain()
         self._pending_actions.clear()
+        self._pending_batch = None
+        if self.timers is not None:
+            self.timers.rebase(int(getattr(self.state, "tick", 0)))
         seed_value = getattr(self.state, "rng_seed", None)
         if seed_value is None:
             seed_value = seed_from_state(self.state.get_rng_state())
         self.rng_manager = RngStreamManager.from_seed(seed_value)
 
-    def apply_actions(self, actions: Mapping[str, object]) -> None:
+    def apply_actions(self, actions: Mapping[str, object] | ActionBatch) -> None:
+        if isinstance(actions, ActionBatch):
+            self._pending_batch = actions
+            actions = actions.overrides
         for agent_id, payload in actions.items():
             if payload is None:
                 # Treat None as an explicit "no action" marker.
@@ -166,6 +189,7 @@ class WorldContext:
         adapter = ensure_world_adapter(cast(AdapterSource, self.state))
         terminated_map = dict(terminated or {})
         raw_batch = self.observation_service.build_batch(adapter, terminated_map)
+        self._last_observation_batch = raw_batch
         contexts = {
             agent_id: observation_agent_context(adapter, agent_id)
             for agent_id in raw_batch.keys()
@@ -226,6 +250,15 @@ class WorldContext:
             agent_contexts=filtered_contexts,
         )
 
+    def latest_observation_batch(self) -> Mapping[str, Mapping[str, Any]]:
+        """Return the raw (array-valued) batch behind the most recent :meth:`observe`.
+
+        Per-agent arrays are shared with the observation builder, so callers
+        must treat them as read-only.
+        """
+
+        return MappingProxyType(dict(self._last_observation_batch))
+
     def tick(
         self,
         *,
@@ -235,9 +268,14 @@ class WorldContext:
         lifecycle: LifecycleManager,
         perturbations: PerturbationScheduler,
         ticks_per_day: int,
+        action_batch: ActionBatch | None = None,
     ) -> "RuntimeStepResult":
         state = self.state
         state.tick = tick
+        if self.timers is not None:
+            # Fire every timer due this tick up front; subsystems re-advance at
+            # their own step to flush same-tick timers armed mid-tick.
+            self.timers.advance(tick)
 
         lifecycle.process_respawns(state, tick=tick)
         console_results = list(state.apply_console(console_operations))
@@ -250,6 +288,10 @@ class WorldContext:
         if prepared_actions:
             combined_actions.update(prepared_actions)
 
+        batch = action_batch if action_batch is not None else self._pending_batch
+        self._pending_batch = None
+        if batch is not None:
+            process_action_batch(state, batch, tick=tick, skip_agents=combined_actions.keys())
         action_objects = self._coerce_actions(combined_actions)
         if action_objects:
             apply_actions(cast("ModularWorldState", state), action_objects)
@@ -265,8 +307,12 @@ class WorldContext:
             events=dispatcher,
         )
         self.rng_manager = rng_manager
-        for step in self.systems or ():
-            step(system_ctx)
+        scheduler = self.scheduler
+        if scheduler is None or scheduler.source != tuple(self.systems or ()):
+            if scheduler is not None:
+                scheduler.close()
+            scheduler = self.scheduler = self._build_scheduler()
+        scheduler.run(system_ctx, tick)
 
         if ticks_per_day and tick % ticks_per_day == 0:
             self.nightly_reset_service.apply(tick)
@@ -292,14 +338,41 @@ class WorldContext:
 
         from townlet.world.runtime import RuntimeStepResult
 
+        applied_actions: Mapping[str, object]
+        if batch is None:
+            applied_actions = {key: combined_actions[key] for key in combined_actions}
+        elif combined_actions:
+            applied_actions = {**batch.as_mapping(), **combined_actions}
+        else:
+            applied_actions = batch.as_mapping()
+
         return RuntimeStepResult(
             console_results=console_results,
             events=events,
-            actions={key: combined_actions[key] for key in combined_actions},
+            actions=applied_actions,
             terminated=terminated,
             termination_reasons=termination_reasons,
         )
 
+    def _build_scheduler(self) -> SystemScheduler:
+        settings = getattr(self.config, "system_scheduler", None)
+        return SystemScheduler(
+            self.systems or (),
+            max_workers=int(getattr(settings, "max_workers", 0) or 0),
+            every=getattr(settings, "every", None),
+        )
+
+    def close(self) -> None:
+        """Release the system scheduler's worker pool and event listener."""
+
+        if self.scheduler is not None:
+            self.scheduler.close()
+
+    def system_timings(self) -> Mapping[str, Mapping[str, float]]:
+        """Return per-system run/skip counts and cumulative/last wall time (ms)."""
+
+        return self.scheduler.snapshot() if self.scheduler is not None else {}
+
     # ------------------------------------------------------------------
     # Snapshot helpers used for observation/telemetry assembly
     # ------------------------------------------------------------------
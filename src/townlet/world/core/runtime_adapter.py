@@ -194,6 +194,10 @@ def ensure_world_adapter(
 ) -> WorldRuntimeAdapterProtocol:
     """Return a runtime adapter, wrapping ``world`` when necessary."""
 
+    # Concrete check first: the runtime Protocol isinstance walks every member
+    # and dominates per-agent observation encoding when hit on each call.
+    if isinstance(world, WorldRuntimeAdapter):
+        return world
     if isinstance(world, WorldRuntimeAdapterProtocol):
         return world
     from townlet.world.grid import WorldState  # local import to avoid cycles
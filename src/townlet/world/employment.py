@@ -5,13 +5,18 @@ from __future__ import annotations
 import logging
 from collections import deque
 from collections.abc import Callable, Iterable, Mapping, MutableMapping
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, Protocol
 
 from townlet.config import EmploymentConfig, SimulationConfig
+from townlet.utils.timers import TimerEntry, TimingWheel
 
 logger = logging.getLogger(__name__)
 
+_SHIFT_TOPIC = "employment.shift"
+
 if TYPE_CHECKING:
+    from townlet.config.loader import JobSpec
     from townlet.world.agents.snapshot import AgentSnapshot
 
     class EmploymentWorld(Protocol):
@@ -31,6 +36,18 @@ if TYPE_CHECKING:
             ...
 
 
+@dataclass(frozen=True, slots=True)
+class _ShiftPlan:
+    """Per-tick employment settings shared by every agent evaluation."""
+
+    jobs: Mapping[str, JobSpec]
+    default_job_id: str | None
+    employment_cfg: EmploymentConfig
+    arrival_buffer: int
+    ticks_per_day: int
+    seven_day_window: int
+
+
 class EmploymentEngine:
     """Manages employment state, queues, and shift bookkeeping."""
 
@@ -44,6 +61,14 @@ class EmploymentEngine:
         self._exits_today: int = 0
         self._exit_timestamps: dict[str, int] = {}
         self._manual_exits: set[str] = set()
+        # Event-driven scheduling state (``employment.event_driven``). The
+        # wheel is private: the schedule is derived state, rebuilt on import.
+        self._timers = self._new_timers(0)
+        self._dirty: set[str] = set()
+        self._order: dict[str, int] = {}
+        self._last_event_tick: int | None = None
+        self._schedule_signature: object = None
+        self._assigned_signature: object = None
 
     # -- properties -----------------------------------------------------
 
@@ -57,89 +82,229 @@ class EmploymentEngine:
         job_ids = self._job_ids()
         if not job_ids:
             return
+        if self._config.employment.event_driven:
+            # Assignment only changes when agents join or the job table changes.
+            signature = self._agents_signature(world), job_ids
+            if signature == self._assigned_signature:
+                return
+            self._assigned_signature = signature
         for index, snapshot in enumerate(world.agents.values()):
             self.assign_job_if_missing(world, snapshot, job_index=index)
 
     def apply_job_state(self, world: EmploymentWorld) -> None:
-        jobs = self._config.jobs
-        job_ids = self._job_ids()
-        default_job_id = job_ids[0] if job_ids else None
+        if self._config.employment.event_driven:
+            self._apply_job_state_event_driven(world)
+            return
+        self._last_event_tick = None
+        plan = self._shift_plan()
+        for snapshot in world.agents.values():
+            self._apply_agent_job_state(world, snapshot, plan)
+
+    def invalidate(self, agent_id: str | None = None) -> None:
+        """Force re-evaluation of ``agent_id`` (or every agent) on the next tick.
+
+        Only relevant in event-driven mode, where agents are skipped between
+        shift transitions. Code that mutates an agent's employment fields
+        (``job_id``, ``shift_state``, ``on_shift``, ``late_ticks_today``,
+        ``absent_shifts_7d``) or its employment context outside the engine
+        must call this.
+        """
+
+        if agent_id is None:
+            self._schedule_signature = None
+            self._assigned_signature = None
+            return
+        if self._config.employment.event_driven:
+            self._dirty.add(agent_id)
+
+    def _shift_plan(self) -> _ShiftPlan:
         employment_cfg = self._config.employment
-        arrival_buffer = self._config.behavior.job_arrival_buffer
+        job_ids = self._job_ids()
         ticks_per_day = max(1, employment_cfg.exit_review_window)
-        seven_day_window = ticks_per_day * 7
-
-        for snapshot in world.agents.values():
-            ctx = self.get_employment_context(world, snapshot.agent_id)
-            current_day = world.tick // ticks_per_day
-            if ctx["current_day"] != current_day:
-                ctx["current_day"] = current_day
-                ctx["late_ticks"] = 0
-                ctx["wages_paid"] = 0.0
-                snapshot.late_ticks_today = 0
-
-            job_id = snapshot.job_id
-            if job_id is None or job_id not in jobs:
-                if default_job_id is None:
-                    self._employment_idle_state(world, snapshot, ctx)
-                    continue
-                job_id = default_job_id
-                snapshot.job_id = job_id
-
-            spec = jobs[job_id]
-            start = spec.start_tick
-            end = spec.end_tick or spec.start_tick
-            if end < start:
-                end = start
-            wage_rate = spec.wage_rate or self._config.economy.get("wage_income", 0.0)
-            lateness_penalty = spec.lateness_penalty
-            required_position = tuple(spec.location) if spec.location else None
-            at_required_location = (
-                required_position is None or snapshot.position == required_position
-            )
+        return _ShiftPlan(
+            jobs=self._config.jobs,
+            default_job_id=job_ids[0] if job_ids else None,
+            employment_cfg=employment_cfg,
+            arrival_buffer=self._config.behavior.job_arrival_buffer,
+            ticks_per_day=ticks_per_day,
+            seven_day_window=ticks_per_day * 7,
+        )
 
-            while ctx["absence_events"] and (
-                world.tick - ctx["absence_events"][0] > seven_day_window
-            ):
-                ctx["absence_events"].popleft()
-            snapshot.absent_shifts_7d = len(ctx["absence_events"])
+    @staticmethod
+    def _shift_window(spec: JobSpec) -> tuple[int, int]:
+        start = spec.start_tick
+        end = spec.end_tick or spec.start_tick
+        return start, max(start, end)
+
+    def _apply_agent_job_state(
+        self, world: EmploymentWorld, snapshot: AgentSnapshot, plan: _ShiftPlan
+    ) -> str | None:
+        """Advance one agent's shift state; return the job whose schedule applied."""
+
+        ctx = self._context(snapshot.agent_id)
+        current_day = world.tick // plan.ticks_per_day
+        if ctx["current_day"] != current_day:
+            ctx["current_day"] = current_day
+            ctx["late_ticks"] = 0
+            ctx["wages_paid"] = 0.0
+            snapshot.late_ticks_today = 0
 
-            if world.tick < start - arrival_buffer:
+        job_id = snapshot.job_id
+        if job_id is None or job_id not in plan.jobs:
+            if plan.default_job_id is None:
                 self._employment_idle_state(world, snapshot, ctx)
-                continue
+                return None
+            job_id = plan.default_job_id
+            snapshot.job_id = job_id
+
+        spec = plan.jobs[job_id]
+        start, end = self._shift_window(spec)
+        wage_rate = spec.wage_rate or self._config.economy.get("wage_income", 0.0)
+        lateness_penalty = spec.lateness_penalty
+        required_position = tuple(spec.location) if spec.location else None
+        at_required_location = (
+            required_position is None or snapshot.position == required_position
+        )
 
-            if start - arrival_buffer <= world.tick < start:
-                self._employment_prepare_state(snapshot, ctx)
-                continue
+        while ctx["absence_events"] and (
+            world.tick - ctx["absence_events"][0] > plan.seven_day_window
+        ):
+            ctx["absence_events"].popleft()
+        snapshot.absent_shifts_7d = len(ctx["absence_events"])
 
-            if start <= world.tick <= end:
-                self._employment_begin_shift(ctx, start, end)
-                state = self._employment_determine_state(
-                    ctx=ctx,
-                    tick=world.tick,
-                    start=start,
-                    at_required_location=at_required_location,
-                    employment_cfg=employment_cfg,
-                )
-                self._employment_apply_state_effects(
-                    world=world,
-                    snapshot=snapshot,
-                    ctx=ctx,
-                    state=state,
-                    at_required_location=at_required_location,
-                    wage_rate=wage_rate,
-                    lateness_penalty=lateness_penalty,
-                    employment_cfg=employment_cfg,
-                )
-                continue
+        if world.tick < start - plan.arrival_buffer:
+            self._employment_idle_state(world, snapshot, ctx)
+            return job_id
 
-            self._employment_finalize_shift(
+        if start - plan.arrival_buffer <= world.tick < start:
+            self._employment_prepare_state(snapshot, ctx)
+            return job_id
+
+        if start <= world.tick <= end:
+            self._employment_begin_shift(ctx, start, end)
+            state = self._employment_determine_state(
+                ctx=ctx,
+                tick=world.tick,
+                start=start,
+                at_required_location=at_required_location,
+                employment_cfg=plan.employment_cfg,
+            )
+            self._employment_apply_state_effects(
                 world=world,
                 snapshot=snapshot,
                 ctx=ctx,
-                employment_cfg=employment_cfg,
-                job_id=job_id,
+                state=state,
+                at_required_location=at_required_location,
+                wage_rate=wage_rate,
+                lateness_penalty=lateness_penalty,
+                employment_cfg=plan.employment_cfg,
             )
+            return job_id
+
+        self._employment_finalize_shift(
+            world=world,
+            snapshot=snapshot,
+            ctx=ctx,
+            employment_cfg=plan.employment_cfg,
+            job_id=job_id,
+        )
+        return job_id
+
+    # -- event-driven scheduling ----------------------------------------
+
+    def _apply_job_state_event_driven(self, world: EmploymentWorld) -> None:
+        """Evaluate only agents whose shift state can change this tick.
+
+        Outside its cohort's shift window an agent's evaluation is idempotent
+        until the next transition: arrival buffer, shift start, shift end, day
+        rollover or the expiry of its oldest recorded absence. Each agent is
+        queued for that tick; agents inside a shift window (whose wages and
+        lateness depend on their position every tick) are queued for the next
+        tick. Due agents are processed in world order, so coworker lookups and
+        emitted events match the per-tick loop exactly.
+        """
+
+        tick = world.tick
+        signature = self._agents_signature(world), self._jobs_signature()
+        if (
+            signature != self._schedule_signature
+            or self._last_event_tick is None
+            or tick != self._last_event_tick + 1
+        ):
+            self._schedule_signature = signature
+            self._order = {agent_id: index for index, agent_id in enumerate(world.agents)}
+            self._timers = self._new_timers(tick)
+            self._dirty.clear()
+            due = list(self._order)
+        else:
+            # Fired shift timers land in ``_dirty`` alongside invalidated agents.
+            self._timers.advance(tick)
+            due = sorted(
+                (agent_id for agent_id in self._dirty if agent_id in self._order),
+                key=self._order.__getitem__,
+            )
+            self._dirty.clear()
+        self._last_event_tick = tick
+        if not due:
+            return
+
+        plan = self._shift_plan()
+        cohort_due: dict[str, int] = {}
+        for agent_id in due:
+            snapshot = world.agents.get(agent_id)
+            if snapshot is None:
+                continue
+            job_id = self._apply_agent_job_state(world, snapshot, plan)
+            next_tick = self._next_due_tick(plan, job_id, self._state[agent_id], tick, cohort_due)
+            self._timers.schedule(_SHIFT_TOPIC, agent_id, next_tick)
+
+    def _new_timers(self, tick: int) -> TimingWheel:
+        timers = TimingWheel(current_tick=tick)
+        timers.register_handler(_SHIFT_TOPIC, self._on_shift_due)
+        return timers
+
+    def _on_shift_due(self, entry: TimerEntry) -> None:
+        self._dirty.add(entry.key)
+
+    def _next_due_tick(
+        self,
+        plan: _ShiftPlan,
+        job_id: str | None,
+        ctx: dict[str, Any],
+        tick: int,
+        cohort_due: dict[str, int],
+    ) -> int:
+        next_tick = (tick // plan.ticks_per_day + 1) * plan.ticks_per_day
+        if job_id is None:
+            return next_tick
+        transition = cohort_due.get(job_id)
+        if transition is None:
+            start, end = self._shift_window(plan.jobs[job_id])
+            if start <= tick <= end:
+                transition = tick + 1
+            else:
+                upcoming = [edge for edge in (start - plan.arrival_buffer, start, end + 1) if edge > tick]
+                transition = min(upcoming, default=next_tick)
+            cohort_due[job_id] = transition
+        next_tick = min(next_tick, transition)
+        absences = ctx["absence_events"]
+        if absences:
+            next_tick = min(next_tick, absences[0] + plan.seven_day_window + 1)
+        return max(next_tick, tick + 1)
+
+    @staticmethod
+    def _agents_signature(world: EmploymentWorld) -> object:
+        version = getattr(world.agents, "version", None)
+        if isinstance(version, int):
+            return version
+        return tuple((agent_id, id(snapshot)) for agent_id, snapshot in world.agents.items())
+
+    def _jobs_signature(self) -> tuple[object, ...]:
+        return (
+            tuple((job_id, *self._shift_window(spec)) for job_id, spec in self._config.jobs.items()),
+            self._config.behavior.job_arrival_buffer,
+            self._config.employment.exit_review_window,
+        )
 
     # -- context helpers ------------------------------------------------
 
@@ -193,6 +358,14 @@ class EmploymentEngine:
         }
 
     def get_employment_context(self, world: EmploymentWorld, agent_id: str) -> dict[str, Any]:
+        """Return the mutable context for ``agent_id``.
+
+        Callers that mutate it must call :meth:`invalidate` for the agent.
+        """
+
+        return self._context(agent_id)
+
+    def _context(self, agent_id: str) -> dict[str, Any]:
         ctx = self._state.get(agent_id)
         if ctx is None or ctx.get("attendance_samples") is None:
             ctx = self.context_defaults()
@@ -313,7 +486,6 @@ class EmploymentEngine:
         ctx["state"] = state
         snapshot.shift_state = state
         eligible_for_wage = state in {"on_time", "late"} and at_required_location
-        coworkers = self._employment_coworkers_on_shift(world, snapshot)
 
         if state == "on_time":
             ctx["on_time_ticks"] += 1
@@ -344,7 +516,8 @@ class EmploymentEngine:
                 if penalty:
                     snapshot.wallet = max(0.0, snapshot.wallet - penalty)
                 snapshot.wages_withheld += wage_rate
-            if coworkers and not ctx["late_help_event_emitted"]:
+            coworkers = [] if ctx["late_help_event_emitted"] else self._employment_coworkers_on_shift(world, snapshot)
+            if coworkers:
                 for other_id in coworkers:
                     world.update_relationship(
                         snapshot.agent_id,
@@ -379,7 +552,8 @@ class EmploymentEngine:
                 ctx["absence_event_emitted"] = True
                 ctx["absence_events"].append(world.tick)
                 snapshot.absent_shifts_7d = len(ctx["absence_events"])
-            if coworkers and not ctx["took_shift_event_emitted"]:
+            coworkers = [] if ctx["took_shift_event_emitted"] else self._employment_coworkers_on_shift(world, snapshot)
+            if coworkers:
                 for other_id in coworkers:
                     world.update_relationship(
                         snapshot.agent_id,
@@ -467,7 +641,7 @@ class EmploymentEngine:
         for other in world.agents.values():
             if other.agent_id == snapshot.agent_id or other.job_id != job_id:
                 continue
-            other_ctx = self.get_employment_context(world, other.agent_id)
+            other_ctx = self._context(other.agent_id)
             if other_ctx["state"] in {"on_time", "late"}:
                 coworkers.append(other.agent_id)
         return coworkers
@@ -602,12 +776,15 @@ class EmploymentEngine:
         """Discard cached employment context for ``agent_id`` if present."""
 
         self._state.pop(agent_id, None)
+        self._timers.cancel(_SHIFT_TOPIC, agent_id)
+        self._dirty.discard(agent_id)
 
     def reset_context(self, agent_id: str) -> dict[str, Any]:
         """Reset the employment context for ``agent_id`` back to defaults."""
 
         ctx = self.context_defaults()
         self._state[agent_id] = ctx
+        self.invalidate(agent_id)
         return ctx
 
     # -- persistence helpers -------------------------------------------
@@ -650,6 +827,7 @@ class EmploymentEngine:
 
         exits_today = payload.get("exits_today", 0)
         self.set_exits_today(_coerce_int(exits_today) or 0)
+        self.invalidate()
 
     def reset_exits_today(self) -> None:
         self._exits_today = 0
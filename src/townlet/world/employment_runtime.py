@@ -36,6 +36,9 @@ class EmploymentRuntime:
     def get_context(self, agent_id: str) -> dict[str, Any]:
         return self.coordinator.get_context(self.world, agent_id)
 
+    def invalidate(self, agent_id: str | None = None) -> None:
+        self.coordinator.invalidate(agent_id)
+
     def reset_context(self, agent_id: str) -> dict[str, Any]:
         return self.coordinator.reset_context(agent_id)
 
@@ -66,6 +66,9 @@ class EmploymentCoordinator:
     def get_context(self, world: Any, agent_id: str) -> dict[str, Any]:
         return self.engine.get_employment_context(world, agent_id)
 
+    def invalidate(self, agent_id: str | None = None) -> None:
+        self.engine.invalidate(agent_id)
+
     def context_defaults(self) -> dict[str, Any]:
         return self.engine.context_defaults()
 
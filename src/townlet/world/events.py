@@ -50,6 +50,12 @@ class EventDispatcher:
         if listener not in self._listeners:
             self._listeners.append(listener)
 
+    def unregister(self, listener: EventListener) -> None:
+        """Detach ``listener`` if it is registered."""
+
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
     def emit(
         self,
         *,
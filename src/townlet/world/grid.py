@@ -11,12 +11,13 @@ from collections.abc import Callable, Iterable, Mapping
 from dataclasses import dataclass, field
 from pathlib import Path
 from types import MappingProxyType
-from typing import Any, Literal
+from typing import TYPE_CHECKING, Any, Literal
 
 from townlet.agents.models import Personality, PersonalityProfile, PersonalityProfiles
 from townlet.agents.relationship_modifiers import RelationshipEvent
 from townlet.config import AffordanceRuntimeConfig, SimulationConfig
 from townlet.config.affordance_manifest import (
+    AffordanceManifest,
     AffordanceManifestError,
     load_affordance_manifest,
 )
@@ -24,8 +25,8 @@ from townlet.console.command import (
     ConsoleCommandEnvelope,
     ConsoleCommandResult,
 )
-from townlet.console.service import ConsoleService
 from townlet.observations.embedding import EmbeddingAllocator
+from townlet.utils.timers import TimingWheel
 from townlet.world.affordance_runtime import AffordanceCoordinator
 from townlet.world.affordance_runtime_service import AffordanceRuntimeService
 from townlet.world.affordances import (
@@ -66,6 +67,7 @@ from townlet.world.perturbations import PerturbationService
 from townlet.world.preconditions import (
     CompiledPrecondition,
     PreconditionSyntaxError,
+    compile_manifest_preconditions,
     compile_preconditions,
 )
 from townlet.world.queue import QueueConflictTracker, QueueManager
@@ -81,6 +83,9 @@ from townlet.world.systems import queues as queue_system
 from townlet.world.systems import relationships as relationship_system
 from townlet.world.systems.base import SystemContext
 
+if TYPE_CHECKING:  # pragma: no cover - typing only; runtime import is lazy to avoid cycles
+    from townlet.console.service import ConsoleService
+
 logger = logging.getLogger(__name__)
 
 _CONSOLE_HISTORY_LIMIT = 512
@@ -154,6 +159,19 @@ class AffordanceSpec:
     )
 
 
+@dataclass(frozen=True)
+class WorldLayoutTemplate:
+    """Parsed manifest and compiled affordance specs reused across world rebuilds.
+
+    Specs are treated as immutable once registered, so fresh worlds can share
+    them instead of re-reading the manifest and recompiling preconditions.
+    """
+
+    source: Path
+    manifest: AffordanceManifest
+    affordances: Mapping[str, AffordanceSpec]
+
+
 @dataclass
 class WorldState:
     """Holds mutable world state for the simulation tick."""
@@ -162,6 +180,7 @@ class WorldState:
     tick: int = 0
     _agents: AgentRegistry = field(init=False, repr=False)
     queue_manager: QueueManager = field(init=False)
+    _timers: TimingWheel = field(init=False, repr=False)
     embedding_allocator: EmbeddingAllocator = field(init=False)
     _personality_reward_enabled: bool = field(init=False, default=False, repr=False)
     _personality_profile_cache: dict[str, PersonalityProfile] = field(
@@ -195,6 +214,8 @@ class WorldState:
         | None
     ) = None
     affordance_runtime_config: AffordanceRuntimeConfig | None = None
+    layout_template: WorldLayoutTemplate | None = None
+    _affordance_manifest: AffordanceManifest | None = field(init=False, default=None, repr=False)
     _affordance_manifest_info: dict[str, object] = field(init=False, default_factory=dict)
     _objects_by_position: dict[tuple[int, int], list[str]] = field(init=False, default_factory=dict)
     _console: ConsoleService | None = field(init=False, default=None, repr=False)
@@ -225,6 +246,7 @@ class WorldState:
         console_service_factory: (
             Callable[[WorldState], ConsoleService] | None
         ) = None,
+        layout_template: WorldLayoutTemplate | None = None,
     ) -> WorldState:
         """Bootstrap the initial world from config."""
 
@@ -232,6 +254,7 @@ class WorldState:
             config=config,
             affordance_runtime_factory=affordance_runtime_factory,
             affordance_runtime_config=affordance_runtime_config,
+            layout_template=layout_template,
         )
         instance.attach_rng(rng or random.Random())
         if attach_console:
@@ -244,7 +267,8 @@ class WorldState:
         self._personality_reward_enabled = self.config.reward_personality_scaling_enabled()
         self._personality_profile_cache.clear()
         self._agents = AgentRegistry()
-        self.queue_manager = QueueManager(config=self.config)
+        self._timers = TimingWheel(current_tick=self.tick)
+        self.queue_manager = QueueManager(config=self.config, timers=self._timers)
         self._spatial_index = WorldSpatialIndex()
         self.embedding_allocator = EmbeddingAllocator(config=self.config)
         self._active_reservations = {}
@@ -457,6 +481,12 @@ class WorldState:
     def agents(self) -> AgentRegistry:
         return self._agents
 
+    @property
+    def timers(self) -> TimingWheel:
+        """Shared timing wheel used for cooldowns and scheduled expiries."""
+
+        return self._timers
+
     @property
     def runtime_instrumentation_level(self) -> str:
         return getattr(self, "_runtime_instrumentation_level", "off")
@@ -527,6 +557,7 @@ class WorldState:
             queue_conflicts=self._queue_conflicts,
             affordance_service=self._affordance_service,
             console=console,
+            timers=self._timers,
             employment=self.employment,
             employment_runtime=self._employment_runtime,
             employment_service=self._employment_service,
@@ -1388,15 +1419,23 @@ class WorldState:
 
     def _load_affordance_definitions(self) -> None:
         manifest_path = Path(self.config.affordances.affordances_file).expanduser()
-        try:
-            manifest = load_affordance_manifest(manifest_path)
-        except FileNotFoundError as error:
-            raise RuntimeError(f"Affordance manifest not found at {manifest_path}.") from error
-        except AffordanceManifestError as error:
-            raise RuntimeError(
-                f"Failed to load affordance manifest {manifest_path}: {error}"
-            ) from error
-
+        template = self.layout_template
+        if template is not None and template.source != manifest_path:
+            template = None
+        if template is not None:
+            manifest = template.manifest
+        else:
+            try:
+                manifest = load_affordance_manifest(manifest_path)
+            except FileNotFoundError as error:
+                raise RuntimeError(f"Affordance manifest not found at {manifest_path}.") from error
+            except AffordanceManifestError as error:
+                raise RuntimeError(
+                    f"Failed to load affordance manifest {manifest_path}: {error}"
+                ) from error
+            compile_manifest_preconditions(manifest)
+
+        self._affordance_manifest = manifest
         self._reset_object_registry()
         self.affordances.clear()
 
@@ -1408,15 +1447,18 @@ class WorldState:
                 stock=getattr(object_entry, "stock", None),
             )
 
-        for affordance_entry in manifest.affordances:
-            self.register_affordance(
-                affordance_id=affordance_entry.affordance_id,
-                object_type=affordance_entry.object_type,
-                duration=affordance_entry.duration,
-                effects=affordance_entry.effects,
-                preconditions=affordance_entry.preconditions,
-                hooks=affordance_entry.hooks,
-            )
+        if template is not None:
+            self.affordances.update(template.affordances)
+        else:
+            for affordance_entry in manifest.affordances:
+                self.register_affordance(
+                    affordance_id=affordance_entry.affordance_id,
+                    object_type=affordance_entry.object_type,
+                    duration=affordance_entry.duration,
+                    effects=affordance_entry.effects,
+                    preconditions=affordance_entry.preconditions,
+                    hooks=affordance_entry.hooks,
+                )
 
         self._affordance_manifest_info = {
             "path": str(manifest.path),
@@ -1426,6 +1468,25 @@ class WorldState:
         }
         self.assign_jobs_to_agents()
 
+    def export_layout_template(self) -> WorldLayoutTemplate | None:
+        """Return the manifest-derived layout for building identical fresh worlds.
+
+        Returns ``None`` when affordances were registered outside the manifest
+        (e.g. by tests or console commands), since a template would drop them.
+        """
+
+        manifest = self._affordance_manifest
+        if manifest is None:
+            return None
+        manifest_ids = {entry.affordance_id for entry in manifest.affordances}
+        if set(self.affordances) != manifest_ids:
+            return None
+        return WorldLayoutTemplate(
+            source=Path(self.config.affordances.affordances_file).expanduser(),
+            manifest=manifest,
+            affordances=MappingProxyType(dict(self.affordances)),
+        )
+
     def affordance_manifest_metadata(self) -> dict[str, object]:
         """Expose manifest metadata (path, checksum, counts) for telemetry."""
 
@@ -1564,6 +1625,8 @@ def build_console_service(
 ) -> ConsoleService:
     """Construct a console service bound to the given world."""
 
+    from townlet.console.service import ConsoleService
+
     return ConsoleService(
         world=world,
         history_limit=history_limit,
@@ -1,8 +1,10 @@
 """Observation helper subpackage."""
 
 __all__ = [
+    "buffers",
     "cache",
     "context",
+    "incremental",
     "interfaces",
     "service",
     "views",
@@ -0,0 +1,98 @@
+"""Preallocated, generation-tagged output buffers for observation batches.
+
+``WorldObservationService`` normally allocates a fresh map tensor and feature
+vector per agent per tick. With the buffer pool enabled it instead owns
+``depth`` generations of ``(N_max, C, H, W)`` map and ``(N_max, F)`` feature
+arrays indexed by embedding slot, and encoders write into row views in place.
+Each :meth:`ObservationBufferPool.begin_tick` rotates to the next generation,
+so arrays handed out for a batch stay valid for ``depth - 1`` further batches;
+consumers that retain them longer must copy (see :meth:`ObservationBufferPool.is_live`).
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+
+class ObservationFrame:
+    """Buffers for one observation batch (one pool generation)."""
+
+    __slots__ = ("_claimed", "features", "generation", "maps")
+
+    def __init__(self, generation: int, maps: np.ndarray, features: np.ndarray) -> None:
+        self.generation = generation
+        self.maps = maps
+        self.features = features
+        self._claimed: set[int] = set()
+
+    def claim(self, slot: int) -> tuple[np.ndarray, np.ndarray] | None:
+        """Return the (map, features) row views for ``slot``.
+
+        Returns ``None`` when the slot is out of range or already claimed in
+        this frame (e.g. forced embedding reuse), so callers fall back to
+        freshly allocated arrays.
+        """
+
+        if not 0 <= slot < self.maps.shape[0] or slot in self._claimed:
+            return None
+        self._claimed.add(slot)
+        return self.maps[slot], self.features[slot]
+
+
+class ObservationBufferPool:
+    """Ring of preallocated observation arrays keyed by embedding slot."""
+
+    def __init__(
+        self,
+        *,
+        capacity: int,
+        map_shape: tuple[int, ...],
+        feature_dim: int,
+        depth: int = 2,
+        dtype: np.dtype | type = np.float32,
+    ) -> None:
+        if capacity < 1:
+            raise ValueError("capacity must be >= 1")
+        if depth < 2:
+            raise ValueError("depth must be >= 2 so the previous batch stays valid")
+        self._depth = int(depth)
+        self._maps = np.zeros((self._depth, int(capacity), *map_shape), dtype=dtype)
+        self._features = np.zeros((self._depth, int(capacity), int(feature_dim)), dtype=dtype)
+        self._generation = -1
+
+    @property
+    def depth(self) -> int:
+        return self._depth
+
+    @property
+    def capacity(self) -> int:
+        return int(self._maps.shape[1])
+
+    @property
+    def map_shape(self) -> tuple[int, ...]:
+        return tuple(int(dim) for dim in self._maps.shape[2:])
+
+    @property
+    def feature_dim(self) -> int:
+        return int(self._features.shape[2])
+
+    @property
+    def generation(self) -> int:
+        """Generation of the most recent frame (``-1`` before the first)."""
+
+        return self._generation
+
+    def begin_tick(self) -> ObservationFrame:
+        """Rotate to the next generation and return its frame."""
+
+        self._generation += 1
+        index = self._generation % self._depth
+        return ObservationFrame(self._generation, self._maps[index], self._features[index])
+
+    def is_live(self, generation: int) -> bool:
+        """Return whether arrays from ``generation`` have not been overwritten yet."""
+
+        return 0 <= self._generation - generation < self._depth
+
+
+__all__ = ["ObservationBufferPool", "ObservationFrame"]
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from .features import encode_feature_vector
-from .map import encode_compact_map, encode_map_tensor
+from .map import encode_compact_map, encode_map_tensor, patch_map_tensor
 from .social import encode_social_vector
 
 __all__ = [
@@ -11,4 +11,5 @@ __all__ = [
     "encode_map_tensor",
     "encode_compact_map",
     "encode_social_vector",
+    "patch_map_tensor",
 ]
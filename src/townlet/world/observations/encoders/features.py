@@ -53,6 +53,7 @@ def encode_feature_vector(
     landmarks: list[str] | None = None,
     landmark_slices: dict[str, slice] | None = None,
     personality_enabled: bool = False,
+    out: np.ndarray | None = None,
 ) -> tuple[np.ndarray, dict[str, float], dict[str, object] | None]:
     """
     Encode a complete feature vector for an agent.
@@ -69,11 +70,20 @@ def encode_feature_vector(
         landmarks: Optional list of landmark types to encode
         landmark_slices: Optional dict mapping landmark name to feature slice
         personality_enabled: Whether to encode personality features
+        out: Optional preallocated feature vector to fill in place
 
     Returns:
         (features, local_summary_dict, personality_context)
     """
-    features = np.zeros(len(feature_index), dtype=np.float32)
+    if out is not None:
+        if out.shape != (len(feature_index),):
+            raise ValueError(
+                f"output buffer shape {out.shape} does not match ({len(feature_index)},)"
+            )
+        out.fill(0.0)
+        features = out
+    else:
+        features = np.zeros(len(feature_index), dtype=np.float32)
 
     # Core features: needs, wallet, shift state, time
     _encode_needs(features, context, feature_index)
@@ -220,12 +230,7 @@ def _encode_environmental_flags(
 
     queue_idx = feature_index.get("in_queue")
     if queue_idx is not None:
-        in_queue = False
-        for object_id in world.objects_snapshot().keys():
-            queue = world.queue_manager.queue_snapshot(object_id)
-            if snapshot.agent_id in queue:
-                in_queue = True
-                break
+        in_queue = world.queue_manager.is_queued(snapshot.agent_id)
         features[queue_idx] = 1.0 if in_queue else 0.0
 
 
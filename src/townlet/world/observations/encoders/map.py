@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
@@ -36,12 +37,18 @@ class LocalSummary:
     nearest_agent_distance_norm: float
 
 
+TileStats = dict[tuple[int, int], tuple[int, int, bool]]
+"""Non-empty tiles of a window keyed by ``(dx, dy)``: (other agents, objects, reserved)."""
+
+
 def encode_map_tensor(
     *,
     channels: tuple[str, ...],
     snapshot: AgentSnapshot,
     radius: int,
     cache: LocalCache,
+    out: np.ndarray | None = None,
+    tile_stats: TileStats | None = None,
 ) -> tuple[np.ndarray, LocalSummary]:
     """
     Encode a local map tensor around an agent's position.
@@ -54,16 +61,24 @@ def encode_map_tensor(
         snapshot: Agent state snapshot
         radius: Map radius in tiles
         cache: Prebuilt spatial lookup cache
+        out: Optional preallocated (C, H, W) array to fill in place
+        tile_stats: Optional dict filled with per-tile counts so the window can
+            later be updated with :func:`patch_map_tensor`
 
     Returns:
         (tensor, summary) where tensor is (C, H, W) and summary contains local stats
     """
     window = radius * 2 + 1
-    tensor = (
-        np.zeros((len(channels), window, window), dtype=np.float32)
-        if channels
-        else np.zeros((0, 0, 0), dtype=np.float32)
-    )
+    if out is not None and channels:
+        _check_out_shape(out, (len(channels), window, window))
+        out.fill(0.0)
+        tensor = out
+    else:
+        tensor = (
+            np.zeros((len(channels), window, window), dtype=np.float32)
+            if channels
+            else np.zeros((0, 0, 0), dtype=np.float32)
+        )
     if channels:
         # Mark self position (first channel is always "self")
         tensor[0, radius, radius] = 1.0
@@ -72,7 +87,6 @@ def encode_map_tensor(
     object_total = 0
     reserved_tiles = 0
     nearest_distance: float | None = None
-    total_tiles = window * window
 
     channel_index = {name: idx for idx, name in enumerate(channels)}
     cx, cy = snapshot.position
@@ -101,6 +115,8 @@ def encode_map_tensor(
             object_total += len(objects)
             if reserved:
                 reserved_tiles += 1
+            if tile_stats is not None and (agents or objects or reserved):
+                tile_stats[(dx, dy)] = (_other_agents(agents, position, snapshot), len(objects), reserved)
 
             if not channels:
                 continue
@@ -124,6 +140,100 @@ def encode_map_tensor(
                             dy
                         ) / distance
 
+    summary = _build_summary(other_agents, object_total, reserved_tiles, nearest_distance, radius)
+    return tensor, summary
+
+
+def patch_map_tensor(
+    tensor: np.ndarray,
+    *,
+    channels: tuple[str, ...],
+    snapshot: AgentSnapshot,
+    radius: int,
+    cache: LocalCache,
+    tiles: Iterable[tuple[int, int]],
+    tile_stats: TileStats,
+) -> LocalSummary:
+    """
+    Re-encode only ``tiles`` of a window previously encoded at ``snapshot.position``.
+
+    ``tensor`` and ``tile_stats`` must come from :func:`encode_map_tensor` for
+    the same agent position; both are updated in place. Static channels (self,
+    path_dx, path_dy) do not depend on occupancy and are left untouched.
+
+    Args:
+        tensor: Previously encoded (C, H, W) window (ignored for empty channels)
+        channels: Channel names the tensor was encoded with
+        snapshot: Agent state snapshot
+        radius: Map radius in tiles
+        cache: Current spatial lookup cache
+        tiles: World positions whose occupancy changed
+        tile_stats: Per-tile counts recorded for the window
+
+    Returns:
+        Local summary recomputed from the updated tile counts
+    """
+    channel_index = {name: idx for idx, name in enumerate(channels)}
+    agents_idx = channel_index.get("agents")
+    objects_idx = channel_index.get("objects")
+    reservations_idx = channel_index.get("reservations")
+    cx, cy = snapshot.position
+    for position in tiles:
+        dx = position[0] - cx
+        dy = position[1] - cy
+        if abs(dx) > radius or abs(dy) > radius:
+            continue
+        agents = cache.agent_lookup.get(position, [])
+        objects = cache.object_lookup.get(position, [])
+        reserved = position in cache.reservation_tiles
+        if agents or objects or reserved:
+            tile_stats[(dx, dy)] = (_other_agents(agents, position, snapshot), len(objects), reserved)
+        else:
+            tile_stats.pop((dx, dy), None)
+        tile_x = dx + radius
+        tile_y = dy + radius
+        if agents_idx is not None:
+            tensor[agents_idx, tile_y, tile_x] = 1.0 if agents else 0.0
+        if objects_idx is not None:
+            tensor[objects_idx, tile_y, tile_x] = 1.0 if objects else 0.0
+        if reservations_idx is not None:
+            tensor[reservations_idx, tile_y, tile_x] = 1.0 if reserved else 0.0
+
+    other_agents = 0
+    object_total = 0
+    reserved_tiles = 0
+    nearest_distance: float | None = None
+    for (dx, dy), (others, objects_count, reserved) in tile_stats.items():
+        other_agents += others
+        object_total += objects_count
+        if reserved:
+            reserved_tiles += 1
+        if others > 0:
+            distance = float(np.hypot(dx, dy))
+            if distance > 0 and (nearest_distance is None or distance < nearest_distance):
+                nearest_distance = distance
+    return _build_summary(other_agents, object_total, reserved_tiles, nearest_distance, radius)
+
+
+def _other_agents(agents: list[str], position: tuple[int, int], snapshot: AgentSnapshot) -> int:
+    if not agents:
+        return 0
+    count = len(agents)
+    # Exclude self when positioned on the same tile
+    if position == snapshot.position:
+        count -= 1
+    return max(0, count)
+
+
+def _build_summary(
+    other_agents: int,
+    object_total: int,
+    reserved_tiles: int,
+    nearest_distance: float | None,
+    radius: int,
+) -> LocalSummary:
+    window = radius * 2 + 1
+    total_tiles = window * window
     max_tiles = max(1, total_tiles - 1)
     agent_ratio = min(1.0, other_agents / max_tiles)
     object_ratio = min(1.0, object_total / max(1, total_tiles))
@@ -133,7 +243,7 @@ def encode_map_tensor(
     else:
         nearest_norm = max(0.0, min(1.0, nearest_distance / max(1, radius)))
 
-    summary = LocalSummary(
+    return LocalSummary(
         agent_count=float(other_agents),
         object_count=float(object_total),
         reserved_tiles=float(reserved_tiles),
@@ -145,8 +255,6 @@ def encode_map_tensor(
         nearest_agent_distance_norm=float(nearest_norm),
     )
 
-    return tensor, summary
-
 
 def encode_compact_map(
     *,
@@ -157,6 +265,7 @@ def encode_compact_map(
     channels: tuple[str, ...],
     object_channels: list[str],
     normalize_counts: bool,
+    out: np.ndarray | None = None,
 ) -> np.ndarray:
     """
     Encode a compact map tensor with per-object-type channels.
@@ -174,12 +283,18 @@ def encode_compact_map(
         channels: All channel names (base + object:* + walkable)
         object_channels: List of object types to encode (e.g., ["fridge", "stove"])
         normalize_counts: If True, clamp counts to 1.0
+        out: Optional preallocated (C, H, W) array to fill in place
 
     Returns:
         Tensor of shape (C, H, W) where C = len(channels)
     """
     window = radius * 2 + 1
-    tensor = np.zeros((len(channels), window, window), dtype=np.float32)
+    if out is not None:
+        _check_out_shape(out, (len(channels), window, window))
+        out.fill(0.0)
+        tensor = out
+    else:
+        tensor = np.zeros((len(channels), window, window), dtype=np.float32)
     channel_index = {name: idx for idx, name in enumerate(channels)}
     if "self" in channel_index:
         tensor[channel_index["self"], radius, radius] = 1.0
@@ -243,4 +358,16 @@ def encode_compact_map(
     return tensor
 
 
-__all__ = ["LocalCache", "LocalSummary", "encode_map_tensor", "encode_compact_map"]
+def _check_out_shape(out: np.ndarray, expected: tuple[int, ...]) -> None:
+    if out.shape != expected:
+        raise ValueError(f"output buffer shape {out.shape} does not match {expected}")
+
+
+__all__ = [
+    "LocalCache",
+    "LocalSummary",
+    "TileStats",
+    "encode_compact_map",
+    "encode_map_tensor",
+    "patch_map_tensor",
+]
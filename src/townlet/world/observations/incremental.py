@@ -0,0 +1,131 @@
+"""Dirty-tile tracking for incremental observation encoding.
+
+Most agents' local windows are unchanged from one tick to the next: the agent
+did not move and nothing entered, left, or was reserved within its radius.
+:class:`IncrementalObservationCache` diffs the per-tick :class:`LocalCache`
+(agent lookups, object registry positions, reservation tiles) against the
+previous tick to find dirty tiles, then lets the observation service reuse an
+agent's last encoded window verbatim, patch just the dirty tiles inside it, or
+fall back to a full encode when the agent moved.
+
+Dirty tiles are derived from the cache rather than from mutation hooks because
+several world paths (action application, perturbations, nightly resets) write
+``AgentSnapshot.position`` directly instead of going through the spatial index.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+
+import numpy as np
+
+from townlet.world.agents.snapshot import AgentSnapshot
+from townlet.world.observations.encoders.map import LocalCache, LocalSummary, TileStats
+
+Position = tuple[int, int]
+
+
+@dataclass(slots=True)
+class EncodedWindow:
+    """Last encoded map window for one agent."""
+
+    position: Position
+    map: np.ndarray
+    summary: LocalSummary
+    tile_stats: TileStats | None = None
+
+
+def diff_local_cache(previous: LocalCache, current: LocalCache) -> set[Position]:
+    """Return tiles whose agents, objects, or reservation state changed."""
+
+    dirty: set[Position] = set()
+    for before, after in (
+        (previous.agent_lookup, current.agent_lookup),
+        (previous.object_lookup, current.object_lookup),
+    ):
+        for position in before.keys() | after.keys():
+            if before.get(position) != after.get(position):
+                dirty.add(position)
+    dirty.update(previous.reservation_tiles ^ current.reservation_tiles)
+    return dirty
+
+
+class IncrementalObservationCache:
+    """Per-agent encoded windows plus the dirty tiles touching each of them."""
+
+    def __init__(self, *, radius: int) -> None:
+        self._radius = int(radius)
+        self._previous: LocalCache | None = None
+        self._windows: dict[str, EncodedWindow] = {}
+        self._dirty: dict[str, list[Position]] = {}
+        self._counts = {"reused": 0, "patched": 0, "encoded": 0}
+
+    @property
+    def radius(self) -> int:
+        return self._radius
+
+    @property
+    def counts(self) -> dict[str, int]:
+        """Reused/patched/encoded window counts for the current tick."""
+
+        return dict(self._counts)
+
+    def begin_tick(self, cache: LocalCache, snapshots: Mapping[str, AgentSnapshot]) -> None:
+        """Diff ``cache`` against the previous tick and bucket dirty tiles per agent."""
+
+        for agent_id in self._windows.keys() - snapshots.keys():
+            del self._windows[agent_id]
+        self._dirty = {}
+        self._counts = {"reused": 0, "patched": 0, "encoded": 0}
+        previous, self._previous = self._previous, cache
+        if previous is None:
+            self._windows.clear()
+            return
+        dirty = diff_local_cache(previous, cache)
+        if not dirty:
+            return
+        candidates = [
+            (agent_id, window.position)
+            for agent_id, window in self._windows.items()
+            if snapshots[agent_id].position == window.position
+        ]
+        if not candidates:
+            return
+        tiles = np.asarray(sorted(dirty), dtype=np.int64)
+        centres = np.asarray([position for _, position in candidates], dtype=np.int64)
+        inside = (np.abs(tiles[None, :, :] - centres[:, None, :]) <= self._radius).all(axis=2)
+        for row in np.flatnonzero(inside.any(axis=1)).tolist():
+            agent_id = candidates[row][0]
+            self._dirty[agent_id] = [
+                (int(x), int(y)) for x, y in tiles[inside[row]].tolist()
+            ]
+
+    def lookup(self, agent_id: str, position: Position) -> tuple[EncodedWindow | None, list[Position]]:
+        """Return the reusable window for ``agent_id`` and its dirty tiles.
+
+        ``(None, [])`` means the agent moved or has no cached window and must
+        be fully encoded; an empty tile list means the window can be reused
+        as-is.
+        """
+
+        window = self._windows.get(agent_id)
+        if window is None or window.position != position:
+            return None, []
+        return window, self._dirty.get(agent_id, [])
+
+    def store(self, agent_id: str, window: EncodedWindow) -> None:
+        self._windows[agent_id] = window
+
+    def record(self, outcome: str) -> None:
+        self._counts[outcome] += 1
+
+    def reset(self) -> None:
+        """Drop all cached windows so the next tick is fully re-encoded."""
+
+        self._previous = None
+        self._windows.clear()
+        self._dirty = {}
+
+
+__all__ = ["EncodedWindow", "IncrementalObservationCache", "diff_local_cache"]
@@ -9,6 +9,7 @@ import numpy as np
 
 from townlet.config import ObservationVariant, SimulationConfig
 from townlet.world.core.runtime_adapter import ensure_world_adapter
+from townlet.world.observations.buffers import ObservationBufferPool, ObservationFrame
 from townlet.world.observations.cache import build_local_cache
 from townlet.world.observations.context import agent_context
 from townlet.world.observations.encoders import (
@@ -16,8 +17,10 @@ from townlet.world.observations.encoders import (
     encode_feature_vector,
     encode_map_tensor,
     encode_social_vector,
+    patch_map_tensor,
 )
-from townlet.world.observations.encoders.map import LocalCache
+from townlet.world.observations.encoders.map import LocalCache, LocalSummary, TileStats
+from townlet.world.observations.incremental import EncodedWindow, IncrementalObservationCache
 from townlet.world.observations.interfaces import (
     AdapterSource,
     ObservationServiceProtocol,
@@ -80,6 +83,25 @@ class WorldObservationService(ObservationServiceProtocol):
             except KeyError:
                 pass  # Landmarks not in feature names
 
+        # Optional buffer pool: encoders write into preallocated per-slot rows and
+        # static metadata is shared across agents and ticks.
+        self._buffer_pool: ObservationBufferPool | None = None
+        self._static_metadata: dict[str, object] | None = None
+        pool_cfg = config.observations_config.buffer_pool
+        if pool_cfg.enabled:
+            self._buffer_pool = ObservationBufferPool(
+                capacity=config.embedding_allocator.max_slots,
+                map_shape=self._map_shape(),
+                feature_dim=len(self._feature_names),
+                depth=pool_cfg.depth,
+            )
+
+        # Optional incremental mode: unchanged windows are reused across ticks and
+        # windows touched by dirty tiles are patched rather than re-encoded.
+        self._incremental: IncrementalObservationCache | None = None
+        if config.observations_config.incremental:
+            self._incremental = IncrementalObservationCache(radius=self._map_shape()[1] // 2)
+
     def _build_feature_names(self) -> tuple[list[str], dict[str, int]]:
         """Build the feature name list for observation encoding."""
         shift_feature_map = {
@@ -186,6 +208,25 @@ class WorldObservationService(ObservationServiceProtocol):
             length += 4  # trust_mean, trust_max, rivalry_mean, rivalry_max
         return length
 
+    def _map_shape(self) -> tuple[int, int, int]:
+        """Return the (C, H, W) map shape produced by the configured variant."""
+        if self._variant == "compact":
+            window = self.compact_cfg.map_window
+            return (len(self.compact_map_channels), window, window)
+        channels = self.full_channels if self._variant == "full" else self.MAP_CHANNELS
+        window = self.hybrid_cfg.local_window
+        return (len(channels), window, window)
+
+    @property
+    def buffer_pool(self) -> ObservationBufferPool | None:
+        """Return the observation buffer pool when buffer-pool mode is enabled."""
+        return self._buffer_pool
+
+    @property
+    def incremental_cache(self) -> IncrementalObservationCache | None:
+        """Return the incremental window cache when incremental mode is enabled."""
+        return self._incremental
+
     @property
     def variant(self) -> object:
         return self._variant
@@ -214,10 +255,13 @@ class WorldObservationService(ObservationServiceProtocol):
             adapter, snapshots
         )
         cache = LocalCache(agent_lookup, object_lookup, reservation_tiles)
+        if self._incremental is not None:
+            self._incremental.begin_tick(cache, snapshots)
+        frame = self._buffer_pool.begin_tick() if self._buffer_pool is not None else None
 
         for agent_id, snapshot in snapshots.items():
             slot = adapter.embedding_allocator.allocate(agent_id, adapter.tick)
-            obs = self._build_single(adapter, snapshot, slot, cache)
+            obs = self._build_single(adapter, snapshot, slot, cache, frame=frame)
             features_array = cast(np.ndarray, obs["features"])
 
             # Handle ctx_reset flags
@@ -259,24 +303,36 @@ class WorldObservationService(ObservationServiceProtocol):
         snapshot: Any,  # AgentSnapshot
         slot: int,
         cache: LocalCache,
+        *,
+        frame: ObservationFrame | None = None,
     ) -> dict[str, np.ndarray | dict[str, object]]:
         """Build observation for a single agent using encoders."""
+        buffers = frame.claim(slot) if frame is not None else None
+        generation = frame.generation if buffers is not None and frame is not None else None
         if self._variant == "hybrid":
-            return self._build_hybrid(world, snapshot, slot, cache)
+            return self._build_hybrid(world, snapshot, slot, cache, buffers, generation)
         if self._variant == "full":
-            return self._build_full(world, snapshot, slot, cache)
+            return self._build_full(world, snapshot, slot, cache, buffers, generation)
         if self._variant == "compact":
-            return self._build_compact(world, snapshot, slot, cache)
+            return self._build_compact(world, snapshot, slot, cache, buffers, generation)
         raise ValueError(f"Unsupported observation variant: {self._variant}")
 
     def _build_hybrid(
-        self, world: Any, snapshot: Any, slot: int, cache: LocalCache
+        self,
+        world: Any,
+        snapshot: Any,
+        slot: int,
+        cache: LocalCache,
+        buffers: tuple[np.ndarray, np.ndarray] | None = None,
+        generation: int | None = None,
     ) -> dict[str, np.ndarray | dict[str, object]]:
         """Build hybrid variant observation."""
-        window = self.hybrid_cfg.local_window
-        radius = window // 2
-        map_tensor, local_summary = encode_map_tensor(
-            channels=self.MAP_CHANNELS, snapshot=snapshot, radius=radius, cache=cache
+        map_tensor, local_summary = self._encode_window(
+            world,
+            snapshot,
+            cache,
+            channels=self.MAP_CHANNELS,
+            out=buffers[0] if buffers is not None else None,
         )
 
         context = agent_context(world, snapshot.agent_id)
@@ -292,6 +348,7 @@ class WorldObservationService(ObservationServiceProtocol):
             landmarks=self._landmarks if self.hybrid_cfg.include_targets else None,
             landmark_slices=self._landmark_slices if self.hybrid_cfg.include_targets else None,
             personality_enabled=self._personality_enabled,
+            out=buffers[1] if buffers is not None else None,
         )
 
         # Encode social vector
@@ -322,6 +379,7 @@ class WorldObservationService(ObservationServiceProtocol):
             social_context=social_context,
             local_summary=local_summary_dict,
             personality_context=personality_context,
+            generation=generation,
         )
 
         return {
@@ -331,13 +389,21 @@ class WorldObservationService(ObservationServiceProtocol):
         }
 
     def _build_full(
-        self, world: Any, snapshot: Any, slot: int, cache: LocalCache
+        self,
+        world: Any,
+        snapshot: Any,
+        slot: int,
+        cache: LocalCache,
+        buffers: tuple[np.ndarray, np.ndarray] | None = None,
+        generation: int | None = None,
     ) -> dict[str, np.ndarray | dict[str, object]]:
         """Build full variant observation."""
-        window = self.hybrid_cfg.local_window
-        radius = window // 2
-        map_tensor, local_summary = encode_map_tensor(
-            channels=self.full_channels, snapshot=snapshot, radius=radius, cache=cache
+        map_tensor, local_summary = self._encode_window(
+            world,
+            snapshot,
+            cache,
+            channels=self.full_channels,
+            out=buffers[0] if buffers is not None else None,
         )
 
         context = agent_context(world, snapshot.agent_id)
@@ -353,6 +419,7 @@ class WorldObservationService(ObservationServiceProtocol):
             landmarks=self._landmarks if self.hybrid_cfg.include_targets else None,
             landmark_slices=self._landmark_slices if self.hybrid_cfg.include_targets else None,
             personality_enabled=self._personality_enabled,
+            out=buffers[1] if buffers is not None else None,
         )
 
         # Encode social vector
@@ -383,6 +450,7 @@ class WorldObservationService(ObservationServiceProtocol):
             social_context=social_context,
             local_summary=local_summary_dict,
             personality_context=personality_context,
+            generation=generation,
         )
 
         return {
@@ -392,26 +460,21 @@ class WorldObservationService(ObservationServiceProtocol):
         }
 
     def _build_compact(
-        self, world: Any, snapshot: Any, slot: int, cache: LocalCache
+        self,
+        world: Any,
+        snapshot: Any,
+        slot: int,
+        cache: LocalCache,
+        buffers: tuple[np.ndarray, np.ndarray] | None = None,
+        generation: int | None = None,
     ) -> dict[str, np.ndarray | dict[str, object]]:
         """Build compact variant observation."""
-        window = self.compact_cfg.map_window
-        radius = window // 2
-
-        # Get local summary for features (no map needed)
-        _, local_summary = encode_map_tensor(
-            channels=(), snapshot=snapshot, radius=radius, cache=cache
-        )
-
-        # Encode compact map
-        map_tensor = encode_compact_map(
-            world=world,
-            snapshot=snapshot,
-            radius=radius,
-            cache=cache,
+        map_tensor, local_summary = self._encode_window(
+            world,
+            snapshot,
+            cache,
             channels=self.compact_map_channels,
-            object_channels=self._compact_object_channels,
-            normalize_counts=self.compact_cfg.normalize_counts,
+            out=buffers[0] if buffers is not None else None,
         )
 
         context = agent_context(world, snapshot.agent_id)
@@ -427,6 +490,7 @@ class WorldObservationService(ObservationServiceProtocol):
             landmarks=self._landmarks if self.compact_cfg.include_targets else None,
             landmark_slices=self._landmark_slices if self.compact_cfg.include_targets else None,
             personality_enabled=self._personality_enabled,
+            out=buffers[1] if buffers is not None else None,
         )
 
         # Encode social vector
@@ -457,13 +521,10 @@ class WorldObservationService(ObservationServiceProtocol):
             social_context=social_context,
             local_summary=local_summary_dict,
             personality_context=personality_context,
+            generation=generation,
         )
-        metadata["compact"] = {
-            "map_window": window,
-            "object_channels": list(self._compact_object_channels),
-            "normalize_counts": bool(self.compact_cfg.normalize_counts),
-            "include_targets": bool(self.compact_cfg.include_targets),
-        }
+        if generation is None:
+            metadata["compact"] = self._compact_metadata()
 
         return {
             "map": map_tensor,
@@ -471,6 +532,80 @@ class WorldObservationService(ObservationServiceProtocol):
             "metadata": metadata,
         }
 
+    def _encode_window(
+        self,
+        world: Any,
+        snapshot: Any,
+        cache: LocalCache,
+        *,
+        channels: tuple[str, ...],
+        out: np.ndarray | None,
+    ) -> tuple[np.ndarray, LocalSummary]:
+        """Encode the variant's map window and local summary.
+
+        In incremental mode an unmoved agent's previous window is reused when no
+        dirty tile falls inside it, and patched tile-by-tile otherwise (compact
+        windows carry per-type counts and are re-encoded instead).
+        """
+        incremental = self._incremental
+        if incremental is not None:
+            cached, dirty = incremental.lookup(snapshot.agent_id, snapshot.position)
+            if cached is not None and dirty and cached.tile_stats is not None:
+                cached.summary = patch_map_tensor(
+                    cached.map,
+                    channels=channels,
+                    snapshot=snapshot,
+                    radius=incremental.radius,
+                    cache=cache,
+                    tiles=dirty,
+                    tile_stats=cached.tile_stats,
+                )
+                incremental.record("patched")
+            elif cached is not None and not dirty:
+                incremental.record("reused")
+            else:
+                cached = None
+            if cached is not None:
+                if out is None:
+                    return cached.map.copy(), cached.summary
+                out[...] = cached.map
+                return out, cached.summary
+
+        tile_stats: TileStats | None = None
+        if self._variant == "compact":
+            radius = self.compact_cfg.map_window // 2
+            _, local_summary = encode_map_tensor(
+                channels=(), snapshot=snapshot, radius=radius, cache=cache
+            )
+            map_tensor = encode_compact_map(
+                world=world,
+                snapshot=snapshot,
+                radius=radius,
+                cache=cache,
+                channels=channels,
+                object_channels=self._compact_object_channels,
+                normalize_counts=self.compact_cfg.normalize_counts,
+                out=out,
+            )
+        else:
+            radius = self.hybrid_cfg.local_window // 2
+            tile_stats = {} if incremental is not None else None
+            map_tensor, local_summary = encode_map_tensor(
+                channels=channels,
+                snapshot=snapshot,
+                radius=radius,
+                cache=cache,
+                out=out,
+                tile_stats=tile_stats,
+            )
+        if incremental is not None:
+            incremental.record("encoded")
+            incremental.store(
+                snapshot.agent_id,
+                EncodedWindow(snapshot.position, map_tensor.copy(), local_summary, tile_stats),
+            )
+        return map_tensor, local_summary
+
     def _build_metadata(
         self,
         *,
@@ -480,20 +615,29 @@ class WorldObservationService(ObservationServiceProtocol):
         social_context: dict[str, object] | None = None,
         local_summary: dict[str, float] | dict[str, object] | None = None,
         personality_context: dict[str, object] | None = None,
+        generation: int | None = None,
     ) -> dict[str, object]:
-        """Build metadata dictionary."""
-        metadata: dict[str, object] = {
-            "variant": self._variant,
-            "map_shape": map_shape,
-            "map_channels": list(map_channels),
-            "feature_names": list(self._feature_names),
-            "embedding_slot": slot,
-        }
-        if self._landmark_slices:
-            metadata["landmark_slices"] = {
-                name: (slice_.start, slice_.stop)
-                for name, slice_ in self._landmark_slices.items()
+        """Build metadata dictionary.
+
+        With a buffer ``generation`` (buffer-pool mode) the run-invariant entries
+        are shared, read-only objects rather than per-agent copies.
+        """
+        if generation is not None:
+            if self._static_metadata is None:
+                self._static_metadata = self._build_static_metadata(map_shape, map_channels)
+            metadata = dict(self._static_metadata)
+            metadata["embedding_slot"] = slot
+            metadata["buffer_generation"] = generation
+        else:
+            metadata = {
+                "variant": self._variant,
+                "map_shape": map_shape,
+                "map_channels": list(map_channels),
+                "feature_names": list(self._feature_names),
+                "embedding_slot": slot,
             }
+            if self._landmark_slices:
+                metadata["landmark_slices"] = self._landmark_slice_bounds()
         if social_context is not None and social_context.get("configured_slots"):
             metadata["social_context"] = social_context
         if local_summary is not None:
@@ -502,6 +646,38 @@ class WorldObservationService(ObservationServiceProtocol):
             metadata["personality"] = personality_context
         return metadata
 
+    def _build_static_metadata(
+        self,
+        map_shape: tuple[int, int, int],
+        map_channels: tuple[str, ...] | list[str],
+    ) -> dict[str, object]:
+        """Build the run-invariant metadata shared in buffer-pool mode."""
+        static: dict[str, object] = {
+            "variant": self._variant,
+            "map_shape": map_shape,
+            "map_channels": list(map_channels),
+            "feature_names": list(self._feature_names),
+        }
+        if self._landmark_slices:
+            static["landmark_slices"] = self._landmark_slice_bounds()
+        if self._variant == "compact":
+            static["compact"] = self._compact_metadata()
+        return static
+
+    def _landmark_slice_bounds(self) -> dict[str, tuple[int, int]]:
+        return {
+            name: (slice_.start, slice_.stop)
+            for name, slice_ in self._landmark_slices.items()
+        }
+
+    def _compact_metadata(self) -> dict[str, object]:
+        return {
+            "map_window": self.compact_cfg.map_window,
+            "object_channels": list(self._compact_object_channels),
+            "normalize_counts": bool(self.compact_cfg.normalize_counts),
+            "include_targets": bool(self.compact_cfg.include_targets),
+        }
+
     def _aggregate_names(self) -> list[str]:
         """Get social aggregate names."""
         if self.social_cfg.include_aggregates:
@@ -6,14 +6,20 @@ import ast
 import re
 from collections.abc import Iterable, Mapping, Sequence
 from dataclasses import dataclass
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from townlet.config.affordance_manifest import AffordanceManifest
+    from townlet.config.cache import ConfigCache
 
 __all__ = [
     "CompiledPrecondition",
     "PreconditionEvaluationError",
     "PreconditionSyntaxError",
+    "compile_manifest_preconditions",
     "compile_preconditions",
     "evaluate_preconditions",
+    "prime_precondition_cache",
 ]
 
 
@@ -132,14 +138,25 @@ def _validate_tree(tree: ast.AST, source: str) -> tuple[str, ...]:
     return tuple(sorted(collector.names))
 
 
+_COMPILED_CACHE: dict[str, CompiledPrecondition] = {}
+
+
 def compile_preconditions(expressions: Iterable[str]) -> tuple[CompiledPrecondition, ...]:
-    """Compile manifest preconditions, raising on syntax errors."""
+    """Compile manifest preconditions, raising on syntax errors.
+
+    Compiled expressions are immutable and memoised per process, so rebuilding
+    worlds from the same manifest skips parsing and validation.
+    """
 
     compiled: list[CompiledPrecondition] = []
     for raw in expressions:
         expression = str(raw or "").strip()
         if not expression:
             continue
+        cached = _COMPILED_CACHE.get(expression)
+        if cached is not None:
+            compiled.append(cached)
+            continue
         normalized = _normalize_expression(expression)
         try:
             tree = ast.parse(normalized, mode="eval")
@@ -148,12 +165,52 @@ def compile_preconditions(expressions: Iterable[str]) -> tuple[CompiledPrecondit
                 f"Invalid syntax in precondition '{expression}': {exc.msg}"
             ) from exc
         identifiers = _validate_tree(tree, expression)
-        compiled.append(
-            CompiledPrecondition(source=expression, tree=tree, identifiers=identifiers)
-        )
+        entry = CompiledPrecondition(source=expression, tree=tree, identifiers=identifiers)
+        _COMPILED_CACHE[expression] = entry
+        compiled.append(entry)
     return tuple(compiled)
 
 
+def prime_precondition_cache(compiled: Iterable[CompiledPrecondition]) -> None:
+    """Seed the compile memo with previously compiled (e.g. cached) expressions."""
+
+    for entry in compiled:
+        _COMPILED_CACHE.setdefault(entry.source, entry)
+
+
+def compile_manifest_preconditions(
+    manifest: AffordanceManifest, *, cache: ConfigCache | None = None
+) -> None:
+    """Prime the compile memo with every precondition in ``manifest``.
+
+    With a compiled-config cache (``cache`` or ``TOWNLET_CONFIG_CACHE_DIR``) the
+    compiled expressions are stored under the manifest checksum, so later
+    workers unpickle them instead of re-parsing. Without one this is a no-op and
+    preconditions compile lazily as affordances are registered.
+    """
+
+    from townlet.config.cache import default_config_cache
+
+    cache = cache if cache is not None else default_config_cache()
+    if cache is None:
+        return
+    key = manifest.checksum.encode("utf-8")
+    cached = cache.get("preconditions", key)
+    if isinstance(cached, tuple):
+        prime_precondition_cache(cached)
+        return
+    try:
+        compiled = tuple(
+            entry
+            for affordance in manifest.affordances
+            for entry in compile_preconditions(affordance.preconditions)
+        )
+    except PreconditionSyntaxError:
+        # Leave syntax errors to affordance registration so they surface as before.
+        return
+    cache.put("preconditions", key, compiled)
+
+
 def compile_precondition(expression: str) -> CompiledPrecondition:
     """Compile a single precondition expression."""
 
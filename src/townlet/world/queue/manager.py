@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+import json
 import time
 from collections.abc import Mapping
 from dataclasses import dataclass
 
 from townlet.config import QueueFairnessConfig, SimulationConfig
+from townlet.utils.timers import TimerEntry, TimingWheel
 
 
 @dataclass
@@ -15,12 +17,28 @@ class QueueEntry:
     joined_tick: int
 
 
+_EMPTY_VIEW: tuple[str, ...] = ()
+_COOLDOWN_TOPIC = "queue.cooldown"
+
+
 class QueueManager:
-    def __init__(self, config: SimulationConfig) -> None:
+    """Tracks per-object waiting queues, active occupants, and cooldowns.
+
+    Queues are stored as insertion-ordered ``agent_id -> QueueEntry`` mappings so
+    membership checks are O(1), with an agent -> objects reverse index for
+    cross-object lookups. Cooldown expiry is driven by a :class:`TimingWheel`;
+    pass the world's shared wheel via ``timers`` or the manager keeps its own.
+    """
+
+    def __init__(self, config: SimulationConfig, *, timers: TimingWheel | None = None) -> None:
         self._settings: QueueFairnessConfig = config.queue_fairness
-        self._queues: dict[str, list[QueueEntry]] = {}
+        self._queues: dict[str, dict[str, QueueEntry]] = {}
+        self._agent_index: dict[str, set[str]] = {}
+        self._views: dict[str, tuple[str, ...]] = {}
         self._active: dict[str, str] = {}
         self._cooldowns: dict[tuple[str, str], int] = {}
+        self._timers = timers if timers is not None else TimingWheel()
+        self._timers.register_handler(_COOLDOWN_TOPIC, self._expire_cooldown)
         self._stall_counts: dict[str, int] = {}
         self._metrics: dict[str, int] = {
             "cooldown_events": 0,
@@ -39,9 +57,9 @@ class QueueManager:
         }
 
     def on_tick(self, tick: int) -> None:
-        expired = [key for key, expiry in self._cooldowns.items() if expiry <= tick]
-        for key in expired:
-            del self._cooldowns[key]
+        # Advancing is idempotent per tick, so this is a no-op when the world
+        # context has already turned a shared wheel.
+        self._timers.advance(tick)
 
     def request_access(self, object_id: str, agent_id: str, tick: int) -> bool:
         start = time.perf_counter_ns()
@@ -57,11 +75,11 @@ class QueueManager:
             if current == agent_id:
                 return True
 
-            queue = self._queues.setdefault(object_id, [])
-            if any(entry.agent_id == agent_id for entry in queue):
+            queue = self._queues.get(object_id)
+            if queue is not None and agent_id in queue:
                 return False
 
-            queue.append(QueueEntry(agent_id=agent_id, joined_tick=tick))
+            self._enqueue(object_id, agent_id, tick)
             granted = self._assign_next(object_id, tick)
             return granted == agent_id
         finally:
@@ -76,9 +94,9 @@ class QueueManager:
 
             del self._active[object_id]
             if success:
-                self._cooldowns[(object_id, agent_id)] = tick + self._settings.cooldown_ticks
-            else:
-                self._cooldowns.pop((object_id, agent_id), None)
+                self._set_cooldown(object_id, agent_id, tick + self._settings.cooldown_ticks)
+            elif self._cooldowns.pop((object_id, agent_id), None) is not None:
+                self._timers.cancel(_COOLDOWN_TOPIC, _cooldown_key(object_id, agent_id))
             self._stall_counts.pop(object_id, None)
             self._assign_next(object_id, tick)
         finally:
@@ -107,7 +125,43 @@ class QueueManager:
         return self._active.get(object_id)
 
     def queue_snapshot(self, object_id: str) -> list[str]:
-        return [entry.agent_id for entry in self._queues.get(object_id, [])]
+        return list(self.queue_view(object_id))
+
+    def queue_view(self, object_id: str) -> tuple[str, ...]:
+        """Return an immutable, cached view of the waiting agents for ``object_id``.
+
+        The tuple is rebuilt only when the queue changes, so repeated reads within
+        a tick share one object and callers may hold it across mutations.
+        """
+
+        view = self._views.get(object_id)
+        if view is not None:
+            return view
+        queue = self._queues.get(object_id)
+        if not queue:
+            return _EMPTY_VIEW
+        view = tuple(queue)
+        self._views[object_id] = view
+        return view
+
+    def queue_length(self, object_id: str) -> int:
+        queue = self._queues.get(object_id)
+        return len(queue) if queue else 0
+
+    def is_queued(self, agent_id: str, object_id: str | None = None) -> bool:
+        """Return whether ``agent_id`` is waiting on ``object_id`` (or any object)."""
+
+        if object_id is None:
+            return agent_id in self._agent_index
+        queue = self._queues.get(object_id)
+        return queue is not None and agent_id in queue
+
+    def queued_objects(self, agent_id: str) -> frozenset[str]:
+        objects = self._agent_index.get(agent_id)
+        return frozenset(objects) if objects else frozenset()
+
+    def cooldown_expiry(self, object_id: str, agent_id: str) -> int | None:
+        return self._cooldowns.get((object_id, agent_id))
 
     def metrics(self) -> dict[str, int]:
         return dict(self._metrics)
@@ -120,35 +174,32 @@ class QueueManager:
             self._perf_metrics[key] = 0
 
     def requeue_to_tail(self, object_id: str, agent_id: str, tick: int) -> None:
-        queue = self._queues.setdefault(object_id, [])
-        if any(entry.agent_id == agent_id for entry in queue):
+        queue = self._queues.get(object_id)
+        if queue is not None and agent_id in queue:
             return
-        queue.append(QueueEntry(agent_id=agent_id, joined_tick=tick))
+        self._enqueue(object_id, agent_id, tick)
         self._metrics["rotation_events"] += 1
 
     def promote_agent(self, object_id: str, agent_id: str) -> None:
         queue = self._queues.get(object_id)
-        if not queue:
+        if not queue or agent_id not in queue:
             return
-        for index, entry in enumerate(queue):
-            if entry.agent_id == agent_id:
-                if index == 0:
-                    return
-                queue.insert(0, queue.pop(index))
-                self._metrics["rotation_events"] += 1
-                break
+        if next(iter(queue)) == agent_id:
+            return
+        entry = queue.pop(agent_id)
+        reordered = {agent_id: entry}
+        reordered.update(queue)
+        self._queues[object_id] = reordered
+        self._views.pop(object_id, None)
+        self._metrics["rotation_events"] += 1
 
     def remove_agent(self, agent_id: str, tick: int) -> None:
         for object_id, current in list(self._active.items()):
             if current == agent_id:
                 self.release(object_id, agent_id, tick, success=False)
 
-        for object_id, entries in list(self._queues.items()):
-            filtered = [entry for entry in entries if entry.agent_id != agent_id]
-            if len(filtered) != len(entries):
-                self._queues[object_id] = filtered
-            if not filtered:
-                self._queues.pop(object_id, None)
+        for object_id in sorted(self._agent_index.get(agent_id, ())):
+            self._dequeue(object_id, agent_id)
 
     def export_state(self) -> dict[str, object]:
         return {
@@ -156,7 +207,7 @@ class QueueManager:
             "queues": {
                 object_id: [
                     {"agent_id": entry.agent_id, "joined_tick": entry.joined_tick}
-                    for entry in entries
+                    for entry in entries.values()
                 ]
                 for object_id, entries in self._queues.items()
             },
@@ -179,10 +230,11 @@ class QueueManager:
             self._active = {}
 
         queues_payload = payload.get("queues", {})
-        queues: dict[str, list[QueueEntry]] = {}
+        self._queues = {}
+        self._agent_index = {}
+        self._views = {}
         if isinstance(queues_payload, dict):
             for object_id, entries in queues_payload.items():
-                object_entries: list[QueueEntry] = []
                 entries_list = entries if isinstance(entries, list) else []
                 for entry in entries_list:
                     if not isinstance(entry, Mapping):
@@ -192,14 +244,13 @@ class QueueManager:
                         continue
                     agent_id = str(agent_raw)
                     joined_tick = int(entry.get("joined_tick", 0))
-                    object_entries.append(
-                        QueueEntry(agent_id=agent_id, joined_tick=joined_tick)
-                    )
-                queues[str(object_id)] = object_entries
-        self._queues = queues
+                    if self.is_queued(agent_id, str(object_id)):
+                        continue
+                    self._enqueue(str(object_id), agent_id, joined_tick)
 
         cooldown_payload = payload.get("cooldowns", [])
         self._cooldowns = {}
+        self._timers.cancel_topic(_COOLDOWN_TOPIC)
         if isinstance(cooldown_payload, list):
             for entry in cooldown_payload:
                 if not isinstance(entry, Mapping):
@@ -207,7 +258,7 @@ class QueueManager:
                 object_id = str(entry.get("object_id"))
                 agent_id = str(entry.get("agent_id"))
                 expiry = int(entry.get("expiry", 0))
-                self._cooldowns[(object_id, agent_id)] = expiry
+                self._set_cooldown(object_id, agent_id, expiry)
 
         stall_payload = payload.get("stall_counts", {})
         if isinstance(stall_payload, dict):
@@ -217,6 +268,43 @@ class QueueManager:
         else:
             self._stall_counts = {}
 
+    def _enqueue(self, object_id: str, agent_id: str, joined_tick: int) -> None:
+        queue = self._queues.setdefault(object_id, {})
+        queue[agent_id] = QueueEntry(agent_id=agent_id, joined_tick=joined_tick)
+        self._agent_index.setdefault(agent_id, set()).add(object_id)
+        self._views.pop(object_id, None)
+
+    def _dequeue(self, object_id: str, agent_id: str) -> QueueEntry | None:
+        queue = self._queues.get(object_id)
+        if queue is None:
+            return None
+        entry = queue.pop(agent_id, None)
+        if entry is None:
+            return None
+        if not queue:
+            del self._queues[object_id]
+        objects = self._agent_index.get(agent_id)
+        if objects is not None:
+            objects.discard(object_id)
+            if not objects:
+                del self._agent_index[agent_id]
+        self._views.pop(object_id, None)
+        return entry
+
+    def _set_cooldown(self, object_id: str, agent_id: str, expiry: int) -> None:
+        self._cooldowns[(object_id, agent_id)] = expiry
+        self._timers.schedule(
+            _COOLDOWN_TOPIC,
+            _cooldown_key(object_id, agent_id),
+            expiry,
+            {"object_id": object_id, "agent_id": agent_id},
+        )
+
+    def _expire_cooldown(self, entry: TimerEntry) -> None:
+        key = (str(entry.payload.get("object_id")), str(entry.payload.get("agent_id")))
+        if self._cooldowns.get(key) == entry.due_tick:
+            del self._cooldowns[key]
+
     def _assign_next(self, object_id: str, tick: int) -> str | None:
         start = time.perf_counter_ns()
         self._perf_metrics["assign_calls"] += 1
@@ -228,21 +316,29 @@ class QueueManager:
             if not queue:
                 return None
 
-            best_index: int | None = None
+            best_agent: str | None = None
             best_priority: float | None = None
-            for index, entry in enumerate(queue):
+            weight = self._settings.age_priority_weight
+            for index, entry in enumerate(queue.values()):
                 wait_time = tick - entry.joined_tick
-                priority = float(index) - self._settings.age_priority_weight * float(wait_time)
+                priority = float(index) - weight * float(wait_time)
                 if best_priority is None or priority < best_priority:
                     best_priority = priority
-                    best_index = index
+                    best_agent = entry.agent_id
 
-            if best_index is None:
+            if best_agent is None:
                 return None
 
-            entry = queue.pop(best_index)
-            self._active[object_id] = entry.agent_id
+            if self._dequeue(object_id, best_agent) is None:
+                return None
+            self._active[object_id] = best_agent
             self._stall_counts.pop(object_id, None)
-            return entry.agent_id
+            return best_agent
         finally:
             self._perf_metrics["assign_ns"] += time.perf_counter_ns() - start
+
+
+def _cooldown_key(object_id: str, agent_id: str) -> str:
+    # Timer keys are strings persisted in snapshots; encode the pair so ids
+    # containing separators cannot collide.
+    return json.dumps([object_id, agent_id])
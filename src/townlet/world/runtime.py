@@ -11,17 +11,18 @@ from __future__ import annotations
 import random
 from collections.abc import Callable, Iterable, Mapping, MutableMapping
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from townlet.console.command import ConsoleCommandEnvelope, ConsoleCommandResult
 from townlet.dto.observations import ObservationEnvelope
-from townlet.scheduler.perturbations import PerturbationScheduler
+from townlet.world.actions import ActionBatch, split_action_input
 
 if TYPE_CHECKING:  # pragma: no cover
     from townlet.config import SimulationConfig
     from townlet.core.interfaces import TelemetrySinkProtocol
     from townlet.dto.world import SimulationSnapshot
     from townlet.lifecycle.manager import LifecycleManager
+    from townlet.scheduler.perturbations import PerturbationScheduler
     from townlet.stability.monitor import StabilityMonitor
     from townlet.stability.promotion import PromotionManager
     from townlet.world.grid import WorldState
@@ -29,7 +30,8 @@ if TYPE_CHECKING:  # pragma: no cover
 
 
 ActionMapping = Mapping[str, object]
-ActionProvider = Callable[["WorldState", int], ActionMapping]
+ActionInput = ActionMapping | ActionBatch
+ActionProvider = Callable[["WorldState", int], ActionInput]
 
 
 @dataclass(slots=True)
@@ -43,7 +45,7 @@ class RuntimeStepResult:
 
     console_results: list[ConsoleCommandResult] = field(default_factory=list)
     events: list[dict[str, object]] = field(default_factory=list)
-    actions: dict[str, object] = field(default_factory=dict)
+    actions: Mapping[str, object] = field(default_factory=dict)
     terminated: dict[str, bool] = field(default_factory=dict)
     termination_reasons: dict[str, str] = field(default_factory=dict)
 
@@ -71,6 +73,7 @@ class WorldRuntime:
         self._ticks_per_day = max(0, int(ticks_per_day))
         self._world_adapter: WorldRuntimeAdapterProtocol | None = None
         self._pending_actions: dict[str, object] = {}
+        self._pending_batch: ActionBatch | None = None
 
     @property
     def world(self) -> WorldState:
@@ -116,8 +119,8 @@ class WorldRuntime:
             raise TypeError("World context returned non-DTO observation envelope")
         return envelope
 
-    def apply_actions(self, actions: ActionMapping) -> None:
-        """Stage policy actions for the next tick."""
+    def apply_actions(self, actions: ActionInput) -> None:
+        """Stage policy actions (a mapping or an :class:`ActionBatch`) for the next tick."""
 
         context = getattr(self._world, "context", None)
         if context is not None:
@@ -125,7 +128,7 @@ class WorldRuntime:
             if callable(apply_actions):
                 apply_actions(actions)
                 return
-        self._pending_actions = dict(actions)
+        self._pending_actions, self._pending_batch = split_action_input(actions)
 
     def snapshot(
         self,
@@ -163,7 +166,7 @@ class WorldRuntime:
         tick: int,
         console_operations: Iterable[ConsoleCommandEnvelope] | None = None,
         action_provider: ActionProvider | None = None,
-        policy_actions: ActionMapping | None = None,
+        policy_actions: ActionInput | None = None,
     ) -> RuntimeStepResult:
         """Advance the world by one tick and return observable artefacts.
 
@@ -172,7 +175,8 @@ class WorldRuntime:
             console_operations: Optional override for the buffered console queue.
             action_provider: Callback used to fetch staged policy actions when
                 ``policy_actions`` is not supplied.
-            policy_actions: Explicit mapping of actions to apply this tick.
+            policy_actions: Explicit actions to apply this tick, either a
+                per-agent mapping or an :class:`ActionBatch` array.
 
         Returns:
             RuntimeStepResult containing console outputs, emitted events and
@@ -186,23 +190,32 @@ class WorldRuntime:
         queued_ops = list(console_operations or ())
 
         prepared_actions: MutableMapping[str, object]
+        action_batch: ActionBatch | None
         if policy_actions is not None:
-            prepared_actions = dict(policy_actions)
+            prepared_actions, action_batch = split_action_input(policy_actions)
         elif action_provider is not None:
-            prepared_actions = dict(action_provider(world, tick))
+            prepared_actions, action_batch = split_action_input(action_provider(world, tick))
         else:
-            prepared_actions = {}
+            prepared_actions, action_batch = {}, None
 
         context = getattr(world, "context", None)
         if context is None:
-            if not prepared_actions:
+            if not prepared_actions and action_batch is None:
                 prepared_actions = dict(self._pending_actions)
+                action_batch = self._pending_batch
             self._pending_actions.clear()
+            self._pending_batch = None
 
             world.tick = tick
             lifecycle.process_respawns(world, tick=tick)
             console_results = list(world.apply_console(queued_ops))
             perturbations.tick(world, current_tick=tick)
+            applied_actions: dict[str, object] = dict(prepared_actions)
+            if action_batch is not None:
+                from townlet.world.systems.affordances import process_action_batch
+
+                process_action_batch(world, action_batch, tick=tick, skip_agents=prepared_actions.keys())
+                applied_actions = {**action_batch.as_mapping(), **prepared_actions}
             world.apply_actions(prepared_actions)
             world.resolve_affordances(current_tick=tick)
             if self._ticks_per_day and tick % self._ticks_per_day == 0:
@@ -214,11 +227,14 @@ class WorldRuntime:
             return RuntimeStepResult(
                 console_results=console_results,
                 events=events,
-                actions=dict(prepared_actions),
+                actions=applied_actions,
                 terminated=terminated,
                 termination_reasons=termination_reasons,
             )
 
+        # Only batch-aware contexts receive ``action_batch``; mapping-only ticks keep
+        # the legacy call shape.
+        batch_kwargs: dict[str, Any] = {} if action_batch is None else {"action_batch": action_batch}
         result = context.tick(
             tick=tick,
             console_operations=queued_ops,
@@ -226,6 +242,7 @@ class WorldRuntime:
             lifecycle=lifecycle,
             perturbations=perturbations,
             ticks_per_day=self._ticks_per_day,
+            **batch_kwargs,
         )
         if isinstance(result, RuntimeStepResult):
             return result
@@ -2,13 +2,17 @@
 
 from __future__ import annotations
 
-from . import affordances, economy, employment, perturbations, queues, relationships
-from .base import SystemContext, SystemStep
+from .base import SystemContext, SystemSpec, SystemStep, declare_system, system_spec
+from .scheduler import SystemScheduler
 
 
 def default_systems() -> tuple[SystemStep, ...]:
     """Return the ordered list of system steps (placeholders for now)."""
 
+    # Imported here so loading a single system module does not pull in (and
+    # cycle through) every other system and the affordance runtime.
+    from . import affordances, economy, employment, perturbations, queues, relationships
+
     return (
         queues.step,
         affordances.step,
@@ -19,4 +23,12 @@ def default_systems() -> tuple[SystemStep, ...]:
     )
 
 
-__all__ = ["SystemContext", "SystemStep", "default_systems"]
+__all__ = [
+    "SystemContext",
+    "SystemScheduler",
+    "SystemSpec",
+    "SystemStep",
+    "declare_system",
+    "default_systems",
+    "system_spec",
+]
@@ -2,9 +2,18 @@
 
 from __future__ import annotations
 
-from collections.abc import Mapping
+from collections.abc import Collection, Mapping
+from dataclasses import dataclass
 from typing import Any
 
+import numpy as np
+
+from townlet.world.actions import (
+    ACTION_BATCH_ERRORS,
+    ACTION_KIND_CODES,
+    ACTION_KIND_INDEX,
+    ActionBatch,
+)
 from townlet.world.affordance_runtime_service import AffordanceRuntimeService
 from townlet.world.affordances import AffordanceOutcome, apply_affordance_outcome
 from townlet.world.affordances.core import advance_running_affordances as _advance_runtime
@@ -12,9 +21,14 @@ from townlet.world.agents.snapshot import AgentSnapshot
 from townlet.world.spatial import WorldSpatialIndex
 from townlet.world.systems import queues as queue_system
 
-from .base import SystemContext
+from .base import SystemContext, declare_system
 
 
+@declare_system(
+    "affordances",
+    reads=("affordances", "objects", "agents", "queues", "relationships"),
+    writes=("affordances", "agents", "objects", "queues", "reservations", "relationships", "events"),
+)
 def step(ctx: SystemContext) -> None:
     """Resolve running affordances and dispatch hooks."""
 
@@ -102,28 +116,145 @@ def apply_outcome(
     apply_affordance_outcome(snapshot, outcome)
 
 
+@dataclass(slots=True)
+class _ActionEnv:
+    """World collaborators needed to resolve agent actions, looked up once per tick."""
+
+    runtime: AffordanceRuntimeService | None
+    queue_manager: Any
+    objects: Mapping[str, Any]
+    active_reservations: Any
+    spatial_index: Any
+    agents: Mapping[str, AgentSnapshot]
+    rivalry_should_avoid: Any
+    record_chat_failure: Any
+    record_chat_success: Any
+
+    @classmethod
+    def from_state(cls, state: Any) -> _ActionEnv:
+        return cls(
+            runtime=getattr(state, "_affordance_service", None),
+            queue_manager=getattr(state, "queue_manager", None),
+            objects=getattr(state, "objects", {}),
+            active_reservations=getattr(state, "_active_reservations", {}),
+            spatial_index=getattr(state, "_spatial_index", None),
+            agents=getattr(state, "agents", {}),
+            rivalry_should_avoid=getattr(state, "rivalry_should_avoid", None),
+            record_chat_failure=getattr(state, "record_chat_failure", None),
+            record_chat_success=getattr(state, "record_chat_success", None),
+        )
+
+
+def _resolve_action(
+    env: _ActionEnv,
+    *,
+    agent_id: str,
+    snapshot: AgentSnapshot,
+    kind: object,
+    object_id: object,
+    position: Any,
+    target_id: object,
+    quality_value: object,
+    affordance_id: object,
+    release_success: bool,
+    reason: object,
+    blocked: bool,
+    tick: int,
+) -> tuple[bool, str | None, dict[str, object]] | None:
+    """Resolve one action; returns ``None`` when no outcome should be recorded."""
+
+    runtime = env.runtime
+    action_success = False
+    outcome_affordance_id: str | None = None
+    outcome_metadata: dict[str, object] = {}
+
+    if kind == "request" and object_id and env.queue_manager is not None:
+        spatial_index = env.spatial_index
+        if not isinstance(spatial_index, WorldSpatialIndex):
+            raise RuntimeError("Affordance queue requests require a spatial index")
+        granted = queue_system.request_access(
+            manager=env.queue_manager,
+            objects=env.objects,
+            active_reservations=env.active_reservations,
+            spatial_index=spatial_index,
+            object_id=str(object_id),
+            agent_id=agent_id,
+            tick=tick,
+        )
+        if not granted and blocked and runtime is not None:
+            handle_blocked(runtime, str(object_id), tick)
+        action_success = bool(granted)
+    elif kind == "move" and position:
+        new_position = tuple(position)
+        if env.spatial_index is not None:
+            env.spatial_index.move_agent(snapshot.agent_id, new_position)
+        snapshot.position = new_position
+        action_success = True
+    elif kind == "chat":
+        if isinstance(target_id, str) and callable(env.rivalry_should_avoid):
+            listener = env.agents.get(target_id)
+            if listener is None:
+                return None
+            if env.rivalry_should_avoid(agent_id, target_id):
+                if callable(env.record_chat_failure):
+                    env.record_chat_failure(agent_id, target_id)
+                return None
+            if listener.position != snapshot.position:
+                if callable(env.record_chat_failure):
+                    env.record_chat_failure(agent_id, target_id)
+                return None
+            try:
+                quality = float(quality_value)  # type: ignore[arg-type]
+            except (TypeError, ValueError):
+                quality = 0.5
+            if callable(env.record_chat_success):
+                env.record_chat_success(agent_id, target_id, quality)
+            action_success = True
+    elif kind == "start" and object_id and runtime is not None:
+        if affordance_id:
+            affordance_id_str = str(affordance_id)
+            action_success, start_metadata = start(
+                runtime,
+                agent_id=agent_id,
+                object_id=str(object_id),
+                affordance_id=affordance_id_str,
+                tick=tick,
+            )
+            outcome_affordance_id = affordance_id_str
+            if start_metadata:
+                outcome_metadata.update(start_metadata)
+    elif kind == "release" and object_id and runtime is not None:
+        outcome_affordance_id, release_metadata = release(
+            runtime,
+            agent_id=agent_id,
+            object_id=str(object_id),
+            success=release_success,
+            reason=str(reason) if reason is not None else None,
+            requested_affordance_id=str(affordance_id)
+            if affordance_id is not None
+            else None,
+            tick=tick,
+        )
+        action_success = release_success
+        if release_metadata:
+            outcome_metadata.update(release_metadata)
+    elif kind == "blocked" and object_id and runtime is not None:
+        handle_blocked(runtime, str(object_id), tick)
+    return action_success, outcome_affordance_id, outcome_metadata
+
+
 def process_actions(state: Any, actions: Mapping[str, Any], tick: int) -> None:
     """Apply raw action payloads to the world state."""
 
     if not actions:
         return
 
-    runtime = getattr(state, "_affordance_service", None)
-    if runtime is None:
+    env = _ActionEnv.from_state(state)
+    if env.runtime is None:
         return
 
-    queue_manager = getattr(state, "queue_manager", None)
-    objects = getattr(state, "objects", {})
-    active_reservations = getattr(state, "_active_reservations", {})
-    spatial_index = getattr(state, "_spatial_index", None)
-    agents = getattr(state, "agents", {})
-
-    rivalry_should_avoid = getattr(state, "rivalry_should_avoid", None)
-    record_chat_failure = getattr(state, "record_chat_failure", None)
-    record_chat_success = getattr(state, "record_chat_success", None)
-
     for agent_id, action in actions.items():
-        snapshot = agents.get(agent_id)
+        snapshot = env.agents.get(agent_id)
         if snapshot is None:
             continue
         if not isinstance(action, Mapping):
@@ -131,88 +262,25 @@ def process_actions(state: Any, actions: Mapping[str, Any], tick: int) -> None:
 
         kind = action.get("kind")
         object_id = action.get("object")
-        action_success = False
         action_duration = int(action.get("duration", 1))
-        outcome_affordance_id: str | None = None
-        outcome_metadata: dict[str, object] = {}
-
-        if kind == "request" and object_id and queue_manager is not None:
-            if not isinstance(spatial_index, WorldSpatialIndex):
-                raise RuntimeError("Affordance queue requests require a spatial index")
-            granted = queue_system.request_access(
-                manager=queue_manager,
-                objects=objects,
-                active_reservations=active_reservations,
-                spatial_index=spatial_index,
-                object_id=object_id,
-                agent_id=agent_id,
-                tick=tick,
-            )
-            if not granted and action.get("blocked"):
-                handle_blocked(runtime, object_id, tick)
-            action_success = bool(granted)
-        elif kind == "move" and action.get("position"):
-            position = tuple(action["position"])
-            if spatial_index is not None:
-                spatial_index.move_agent(snapshot.agent_id, position)
-            snapshot.position = position
-            action_success = True
-        elif kind == "chat":
-            target_id = action.get("target") or action.get("listener")
-            if isinstance(target_id, str) and callable(rivalry_should_avoid):
-                listener = agents.get(target_id)
-                if listener is None:
-                    continue
-                if rivalry_should_avoid(agent_id, target_id):
-                    if callable(record_chat_failure):
-                        record_chat_failure(agent_id, target_id)
-                    continue
-                if listener.position != snapshot.position:
-                    if callable(record_chat_failure):
-                        record_chat_failure(agent_id, target_id)
-                    continue
-                quality_value = action.get("quality", 0.5)
-                try:
-                    quality = float(quality_value)
-                except (TypeError, ValueError):
-                    quality = 0.5
-                if callable(record_chat_success):
-                    record_chat_success(agent_id, target_id, quality)
-                action_success = True
-        elif kind == "start" and object_id:
-            affordance_id = action.get("affordance")
-            if affordance_id:
-                affordance_id_str = str(affordance_id)
-                action_success, start_metadata = start(
-                    runtime,
-                    agent_id=agent_id,
-                    object_id=object_id,
-                    affordance_id=affordance_id_str,
-                    tick=tick,
-                )
-                outcome_affordance_id = affordance_id_str
-                if start_metadata:
-                    outcome_metadata.update(start_metadata)
-        elif kind == "release" and object_id:
-            success = bool(action.get("success", True))
-            affordance_hint = action.get("affordance")
-            reason_value = action.get("reason")
-            outcome_affordance_id, release_metadata = release(
-                runtime,
-                agent_id=agent_id,
-                object_id=object_id,
-                success=success,
-                reason=str(reason_value) if reason_value is not None else None,
-                requested_affordance_id=str(affordance_hint)
-                if affordance_hint is not None
-                else None,
-                tick=tick,
-            )
-            action_success = success
-            if release_metadata:
-                outcome_metadata.update(release_metadata)
-        elif kind == "blocked" and object_id:
-            handle_blocked(runtime, object_id, tick)
+        resolved = _resolve_action(
+            env,
+            agent_id=agent_id,
+            snapshot=snapshot,
+            kind=kind,
+            object_id=object_id,
+            position=action.get("position"),
+            target_id=action.get("target") or action.get("listener"),
+            quality_value=action.get("quality", 0.5),
+            affordance_id=action.get("affordance"),
+            release_success=bool(action.get("success", True)),
+            reason=action.get("reason"),
+            blocked=bool(action.get("blocked")),
+            tick=tick,
+        )
+        if resolved is None:
+            continue
+        action_success, outcome_affordance_id, outcome_metadata = resolved
 
         if kind:
             apply_outcome(
@@ -229,9 +297,145 @@ def process_actions(state: Any, actions: Mapping[str, Any], tick: int) -> None:
             )
 
 
+_MAX_REPORTED_BATCH_ERRORS = 32
+
+
+def process_action_batch(
+    state: Any,
+    batch: ActionBatch,
+    tick: int,
+    *,
+    skip_agents: Collection[str] = (),
+) -> dict[str, object]:
+    """Validate and apply a batched action array in a single pass.
+
+    Validation runs vectorised over the whole array and moves are decoded from
+    their deltas; each valid row is then resolved through the same code path as
+    mapping actions without building per-agent payload dicts. Rows for ``skip_agents`` are
+    ignored (their mapping actions are applied separately). A single
+    ``action.batch`` event summarising the batch is emitted and its payload is
+    returned.
+    """
+
+    slots = batch.slots
+    rows = batch.array
+    errors = batch.validate()
+    valid = errors == 0
+    if skip_agents:
+        skip_slots = slots.slots_for(skip_agents)
+        valid &= ~np.isin(rows["agent_slot"], skip_slots)
+
+    env = _ActionEnv.from_state(state)
+    agents = env.agents
+    records_getter = getattr(state, "agent_records_view", None)
+    records = records_getter() if callable(records_getter) else {}
+    agent_ids = slots.agents
+    object_ids = slots.objects
+    affordance_ids = slots.affordances
+
+    valid_index = np.flatnonzero(valid)
+    selected = rows[valid_index]
+    kinds = selected["kind_code"].tolist()
+    agent_slots = selected["agent_slot"].tolist()
+    targets = selected["target_object_slot"].tolist()
+    durations = selected["duration"].tolist()
+    affordance_slots = selected["affordance_slot"].tolist()
+
+    # Moves are relative: only the deltas are materialised, never per-agent payloads.
+    deltas = list(zip(selected["dx"].tolist(), selected["dy"].tolist(), strict=True))
+    move_code = ACTION_KIND_INDEX["move"]
+
+    kind_counts = [0] * len(ACTION_KIND_CODES)
+    success_counts = [0] * len(ACTION_KIND_CODES)
+    unknown_agents = 0
+    for row, kind_code in enumerate(kinds):
+        agent_id = agent_ids[agent_slots[row]]
+        snapshot = agents.get(agent_id)
+        if snapshot is None:
+            unknown_agents += 1
+            continue
+        kind = ACTION_KIND_CODES[kind_code]
+        target = targets[row]
+        affordance_slot = affordance_slots[row]
+        object_id: str | None = None
+        target_id: str | None = None
+        if kind == "chat":
+            target_id = agent_ids[target]
+        elif 0 <= target < len(object_ids):
+            object_id = object_ids[target]
+        affordance_id = (
+            affordance_ids[affordance_slot] if 0 <= affordance_slot < len(affordance_ids) else None
+        )
+        position: tuple[int, int] | None = None
+        if kind_code == move_code:
+            dx, dy = deltas[row]
+            x, y = snapshot.position
+            position = (x + dx, y + dy)
+        kind_counts[kind_code] += 1
+        resolved = _resolve_action(
+            env,
+            agent_id=agent_id,
+            snapshot=snapshot,
+            kind=kind,
+            object_id=object_id,
+            position=position,
+            target_id=target_id,
+            quality_value=0.5,
+            affordance_id=affordance_id,
+            release_success=True,
+            reason=None,
+            blocked=False,
+            tick=tick,
+        )
+        record = records.get(agent_id)
+        if record is not None:
+            record.touch(tick=tick, metadata={"last_action": kind})
+        if resolved is None:
+            continue
+        action_success, outcome_affordance_id, outcome_metadata = resolved
+        if action_success:
+            success_counts[kind_code] += 1
+        apply_outcome(
+            snapshot,
+            kind=kind,
+            success=action_success,
+            duration=durations[row],
+            object_id=object_id,
+            affordance_id=outcome_affordance_id,
+            tick=tick,
+            metadata=outcome_metadata,
+        )
+
+    invalid_index = np.flatnonzero(errors != 0)
+    summary: dict[str, object] = {
+        "size": int(rows.shape[0]),
+        "applied": len(kinds) - unknown_agents,
+        "invalid": int(invalid_index.shape[0]),
+        "unknown_agents": unknown_agents,
+        "kinds": {ACTION_KIND_CODES[code]: count for code, count in enumerate(kind_counts) if count},
+        "succeeded": {
+            ACTION_KIND_CODES[code]: count for code, count in enumerate(success_counts) if count
+        },
+    }
+    if invalid_index.size:
+        summary["errors"] = [
+            {
+                "row": int(index),
+                "agent_slot": int(rows["agent_slot"][index]),
+                "error": ACTION_BATCH_ERRORS[int(errors[index])],
+            }
+            for index in invalid_index[:_MAX_REPORTED_BATCH_ERRORS].tolist()
+        ]
+    emit = getattr(state, "emit_event", None)
+    if callable(emit):
+        emit("action.batch", summary)
+    return summary
+
+
 __all__ = [
     "apply_outcome",
     "handle_blocked",
+    "process_action_batch",
     "process_actions",
     "release",
     "resolve",
@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass
 from typing import Any, Protocol
 
 from townlet.world.events import EventDispatcher
 from townlet.world.rng import RngStreamManager
+
+
 @dataclass(slots=True)
 class SystemContext:
     """Context passed to each system step during tick orchestration."""
@@ -26,4 +28,94 @@ class System(Protocol):
 
 SystemStep = Callable[[SystemContext], None]
 
-__all__ = ["System", "SystemContext", "SystemStep"]
+#: Resource name standing for "all world state"; undeclared steps read and write it.
+ALL_STATE = "*"
+_SPEC_ATTR = "__townlet_system__"
+
+
+@dataclass(frozen=True, slots=True)
+class SystemSpec:
+    """Scheduling declaration for a system step.
+
+    ``reads``/``writes`` name the slices of world state the step touches
+    (e.g. ``"agents"``, ``"queues"``, ``"events"``); :data:`ALL_STATE`
+    conflicts with everything. ``every`` runs the step on ticks divisible by
+    it (``None`` disables the cadence), ``on_events`` additionally runs it
+    when one of those event types was emitted since its last run, and
+    ``idle`` returns ``True`` when a run would be a no-op. Only steps marked
+    ``parallel_safe`` may share a thread-pool wave with other steps.
+    """
+
+    name: str
+    step: SystemStep
+    reads: frozenset[str] = frozenset({ALL_STATE})
+    writes: frozenset[str] = frozenset({ALL_STATE})
+    every: int | None = 1
+    on_events: frozenset[str] = frozenset()
+    idle: Callable[[SystemContext], bool] | None = None
+    parallel_safe: bool = False
+
+    def conflicts_with(self, other: SystemSpec) -> bool:
+        """Return whether the two steps must not run concurrently."""
+
+        if ALL_STATE in self.writes | other.writes:
+            return True
+        if (ALL_STATE in self.reads and other.writes) or (ALL_STATE in other.reads and self.writes):
+            return True
+        return bool(self.writes & (other.reads | other.writes) or other.writes & self.reads)
+
+
+def declare_system(
+    name: str,
+    *,
+    reads: Iterable[str] = (ALL_STATE,),
+    writes: Iterable[str] = (ALL_STATE,),
+    every: int | None = 1,
+    on_events: Iterable[str] = (),
+    idle: Callable[[SystemContext], bool] | None = None,
+    parallel_safe: bool = False,
+) -> Callable[[SystemStep], SystemStep]:
+    """Attach a :class:`SystemSpec` to a step function; the step is returned unchanged."""
+
+    if every is not None and every < 1:
+        raise ValueError(f"system '{name}': every must be >= 1 or None")
+
+    def decorator(step: SystemStep) -> SystemStep:
+        spec = SystemSpec(
+            name=name,
+            step=step,
+            reads=frozenset(reads),
+            writes=frozenset(writes),
+            every=every,
+            on_events=frozenset(on_events),
+            idle=idle,
+            parallel_safe=parallel_safe,
+        )
+        setattr(step, _SPEC_ATTR, spec)
+        return step
+
+    return decorator
+
+
+def system_spec(step: SystemStep | SystemSpec) -> SystemSpec:
+    """Return the declared spec for ``step``; undeclared steps touch all state every tick."""
+
+    if isinstance(step, SystemSpec):
+        return step
+    declared = getattr(step, _SPEC_ATTR, None)
+    if isinstance(declared, SystemSpec):
+        return declared
+    name = getattr(step, "__qualname__", None) or type(step).__name__
+    module = getattr(step, "__module__", None)
+    return SystemSpec(name=f"{module}.{name}" if module else name, step=step)
+
+
+__all__ = [
+    "ALL_STATE",
+    "System",
+    "SystemContext",
+    "SystemSpec",
+    "SystemStep",
+    "declare_system",
+    "system_spec",
+]
@@ -6,11 +6,16 @@ import logging
 
 from townlet.world.economy import EconomyService
 
-from .base import SystemContext
+from .base import SystemContext, declare_system
 
 logger = logging.getLogger(__name__)
 
 
+@declare_system(
+    "economy",
+    reads=("agents", "objects", "economy"),
+    writes=("objects", "economy", "events"),
+)
 def step(ctx: SystemContext) -> None:
     """Update economy metrics and utilities (implementation pending)."""
 
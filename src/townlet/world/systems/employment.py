@@ -11,11 +11,16 @@ from townlet.world.agents.employment import EmploymentService
 from townlet.world.agents.nightly_reset import NightlyResetService
 from townlet.world.agents.snapshot import AgentSnapshot
 
-from .base import SystemContext
+from .base import SystemContext, declare_system
 
 logger = logging.getLogger(__name__)
 
 
+@declare_system(
+    "employment",
+    reads=("agents", "objects", "employment"),
+    writes=("agents", "employment", "events"),
+)
 def step(ctx: SystemContext) -> None:
     """Advance employment scheduling and wage bookkeeping."""
 
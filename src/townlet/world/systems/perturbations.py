@@ -6,9 +6,10 @@ from collections.abc import Iterable
 
 from townlet.world.perturbations.service import PerturbationService
 
-from .base import SystemContext
+from .base import SystemContext, declare_system
 
 
+@declare_system("perturbations", reads=("perturbations",), writes=(), parallel_safe=True)
 def step(ctx: SystemContext) -> None:
     """Advance perturbation schedules (implementation pending)."""
 
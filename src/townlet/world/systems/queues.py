@@ -8,9 +8,14 @@ from typing import Any
 from townlet.world.queue.manager import QueueManager
 from townlet.world.spatial import WorldSpatialIndex
 
-from .base import SystemContext
+from .base import SystemContext, declare_system
 
 
+@declare_system(
+    "queues",
+    reads=("queues", "reservations", "objects", "agents"),
+    writes=("queues", "reservations", "affordances", "relationships", "events"),
+)
 def step(ctx: SystemContext) -> None:
     """Synchronise queue state each tick."""
 
@@ -186,13 +191,12 @@ def _process_queue_conflicts(state: Any, manager: QueueManager, tick: int) -> No
             # Reservation bookkeeping may temporarily yield a placeholder; skip until
             # the queue manager records a concrete occupant.
             continue
-        queue = manager.queue_snapshot(object_id)
-        if not queue:
+        if not manager.queue_length(object_id):
             continue
         if not manager.record_blocked_attempt(object_id):
             continue
 
-        waiting = manager.queue_snapshot(object_id)
+        waiting = manager.queue_view(object_id)
         rival = waiting[0] if waiting else None
         manager.release(object_id, occupant, tick, success=False)
         manager.requeue_to_tail(object_id, occupant, tick)
@@ -7,9 +7,22 @@ from townlet.world.agents.relationships_service import RelationshipService
 from townlet.world.relationships import RelationshipLedger, RelationshipTie
 from townlet.world.rivalry import RivalryLedger
 
-from .base import SystemContext
+from .base import SystemContext, declare_system
 
 
+def _nothing_to_decay(ctx: SystemContext) -> bool:
+    service = getattr(ctx.state, "_relationships", None)
+    has_work = getattr(service, "has_decay_work", None)
+    return callable(has_work) and not has_work()
+
+
+@declare_system(
+    "relationships",
+    reads=("relationships",),
+    writes=("relationships",),
+    idle=_nothing_to_decay,
+    parallel_safe=True,
+)
 def step(ctx: SystemContext) -> None:
     """Advance relationship decay each tick."""
 
@@ -0,0 +1,174 @@
+"""Tick scheduler for world systems.
+
+:class:`SystemScheduler` replaces the fixed ``for step in systems`` loop in
+:meth:`townlet.world.core.context.WorldContext.tick`. Each step carries a
+:class:`~townlet.world.systems.base.SystemSpec` (see
+:func:`~townlet.world.systems.base.declare_system`) and the scheduler:
+
+* runs a step only when its cadence is due (every tick, every N ticks) or an
+  event it listens for was emitted since its last run, and skips it when its
+  ``idle`` predicate reports there is nothing to do;
+* keeps declaration order, but groups consecutive ``parallel_safe`` steps
+  whose read/write sets are disjoint into a wave executed on a thread pool
+  when ``max_workers > 0`` (worthwhile for steps that release the GIL);
+* records per-system run/skip counts and wall time.
+
+Undeclared steps are treated as reading and writing all state every tick, so
+existing callables keep their exact sequential behaviour.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections.abc import Iterable, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+
+from townlet.world.events import Event, EventDispatcher
+
+from .base import SystemContext, SystemSpec, SystemStep, system_spec
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class SystemTiming:
+    """Cumulative scheduling statistics for one system."""
+
+    runs: int = 0
+    skips: int = 0
+    total_ms: float = 0.0
+    last_ms: float = 0.0
+
+    def as_dict(self) -> dict[str, float]:
+        return {"runs": self.runs, "skips": self.skips, "total_ms": self.total_ms, "last_ms": self.last_ms}
+
+
+class SystemScheduler:
+    """Run system steps according to their declared cadence and state access."""
+
+    def __init__(
+        self,
+        systems: Iterable[SystemStep | SystemSpec],
+        *,
+        max_workers: int = 0,
+        every: Mapping[str, int] | None = None,
+    ) -> None:
+        self.source = tuple(systems)
+        overrides = dict(every or {})
+        specs: list[SystemSpec] = []
+        for item in self.source:
+            spec = system_spec(item)
+            if spec.name in overrides:
+                spec = replace(spec, every=overrides.pop(spec.name))
+            if spec.every is not None and spec.every < 1:
+                raise ValueError(f"system '{spec.name}': every must be >= 1 or None")
+            specs.append(spec)
+        names = [spec.name for spec in specs]
+        if len(set(names)) != len(names):
+            raise ValueError(f"Duplicate system names: {names}")
+        if overrides:
+            raise ValueError(f"Cadence override for unknown system(s): {sorted(overrides)}")
+        self.specs: tuple[SystemSpec, ...] = tuple(specs)
+        self.max_workers = max(0, int(max_workers))
+        self.timings = {spec.name: SystemTiming() for spec in self.specs}
+        self.last_tick_ms: dict[str, float] = {}
+        self._listeners: dict[str, tuple[str, ...]] = {}
+        for spec in self.specs:
+            for event_type in spec.on_events:
+                self._listeners[event_type] = (*self._listeners.get(event_type, ()), spec.name)
+        self._triggered: set[str] = set()
+        self._dispatcher: EventDispatcher | None = None
+        self._pool: ThreadPoolExecutor | None = None
+
+    # ------------------------------------------------------------------
+    def run(self, ctx: SystemContext, tick: int) -> dict[str, float]:
+        """Run every due system for ``tick``; returns wall time (ms) per system run."""
+
+        self._watch(ctx.events)
+        self.last_tick_ms = {}
+        wave: list[SystemSpec] = []
+        for spec in self.specs:
+            if wave and not self._joins(wave, spec):
+                self._run_wave(wave, ctx)
+                wave = []
+            if self._due(spec, ctx, tick):
+                wave.append(spec)
+            else:
+                self.timings[spec.name].skips += 1
+        if wave:
+            self._run_wave(wave, ctx)
+        return dict(self.last_tick_ms)
+
+    def snapshot(self) -> dict[str, dict[str, float]]:
+        """Return cumulative runs/skips/timings keyed by system name."""
+
+        return {name: timing.as_dict() for name, timing in self.timings.items()}
+
+    def close(self) -> None:
+        """Shut down the worker pool and detach from the event dispatcher.
+
+        The scheduler stays usable; the next :meth:`run` re-attaches and
+        recreates the pool on demand.
+        """
+
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+        if self._dispatcher is not None:
+            self._dispatcher.unregister(self._on_event)
+            self._dispatcher = None
+
+    # ------------------------------------------------------------------
+    def _watch(self, dispatcher: EventDispatcher) -> None:
+        if self._listeners and dispatcher is not self._dispatcher:
+            if self._dispatcher is not None:
+                self._dispatcher.unregister(self._on_event)
+            dispatcher.register(self._on_event)
+            self._dispatcher = dispatcher
+
+    def _on_event(self, event: Event) -> None:
+        names = self._listeners.get(event.type)
+        if names:
+            self._triggered.update(names)
+
+    def _due(self, spec: SystemSpec, ctx: SystemContext, tick: int) -> bool:
+        triggered = spec.name in self._triggered
+        if not triggered and (spec.every is None or tick % spec.every != 0):
+            return False
+        self._triggered.discard(spec.name)
+        return spec.idle is None or not spec.idle(ctx)
+
+    @staticmethod
+    def _joins(wave: Sequence[SystemSpec], spec: SystemSpec) -> bool:
+        return spec.parallel_safe and all(
+            member.parallel_safe and not member.conflicts_with(spec) for member in wave
+        )
+
+    def _run_wave(self, wave: Sequence[SystemSpec], ctx: SystemContext) -> None:
+        if len(wave) == 1 or self.max_workers == 0:
+            for spec in wave:
+                self._record(spec, self._timed(spec, ctx))
+            return
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="townlet-system")
+        futures = [self._pool.submit(self._timed, spec, ctx) for spec in wave]
+        for spec, future in zip(wave, futures, strict=True):
+            self._record(spec, future.result())
+
+    @staticmethod
+    def _timed(spec: SystemSpec, ctx: SystemContext) -> float:
+        start = time.perf_counter()
+        spec.step(ctx)
+        return (time.perf_counter() - start) * 1000.0
+
+    def _record(self, spec: SystemSpec, elapsed_ms: float) -> None:
+        timing = self.timings[spec.name]
+        timing.runs += 1
+        timing.total_ms += elapsed_ms
+        timing.last_ms = elapsed_ms
+        self.last_tick_ms[spec.name] = elapsed_ms
+
+
+__all__ = ["SystemScheduler", "SystemTiming"]
@@ -1,13 +1,23 @@
-"""Observer UI toolkit exports."""
+"""Observer UI toolkit exports.
 
-from .commands import ConsoleCommandExecutor
-from .telemetry import (
-    AgentSummary,
-    EmploymentMetrics,
-    TelemetryClient,
-    TelemetrySnapshot,
-    TransportStatus,
-)
+Exports resolve lazily so the telemetry client can be used without importing
+the console command stack (and the simulation modules behind it).
+"""
+
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover - static re-exports
+    from .commands import ConsoleCommandExecutor
+    from .telemetry import (
+        AgentSummary,
+        EmploymentMetrics,
+        TelemetryClient,
+        TelemetrySnapshot,
+        TransportStatus,
+    )
 
 __all__ = [
     "AgentSummary",
@@ -17,3 +27,15 @@ __all__ = [
     "TelemetrySnapshot",
     "TransportStatus",
 ]
+
+
+def __getattr__(name: str) -> object:  # pragma: no cover - lazy import glue
+    if name == "ConsoleCommandExecutor":
+        return import_module(".commands", __name__).ConsoleCommandExecutor
+    if name in __all__:
+        return getattr(import_module(".telemetry", __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:  # pragma: no cover - module reflection helper
+    return sorted(__all__)
@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
+import copy
 import difflib
 import itertools
 import math
+import queue
 import re
+import threading
 import time
 from collections.abc import Callable, Iterable, Mapping, Sequence
+from concurrent.futures import Future
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
@@ -314,11 +318,39 @@ class AgentCardState:
         return total_pages
 
 
+@dataclass
+class PanelCache:
+    """Reuses rendered panels whose source telemetry sections are unchanged.
+
+    Each entry stores the key it was built from; a panel is rebuilt only
+    when the new key compares unequal (telemetry sections are frozen
+    dataclasses/tuples, so equality is a value comparison).
+    """
+
+    hits: int = 0
+    misses: int = 0
+    _entries: dict[str, tuple[object, object]] = field(default_factory=dict, repr=False)
+
+    def get(self, name: str, key: object, build: Callable[[], Any]) -> Any:
+        entry = self._entries.get(name)
+        if entry is not None and entry[0] == key:
+            self.hits += 1
+            return entry[1]
+        self.misses += 1
+        value = build()
+        self._entries[name] = (key, value)
+        return value
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
 @dataclass
 class DashboardState:
     """Top-level dashboard rendering state shared across ticks."""
 
     agent_cards: AgentCardState = field(default_factory=AgentCardState)
+    panels: PanelCache = field(default_factory=PanelCache)
 
 
 def _extract_palette_commands(
@@ -580,8 +612,19 @@ def render_snapshot(
     personality_enabled: bool = False,
     show_personality_narration: bool = True,
 ) -> Iterable[Panel]:
-    """Yield rich Panels representing the current telemetry snapshot."""
+    """Yield rich Panels representing the current telemetry snapshot.
+
+    When ``state`` is supplied, the agent card, perturbation, anneal/promotion
+    and social panels are reused from ``state.panels`` while their source
+    sections are unchanged.
+    """
     panels: list[Panel] = []
+    panel_cache = state.panels if state is not None else None
+
+    def _cached(name: str, key: object, build: Callable[[], Any]) -> Any:
+        if panel_cache is None:
+            return build()
+        return panel_cache.get(name, key, build)
 
     header_table = Table.grid(expand=True)
     header_table.add_column(justify="left")
@@ -644,11 +687,22 @@ def render_snapshot(
         if overlay is not None:
             panels.append(overlay)
 
-    banner = _build_perturbation_banner(snapshot)
+    health_perturbations = (
+        (snapshot.health.perturbations_pending, snapshot.health.perturbations_active) if snapshot.health else None
+    )
+    banner = _cached(
+        "perturbation_banner",
+        (snapshot.perturbations, health_perturbations),
+        lambda: _build_perturbation_banner(snapshot),
+    )
     if banner is not None:
         panels.append(banner)
 
-    perturbation_panel = _build_perturbation_panel(snapshot)
+    perturbation_panel = _cached(
+        "perturbations",
+        snapshot.perturbations,
+        lambda: _build_perturbation_panel(snapshot),
+    )
     if perturbation_panel is not None:
         panels.append(perturbation_panel)
 
@@ -656,13 +710,33 @@ def render_snapshot(
     if palette is not None and palette.personality_filter:
         active_personality_filter = palette.personality_filter
 
-    agent_cards_panel = _build_agent_cards_panel(
-        snapshot,
-        tick,
-        focus_agent=focus_agent,
-        state=state.agent_cards if state else None,
-        personality_filter=active_personality_filter,
-        personality_enabled=personality_enabled,
+    card_state = state.agent_cards if state else None
+    agent_cards_key: object = None
+    if card_state is not None and not _agent_rotation_due(card_state, tick, len(snapshot.agents)):
+        agent_cards_key = (
+            snapshot.agents,
+            snapshot.relationship_summary,
+            snapshot.history,
+            snapshot.personalities,
+            snapshot.social_events,
+            snapshot.perturbations.cooldowns_agents,
+            focus_agent,
+            active_personality_filter,
+            personality_enabled,
+            card_state.page,
+            card_state.page_size,
+        )
+    agent_cards_panel = _cached(
+        "agent_cards",
+        agent_cards_key if agent_cards_key is not None else object(),
+        lambda: _build_agent_cards_panel(
+            snapshot,
+            tick,
+            focus_agent=focus_agent,
+            state=card_state,
+            personality_filter=active_personality_filter,
+            personality_enabled=personality_enabled,
+        ),
     )
     if agent_cards_panel is not None:
         panels.append(agent_cards_panel)
@@ -802,7 +876,9 @@ def render_snapshot(
         )
     )
 
-    panels.append(_build_anneal_panel(snapshot))
+    panels.append(
+        _cached("anneal", (snapshot.anneal, snapshot.promotion), lambda: _build_anneal_panel(snapshot))
+    )
     panels.append(_build_policy_inspector_panel(snapshot))
     panels.append(_build_relationship_overlay_panel(snapshot))
     panels.append(_build_kpi_panel(snapshot))
@@ -840,7 +916,11 @@ def render_snapshot(
                 else {},
             )
 
-    social_panel = _build_social_panel(summary, relationships, snapshot.social_events)
+    social_panel = _cached(
+        "social",
+        (summary, relationships, snapshot.social_events),
+        lambda: _build_social_panel(summary, relationships, snapshot.social_events),
+    )
     if social_panel is not None:
         panels.append(social_panel)
     if relationships is not None:
@@ -924,6 +1004,17 @@ def render_snapshot(
     return panels
 
 
+def _agent_rotation_due(card_state: AgentCardState, tick: int, agent_count: int) -> bool:
+    """Return True when ``card_state.update`` may rotate or re-anchor at ``tick``."""
+
+    if not card_state.rotate or card_state.rotate_interval <= 0:
+        return False
+    if agent_count <= max(1, card_state.page_size):
+        return False
+    last = card_state._last_rotate_tick
+    return last is None or tick - last >= card_state.rotate_interval
+
+
 def _build_social_panel(
     summary: RelationshipSummarySnapshot | None,
     relationships: RelationshipChurn | None,
@@ -1952,6 +2043,137 @@ def _humanize_kpi(key: str) -> str:
     return key.replace("_", " ").title()
 
 
+@dataclass(frozen=True)
+class DashboardSample:
+    """Telemetry captured by the simulation thread for one UI frame."""
+
+    tick: int
+    payload: Mapping[str, Any]
+    envelope: ObservationEnvelope
+
+
+class SimulationWorker:
+    """Steps a :class:`SimulationLoop` on a background thread.
+
+    The UI thread calls :meth:`sample` at its refresh rate; the worker
+    answers between ticks with a deep-copied ``telemetry_snapshot`` payload
+    and the latest observation envelope, so telemetry is never read while a
+    tick is mutating it and the simulation is never paced by rendering.
+    Console commands sent through :meth:`dispatch` are likewise executed on
+    the simulation thread between ticks.
+    """
+
+    def __init__(
+        self,
+        loop: SimulationLoop,
+        router: Any,
+        *,
+        max_ticks: int = 0,
+        on_tick: Callable[[], None] | None = None,
+    ) -> None:
+        self._loop = loop
+        self._router = router
+        self._max_ticks = max_ticks
+        self._on_tick = on_tick
+        self._stop = threading.Event()
+        self._requested = threading.Event()
+        self._ready = threading.Event()
+        self._finished = threading.Event()
+        self._sample: DashboardSample | None = None
+        self._error: BaseException | None = None
+        self._commands: queue.SimpleQueue[tuple[ConsoleCommand, Future[object]]] = queue.SimpleQueue()
+        self._dispatch_lock = threading.Lock()
+        self._accepting = False
+        self._thread = threading.Thread(target=self._run, name="townlet-dashboard-sim", daemon=True)
+
+    @property
+    def finished(self) -> bool:
+        return self._finished.is_set()
+
+    def start(self) -> None:
+        with self._dispatch_lock:
+            self._accepting = True
+        self._thread.start()
+
+    def dispatch(self, command: ConsoleCommand) -> object:
+        """Run ``command`` on the simulation thread between ticks and return its result."""
+
+        with self._dispatch_lock:
+            if self._accepting:
+                future: Future[object] = Future()
+                self._commands.put((command, future))
+            else:
+                return self._router.dispatch(command)
+        return future.result()
+
+    def stop(self, timeout: float | None = 5.0) -> None:
+        self._stop.set()
+        if self._thread.is_alive():
+            self._thread.join(timeout)
+
+    def sample(self, timeout: float | None = None) -> DashboardSample | None:
+        """Request a fresh sample and wait up to ``timeout`` seconds for it.
+
+        Returns the most recent sample (which may be older than requested if
+        the worker is mid-tick when the timeout expires). Re-raises any error
+        raised on the simulation thread.
+        """
+
+        if not self._finished.is_set():
+            self._requested.set()
+            self._ready.wait(timeout)
+        self._ready.clear()
+        if self._error is not None:
+            raise self._error
+        return self._sample
+
+    def _run(self) -> None:
+        ticks = 0
+        envelope: ObservationEnvelope | None = None
+        try:
+            while not self._stop.is_set() and (self._max_ticks <= 0 or ticks < self._max_ticks):
+                self._drain_commands()
+                envelope = self._loop.step().envelope
+                ticks += 1
+                if self._on_tick is not None:
+                    self._on_tick()
+                if self._requested.is_set():
+                    self._publish(envelope)
+            if envelope is not None:
+                self._publish(envelope)
+        except BaseException as exc:  # pragma: no cover - surfaced on the UI thread
+            self._error = exc
+        finally:
+            with self._dispatch_lock:
+                self._accepting = False
+            self._drain_commands()
+            self._finished.set()
+            self._ready.set()
+
+    def _drain_commands(self) -> None:
+        while True:
+            try:
+                command, future = self._commands.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                future.set_result(self._router.dispatch(command))
+            except Exception as exc:
+                future.set_exception(exc)
+
+    def _publish(self, envelope: ObservationEnvelope) -> None:
+        payload = self._router.dispatch(ConsoleCommand(name="telemetry_snapshot", args=(), kwargs={}))
+        if not isinstance(payload, Mapping):
+            raise TypeError("Console returned non-mapping telemetry payload")
+        self._sample = DashboardSample(
+            tick=self._loop.tick,
+            payload=copy.deepcopy(dict(payload)),
+            envelope=envelope,
+        )
+        self._requested.clear()
+        self._ready.set()
+
+
 def run_dashboard(
     loop: SimulationLoop,
     *,
@@ -1970,8 +2192,15 @@ def run_dashboard(
     show_personality_narration: bool = True,
     telemetry_provider: str | None = None,
     policy_provider: str | None = None,
+    background_sim: bool = True,
 ) -> None:
-    """Continuously render dashboard against a SimulationLoop instance."""
+    """Continuously render dashboard against a SimulationLoop instance.
+
+    With ``background_sim`` (the default) the loop runs at full speed on a
+    :class:`SimulationWorker` thread and the UI samples the latest telemetry
+    every ``refresh_interval`` seconds. ``background_sim=False`` keeps the
+    lock-step behaviour (one render per tick), which scripted demos rely on.
+    """
     from townlet.world.agents.snapshot import AgentSnapshot
 
     if not loop.world.agents:
@@ -2000,7 +2229,15 @@ def run_dashboard(
     )
     client = TelemetryClient()
     console = Console()
-    executor = ConsoleCommandExecutor(router)
+
+    def _notify_tick() -> None:
+        if on_tick is not None:
+            on_tick(loop, executor, loop.tick)
+
+    worker: SimulationWorker | None = None
+    if background_sim:
+        worker = SimulationWorker(loop, router, max_ticks=max_ticks, on_tick=_notify_tick)
+    executor = ConsoleCommandExecutor(worker if worker is not None else router)
 
     page_size = agent_page_size if agent_page_size > 0 else len(loop.world.agents) or 1
     rotate_enabled = agent_autorotate and agent_rotate_interval != 0
@@ -2024,49 +2261,69 @@ def run_dashboard(
     if defer:
         executor.submit(ConsoleCommand(name="employment_exit", args=("defer", defer), kwargs={}))
 
-    tick = 0
+    def _frame(snapshot: TelemetrySnapshot, envelope: ObservationEnvelope, frame_tick: int) -> Group:
+        refreshed = time.strftime("%H:%M:%S")
+        panels = list(
+            render_snapshot(
+                snapshot,
+                tick=frame_tick,
+                refreshed=refreshed,
+                palette=palette_state,
+                state=dashboard_state,
+                focus_agent=focus_agent,
+                personality_filter=personality_filter,
+                personality_enabled=personality_ui_enabled,
+                show_personality_narration=show_personality_narration,
+            )
+        )
+        map_panel = _build_map_panel(
+            snapshot,
+            envelope,
+            focus_agent,
+            show_coords=show_coords,
+        )
+        if map_panel is not None:
+            panels.append(map_panel)
+        panels.append(Text(f"Tick: {frame_tick}", style="dim"))
+        return Group(*panels)
+
     refresh_rate = 1.0 / max(refresh_interval, 1e-3)
     try:
         with Live(console=console, refresh_per_second=refresh_rate, transient=False) as live:
-            while max_ticks <= 0 or tick < max_ticks:
-                tick += 1
-                loop_start = time.monotonic()
-                artifacts = loop.step()
-                if on_tick is not None:
-                    on_tick(loop, executor, loop.tick)
-                snapshot = client.from_console(router)
-                refreshed = time.strftime("%H:%M:%S")
-                panels = list(
-                    render_snapshot(
-                        snapshot,
-                        tick=loop.tick,
-                        refreshed=refreshed,
-                        palette=palette_state,
-                        state=dashboard_state,
-                        focus_agent=focus_agent,
-                        personality_filter=personality_filter,
-                        personality_enabled=personality_ui_enabled,
-                        show_personality_narration=show_personality_narration,
-                    )
-                )
-                map_panel = _build_map_panel(
-                    snapshot,
-                    artifacts.envelope,
-                    focus_agent,
-                    show_coords=show_coords,
-                )
-                if map_panel is not None:
-                    panels.append(map_panel)
-                footer = Text(f"Tick: {loop.tick}", style="dim")
-                panels.append(footer)
-                live.update(Group(*panels))
-                elapsed = time.monotonic() - loop_start
-                sleep_for = max(0.0, refresh_interval - elapsed)
-                if sleep_for:
-                    time.sleep(sleep_for)
+            if worker is not None:
+                worker.start()
+                last_tick: int | None = None
+                while True:
+                    frame_start = time.monotonic()
+                    done = worker.finished
+                    sample = worker.sample(timeout=max(refresh_interval, 0.05))
+                    if sample is not None and sample.tick != last_tick:
+                        last_tick = sample.tick
+                        snapshot = client.parse_payload(sample.payload)
+                        live.update(_frame(snapshot, sample.envelope, sample.tick))
+                    if done:
+                        break
+                    sleep_for = max(0.0, refresh_interval - (time.monotonic() - frame_start))
+                    if sleep_for:
+                        time.sleep(sleep_for)
+            else:
+                tick = 0
+                while max_ticks <= 0 or tick < max_ticks:
+                    tick += 1
+                    loop_start = time.monotonic()
+                    artifacts = loop.step()
+                    _notify_tick()
+                    snapshot = client.from_console(router)
+                    live.update(_frame(snapshot, artifacts.envelope, loop.tick))
+                    elapsed = time.monotonic() - loop_start
+                    sleep_for = max(0.0, refresh_interval - elapsed)
+                    if sleep_for:
+                        time.sleep(sleep_for)
     except KeyboardInterrupt:
         console.print("[yellow]Dashboard interrupted by user.[/yellow]")
     finally:
+        if worker is not None:
+            worker.stop()
         executor.shutdown()
 
 
@@ -164,3 +164,19 @@ def test_dummy_loop_multiple_agents(simulation_config) -> None:
         agent_obs = next((a for a in artifacts.envelope.agents if a.agent_id == agent_id), None)
         assert agent_obs is not None, f"Missing observation for {agent_id}"
         assert agent_obs.agent_id == agent_id
+
+
+def test_dummy_world_runtime_accepts_action_batches() -> None:
+    """Dummy runtime decodes ActionBatch input like the default adapter."""
+    from townlet.testing.dummy_world import DummyWorldRuntime
+    from townlet.world.actions import ActionBatch, ActionSlots
+
+    runtime = DummyWorldRuntime(agents_list=("alice", "bob"))
+    batch = ActionBatch.allocate(ActionSlots(agents=("alice", "bob"))).with_overrides({"bob": {"kind": "wait"}})
+
+    runtime.apply_actions(batch)
+    assert set(runtime.observe().actions) == {"alice", "bob"}
+
+    result = runtime.tick(tick=1, action_provider=lambda world, tick: batch, policy_actions={"alice": None})
+    assert result.actions["bob"] == {"kind": "wait"}
+    assert result.actions["alice"] is None
@@ -70,14 +70,12 @@ class TestBCStrategy:
             strategy.run(context)
 
     @patch("townlet.policy.models.torch_available")
-    @patch("townlet.policy.bc.load_bc_samples")
-    @patch("townlet.policy.bc.BCTrajectoryDataset")
+    @patch("townlet.policy.bc.load_bc_dataset")
     @patch("townlet.policy.bc.BCTrainer")
     def test_strategy_returns_valid_dto(
         self,
         mock_trainer_cls: MagicMock,
-        mock_dataset_cls: MagicMock,
-        mock_load_samples: MagicMock,
+        mock_load_dataset: MagicMock,
         mock_torch_available: MagicMock,
         test_context: TrainingContext,
     ):
@@ -92,7 +90,7 @@ class TestBCStrategy:
         mock_dataset.feature_dim = 128
         mock_dataset.map_shape = (9, 9, 3)
         mock_dataset.action_dim = 10
-        mock_dataset_cls.return_value = mock_dataset
+        mock_load_dataset.return_value = mock_dataset
 
         # Mock trainer
         mock_trainer = MagicMock()
@@ -131,14 +129,12 @@ class TestBCStrategy:
         assert result.duration_sec >= 0.0
 
     @patch("townlet.policy.models.torch_available")
-    @patch("townlet.policy.bc.load_bc_samples")
-    @patch("townlet.policy.bc.BCTrajectoryDataset")
+    @patch("townlet.policy.bc.load_bc_dataset")
     @patch("townlet.policy.bc.BCTrainer")
     def test_strategy_handles_minimal_metrics(
         self,
         mock_trainer_cls: MagicMock,
-        mock_dataset_cls: MagicMock,
-        mock_load_samples: MagicMock,
+        mock_load_dataset: MagicMock,
         mock_torch_available: MagicMock,
         test_context: TrainingContext,
     ):
@@ -153,7 +149,7 @@ class TestBCStrategy:
         mock_dataset.feature_dim = 128
         mock_dataset.map_shape = (9, 9, 3)
         mock_dataset.action_dim = 10
-        mock_dataset_cls.return_value = mock_dataset
+        mock_load_dataset.return_value = mock_dataset
 
         # Mock trainer with minimal metrics (no validation)
         mock_trainer = MagicMock()
@@ -172,14 +168,12 @@ class TestBCStrategy:
         assert result.val_loss is None
 
     @patch("townlet.policy.models.torch_available")
-    @patch("townlet.policy.bc.load_bc_samples")
-    @patch("townlet.policy.bc.BCTrajectoryDataset")
+    @patch("townlet.policy.bc.load_bc_dataset")
     @patch("townlet.policy.bc.BCTrainer")
     def test_strategy_creates_correct_trainer_params(
         self,
         mock_trainer_cls: MagicMock,
-        mock_dataset_cls: MagicMock,
-        mock_load_samples: MagicMock,
+        mock_load_dataset: MagicMock,
         mock_torch_available: MagicMock,
         test_context: TrainingContext,
     ):
@@ -194,7 +188,7 @@ class TestBCStrategy:
         mock_dataset.feature_dim = 128
         mock_dataset.map_shape = (9, 9, 3)
         mock_dataset.action_dim = 10
-        mock_dataset_cls.return_value = mock_dataset
+        mock_load_dataset.return_value = mock_dataset
 
         # Mock trainer
         mock_trainer = MagicMock()
@@ -224,14 +218,12 @@ class TestBCStrategy:
         assert policy_cfg.action_dim == 10
 
     @patch("townlet.policy.models.torch_available")
-    @patch("townlet.policy.bc.load_bc_samples")
-    @patch("townlet.policy.bc.BCTrajectoryDataset")
+    @patch("townlet.policy.bc.load_bc_dataset")
     @patch("townlet.policy.bc.BCTrainer")
     def test_dto_serialization(
         self,
         mock_trainer_cls: MagicMock,
-        mock_dataset_cls: MagicMock,
-        mock_load_samples: MagicMock,
+        mock_load_dataset: MagicMock,
         mock_torch_available: MagicMock,
         test_context: TrainingContext,
     ):
@@ -246,7 +238,7 @@ class TestBCStrategy:
         mock_dataset.feature_dim = 128
         mock_dataset.map_shape = (9, 9, 3)
         mock_dataset.action_dim = 10
-        mock_dataset_cls.return_value = mock_dataset
+        mock_load_dataset.return_value = mock_dataset
 
         mock_trainer = MagicMock()
         mock_trainer.fit.return_value = {"accuracy": 0.92, "loss": 0.18}
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import gzip
+import json
+from pathlib import Path
+
+import pytest
+
+from townlet.config import TelemetryTransportConfig
+from townlet.telemetry.archive import ArchiveTransport, TelemetryArchiveReader
+from townlet.telemetry.transport import create_transport
+
+
+def _payload(tick: int, payload_type: str = "diff", **extra: object) -> bytes:
+    body = {"tick": tick, "payload_type": payload_type, **extra}
+    return (json.dumps(body) + "\n").encode("utf-8")
+
+
+def _write_archive(directory: Path, ticks: range, **kwargs: object) -> None:
+    transport = ArchiveTransport(directory, **kwargs)  # type: ignore[arg-type]
+    transport.start()
+    for tick in ticks:
+        kind = "snapshot" if tick == ticks.start else "diff"
+        transport.send(_payload(tick, kind, changes={"value": tick}))
+    transport.stop()
+
+
+def test_archive_rotates_segments_by_tick_span(tmp_path: Path) -> None:
+    archive = tmp_path / "archive"
+    _write_archive(archive, range(0, 25), segment_max_ticks=10)
+
+    reader = TelemetryArchiveReader(archive)
+    segments = reader.segments
+    assert [(seg.first_tick, seg.last_tick) for seg in segments] == [(0, 9), (10, 19), (20, 24)]
+    assert sum(seg.records for seg in segments) == 25
+    first_length = len(_payload(0, "snapshot", changes={"value": 0}))
+    index_line = (archive / "segment-000000.idx").read_text().splitlines()[0]
+    assert index_line.split("\t") == ["0", "0", str(first_length), "snapshot"]
+
+
+def test_archive_reader_seeks_tick_range_and_filters_types(tmp_path: Path) -> None:
+    archive = tmp_path / "archive"
+    _write_archive(archive, range(0, 40), segment_max_bytes=1_024)
+
+    reader = TelemetryArchiveReader(archive)
+    assert len(reader.segments) > 1
+    ticks = [record["tick"] for record in reader.iter_records(start_tick=12, end_tick=17)]
+    assert ticks == list(range(12, 18))
+    snapshots = list(reader.iter_records(event_types={"snapshot"}))
+    assert [record["tick"] for record in snapshots] == [0]
+
+
+def test_archive_gzip_segments_round_trip(tmp_path: Path) -> None:
+    archive = tmp_path / "archive"
+    _write_archive(archive, range(0, 30), segment_max_ticks=8, compression="gzip")
+
+    segment = archive / "segment-000001.jsonl.gz"
+    with gzip.open(segment, "rt", encoding="utf-8") as handle:
+        assert json.loads(handle.readline())["tick"] == 8
+    reader = TelemetryArchiveReader(archive)
+    assert [record["tick"] for record in reader.iter_records(start_tick=20, end_tick=22)] == [20, 21, 22]
+
+
+def test_archive_resumes_numbering_and_reads_live_segment(tmp_path: Path) -> None:
+    archive = tmp_path / "archive"
+    _write_archive(archive, range(0, 5))
+
+    live = ArchiveTransport(archive)
+    live.start()
+    live.send(_payload(5))
+    live.send(_payload(6))
+    reader = TelemetryArchiveReader(archive)
+    assert [seg.index for seg in reader.segments] == [0, 1]
+    assert [record["tick"] for record in reader.iter_records(start_tick=4)] == [4, 5, 6]
+    live.stop()
+    manifest = json.loads((archive / "manifest.json").read_text())
+    assert [item["name"] for item in manifest["segments"]] == ["segment-000000.jsonl", "segment-000001.jsonl"]
+
+
+def test_archive_snapshot_at_applies_diffs(tmp_path: Path) -> None:
+    archive = tmp_path / "archive"
+    transport = ArchiveTransport(archive, segment_max_ticks=2)
+    transport.start()
+    transport.send(_payload(0, "snapshot", agents={"alice": 1}, queues={}))
+    transport.send(_payload(1, "diff", changes={"agents": {"alice": 2}}))
+    transport.send(_payload(2, "diff", changes={"queues": {"fridge": ["alice"]}}, removed=["agents"]))
+    transport.stop()
+
+    reader = TelemetryArchiveReader(archive)
+    at_one = reader.snapshot_at(1)
+    assert at_one is not None
+    assert at_one["tick"] == 1 and at_one["agents"] == {"alice": 2}
+    latest = reader.snapshot_at()
+    assert latest is not None
+    assert "agents" not in latest and latest["queues"] == {"fridge": ["alice"]}
+
+
+def test_reader_streams_plain_ndjson_and_reports_location(tmp_path: Path) -> None:
+    log = tmp_path / "stream.jsonl"
+    log.write_bytes(_payload(1) + b"\n" + _payload(2) + b"[1, 2]\n")
+    reader = TelemetryArchiveReader(log)
+    entries = reader.iter_entries(end_tick=2)
+    assert next(entries).tick == 1
+    assert next(entries).location == f"{log}:3"
+    with pytest.raises(ValueError, match=r"stream.jsonl:4: expected JSON object"):
+        next(entries)
+
+
+def test_create_transport_archive_from_config(tmp_path: Path) -> None:
+    config = TelemetryTransportConfig(
+        type="archive",
+        file_path=tmp_path / "archive",
+        archive={"segment_max_ticks": 5, "compression": "gzip"},
+    )
+    transport = create_transport(
+        transport_type=config.type,
+        file_path=config.file_path,
+        endpoint=None,
+        connect_timeout=5.0,
+        send_timeout=1.0,
+        enable_tls=config.enable_tls,
+        verify_hostname=False,
+        ca_file=None,
+        cert_file=None,
+        key_file=None,
+        allow_plaintext=False,
+        archive_segment_max_ticks=config.archive.segment_max_ticks,
+        archive_compression=config.archive.compression,
+    )
+    assert isinstance(transport, ArchiveTransport)
+    transport.send(_payload(3, "snapshot"))
+    transport.stop()
+    assert (tmp_path / "archive" / "segment-000000.jsonl.gz").exists()
+    with pytest.raises(ValueError, match="file_path is required when type is 'archive'"):
+        TelemetryTransportConfig(type="archive")
+
+
+def test_archive_send_uses_supplied_tick_without_decoding(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    import townlet.telemetry.archive as archive_module
+
+    def _fail(*_: object, **__: object) -> object:
+        raise AssertionError("payload decoded despite supplied metadata")
+
+    transport = ArchiveTransport(tmp_path / "archive")
+    transport.start()
+    monkeypatch.setattr(archive_module.json, "loads", _fail)
+    transport.send(_payload(7, "snapshot"), tick=7, event_type="snapshot")
+    monkeypatch.undo()
+    transport.stop()
+
+    entries = list(TelemetryArchiveReader(tmp_path / "archive").iter_entries())
+    assert [(entry.tick, entry.event_type) for entry in entries] == [(7, "snapshot")]
@@ -30,7 +30,7 @@ def test_worker_manager_fan_out_handles_overflow() -> None:
     status = _status_template()
     send_calls: list[tuple[str, bytes]] = []
 
-    def send_payload(payload: bytes) -> None:
+    def send_payload(payload: bytes, tick: int | None, event_type: str | None) -> None:
         send_calls.append((threading.current_thread().name, payload))
 
     manager = TelemetryWorkerManager(
@@ -59,7 +59,7 @@ def test_worker_manager_block_strategy_drops_when_stalled(monkeypatch) -> None:
     status = _status_template()
     send_calls: list[bytes] = []
 
-    def send_payload(payload: bytes) -> None:
+    def send_payload(payload: bytes, tick: int | None, event_type: str | None) -> None:
         send_calls.append(payload)
 
     manager = TelemetryWorkerManager(
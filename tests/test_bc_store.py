@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import json
+import pickle
+import runpy
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from townlet.policy.models import torch_available
+
+pytestmark = pytest.mark.skipif(not torch_available(), reason="Torch not installed")
+
+import torch  # noqa: E402
+
+from townlet.config import load_config  # noqa: E402
+from townlet.policy.backends.pytorch.bc import BlockShuffleSampler, class_balanced_weights  # noqa: E402
+from townlet.policy.bc import (  # noqa: E402
+    BCTrainer,
+    BCTrainingConfig,
+    BCTrajectoryDataset,
+    MemmapBCDataset,
+    load_bc_dataset,
+    load_bc_samples,
+)
+from townlet.policy.models import ConflictAwarePolicyConfig  # noqa: E402
+from townlet.policy.training.orchestrator import TrainingOrchestrator  # noqa: E402
+
+FEATURE_NAMES = ["f0", "f1", "rivalry_max", "rivalry_avoid_count"]
+
+
+def _write_manifest(tmp_path: Path, actions_per_sample: list[list[int]]) -> Path:
+    rng = np.random.default_rng(5)
+    entries = []
+    for index, actions in enumerate(actions_per_sample):
+        steps = len(actions)
+        features = rng.random((steps, len(FEATURE_NAMES)), dtype=np.float32)
+        features[:, 0] = actions
+        sample_path = tmp_path / f"bc_{index}.npz"
+        np.savez(
+            sample_path,
+            map=rng.random((steps, 4, 4, 2), dtype=np.float32),
+            features=features,
+            actions=np.asarray(actions),
+            old_log_probs=np.zeros(steps, dtype=np.float32),
+            value_preds=np.zeros(steps + 1, dtype=np.float32),
+            rewards=np.zeros(steps, dtype=np.float32),
+            dones=np.arange(steps) == steps - 1,
+        )
+        sample_path.with_suffix(".json").write_text(json.dumps({"feature_names": FEATURE_NAMES}))
+        entries.append({"sample": sample_path.name, "meta": sample_path.with_suffix(".json").name})
+    manifest = tmp_path / "bc_manifest.json"
+    manifest.write_text(json.dumps(entries))
+    return manifest
+
+
+def _build_store(tmp_path: Path, manifest: Path) -> Path:
+    main = runpy.run_path("scripts/build_bc_store.py")["main"]
+    assert main([str(manifest), "--output", str(tmp_path / "store")]) == 0
+    return tmp_path / "store" / "bc_store.json"
+
+
+def test_store_matches_in_memory_dataset(tmp_path: Path) -> None:
+    manifest = _write_manifest(tmp_path, [[0, 1, 1, 0, 2], [1, 1, 1]])
+    index_path = _build_store(tmp_path, manifest)
+    expected = BCTrajectoryDataset(load_bc_samples(manifest))
+    dataset = load_bc_dataset(index_path)
+
+    assert isinstance(dataset, MemmapBCDataset)
+    assert (len(dataset), dataset.map_shape, dataset.feature_dim, dataset.action_dim) == (
+        len(expected),
+        expected.map_shape,
+        expected.feature_dim,
+        expected.action_dim,
+    )
+    assert dataset.action_counts == {0: 2, 1: 5, 2: 1}
+    for index in range(len(expected)):
+        for ours, theirs in zip(dataset[index], expected[index], strict=True):
+            assert torch.equal(ours, theirs)
+    maps, features, actions = dataset[[6, 0, 3]]
+    assert torch.equal(maps, torch.stack([expected[i][0] for i in (6, 0, 3)]))
+    assert torch.equal(features, torch.stack([expected[i][1] for i in (6, 0, 3)]))
+    assert actions.tolist() == [1, 0, 0]
+
+    restored = pickle.loads(pickle.dumps(dataset))
+    assert restored._columns is None
+    assert torch.equal(restored[2][0], expected[2][0])
+
+
+def test_block_shuffle_and_balanced_weights() -> None:
+    sampler = BlockShuffleSampler(10, 4, generator=torch.Generator().manual_seed(0))
+    order = list(sampler)
+    assert sorted(order) == list(range(10))
+    blocks = [index // 4 for index in order]
+    assert [block for position, block in enumerate(blocks) if position == 0 or block != blocks[position - 1]] == list(
+        dict.fromkeys(blocks)
+    )
+
+    weights = class_balanced_weights(np.array([0, 0, 0, 1, 2, 2]))
+    assert weights.tolist() == pytest.approx([1 / 3, 1 / 3, 1 / 3, 1.0, 0.5, 0.5])
+
+
+@pytest.mark.parametrize("sampling", ["block", "balanced"])
+def test_trainer_fits_memmap_store_with_workers(tmp_path: Path, sampling: str) -> None:
+    manifest = _write_manifest(tmp_path, [[0, 1] * 8, [1] * 12])
+    dataset = MemmapBCDataset(_build_store(tmp_path, manifest))
+    policy_cfg = ConflictAwarePolicyConfig(feature_dim=dataset.feature_dim, map_shape=dataset.map_shape, action_dim=2)
+    torch.manual_seed(0)
+    trainer = BCTrainer(
+        BCTrainingConfig(learning_rate=0.05, batch_size=8, epochs=30, num_workers=1, sampling=sampling, block_size=8),  # type: ignore[arg-type]
+        policy_cfg,
+    )
+    metrics = trainer.fit(dataset)
+    assert metrics["accuracy"] >= 0.95
+    assert trainer.evaluate(dataset)["samples"] == 28.0
+
+
+def test_strategy_trains_from_store_index(tmp_path: Path) -> None:
+    manifest = _write_manifest(tmp_path, [[0, 1, 0, 1], [1, 0]])
+    config = load_config(Path("configs/examples/poc_hybrid.yaml"))
+    config.training.bc.manifest = _build_store(tmp_path, manifest)
+    config.training.bc.epochs = 2
+    config.training.bc.sampling = "block"
+    result = TrainingOrchestrator(config).run_bc()
+    assert result.manifest.endswith("bc_store.json")
+    assert 0.0 <= result.accuracy <= 1.0
+
+
+def test_distributed_fit_rejects_non_uniform_sampling(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    dataset = load_bc_dataset(_write_manifest(tmp_path, [[0, 1, 0, 1]]))
+    policy_cfg = ConflictAwarePolicyConfig(feature_dim=dataset.feature_dim, map_shape=dataset.map_shape, action_dim=2)
+    trainer = BCTrainer(BCTrainingConfig(sampling="block", block_size=2), policy_cfg)
+    monkeypatch.setattr("townlet.policy.training.distributed.current_group", lambda: (0, 2))
+    with pytest.raises(ValueError, match="not supported with distributed training"):
+        trainer.fit(dataset)
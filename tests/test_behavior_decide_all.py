@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import random
+from pathlib import Path
+
+from tests.helpers.modular_world import ModularTestWorld
+from townlet.agents.models import PersonalityProfiles
+from townlet.config import load_config
+from townlet.policy.behavior import ScriptedBehavior
+from townlet.world.grid import AgentSnapshot
+
+
+def _populated_world(agent_count: int = 40) -> ModularTestWorld:
+    config = load_config(Path("configs/examples/poc_hybrid.yaml"))
+    config.conflict.rivalry.avoid_threshold = 0.1
+    config.features.stages.relationships = "A"
+    world = ModularTestWorld.from_config(config)
+    for object_id, object_type in (("shower_1", "shower"), ("bed_1", "bed"), ("fridge_1", "fridge")):
+        world.register_object(object_id=object_id, object_type=object_type)
+    rng = random.Random(7)
+    profile = PersonalityProfiles.get("socialite")
+    for index in range(agent_count):
+        agent_id = f"agent_{index:02d}"
+        world.agents[agent_id] = AgentSnapshot(
+            agent_id=agent_id,
+            position=(rng.randrange(4), rng.randrange(4)),
+            needs={need: rng.choice((0.1, 0.9)) for need in ("hunger", "hygiene", "energy")},
+            wallet=1.0,
+            personality=profile.personality,
+            personality_profile="socialite",
+        )
+    agent_ids = list(world.agents)
+    for _ in range(agent_count):
+        world.register_rivalry_conflict(rng.choice(agent_ids), rng.choice(agent_ids))
+    for agent_id in agent_ids[: agent_count // 4]:
+        world.queue_manager.request_access("shower_1", agent_id, tick=world.tick)
+    return world
+
+
+def test_decide_all_matches_per_agent_decide() -> None:
+    world = _populated_world()
+    sequential = ScriptedBehavior(world.config)
+    batched = ScriptedBehavior(world.config)
+
+    for tick in range(3):
+        world.tick = tick
+        expected = {agent_id: sequential.decide(world, agent_id) for agent_id in world.agents}
+        assert batched.decide_all(world) == expected
+        assert batched.pending == sequential.pending
+        assert batched._chat_cooldowns == sequential._chat_cooldowns
+
+    kinds = {intent.kind for intent in expected.values()}
+    assert {"request", "move"} & kinds
+
+
+def test_decide_all_subset_and_unknown_agents() -> None:
+    world = _populated_world(agent_count=6)
+    behavior = ScriptedBehavior(world.config)
+
+    intents = behavior.decide_all(world, ["agent_01", "ghost"])
+    assert list(intents) == ["agent_01", "ghost"]
+    assert intents["ghost"].kind == "wait"
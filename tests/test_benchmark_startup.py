@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from townlet.benchmark.startup import ENTRY_POINTS, EntryPoint, check_entry, parse_importtime
+
+_SAMPLE = """\
+import time: self [us] | cumulative | imported package
+import time:       100 |        100 | site
+import time:       200 |        200 |   townlet.utils
+import time:       300 |        500 | townlet.config
+import time:        50 |         50 | json
+"""
+
+
+def test_parse_importtime_sums_top_level_rows_excluding_baseline() -> None:
+    profile = parse_importtime(_SAMPLE, baseline=frozenset({"site"}))
+    assert profile.total_ms == 0.55
+    assert profile.imported == {"townlet.utils", "townlet.config", "json"}
+    assert profile.slowest[0] == ("townlet.config", 0.5)
+
+
+def test_light_entry_points_do_not_import_heavy_modules() -> None:
+    for name in ("telemetry_summary", "validate_affordances"):
+        result = check_entry(ENTRY_POINTS[name], repeat=1, scale=20.0)
+        assert result.ok, result.violations
+
+
+def test_entry_points_measure_existing_scripts() -> None:
+    for name, entry in ENTRY_POINTS.items():
+        assert entry.path.is_file(), entry.path
+        assert name == entry.path.stem
+
+
+def test_check_entry_reports_forbidden_imports(tmp_path: Path) -> None:
+    script = tmp_path / "json_only.py"
+    script.write_text('import json\n\nif __name__ == "__main__":\n    import csv\n')
+    entry = EntryPoint(script, budget_ms=10_000.0, forbidden=("json.decoder", "csv"))
+    result = check_entry(entry, repeat=1)
+    assert result.entry == "json_only"
+    assert result.violations == ["forbidden module 'json.decoder' imported at startup"]
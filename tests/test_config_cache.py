@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import runpy
+from pathlib import Path
+
+import pytest
+
+from townlet.config import SimulationConfig, load_config
+from townlet.config.affordance_manifest import load_affordance_manifest
+from townlet.config.cache import CONFIG_CACHE_ENV, ConfigCache
+from townlet.world import preconditions
+from townlet.world.preconditions import compile_manifest_preconditions, compile_preconditions
+
+CONFIG_PATH = Path("configs/examples/poc_hybrid.yaml")
+_MANIFEST = (
+    "- id: eat\n"
+    "  type: affordance\n"
+    "  object_type: fridge\n"
+    "  duration: 2\n"
+    "  effects: {hunger: 0.5}\n"
+    "  preconds: ['agent.wallet > 0.25']\n"
+)
+
+
+def test_load_config_reuses_cached_entry(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv(CONFIG_CACHE_ENV, str(tmp_path / "cache"))
+    first = load_config(CONFIG_PATH)
+    entries = list((tmp_path / "cache").glob("config-*.pickle"))
+    assert len(entries) == 1
+
+    calls: list[object] = []
+    original = SimulationConfig.model_validate
+
+    def _tracking(data: object) -> SimulationConfig:
+        calls.append(data)
+        return original(data)
+
+    monkeypatch.setattr(SimulationConfig, "model_validate", _tracking)
+    second = load_config(CONFIG_PATH)
+    assert not calls
+    assert second == first
+
+
+def test_cache_key_tracks_file_contents(tmp_path: Path) -> None:
+    cache = ConfigCache(tmp_path / "cache")
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(CONFIG_PATH.read_text())
+    baseline = load_config(config_path, cache=cache)
+
+    config_path.write_text(CONFIG_PATH.read_text().replace(f"config_id: \"{baseline.config_id}\"", "config_id: edited"))
+    edited = load_config(config_path, cache=cache)
+    assert edited.config_id == "edited"
+    assert len(list(cache.directory.glob("config-*.pickle"))) == 2
+
+
+def test_manifest_cache_restores_path(tmp_path: Path) -> None:
+    cache = ConfigCache(tmp_path / "cache")
+    manifest_path = tmp_path / "affordances.yaml"
+    manifest_path.write_text(_MANIFEST)
+    loaded = load_affordance_manifest(manifest_path, cache=cache)
+    entry = cache.entry_path("affordances", manifest_path.read_bytes())
+    assert entry.exists()
+
+    moved = tmp_path / "moved.yaml"
+    moved.write_bytes(manifest_path.read_bytes())
+    cached = load_affordance_manifest(moved, cache=cache)
+    assert cached.path == moved
+    assert cached.affordances == loaded.affordances
+    assert cached.checksum == loaded.checksum
+
+
+def test_manifest_preconditions_compile_once_per_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    cache = ConfigCache(tmp_path / "cache")
+    manifest_path = tmp_path / "affordances.yaml"
+    manifest_path.write_text(_MANIFEST)
+    manifest = load_affordance_manifest(manifest_path, cache=cache)
+    compile_manifest_preconditions(manifest, cache=cache)
+    assert cache.entry_path("preconditions", manifest.checksum.encode("utf-8")).exists()
+    first = compile_preconditions(["agent.wallet > 0.25"])
+
+    def _fail(expressions: object) -> tuple[object, ...]:
+        raise AssertionError("cached preconditions should not be recompiled")
+
+    monkeypatch.setattr(preconditions, "compile_preconditions", _fail)
+    compile_manifest_preconditions(manifest, cache=cache)
+    monkeypatch.undo()
+    assert compile_preconditions(["agent.wallet > 0.25"])[0] is first[0]
+
+
+def test_prewarm_script_populates_cache(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    module = runpy.run_path("scripts/prewarm_config_cache.py")
+    cache_dir = tmp_path / "cache"
+    assert module["main"]([str(CONFIG_PATH), "--cache-dir", str(cache_dir)]) == 0
+    assert "[ok]" in capsys.readouterr().out
+    assert len(list(cache_dir.glob("config-*.pickle"))) == 1
+    assert len(list(cache_dir.glob("affordances-*.pickle"))) == 1
+    assert len(list(cache_dir.glob("preconditions-*.pickle"))) == 1
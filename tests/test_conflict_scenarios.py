@@ -20,7 +20,7 @@ def _run_scenario(config_path: str, ticks: int) -> SimulationLoop:
     apply_scenario(loop, scenario)
     # Disable transport IO for deterministic tests
     loop.telemetry._transport_client = SimpleNamespace(  
-        send=lambda payload: None,
+        send=lambda payload, **_: None,
         close=lambda: None,
     )
     for _ in range(ticks):
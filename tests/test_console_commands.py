@@ -407,6 +407,47 @@ def test_console_queue_inspect_returns_queue_details() -> None:
     assert isinstance(result["cooldowns"], list)
 
 
+def test_console_queries_are_memoized_until_tick_advances() -> None:
+    config = load_config(Path("configs/examples/poc_hybrid.yaml"))
+    loop = SimulationLoop(config)
+    world = loop.world
+    router = create_console_router(
+        loop.telemetry, world, loop.perturbations, policy=loop.policy, config=config
+    )
+    world.queue_manager.request_access("test_object", "alice", tick=0)
+    command = ConsoleCommand(name="queue_inspect", args=("test_object",), kwargs={"cmd_id": "a"})
+    first = router.dispatch(command)
+    assert first["queue"] == []
+    # Mutations outside the console are not visible until telemetry moves on.
+    world.queue_manager.request_access("test_object", "bob", tick=0)
+    repeat = router.dispatch(ConsoleCommand(name="queue_inspect", args=("test_object",), kwargs={"cmd_id": "b"}))
+    assert repeat == first
+    assert repeat is not first
+
+    loop.step()
+    refreshed = router.dispatch(command)
+    assert [entry["agent_id"] for entry in refreshed["queue"]] == ["bob"]
+    assert refreshed["tick"] == world.tick
+
+
+def test_console_mutating_command_invalidates_cached_snapshot() -> None:
+    config = load_config(Path("configs/examples/poc_hybrid.yaml"))
+    loop = SimulationLoop(config)
+    router = create_console_router(
+        loop.telemetry,
+        loop.world,
+        loop.perturbations,
+        policy=loop.policy,
+        config=config,
+        precompute=("telemetry_snapshot",),
+    )
+    loop.step()
+    before = router.dispatch(ConsoleCommand(name="telemetry_snapshot", args=(), kwargs={}))
+    router.dispatch(ConsoleCommand(name="announce_story", args=("Cache check",), kwargs={}))
+    after = router.dispatch(ConsoleCommand(name="telemetry_snapshot", args=(), kwargs={}))
+    assert len(after["narrations"]) == len(before["narrations"]) + 1
+
+
 def test_console_set_spawn_delay_updates_lifecycle() -> None:
     config = load_config(Path("configs/examples/poc_hybrid.yaml"))
     loop = SimulationLoop(config)
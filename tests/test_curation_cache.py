@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import runpy
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+import townlet.policy.curation as curation
+from townlet.policy.curation import DEFAULT_CACHE_NAME, ManifestStreamWriter
+
+FEATURE_NAMES = ["f0", "f1", "rivalry_max", "rivalry_avoid_count"]
+
+
+def _write_sample(captures: Path, stem: str, reward: float, timesteps: int) -> None:
+    np.savez(
+        captures / f"{stem}.npz",
+        map=np.zeros((timesteps, 4, 4, 1), dtype=np.float32),
+        features=np.zeros((timesteps, 4), dtype=np.float32),
+        actions=np.zeros(timesteps, dtype=np.int64),
+        old_log_probs=np.zeros(timesteps, dtype=np.float32),
+        value_preds=np.zeros(timesteps + 1, dtype=np.float32),
+        rewards=np.full(timesteps, reward, dtype=np.float32),
+        dones=np.arange(timesteps) == timesteps - 1,
+    )
+    (captures / f"{stem}.json").write_text(json.dumps({"feature_names": FEATURE_NAMES, "timesteps": timesteps}))
+
+
+@pytest.fixture()
+def captures(tmp_path: Path) -> Path:
+    directory = tmp_path / "captures"
+    directory.mkdir()
+    _write_sample(directory, "sample_a", 0.5, 10)
+    _write_sample(directory, "sample_b", 0.2, 5)
+    return directory
+
+
+@pytest.fixture()
+def load_counter(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    loaded: list[str] = []
+    original = curation.load_replay_entry
+
+    def _counting(entry):  # type: ignore[no-untyped-def]
+        loaded.append(Path(entry[0]).name)
+        return original(entry)
+
+    monkeypatch.setattr(curation, "load_replay_entry", _counting)
+    return loaded
+
+
+def _curate(captures: Path, output: Path, *extra: str) -> list[dict[str, object]]:
+    runpy.run_path("scripts/curate_trajectories.py")["main"]([str(captures), "--output", str(output), *extra])
+    return json.loads(output.read_text())
+
+
+def test_recuration_reuses_cached_metrics(tmp_path: Path, captures: Path, load_counter: list[str]) -> None:
+    first = _curate(captures, tmp_path / "first.json", "--min-timesteps", "8")
+    assert sorted(load_counter) == ["sample_a.npz", "sample_b.npz"]
+    assert (captures / DEFAULT_CACHE_NAME).exists()
+    assert [entry["accepted"] for entry in first] == [True, False]
+
+    second = _curate(captures, tmp_path / "second.json", "--min-timesteps", "1", "--min-reward", "2.0")
+    assert len(load_counter) == 2
+    assert [entry["metrics"] for entry in second] == [entry["metrics"] for entry in first]
+    assert [entry["accepted"] for entry in second] == [True, False]
+
+    sample_a = captures / "sample_a.npz"
+    stat = sample_a.stat()
+    os.utime(sample_a, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10_000_000))
+    _curate(captures, tmp_path / "touched.json")
+    assert len(load_counter) == 2
+
+    _write_sample(captures, "sample_b", 1.0, 5)
+    changed = _curate(captures, tmp_path / "changed.json")
+    assert load_counter[2:] == ["sample_b.npz"]
+    assert changed[1]["metrics"]["reward_sum"] == pytest.approx(5.0)
+
+    uncached = _curate(captures, tmp_path / "uncached.json", "--no-cache")
+    assert len(load_counter) == 5
+    assert uncached == changed
+
+
+def test_parallel_curation_matches_serial(tmp_path: Path, captures: Path) -> None:
+    serial = _curate(captures, tmp_path / "serial.json", "--no-cache")
+    parallel = _curate(captures, tmp_path / "parallel.json", "--workers", "2", "--no-cache")
+    assert parallel == serial
+
+
+def test_manifest_stream_writer_matches_json_dumps(tmp_path: Path) -> None:
+    entries = [{"sample": "a.npz", "metrics": {"timesteps": 3}, "accepted": True}, {"sample": "b.npz", "index": 2}]
+    for count in (0, 1, 2):
+        output = tmp_path / f"manifest_{count}.json"
+        with ManifestStreamWriter(output) as writer:
+            for entry in entries[:count]:
+                writer.write(entry)
+        assert output.read_text() == json.dumps(entries[:count], indent=2)
+
+    with pytest.raises(RuntimeError), ManifestStreamWriter(tmp_path / "aborted.json") as writer:
+        writer.write(entries[0])
+        raise RuntimeError("boom")
+    assert not list(tmp_path.glob("aborted.json*"))
+
+
+def test_audit_uses_cached_digests(tmp_path: Path, captures: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    checksums = {
+        stem: {
+            "sample": f"{stem}.npz",
+            "meta": f"{stem}.json",
+            "sha256": hashlib.sha256(
+                (captures / f"{stem}.npz").read_bytes() + (captures / f"{stem}.json").read_bytes()
+            ).hexdigest(),
+        }
+        for stem in ("sample_a", "sample_b")
+    }
+    (tmp_path / "checksums.json").write_text(json.dumps(checksums))
+    (tmp_path / "manifest.json").write_text(json.dumps([{"meta": "sample_a.json"}, {"meta": "sample_b.json"}]))
+    payload = {
+        "manifest": str(tmp_path / "manifest.json"),
+        "checksums": str(tmp_path / "checksums.json"),
+        "captures_dir": str(captures),
+    }
+    audit_dataset = runpy.run_path("scripts/audit_bc_datasets.py")["audit_dataset"]
+
+    assert audit_dataset("demo", payload, workers=2)["status"] == "PASS"
+    hashed: list[int] = []
+    original = curation.content_digest
+    monkeypatch.setattr(curation, "content_digest", lambda paths: hashed.append(1) or original(paths))
+    assert audit_dataset("demo", payload)["status"] == "PASS"
+    assert hashed == []
+
+    (captures / "sample_b.json").write_text("{}")
+    report = audit_dataset("demo", payload)
+    assert report["status"] == "FAIL"
+    assert len(hashed) == 1
+    assert any(finding.startswith("sample_b: checksum mismatch") for finding in report["findings"])
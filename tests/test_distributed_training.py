@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from townlet.policy.models import torch_available
+
+pytestmark = pytest.mark.skipif(not torch_available(), reason="Torch not installed")
+
+import torch.distributed as dist  # noqa: E402
+
+from townlet.config import PPOConfig, load_config  # noqa: E402
+from townlet.policy.replay import ReplaySample  # noqa: E402
+from townlet.policy.replay_buffer import InMemoryReplayDataset, InMemoryReplayDatasetConfig  # noqa: E402
+from townlet.policy.training.orchestrator import TrainingOrchestrator  # noqa: E402
+from townlet.policy.training_orchestrator import PolicyTrainingOrchestrator  # noqa: E402
+
+if not dist.is_available():  # pragma: no cover - platform dependent
+    pytest.skip("torch.distributed not available", allow_module_level=True)
+
+
+def _samples(count: int = 4, timesteps: int = 6) -> list[ReplaySample]:
+    rng = np.random.default_rng(11)
+    names = ["f0", "f1", "rivalry_max", "rivalry_avoid_count"]
+    return [
+        ReplaySample(
+            map=rng.random((timesteps, 2, 3, 3), dtype=np.float32),
+            features=rng.random((timesteps, len(names)), dtype=np.float32),
+            actions=rng.integers(0, 3, timesteps),
+            old_log_probs=-rng.random(timesteps, dtype=np.float32),
+            value_preds=rng.random(timesteps + 1, dtype=np.float32),
+            rewards=rng.random(timesteps, dtype=np.float32),
+            dones=np.arange(timesteps) == timesteps - 1,
+            metadata={"feature_names": names, "action_dim": 3},
+        )
+        for _ in range(count)
+    ]
+
+
+def _config(world_size: int):
+    config = load_config(Path("configs/examples/poc_hybrid.yaml"))
+    config.ppo = PPOConfig(mini_batch_size=4)
+    config.training.distributed.world_size = world_size
+    config.training.distributed.threads_per_rank = 1
+    return config
+
+
+def _dataset(samples: list[ReplaySample] | None = None) -> InMemoryReplayDataset:
+    return InMemoryReplayDataset(InMemoryReplayDatasetConfig(entries=samples or _samples(), batch_size=1))
+
+
+def test_iter_shard_partitions_batches() -> None:
+    dataset = _dataset()
+    everything = [batch.actions.tolist() for batch in dataset]
+    shards = [[batch.actions.tolist() for batch in dataset.iter_shard(rank, 3)] for rank in range(3)]
+    assert [len(shard) for shard in shards] == [2, 1, 1]
+    assert sorted(actions for shard in shards for actions in shard) == sorted(everything)
+
+
+def test_two_rank_ppo_aggregates_on_rank_zero(tmp_path: Path) -> None:
+    orchestrator = TrainingOrchestrator(_config(2))
+    log_path = tmp_path / "ppo.jsonl"
+    result = orchestrator.run_ppo(in_memory_dataset=_dataset(), epochs=2, log_path=log_path, device_str="cpu")
+
+    single = TrainingOrchestrator(_config(1)).run_ppo(in_memory_dataset=_dataset(), epochs=2, device_str="cpu")
+    assert result.transitions == single.transitions == 24.0
+    assert result.steps == 48.0
+    assert np.isfinite(result.loss_total)
+    assert orchestrator.context.metadata["cumulative_steps"] == 48
+    assert orchestrator.context.metadata["cycle_id"] == 0
+    entries = [json.loads(line) for line in log_path.read_text().splitlines()]
+    assert [entry["epoch"] for entry in entries] == [1.0, 2.0]
+    assert entries[-1]["transitions"] == 24.0
+
+
+def test_padding_minibatches_are_not_counted_as_updates() -> None:
+    # Three batches over two ranks: rank 1 pads its single batch to match rank 0.
+    samples = _samples(count=3)
+    result = TrainingOrchestrator(_config(2)).run_ppo(in_memory_dataset=_dataset(samples), epochs=1, device_str="cpu")
+    single = TrainingOrchestrator(_config(1)).run_ppo(in_memory_dataset=_dataset(samples), epochs=1, device_str="cpu")
+    assert result.transitions == single.transitions == 18.0
+    assert result.updates == single.updates
+
+
+def test_two_rank_legacy_orchestrator_ppo_and_bc(tmp_path: Path) -> None:
+    harness = PolicyTrainingOrchestrator(_config(2))
+    summary = harness.run_ppo(in_memory_dataset=_dataset(), epochs=1, device_str="cpu")
+    assert summary["transitions"] == 24.0
+    assert harness._ppo_state["step"] == 24
+
+    sample_path = tmp_path / "sample.npz"
+    meta_path = tmp_path / "sample.json"
+    sample = _samples(count=1, timesteps=10)[0]
+    np.savez(
+        sample_path,
+        map=sample.map,
+        features=sample.features,
+        actions=sample.actions,
+        old_log_probs=sample.old_log_probs,
+        value_preds=sample.value_preds,
+        rewards=sample.rewards,
+        dones=sample.dones,
+    )
+    meta_path.write_text(json.dumps(sample.metadata))
+    manifest = tmp_path / "bc_manifest.json"
+    manifest.write_text(json.dumps([{"sample": sample_path.name, "meta": meta_path.name}]))
+    metrics = harness.run_bc_training(manifest=manifest)
+    assert metrics["mode"] == "bc"
+    assert 0.0 <= metrics["accuracy"] <= 1.0
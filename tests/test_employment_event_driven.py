@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import copy
+import random
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any
+
+from townlet.config import load_config
+from townlet.core.sim_loop import SimulationLoop
+from townlet.world.agents.registry import AgentRegistry
+from townlet.world.agents.snapshot import AgentSnapshot
+from townlet.world.employment import EmploymentEngine
+
+JOB_LOCATIONS = {"grocer": (0, 0), "barista": (1, 0)}
+
+
+class _World:
+    def __init__(self) -> None:
+        self.tick = 0
+        self.agents = AgentRegistry()
+        self.relationships: list[tuple[str, str, str]] = []
+
+    def update_relationship(self, agent_a: str, agent_b: str, *, event: str = "", **_: float) -> None:
+        self.relationships.append((agent_a, agent_b, event))
+
+
+def _engine(event_driven: bool) -> tuple[EmploymentEngine, list[tuple[str, dict[str, object]]]]:
+    config = load_config(Path("configs/examples/poc_hybrid.yaml"))
+    config.employment.event_driven = event_driven
+    config.employment.exit_review_window = 40
+    config.employment.grace_ticks = 2
+    config.employment.absent_cutoff = 8
+    config.employment.absence_slack = 3
+    config.behavior.job_arrival_buffer = 5
+    config.jobs["grocer"].start_tick, config.jobs["grocer"].end_tick = 30, 60
+    config.jobs["barista"].start_tick, config.jobs["barista"].end_tick = 45, 90
+    events: list[tuple[str, dict[str, object]]] = []
+    return EmploymentEngine(config, lambda name, payload: events.append((name, copy.deepcopy(payload)))), events
+
+
+def _run(event_driven: bool, ticks: int = 420) -> tuple[dict[str, Any], list[Any], list[Any], int]:
+    engine, events = _engine(event_driven)
+    world = _World()
+    for index in range(6):
+        agent_id = f"agent_{index}"
+        world.agents[agent_id] = AgentSnapshot(agent_id=agent_id, position=(5, 5), needs={})
+    evaluations = 0
+    original = engine._apply_agent_job_state
+
+    def counting(*args: Any) -> str | None:
+        nonlocal evaluations
+        evaluations += 1
+        return original(*args)
+
+    engine._apply_agent_job_state = counting  # type: ignore[method-assign]
+    rng = random.Random(5)
+    for tick in range(ticks):
+        world.tick = tick
+        for snapshot in world.agents.values():
+            location = JOB_LOCATIONS.get(snapshot.job_id or "", (0, 0))
+            snapshot.position = location if rng.random() < 0.6 else (5, 5)
+        if tick == 100:
+            # Nightly-reset style mutation through the public context accessor.
+            ctx = engine.get_employment_context(world, "agent_1")
+            ctx["state"] = "pre_shift"
+            world.agents["agent_1"].shift_state = "pre_shift"
+            engine.invalidate("agent_1")
+        if tick == 120:
+            world.agents["late_joiner"] = AgentSnapshot(agent_id="late_joiner", position=(5, 5), needs={})
+        if tick == 150:
+            world.agents["agent_2"].job_id = "barista"
+            engine.invalidate("agent_2")
+        if tick == 200:
+            del world.agents["agent_3"]
+            engine.clear_context("agent_3")
+        engine.assign_jobs_to_agents(world)
+        engine.apply_job_state(world)
+    agents = {agent_id: asdict(snapshot) for agent_id, snapshot in world.agents.items()}
+    contexts = {agent_id: {k: (list(v) if hasattr(v, "maxlen") else v) for k, v in ctx.items()} for agent_id, ctx in engine._state.items()}
+    return {"agents": agents, "contexts": contexts}, events, world.relationships, evaluations
+
+
+def test_event_driven_matches_per_tick_evaluation() -> None:
+    expected_state, expected_events, expected_relationships, per_tick_evaluations = _run(False)
+    state, events, relationships, evaluations = _run(True)
+
+    assert state == expected_state
+    assert events == expected_events
+    assert relationships == expected_relationships
+    assert {name for name, _ in events} >= {"shift_late_start", "shift_absent"}
+    # Absences expire after seven 40-tick days, inside the run.
+    assert all(agent["absent_shifts_7d"] == 0 for agent in state["agents"].values())
+    assert evaluations * 4 < per_tick_evaluations
+
+
+def _simulate(event_driven: bool) -> dict[str, dict[str, Any]]:
+    config = load_config(Path("configs/examples/poc_hybrid.yaml"))
+    config.employment.enforce_job_loop = True
+    config.employment.event_driven = event_driven
+    for job in config.jobs.values():
+        job.start_tick = 5
+        job.end_tick = 12
+        job.location = (0, 0)
+    config.behavior.job_arrival_buffer = 0
+    loop = SimulationLoop(config)
+    world = loop.world
+    world.agents.clear()
+    for agent_id, position in (("alice", (0, 0)), ("bob", (5, 5))):
+        world.agents[agent_id] = AgentSnapshot(
+            agent_id=agent_id,
+            position=position,
+            needs={"hunger": 0.5, "hygiene": 0.5, "energy": 0.5},
+            wallet=1.0,
+        )
+    world.assign_jobs_to_agents()
+    for _ in range(8):
+        loop.step()
+    world.agents["bob"].position = (0, 0)
+    for _ in range(8):
+        loop.step()
+    return {agent_id: asdict(snapshot) for agent_id, snapshot in world.agents.items()}
+
+
+def test_event_driven_simulation_matches_per_tick() -> None:
+    agents = _simulate(True)
+    assert agents == _simulate(False)
+    assert agents["alice"]["shift_state"] == agents["bob"]["shift_state"] == "post_shift"
+    assert agents["bob"]["wages_withheld"] > 0
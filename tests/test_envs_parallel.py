@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+from functools import partial
+from pathlib import Path
+
+import numpy as np
+
+from townlet.config import load_config
+from townlet.envs import (
+    ENV_ACTIONS,
+    SCRIPTED_ACTION,
+    SubprocVectorTownletEnv,
+    TownletParallelEnv,
+    VectorTownletEnv,
+)
+
+CONFIG_PATH = Path("configs/examples/poc_hybrid.yaml")
+
+
+def _make_env(max_ticks: int = 4) -> TownletParallelEnv:
+    return TownletParallelEnv(load_config(CONFIG_PATH), max_ticks=max_ticks)
+
+
+def test_parallel_env_reset_and_step_shapes() -> None:
+    env = _make_env()
+    observations, _ = env.reset(seed=1)
+    assert set(observations) == set(env.possible_agents)
+    agent = env.possible_agents[0]
+    assert env.observation_space(agent).contains(observations[agent])
+    assert observations[agent]["action_mask"][SCRIPTED_ACTION] == 1
+
+    actions = {agent: ENV_ACTIONS.index("wait") for agent in env.agents}
+    observations, rewards, _, _, _ = env.step(actions)
+    assert set(rewards) == set(env.possible_agents)
+    assert observations[agent]["map"].shape == env.map_shape
+    env.close()
+
+
+def test_parallel_env_truncates_after_max_ticks() -> None:
+    env = _make_env(max_ticks=2)
+    env.reset(seed=0)
+    env.step({})
+    _, _, _, truncations, _ = env.step({})
+    assert all(truncations.values())
+    assert env.agents == []
+    env.close()
+
+
+def test_move_mask_blocks_out_of_bounds() -> None:
+    env = _make_env()
+    env.reset(seed=0)
+    agent_id = env.possible_agents[0]
+    env.loop.world.teleport_agent(agent_id, (0, 0))
+    env.loop.world_context.observe()
+    env._refresh_arrays()
+    mask = env.arrays()["action_mask"][0]
+    assert mask[ENV_ACTIONS.index("move_north")] == 0
+    assert mask[ENV_ACTIONS.index("move_west")] == 0
+    env.close()
+
+
+def test_seeded_reset_replays_identically() -> None:
+    env = _make_env()
+    actions = np.full(len(env.possible_agents), SCRIPTED_ACTION)
+
+    env.reset_arrays(seed=5)
+    first = [env.step_arrays(actions)["features"].copy() for _ in range(3)]
+    env.reset_arrays(seed=5)
+    second = [env.step_arrays(actions)["features"].copy() for _ in range(3)]
+    for left, right in zip(first, second, strict=True):
+        np.testing.assert_array_equal(left, right)
+    env.close()
+
+
+def test_vector_env_stacks_worlds_and_auto_resets() -> None:
+    vector = VectorTownletEnv([partial(_make_env, 2), partial(_make_env, 3)])
+    arrays = vector.reset(seed=10)
+    total = vector.num_envs * vector.agents_per_env
+    assert arrays["map"].shape[0] == total
+    assert arrays["reset_mask"].all()
+
+    actions = np.full(total, SCRIPTED_ACTION)
+    vector.step(actions)
+    arrays = vector.step(actions)
+    assert arrays["reset_mask"].tolist() == [True, False]
+    assert arrays["truncations"][: vector.agents_per_env].all()
+    assert not arrays["truncations"][vector.agents_per_env :].any()
+    vector.close()
+
+
+def test_subprocess_vector_env_matches_in_process() -> None:
+    factories = [partial(_make_env, 3), partial(_make_env, 3)]
+    local = VectorTownletEnv(factories)
+    remote = SubprocVectorTownletEnv(factories, start_method="spawn")
+    try:
+        local_arrays = local.reset(seed=2)
+        remote_arrays = remote.reset(seed=2)
+        np.testing.assert_array_equal(local_arrays["features"], remote_arrays["features"])
+        actions = np.full(local.num_envs * local.agents_per_env, SCRIPTED_ACTION)
+        for _ in range(4):
+            local_arrays = local.step(actions)
+            remote_arrays = remote.step(actions)
+            np.testing.assert_array_equal(local_arrays["features"], remote_arrays["features"])
+            np.testing.assert_array_equal(local_arrays["rewards"], remote_arrays["rewards"])
+    finally:
+        local.close()
+        remote.close()
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from townlet.config import load_config
+from townlet.core.sim_loop import SimulationLoop
+from townlet.world.grid import AgentSnapshot
+from townlet.world.observations.buffers import ObservationBufferPool
+from townlet.world.observations.service import WorldObservationService
+
+
+def _make_loop(variant: str) -> SimulationLoop:
+    config = load_config(Path("configs/examples/poc_hybrid.yaml"))
+    config.observations_config.hybrid.include_targets = True
+    config.observations_config.compact.object_channels = ["stove"]
+    config.observations_config.compact.include_targets = True
+    config.features.systems.observations = variant
+    loop = SimulationLoop(config)
+    world = loop.world
+    world.agents.clear()
+    world.register_object(object_id="stove_test", object_type="stove", position=(2, 0))
+    world.agents["alice"] = AgentSnapshot(
+        agent_id="alice",
+        position=(0, 0),
+        needs={"hunger": 0.4, "hygiene": 0.5, "energy": 0.6},
+        wallet=2.0,
+    )
+    world.agents["bob"] = AgentSnapshot(
+        agent_id="bob",
+        position=(1, 0),
+        needs={"hunger": 0.7, "hygiene": 0.8, "energy": 0.9},
+        wallet=3.0,
+    )
+    return loop
+
+
+@pytest.mark.parametrize("variant", ["hybrid", "full", "compact"])
+def test_buffer_pool_matches_allocating_encoders(variant: str) -> None:
+    loop = _make_loop(variant)
+    baseline = WorldObservationService(config=loop.config)
+    pooled_config = loop.config.model_copy(deep=True)
+    pooled_config.observations_config.buffer_pool.enabled = True
+    pooled = WorldObservationService(config=pooled_config)
+
+    expected = baseline.build_batch(loop.world_adapter, terminated={})
+    observed = pooled.build_batch(loop.world_adapter, terminated={"bob": True})
+    pool = pooled.buffer_pool
+    assert pool is not None
+
+    for agent_id in ("alice", "bob"):
+        obs = observed[agent_id]
+        slot = obs["metadata"]["embedding_slot"]
+        assert np.shares_memory(obs["map"], pool._maps)
+        assert obs["map"].shape == expected[agent_id]["map"].shape
+        np.testing.assert_array_equal(obs["map"], expected[agent_id]["map"])
+        metadata = dict(obs["metadata"])
+        assert metadata.pop("buffer_generation") == pool.generation
+        assert metadata == expected[agent_id]["metadata"] | {"embedding_slot": slot}
+    np.testing.assert_array_equal(observed["alice"]["features"], expected["alice"]["features"])
+    reset_index = pooled.feature_names.index("ctx_reset_flag")
+    assert observed["bob"]["features"][reset_index] == 1.0
+    assert observed["alice"]["metadata"]["feature_names"] is observed["bob"]["metadata"]["feature_names"]
+
+
+def test_buffer_pool_rotates_generations() -> None:
+    pool = ObservationBufferPool(capacity=2, map_shape=(1, 3, 3), feature_dim=4, depth=2)
+    first = pool.begin_tick()
+    buffers = first.claim(0)
+    assert buffers is not None
+    assert first.claim(0) is None
+    assert first.claim(5) is None
+    second = pool.begin_tick()
+    assert pool.is_live(first.generation) and pool.is_live(second.generation)
+    third = pool.begin_tick()
+    assert not pool.is_live(first.generation)
+    assert np.shares_memory(third.maps, first.maps)
+    assert not np.shares_memory(second.maps, first.maps)
+    with pytest.raises(ValueError):
+        ObservationBufferPool(capacity=2, map_shape=(1, 3, 3), feature_dim=4, depth=1)
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from townlet.config import load_config
+from townlet.core.sim_loop import SimulationLoop
+from townlet.world.grid import AgentSnapshot
+from townlet.world.observations.service import WorldObservationService
+
+
+def _make_loop(variant: str) -> SimulationLoop:
+    config = load_config(Path("configs/examples/poc_hybrid.yaml"))
+    config.observations_config.hybrid.include_targets = True
+    config.observations_config.compact.object_channels = ["stove"]
+    config.features.systems.observations = variant
+    loop = SimulationLoop(config)
+    world = loop.world
+    world.agents.clear()
+    world.register_object(object_id="stove_test", object_type="stove", position=(2, 0))
+    for index, position in enumerate([(0, 0), (1, 0), (3, 3), (10, 10), (20, 20), (21, 20)]):
+        agent_id = f"agent_{index}"
+        world.agents[agent_id] = AgentSnapshot(
+            agent_id=agent_id,
+            position=position,
+            needs={"hunger": 0.4, "hygiene": 0.5, "energy": 0.6},
+            wallet=1.0,
+        )
+    return loop
+
+
+def _assert_same(observed, expected) -> None:
+    assert observed.keys() == expected.keys()
+    for agent_id, obs in observed.items():
+        np.testing.assert_array_equal(obs["map"], expected[agent_id]["map"])
+        np.testing.assert_array_equal(obs["features"], expected[agent_id]["features"])
+        assert obs["metadata"] == expected[agent_id]["metadata"]
+
+
+@pytest.mark.parametrize("variant", ["hybrid", "full", "compact"])
+def test_incremental_encoding_matches_full_rebuild(variant: str) -> None:
+    loop = _make_loop(variant)
+    world = loop.world
+    baseline = WorldObservationService(config=loop.config)
+    incremental_config = loop.config.model_copy(deep=True)
+    incremental_config.observations_config.incremental = True
+    incremental = WorldObservationService(config=incremental_config)
+    cache = incremental.incremental_cache
+    assert cache is not None
+
+    def step() -> None:
+        _assert_same(
+            incremental.build_batch(loop.world_adapter, terminated={}),
+            baseline.build_batch(loop.world_adapter, terminated={}),
+        )
+
+    step()
+    assert cache.counts == {"reused": 0, "patched": 0, "encoded": 6}
+
+    world.tick += 1
+    step()
+    assert cache.counts == {"reused": 6, "patched": 0, "encoded": 0}
+
+    world.tick += 1
+    world.agents["agent_1"].position = (2, 1)
+    world.register_object(object_id="bed_test", object_type="bed", position=(19, 19))
+    step()
+    counts = cache.counts
+    assert counts["encoded"] == 1 + (4 if variant == "compact" else 0)
+    assert counts["patched"] == (0 if variant == "compact" else 4)
+    assert counts["reused"] == 1
+
+    world.tick += 1
+    world.agents.pop("agent_5")
+    step()
+    assert cache.counts["reused"] == 4
+    assert "agent_5" not in cache._windows
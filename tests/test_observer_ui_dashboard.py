@@ -5,11 +5,13 @@ import pytest
 from rich.console import Console
 
 from townlet.config import load_config
-from townlet.console.handlers import create_console_router
+from townlet.console.handlers import ConsoleCommand, create_console_router
 from townlet.core.sim_loop import SimulationLoop
 from townlet.dto.telemetry import TelemetryEventDTO, TelemetryMetadata
 from townlet_ui.dashboard import (
+    DashboardState,
     PaletteState,
+    SimulationWorker,
     _build_map_panel,
     _derive_promotion_reason,
     _promotion_border_style,
@@ -137,6 +139,41 @@ def test_run_dashboard_advances_loop(monkeypatch: pytest.MonkeyPatch) -> None:
     assert calls["sleep"] == 0
 
 
+def test_render_snapshot_reuses_unchanged_panels() -> None:
+    loop = make_loop()
+    router = create_console_router(loop.telemetry, loop.world, policy=loop.policy, config=loop.config)
+    loop.step()
+    snapshot = TelemetryClient().from_console(router)
+    state = DashboardState()
+    first = list(render_snapshot(snapshot, tick=1, refreshed="00:00:00", state=state))
+    misses = state.panels.misses
+    second = list(render_snapshot(snapshot, tick=2, refreshed="00:00:02", state=state))
+
+    assert state.panels.misses == misses
+    assert state.panels.hits == misses
+    reused = {id(panel) for panel in first} & {id(panel) for panel in second}
+    assert reused
+
+
+def test_simulation_worker_samples_and_dispatches_between_ticks() -> None:
+    loop = make_loop()
+    router = create_console_router(loop.telemetry, loop.world, policy=loop.policy, config=loop.config)
+    worker = SimulationWorker(loop, router, max_ticks=5)
+    worker.start()
+    try:
+        result = worker.dispatch(ConsoleCommand(name="health_status", args=(), kwargs={}))
+        assert "health" in result
+        sample = None
+        while not worker.finished:
+            sample = worker.sample(timeout=1.0)
+        sample = worker.sample(timeout=0)
+    finally:
+        worker.stop()
+    assert sample is not None
+    assert sample.tick == loop.tick == 5
+    assert TelemetryClient().parse_payload(sample.payload).agents
+
+
 def test_build_map_panel_produces_table() -> None:
     loop = make_loop()
     router = create_console_router(
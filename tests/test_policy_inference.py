@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import json
+import runpy
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from townlet.policy.models import torch_available
+
+pytestmark = pytest.mark.skipif(not torch_available(), reason="Torch not installed")
+
+import torch  # noqa: E402
+
+from townlet.config import load_config  # noqa: E402
+from townlet.policy.inference import (  # noqa: E402
+    InferenceAccuracyError,
+    export_inference_artifact,
+    load_inference_artifact,
+)
+from townlet.policy.models import ConflictAwarePolicyConfig, ConflictAwarePolicyNetwork  # noqa: E402
+from townlet.policy.runner import PolicyRuntime  # noqa: E402
+
+MAP_SHAPE = (4, 5, 5)
+FEATURE_DIM = 12
+ACTION_DIM = 6
+
+
+def _network(hidden_dim: int = 256) -> tuple[ConflictAwarePolicyNetwork, ConflictAwarePolicyConfig]:
+    config = ConflictAwarePolicyConfig(
+        feature_dim=FEATURE_DIM, map_shape=MAP_SHAPE, action_dim=ACTION_DIM, hidden_dim=hidden_dim
+    )
+    torch.manual_seed(0)
+    return ConflictAwarePolicyNetwork(config), config
+
+
+def test_traced_artifact_round_trips_signature(tmp_path: Path) -> None:
+    network, config = _network(hidden_dim=32)
+    output = tmp_path / "policy.pt"
+    signature = export_inference_artifact(network, config, output, batch_sizes=(1, 8), benchmark_iterations=5)
+
+    assert signature.accuracy["max_logit_error"] <= 1e-4
+    assert signature.accuracy["action_agreement"] == 1.0
+    assert set(signature.latency_ms) == {"eager", "artifact"}
+    assert set(signature.latency_ms["artifact"]) == {"1", "8"}
+
+    artifact = load_inference_artifact(output)
+    assert artifact.signature == signature
+    assert artifact.signature.accepts(MAP_SHAPE, FEATURE_DIM, ACTION_DIM)
+    assert not artifact.signature.accepts((4, 7, 7), FEATURE_DIM, ACTION_DIM)
+    assert not artifact.signature.accepts(MAP_SHAPE, FEATURE_DIM, ACTION_DIM + 1)
+    maps, features = torch.randn(3, *MAP_SHAPE), torch.randn(3, FEATURE_DIM)
+    with torch.no_grad():
+        expected = network(maps, features)
+        actual = artifact.module(maps, features)
+    for ours, theirs in zip(actual, expected, strict=True):
+        assert torch.allclose(ours, theirs, atol=1e-5)
+
+
+def test_quantized_export_enforces_tolerance(tmp_path: Path) -> None:
+    network, config = _network(hidden_dim=32)
+    signature = export_inference_artifact(
+        network, config, tmp_path / "policy_int8.pt", quantize=True, benchmark_iterations=0
+    )
+    assert signature.quantized
+    assert 0.0 < signature.accuracy["max_logit_error"] <= signature.accuracy["tolerance"]
+    assert signature.latency_ms == {}
+
+    with pytest.raises(InferenceAccuracyError):
+        export_inference_artifact(
+            network, config, tmp_path / "rejected.pt", quantize=True, tolerance=1e-9, benchmark_iterations=0
+        )
+    assert not (tmp_path / "rejected.pt").exists()
+
+
+def test_policy_runtime_runs_artifact_when_signature_matches(tmp_path: Path) -> None:
+    network, config = _network()
+    output = tmp_path / "policy.pt"
+    export_inference_artifact(network, config, output, benchmark_iterations=0)
+    sim_config = load_config(Path("configs/examples/poc_hybrid.yaml"))
+    frame = {
+        "map": np.random.default_rng(1).random(MAP_SHAPE, dtype=np.float32),
+        "features": np.linspace(-1.0, 1.0, FEATURE_DIM, dtype=np.float32),
+        "action_id": 2,
+    }
+
+    eager = PolicyRuntime(sim_config)
+    eager._action_lookup = {str(index): index for index in range(ACTION_DIM)}
+    eager_frame = dict(frame)
+    eager._annotate_with_policy_outputs(eager_frame)
+    assert isinstance(eager._policy_net, ConflictAwarePolicyNetwork)
+
+    sim_config.policy_runtime.inference_artifact = output
+    runtime = PolicyRuntime(sim_config)
+    runtime._action_lookup = dict(eager._action_lookup)
+    traced_frame = dict(frame)
+    runtime._annotate_with_policy_outputs(traced_frame)
+    assert isinstance(runtime._policy_net, torch.jit.ScriptModule)
+    assert traced_frame["log_prob"] == pytest.approx(eager_frame["log_prob"], abs=1e-5)
+    assert traced_frame["value_pred"] == pytest.approx(eager_frame["value_pred"], abs=1e-5)
+
+    assert runtime._ensure_policy_network((4, 7, 7), FEATURE_DIM, ACTION_DIM)
+    assert isinstance(runtime._policy_net, ConflictAwarePolicyNetwork)
+
+    grown = PolicyRuntime(sim_config)
+    grown._action_lookup = {str(index): index for index in range(ACTION_DIM + 2)}
+    grown_frame = dict(frame, action_id=ACTION_DIM + 1)
+    grown._annotate_with_policy_outputs(grown_frame)
+    assert isinstance(grown._policy_net, ConflictAwarePolicyNetwork)
+    assert grown_frame["logits"].shape == (ACTION_DIM + 2,)
+
+    sim_config.policy_runtime.inference_artifact = tmp_path / "missing.pt"
+    missing = PolicyRuntime(sim_config)
+    assert missing._ensure_policy_network(MAP_SHAPE, FEATURE_DIM, ACTION_DIM)
+    assert isinstance(missing._policy_net, ConflictAwarePolicyNetwork)
+
+
+def test_export_script_loads_state_dict(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    network, _ = _network(hidden_dim=16)
+    state_path = tmp_path / "policy_state.pt"
+    torch.save(network.state_dict(), state_path)
+    main = runpy.run_path("scripts/export_policy_inference.py")["main"]
+    output = tmp_path / "exported.pt"
+    argv = [
+        "--output",
+        str(output),
+        "--state-dict",
+        str(state_path),
+        "--map-shape",
+        *(str(size) for size in MAP_SHAPE),
+        "--feature-dim",
+        str(FEATURE_DIM),
+        "--action-dim",
+        str(ACTION_DIM),
+        "--hidden-dim",
+        "16",
+        "--quantize",
+        "--benchmark-iterations",
+        "3",
+    ]
+    assert main(argv) == 0
+    report = json.loads(capsys.readouterr().out)
+    assert report["accuracy"]["max_logit_error"] <= report["accuracy"]["tolerance"]
+    assert set(report["latency_ms"]["artifact"]) == {"1"}
+    assert load_inference_artifact(output).signature.quantized
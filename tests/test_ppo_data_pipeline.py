@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from townlet.policy.models import torch_available
+
+pytestmark = pytest.mark.skipif(not torch_available(), reason="Torch not installed")
+
+import torch  # noqa: E402
+
+from townlet.config import PPOConfig, load_config  # noqa: E402
+from townlet.policy.backends.pytorch import ppo_utils as ops  # noqa: E402
+from townlet.policy.backends.pytorch.ppo_data import PPODataPipeline  # noqa: E402
+from townlet.policy.replay import ReplaySample, build_batch  # noqa: E402
+from townlet.policy.replay_buffer import InMemoryReplayDataset, InMemoryReplayDatasetConfig  # noqa: E402
+from townlet.policy.training.orchestrator import TrainingOrchestrator  # noqa: E402
+
+
+def _samples(count: int = 3, timesteps: int = 6) -> list[ReplaySample]:
+    rng = np.random.default_rng(7)
+    names = ["f0", "f1", "rivalry_max", "rivalry_avoid_count"]
+    return [
+        ReplaySample(
+            map=rng.random((timesteps, 2, 3, 3), dtype=np.float32),
+            features=rng.random((timesteps, len(names)), dtype=np.float32),
+            actions=rng.integers(0, 3, timesteps),
+            old_log_probs=-rng.random(timesteps, dtype=np.float32),
+            value_preds=rng.random(timesteps + 1, dtype=np.float32),
+            rewards=rng.random(timesteps, dtype=np.float32),
+            dones=np.arange(timesteps) == timesteps - 1,
+            metadata={"feature_names": names, "action_dim": 3},
+        )
+        for _ in range(count)
+    ]
+
+
+def test_pipeline_caches_advantages_and_covers_every_transition() -> None:
+    batch = build_batch(_samples())
+    pipeline = PPODataPipeline(
+        [batch],
+        device=torch.device("cpu"),
+        gamma=0.99,
+        gae_lambda=0.95,
+        advantage_normalization=False,
+        mini_batch_size=4,
+        num_mini_batches=4,
+    )
+    expected = ops.compute_gae(
+        rewards=torch.from_numpy(batch.rewards),
+        value_preds=torch.from_numpy(batch.value_preds),
+        dones=torch.from_numpy(batch.dones.astype(np.float32)),
+        gamma=0.99,
+        gae_lambda=0.95,
+    )
+    cached = pipeline.batches[0]
+    assert torch.allclose(cached.advantages, expected.advantages.reshape(-1))
+    assert torch.allclose(cached.returns, expected.returns.reshape(-1))
+    assert np.shares_memory(cached.maps.numpy(), batch.maps)
+
+    generator = torch.Generator().manual_seed(3)
+    seen = torch.cat([minibatch.actions for minibatch in pipeline.iter_minibatches(generator)])
+    assert sorted(seen.tolist()) == sorted(batch.actions.reshape(-1).tolist())
+    assert pipeline.transitions == batch.actions.size
+
+
+def test_prefetch_matches_inline_minibatches() -> None:
+    summaries = []
+    for prefetch in (False, True):
+        config = load_config(Path("configs/examples/poc_hybrid.yaml"))
+        config.ppo = PPOConfig(mini_batch_size=4, prefetch_minibatches=prefetch)
+        dataset = InMemoryReplayDataset(InMemoryReplayDatasetConfig(entries=_samples(), batch_size=1))
+        torch.manual_seed(0)
+        result = TrainingOrchestrator(config).run_ppo(in_memory_dataset=dataset, epochs=2, device_str="cpu")
+        summaries.append(result.model_dump(exclude={"duration_sec", "epoch_duration_sec"}))
+    assert summaries[0] == summaries[1]
+    assert summaries[0]["updates"] > 3
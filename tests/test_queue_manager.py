@@ -90,3 +90,81 @@ def test_cooldown_expiration_clears_entries(queue_manager: QueueManager) -> None
     assert queue_manager.request_access("shower", "alice", tick=1) is False
     queue_manager.on_tick(5)
     assert queue_manager.request_access("shower", "alice", tick=6) is True
+
+
+def test_cooldown_timers_do_not_collide_on_separator_ids(queue_manager: QueueManager) -> None:
+    queue_manager._settings.cooldown_ticks = 3
+    assert queue_manager.request_access("a:b", "c", tick=0)
+    queue_manager.release("a:b", "c", tick=0)
+    assert queue_manager.request_access("a", "b:c", tick=1)
+    queue_manager.release("a", "b:c", tick=1)
+    queue_manager.on_tick(10)
+    assert queue_manager.cooldown_expiry("a:b", "c") is None
+    assert queue_manager.cooldown_expiry("a", "b:c") is None
+
+
+def test_reverse_index_tracks_membership_across_objects(queue_manager: QueueManager) -> None:
+    assert queue_manager.request_access("shower", "alice", tick=0) is True
+    assert queue_manager.request_access("stove", "carol", tick=0) is True
+    assert queue_manager.request_access("shower", "bob", tick=1) is False
+    assert queue_manager.request_access("stove", "bob", tick=1) is False
+
+    assert queue_manager.is_queued("bob") is True
+    assert queue_manager.is_queued("bob", "shower") is True
+    assert queue_manager.is_queued("alice") is False
+    assert queue_manager.queued_objects("bob") == frozenset({"shower", "stove"})
+
+    queue_manager.release("shower", "alice", tick=2)
+    assert queue_manager.active_agent("shower") == "bob"
+    assert queue_manager.queued_objects("bob") == frozenset({"stove"})
+
+    queue_manager.remove_agent("bob", tick=3)
+    assert queue_manager.is_queued("bob") is False
+    assert queue_manager.queue_length("stove") == 0
+    assert queue_manager.active_agent("shower") is None
+
+
+def test_queue_view_is_cached_until_mutation(queue_manager: QueueManager) -> None:
+    assert queue_manager.request_access("shower", "alice", tick=0) is True
+    assert queue_manager.request_access("shower", "bob", tick=1) is False
+    assert queue_manager.request_access("shower", "carol", tick=2) is False
+
+    view = queue_manager.queue_view("shower")
+    assert view == ("bob", "carol")
+    assert queue_manager.queue_view("shower") is view
+
+    queue_manager.promote_agent("shower", "carol")
+    assert queue_manager.queue_view("shower") == ("carol", "bob")
+    assert view == ("bob", "carol")
+    assert queue_manager.queue_snapshot("shower") == ["carol", "bob"]
+
+
+def test_refreshed_cooldown_supersedes_previous_expiry(queue_manager: QueueManager) -> None:
+    queue_manager._settings.cooldown_ticks = 5
+    assert queue_manager.request_access("shower", "alice", tick=0)
+    queue_manager.release("shower", "alice", tick=0)
+    assert queue_manager.cooldown_expiry("shower", "alice") == 5
+
+    queue_manager.on_tick(5)
+    assert queue_manager.request_access("shower", "alice", tick=5)
+    queue_manager.release("shower", "alice", tick=8)
+    # The earlier expiry=5 timer must not clear the refreshed cooldown.
+    queue_manager.on_tick(9)
+    assert queue_manager.cooldown_expiry("shower", "alice") == 13
+    queue_manager.on_tick(13)
+    assert queue_manager.cooldown_expiry("shower", "alice") is None
+
+
+def test_import_state_rebuilds_indexes(queue_manager: QueueManager) -> None:
+    assert queue_manager.request_access("shower", "alice", tick=0)
+    assert queue_manager.request_access("shower", "bob", tick=1) is False
+    queue_manager.release("shower", "alice", tick=2)
+    payload = queue_manager.export_state()
+
+    restored = QueueManager(load_config(Path("configs/examples/poc_hybrid.yaml")))
+    restored.import_state(payload)
+    assert restored.export_state() == payload
+    assert restored.active_agent("shower") == "bob"
+    assert restored.cooldown_expiry("shower", "alice") == payload["cooldowns"][0]["expiry"]  # type: ignore[index]
+    restored.on_tick(10_000)
+    assert restored.cooldown_expiry("shower", "alice") is None
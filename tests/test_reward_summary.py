@@ -46,3 +46,19 @@ def test_reward_aggregator_tracks_components(tmp_path: Path) -> None:
     assert "terminal_penalty" in text
     assert "alice" in text
     assert "bob" in text
+
+
+def test_collect_statistics_reads_archive_tick_range(tmp_path: Path) -> None:
+    from townlet.telemetry.archive import ArchiveTransport
+
+    archive = tmp_path / "archive"
+    transport = ArchiveTransport(archive, segment_max_ticks=4)
+    transport.start()
+    for tick in range(12):
+        payload = {"tick": tick, "reward_breakdown": {"alice": {"total": float(tick)}}}
+        transport.send(json.dumps(payload).encode("utf-8"))
+    transport.stop()
+
+    summary = collect_statistics([archive], start_tick=5, end_tick=8).summary()
+    assert summary["payloads"] == 4
+    assert summary["agents"]["alice"]["total_sum"] == 5.0 + 6.0 + 7.0 + 8.0
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import json
+import runpy
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from townlet.policy.replay import ReplayDataset, ReplayDatasetConfig
+from townlet.policy.rollout import RolloutBuffer
+from townlet.policy.rollout_shards import load_shard_index, load_shard_record, load_shard_sample
+
+FEATURE_NAMES = ["f0", "rivalry_max", "rivalry_avoid_count"]
+
+
+def _buffer(agent_steps: dict[str, int]) -> RolloutBuffer:
+    buffer = RolloutBuffer()
+    for agent_index, (agent_id, steps) in enumerate(agent_steps.items()):
+        buffer.extend(
+            {
+                "tick": tick,
+                "agent_id": agent_id,
+                "map": np.full((2, 3, 3), agent_index + tick, dtype=np.float32),
+                "features": np.full(len(FEATURE_NAMES), 0.1 * tick, dtype=np.float32),
+                "metadata": {"feature_names": FEATURE_NAMES},
+                "action": {"kind": "move", "target": (tick, agent_index)},
+                "action_id": tick % 2,
+                "rewards": [0.5 * agent_index],
+                "dones": [tick == steps - 1],
+                "log_prob": -0.1 * tick,
+                "value_pred": 0.2 * tick,
+            }
+            for tick in range(steps)
+        )
+    return buffer
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_shards_round_trip_through_manifest(tmp_path: Path, compress: bool) -> None:
+    buffer = _buffer({"alice": 4, "bob": 4, "carol": 4})
+    index_path = buffer.save_shards(tmp_path, compress=compress, agents_per_shard=2)
+
+    index = json.loads(index_path.read_text())
+    assert [shard["agents"] for shard in index["shards"]] == [["alice", "bob"], ["carol"]]
+    assert not list(tmp_path.glob("*_dto.json"))
+    assert all(name.endswith(".gz") == compress for name in (shard["meta"] for shard in index["shards"]))
+
+    expected = buffer.to_samples()
+    refs = load_shard_index(index_path)
+    for ref, agent_id in zip(refs, ("alice", "bob", "carol"), strict=True):
+        sample = load_shard_sample(ref)
+        for name in ("map", "features", "actions", "old_log_probs", "value_preds", "rewards", "dones"):
+            np.testing.assert_array_equal(getattr(sample, name), getattr(expected[agent_id], name))
+        assert sample.metadata["agent_id"] == agent_id
+        assert sample.metadata["metrics"]["timesteps"] == 4.0
+        record = load_shard_record(ref)
+        assert record["ticks"] == [0, 1, 2, 3]
+        assert record["actions"][1] == {"kind": "move", "target": [1, refs.index(ref)]}
+
+    dataset = ReplayDataset(ReplayDatasetConfig.from_manifest(index_path, batch_size=3))
+    batches = list(dataset)
+    assert len(batches) == 1
+    assert batches[0].maps.shape == (3, 4, 2, 3, 3)
+    assert ReplayDatasetConfig.from_capture_dir(tmp_path).entries == refs
+
+
+def test_curate_reads_shard_index(tmp_path: Path) -> None:
+    captures = tmp_path / "captures"
+    _buffer({"alice": 10, "bob": 3}).save(captures, sharded=True)
+    manifest_path = tmp_path / "manifest.json"
+    main = runpy.run_path("scripts/curate_trajectories.py")["main"]
+    main([str(captures), "--output", str(manifest_path), "--min-timesteps", "5"])
+
+    manifest = json.loads(manifest_path.read_text())
+    assert [(entry["index"], entry["accepted"]) for entry in manifest] == [(0, True), (1, False)]
+    accepted = ReplayDatasetConfig.from_manifest(manifest_path).entries
+    assert len(accepted) == 2
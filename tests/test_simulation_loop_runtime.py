@@ -48,3 +48,98 @@ def test_simulation_loop_close_is_idempotent(base_config: object) -> None:
     finally:
         loop.close()
         loop.close()
+
+
+def _agent_state(loop: SimulationLoop) -> dict[str, tuple[object, ...]]:
+    return {
+        agent_id: (snapshot.position, tuple(sorted(snapshot.needs.items())))
+        for agent_id, snapshot in loop.world.agents.items()
+    }
+
+
+def test_reset_reuses_components_and_skips_manifest_reload(
+    monkeypatch: pytest.MonkeyPatch, base_config: object
+) -> None:
+    loop = SimulationLoop(base_config.model_copy(deep=True))
+    try:
+        policy, publisher, stability = loop.policy, loop.telemetry_publisher, loop.stability
+        first_world = loop.world
+        object_ids = set(first_world.objects)
+        loop.run_for(3)
+
+        def _fail(path: Path) -> None:
+            raise AssertionError(f"manifest reloaded from {path}")
+
+        monkeypatch.setattr("townlet.world.grid.load_affordance_manifest", _fail)
+        loop.reset(seed=3)
+        assert loop.tick == 0
+        assert loop.world is not first_world
+        assert set(loop.world.objects) == object_ids
+        assert loop.world.affordances.keys() == first_world.affordances.keys()
+        assert loop.policy is policy
+        assert loop.telemetry_publisher is publisher
+        assert loop.stability is stability
+
+        with pytest.raises(AssertionError, match="manifest reloaded"):
+            loop.reset(rebuild=True)
+    finally:
+        _close_loop(loop)
+
+
+# Wall-clock timings, transport counters and the world's unseeded rng_seed
+# differ between any two runs, rebuilt or not.
+_NONDETERMINISTIC_KEYS = {
+    "transport_status",
+    "transport_buffer_pending",
+    "transport",
+    "duration_ms",
+    "last_flush_duration_ms",
+    "payloads_flushed_total",
+    "bytes_flushed_total",
+    "queue_affinity_metrics",
+    "rng_seed",
+}
+
+
+def _deterministic(value: object) -> object:
+    if isinstance(value, dict):
+        return {key: _deterministic(item) for key, item in value.items() if key not in _NONDETERMINISTIC_KEYS}
+    if isinstance(value, list):
+        return [_deterministic(item) for item in value]
+    return value
+
+
+def _telemetry_state(loop: SimulationLoop) -> tuple[object, ...]:
+    publisher = loop.telemetry_publisher
+    assert publisher is not None
+    return (
+        publisher._current_tick,
+        _deterministic(publisher.export_state()),
+        _deterministic(loop._last_health_payload),
+        _deterministic(loop._last_global_context),
+    )
+
+
+def test_fast_reset_replays_like_full_rebuild(base_config: object) -> None:
+    from townlet.envs.parallel import populate_from_config
+
+    def _rollout(loop: SimulationLoop, *, rebuild: bool) -> tuple[object, ...]:
+        loop.reset(seed=11, rebuild=rebuild)
+        after_reset = _telemetry_state(loop)
+        assert loop.telemetry_publisher._payload_builder._previous_snapshot is None
+        populate_from_config(loop)
+        loop.run_for(8)
+        return _agent_state(loop), after_reset, _telemetry_state(loop)
+
+    loop = SimulationLoop(base_config.model_copy(deep=True))
+    try:
+        loop.run_for(4)
+        rebuilt = _rollout(loop, rebuild=True)
+        loop.run_for(5)
+        fast = _rollout(loop, rebuild=False)
+        assert rebuilt[0]
+        assert rebuilt[1][0] == 0 and rebuilt[1][2] is None
+        assert rebuilt[2][0] == 8
+        assert fast == rebuilt
+    finally:
+        _close_loop(loop)
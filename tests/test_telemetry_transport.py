@@ -48,7 +48,7 @@ def test_telemetry_publisher_flushes_payload(monkeypatch: pytest.MonkeyPatch) ->
     sent: list[bytes] = []
 
     class CaptureTransport:
-        def send(self, payload: bytes) -> None:
+        def send(self, payload: bytes, **_: object) -> None:
             sent.append(payload)
 
         def close(self) -> None:  # pragma: no cover - nothing to close in stub
@@ -84,7 +84,7 @@ def test_telemetry_publisher_retries_on_failure(monkeypatch: pytest.MonkeyPatch)
             self.fail_first = fail_first
             self.calls = 0
 
-        def send(self, payload: bytes) -> None:
+        def send(self, payload: bytes, **_: object) -> None:
             self.calls += 1
             if self.fail_first and self.calls == 1:
                 raise RuntimeError("simulated send failure")
@@ -126,7 +126,7 @@ def test_telemetry_publisher_retries_on_failure(monkeypatch: pytest.MonkeyPatch)
 
 def test_telemetry_worker_metrics_and_stop(monkeypatch: pytest.MonkeyPatch) -> None:
     class NoopTransport:
-        def send(self, payload: bytes) -> None:  # pragma: no cover - noop
+        def send(self, payload: bytes, **_: object) -> None:  # pragma: no cover - noop
             pass
 
         def close(self) -> None:  # pragma: no cover - noop
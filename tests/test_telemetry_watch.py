@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import gzip
 from pathlib import Path
 
 import pytest
@@ -8,6 +9,7 @@ from scripts.telemetry_watch import (
     _parse_health_line,
     check_health_thresholds,
     stream_health_records,
+    stream_records,
 )
 
 
@@ -59,3 +61,24 @@ def test_health_thresholds_raise() -> None:
     )()
     with pytest.raises(SystemExit):
         check_health_thresholds(record, args)
+
+
+def test_stream_health_records_reads_gzip_segment(tmp_path: Path) -> None:
+    log = tmp_path / "health.log.gz"
+    with gzip.open(log, "wt", encoding="utf-8") as handle:
+        handle.write(
+            "tick_health tick=9 duration_ms=3.0 queue=0 dropped=0 perturbations_pending=0 "
+            "perturbations_active=0 exit_queue=0\n"
+        )
+    records = list(stream_health_records(log, follow=False, interval=0.01))
+    assert [record["tick"] for record in records] == [9]
+
+
+def test_follow_refuses_compressed_segments(tmp_path: Path) -> None:
+    log = tmp_path / "ppo.jsonl.gz"
+    with gzip.open(log, "wt", encoding="utf-8") as handle:
+        handle.write("{}\n")
+    with pytest.raises(ValueError, match="compressed segment"):
+        next(stream_records(log, follow=True, interval=0.01))
+    with pytest.raises(ValueError, match="compressed segment"):
+        next(stream_health_records(log, follow=True, interval=0.01))
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from townlet.config import load_config
+from townlet.core.sim_loop import SimulationLoop, SimulationLoopError
+from townlet.core.tick_pipeline import TICK_STAGES, TickPipeline, barrier_stage, overlaps_deferred_stage
+from townlet.world.grid import AgentSnapshot
+
+_TIMING_STATE_KEYS = {"transport_status", "transport_buffer_pending", "health"}
+
+
+def _make_loop(*, pipelined: bool) -> SimulationLoop:
+    config = load_config(Path("configs/examples/poc_hybrid.yaml"))
+    config.runtime.pipelined = pipelined
+    loop = SimulationLoop(config)
+    for index, position in enumerate([(0, 0), (2, 1), (4, 4)]):
+        agent_id = f"agent_{index}"
+        loop.world.agents[agent_id] = AgentSnapshot(
+            agent_id=agent_id,
+            position=position,
+            needs={"hunger": 0.3, "hygiene": 0.5, "energy": 0.2},
+            wallet=1.0,
+        )
+    return loop
+
+
+def _run(loop: SimulationLoop, ticks: int) -> tuple[list[object], list[dict[str, float]], dict[str, object]]:
+    artifacts = loop.run_for_ticks(ticks, collect=True)
+    agents = [artifact.envelope.model_dump()["agents"] for artifact in artifacts]
+    rewards = [artifact.rewards for artifact in artifacts]
+    state = {
+        key: value
+        for key, value in loop.telemetry.export_state().items()
+        if key not in _TIMING_STATE_KEYS
+    }
+    loop.close()
+    return agents, rewards, state
+
+
+def test_pipelined_loop_matches_sequential_loop() -> None:
+    sequential = _run(_make_loop(pipelined=False), 12)
+    pipelined_loop = _make_loop(pipelined=True)
+    assert pipelined_loop._tick_pipeline is not None
+    pipelined = _run(pipelined_loop, 12)
+
+    assert pipelined == sequential
+    assert pipelined_loop._tick_pipeline is None
+
+
+def test_stage_dependencies_place_barrier_after_policy_inference() -> None:
+    stages = {stage.name: stage for stage in TICK_STAGES}
+    deferred = stages["telemetry_emit"]
+
+    assert overlaps_deferred_stage(stages["policy_decide"], deferred)
+    assert not overlaps_deferred_stage(stages["world_tick"], deferred)
+    assert barrier_stage() == "console_drain"
+
+    pipeline = TickPipeline()
+    pipeline.submit(lambda: None)
+    pipeline.enter("policy_decide")
+    assert pipeline.pending
+    pipeline.enter("console_drain")
+    assert not pipeline.pending
+    pipeline.close()
+
+
+def test_deferred_stage_errors_surface_on_next_step(monkeypatch: pytest.MonkeyPatch) -> None:
+    loop = _make_loop(pipelined=True)
+    loop.step()
+
+    def _boom(record: object) -> float:
+        raise RuntimeError("telemetry stage failed")
+
+    monkeypatch.setattr(loop, "_emit_tick_telemetry", _boom)
+    loop.step()
+    with pytest.raises(SimulationLoopError) as excinfo:
+        loop.step()
+    assert "telemetry stage failed" in str(excinfo.value.__cause__)
+    loop.close()
+
+    pipeline = TickPipeline()
+    pipeline.submit(lambda: None)
+    assert pipeline.pending
+    pipeline.close()
+    assert not pipeline.pending
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from townlet.utils.timers import TimerEntry, TimingWheel
+
+
+def _collect(wheel: TimingWheel, topic: str) -> list[TimerEntry]:
+    fired: list[TimerEntry] = []
+    wheel.register_handler(topic, fired.append)
+    return fired
+
+
+def test_fires_entries_in_due_then_schedule_order() -> None:
+    wheel = TimingWheel(slots=4, levels=2)
+    fired = _collect(wheel, "t")
+    wheel.schedule("t", "b", 3)
+    wheel.schedule("t", "a", 2)
+    wheel.schedule("t", "c", 3)
+
+    assert wheel.advance(1) == 0
+    assert wheel.advance(3) == 3
+    assert [entry.key for entry in fired] == ["a", "b", "c"]
+    assert len(wheel) == 0
+
+
+def test_cascades_entries_beyond_first_level_and_overflow() -> None:
+    wheel = TimingWheel(slots=4, levels=2)
+    fired = _collect(wheel, "t")
+    due_ticks = [5, 13, 15, 16, 17, 40]
+    for due in due_ticks:
+        wheel.schedule("t", f"k{due}", due)
+
+    for tick in range(1, 41):
+        wheel.advance(tick)
+        assert all(entry.due_tick == tick for entry in fired if entry.key == f"k{tick}")
+    assert [entry.due_tick for entry in fired] == due_ticks
+
+
+def test_reschedule_and_cancel_replace_previous_deadline() -> None:
+    wheel = TimingWheel()
+    fired = _collect(wheel, "t")
+    wheel.schedule("t", "a", 5)
+    wheel.schedule("t", "a", 9)
+    wheel.schedule("t", "b", 6)
+    assert wheel.cancel("t", "b") is True
+    assert wheel.cancel("t", "b") is False
+
+    wheel.advance(8)
+    assert fired == []
+    assert wheel.due_tick("t", "a") == 9
+    wheel.advance(9)
+    assert [entry.key for entry in fired] == ["a"]
+
+
+def test_overdue_entries_flush_on_repeat_advance() -> None:
+    wheel = TimingWheel(current_tick=10)
+    fired = _collect(wheel, "t")
+    wheel.advance(10)
+    wheel.schedule("t", "late", 7, {"reason": "catch_up"})
+
+    assert wheel.advance(10) == 1
+    assert fired[0].payload == {"reason": "catch_up"}
+
+
+def test_export_import_round_trip_and_rebase() -> None:
+    wheel = TimingWheel()
+    wheel.schedule("x", "a", 100, {"n": 1})
+    wheel.schedule("y", "b", 7)
+    wheel.advance(3)
+    payload = wheel.export_state()
+
+    restored = TimingWheel()
+    fired = _collect(restored, "y")
+    restored.import_state(payload)
+    assert restored.export_state() == payload
+    assert restored.current_tick == 3
+
+    restored.rebase(0)
+    assert restored.current_tick == 0
+    assert restored.due_tick("x", "a") == 100
+    restored.advance(7)
+    assert [entry.key for entry in fired] == ["b"]
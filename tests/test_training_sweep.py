@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import json
+import runpy
+from pathlib import Path
+
+import numpy as np
+import pytest
+from pydantic import ValidationError
+
+from townlet.config import load_config
+from townlet.policy.models import torch_available
+from townlet.policy.replay import ReplayDataset, ReplayDatasetConfig, load_replay_sample
+from townlet.policy.replay_store import build_replay_store, load_store_index, load_store_sample
+from townlet.policy.training.sweep import SweepSpec, apply_overrides, expand_trials
+
+FEATURE_NAMES = ["f0", "f1", "rivalry_max", "rivalry_avoid_count"]
+
+
+def _write_manifest(tmp_path: Path, grids: list[int], timesteps: int = 6) -> Path:
+    rng = np.random.default_rng(3)
+    entries = []
+    metrics = {}
+    for index, grid in enumerate(grids):
+        sample_path = tmp_path / f"sample_{index}.npz"
+        np.savez(
+            sample_path,
+            map=rng.random((timesteps, 2, grid, grid), dtype=np.float32),
+            features=rng.random((timesteps, len(FEATURE_NAMES)), dtype=np.float32),
+            actions=rng.integers(0, 3, timesteps),
+            old_log_probs=-rng.random(timesteps, dtype=np.float32),
+            value_preds=rng.random(timesteps + 1, dtype=np.float32),
+            rewards=rng.random(timesteps, dtype=np.float32),
+            dones=np.arange(timesteps) == timesteps - 1,
+        )
+        sample_path.with_suffix(".json").write_text(json.dumps({"feature_names": FEATURE_NAMES, "action_dim": 3}))
+        entries.append({"sample": sample_path.name, "meta": sample_path.with_suffix(".json").name})
+        metrics[sample_path.name] = {"timesteps": float(timesteps), "reward_sum": float(index)}
+    manifest = tmp_path / "manifest.json"
+    manifest.write_text(json.dumps(entries))
+    (tmp_path / "metrics.json").write_text(json.dumps(metrics))
+    return manifest
+
+
+def test_replay_store_round_trips_and_memory_maps(tmp_path: Path) -> None:
+    manifest = _write_manifest(tmp_path, grids=[3, 5, 3])
+    source = ReplayDatasetConfig.from_manifest(manifest)
+    source.metrics_map = json.loads((tmp_path / "metrics.json").read_text())
+    index_path = build_replay_store(source, tmp_path / "store")
+
+    index = json.loads(index_path.read_text())
+    assert [segment["samples"] for segment in index["segments"]] == [2, 1]
+    refs = load_store_index(index_path)
+    assert ReplayDatasetConfig.from_manifest(index_path).entries == refs
+    for ref, entry in zip(refs, source.entries, strict=True):
+        assert isinstance(entry, tuple)
+        expected = load_replay_sample(*entry)
+        sample = load_store_sample(ref)
+        for name in ("map", "features", "actions", "old_log_probs", "value_preds", "rewards", "dones"):
+            np.testing.assert_array_equal(getattr(sample, name), getattr(expected, name))
+        assert not sample.map.flags.writeable
+        assert isinstance(sample.map.base, np.memmap)
+
+    dataset = ReplayDataset(ReplayDatasetConfig.from_manifest(index_path))
+    assert dataset.baseline_metrics["sample_count"] == 3.0
+    assert dataset.baseline_metrics["reward_sum"] == 3.0
+    assert len(dataset) == 3
+
+
+def test_expand_trials_and_apply_overrides() -> None:
+    spec = SweepSpec.model_validate(
+        {
+            "grid": {"ppo.learning_rate": [1e-4, 3e-4], "ppo.num_epochs": [1, 2]},
+            "random": {"samples": 3, "seed": 5, "space": {"ppo.clip_param": {"uniform": [0.1, 0.3]}}},
+        }
+    )
+    trials = expand_trials(spec)
+    assert len(trials) == 12
+    assert trials == expand_trials(spec)
+    assert all(0.1 <= trial.overrides["ppo.clip_param"] <= 0.3 for trial in trials)
+
+    config = load_config(Path("configs/examples/poc_hybrid.yaml"))
+    assert config.ppo is None
+    updated = apply_overrides(config, trials[-1].overrides)
+    assert updated.ppo is not None and updated.ppo.learning_rate == 3e-4 and updated.ppo.num_epochs == 2
+    assert config.ppo is None
+    schedule = [{"cycle": 0, "mode": "ppo", "epochs": 2}]
+    assert apply_overrides(config, {"training.anneal_schedule": schedule}).training.anneal_schedule[0].epochs == 2
+    with pytest.raises(ValueError, match="does not name a config field"):
+        apply_overrides(config, {"ppo.learning_rat": 1e-3})
+    with pytest.raises(ValidationError):
+        apply_overrides(config, {"ppo.learning_rate": -1.0})
+    with pytest.raises(ValidationError):
+        SweepSpec.model_validate({"random": {"samples": 1, "space": {"ppo.gamma": {"normal": [0, 1]}}}})
+
+
+@pytest.mark.skipif(not torch_available(), reason="Torch not installed")
+def test_sweep_cli_runs_trials_in_parallel(tmp_path: Path) -> None:
+    manifest = _write_manifest(tmp_path, grids=[3, 3, 3, 3])
+    spec_path = tmp_path / "sweep.yaml"
+    spec_path.write_text(
+        json.dumps(
+            {
+                "base_config": str(Path("configs/examples/poc_hybrid.yaml").resolve()),
+                "mode": "ppo",
+                "epochs": 1,
+                "replay_manifest": str(manifest),
+                "grid": {"ppo.learning_rate": [1e-4, 1e-3, -1.0], "ppo.mini_batch_size": [4]},
+                "workers": 2,
+                "threads_per_trial": 1,
+            }
+        )
+    )
+    output = tmp_path / "sweep"
+    main = runpy.run_path("scripts/run_sweep.py")["main"]
+    assert main([str(spec_path), "--output", str(output)]) == 1
+
+    records = {record["trial_id"]: record for record in map(json.loads, (output / "sweep_results.jsonl").read_text().splitlines())}
+    assert sorted(records) == ["trial_0000", "trial_0001", "trial_0002"]
+    assert records["trial_0002"]["status"] == "error"
+    assert records["trial_0000"]["metrics"]["transitions"] == 24.0
+    assert (output / "trials" / "trial_0001" / "ppo_log.jsonl").exists()
+    summary = json.loads((output / "sweep_summary.json").read_text())
+    assert (summary["completed"], summary["failed"]) == (2, 1)
+    assert [entry["trial_id"] for entry in summary["ranking"]] == sorted(
+        ["trial_0000", "trial_0001"], key=lambda trial: records[trial]["metrics"]["loss_total"]
+    )
+    assert Path(summary["replay_store"]).name == "replay_store.json"
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from townlet.policy.replay import frames_to_replay_sample
+from townlet.policy.rollout import RolloutBuffer
+from townlet.policy.trajectory_store import TrajectoryStore
+
+
+def _frame(agent_id: str, tick: int, *, action: dict[str, object] | None = None) -> dict[str, object]:
+    return {
+        "tick": tick,
+        "agent_id": agent_id,
+        "map": np.full((2, 3, 3), float(tick), dtype=np.float32),
+        "features": np.arange(4, dtype=np.float32) + tick,
+        "metadata": {"feature_names": ["a", "b", "c", "d"], "dto": {"schema_version": "0.2.0", "wallet": float(tick)}},
+        "anneal_context": {"ratio": 0.5},
+        "action": action or {"kind": "wait"},
+        "action_id": None if action is not None else tick % 3,
+        "rewards": [0.1 * tick],
+        "dones": [tick == 9],
+        "log_prob": -0.5 * tick,
+        "value_pred": 0.25 * tick,
+    }
+
+
+@pytest.mark.parametrize("keyed_actions", [False, True])
+def test_store_samples_match_frame_stacking(keyed_actions: bool) -> None:
+    frames = [
+        _frame(agent_id, tick, action={"kind": "move", "step": tick % 2} if keyed_actions else None)
+        for tick in range(10)
+        for agent_id in ("alice", "bob")
+    ]
+    store = TrajectoryStore(initial_capacity=2)
+    store.extend(frames)
+    assert len(store) == len(frames)
+
+    for agent_id, columns in store.agents().items():
+        observed = columns.to_replay_sample()
+        expected = frames_to_replay_sample([frame for frame in frames if frame["agent_id"] == agent_id])
+        for name in ("map", "features", "actions", "old_log_probs", "value_preds", "rewards", "dones"):
+            np.testing.assert_allclose(getattr(observed, name), getattr(expected, name))
+        assert observed.metadata == expected.metadata
+        assert np.shares_memory(observed.map, columns.to_replay_sample().map)
+
+
+def test_rollout_buffer_samples_are_views() -> None:
+    buffer = RolloutBuffer()
+    buffer.extend([_frame("alice", tick) for tick in range(3)])
+    first = buffer.to_samples()["alice"]
+    second = buffer.to_samples()["alice"]
+    assert np.shares_memory(first.map, second.map)
+    assert np.shares_memory(first.value_preds, second.value_preds)
+    frames = buffer.by_agent()["alice"].frames
+    assert [frame["tick"] for frame in frames] == [0, 1, 2]
+    assert all(frame["metadata"] is frames[0]["metadata"] for frame in frames)
+
+    with pytest.raises(ValueError):
+        buffer.extend([{**_frame("alice", 3), "map": np.zeros((1, 3, 3), dtype=np.float32)}])
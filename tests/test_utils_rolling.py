@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import json
+import random
+import statistics
+
+import pytest
+
+from townlet.utils.rolling import RollingStats
+
+
+def _replay(stats: RollingStats, ticks: range, window: int, rng: random.Random) -> None:
+    for tick in ticks:
+        for _ in range(rng.randint(0, 7)):
+            stats.add(tick, rng.uniform(-2.0, 2.0))
+        stats.evict_before(tick - window)
+
+
+def test_window_moments_match_recomputed_values() -> None:
+    rng = random.Random(7)
+    stats = RollingStats(capacity=4)
+    _replay(stats, range(3000), window=50, rng=rng)
+
+    values = [value for _, value in stats]
+    assert len(stats) == len(values)
+    assert stats.oldest_tick() == min(tick for tick, _ in stats)
+    assert stats.mean() == pytest.approx(statistics.fmean(values), abs=1e-12)
+    assert stats.variance() == pytest.approx(statistics.pvariance(values), abs=1e-12)
+
+
+def test_integer_samples_produce_exact_mean() -> None:
+    stats = RollingStats()
+    counts = [3, 1, 4, 1, 5, 9, 2, 6]
+    for tick, count in enumerate(counts):
+        stats.add(tick, count)
+    stats.evict_before(2)
+    assert stats.mean() == sum(counts[2:]) / len(counts[2:])
+    assert stats.samples()[0] == (2, 4.0)
+
+
+def test_constant_samples_have_zero_variance() -> None:
+    stats = RollingStats()
+    for tick in range(100):
+        stats.add(tick, 0.5)
+        stats.evict_before(tick - 10)
+    assert stats.mean() == 0.5
+    assert stats.variance() == 0.0
+
+
+def test_export_load_continues_bitwise_identically() -> None:
+    rng = random.Random(11)
+    live = RollingStats()
+    _replay(live, range(500), window=40, rng=rng)
+
+    payload = json.loads(json.dumps({"samples": live.samples(), "stats": live.export_state()}))
+    restored = RollingStats()
+    restored.load([(int(t), float(v)) for t, v in payload["samples"]], payload["stats"])
+
+    continuation = random.Random(3)
+    _replay(live, range(500, 2500), window=40, rng=continuation)
+    continuation.seed(3)
+    _replay(restored, range(500, 2500), window=40, rng=continuation)
+
+    assert restored.samples() == live.samples()
+    assert restored.export_state() == live.export_state()
+    assert restored.variance() == live.variance()
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from townlet.config.loader import load_config
+from townlet.core.sim_loop import SimulationLoop
+from townlet.world.actions import (
+    ACTION_BATCH_ERRORS,
+    ACTION_KIND_INDEX,
+    ActionBatch,
+    ActionSlots,
+    split_action_input,
+)
+from townlet.world.grid import AgentSnapshot
+from townlet.world.systems.affordances import process_action_batch
+
+
+@pytest.fixture()
+def loop() -> Iterator[SimulationLoop]:
+    config = load_config(Path("configs/examples/poc_hybrid.yaml"))
+    sim = SimulationLoop(config)
+    try:
+        yield sim
+    finally:
+        sim.close()
+
+
+def _register_agent(world, agent_id: str, position: tuple[int, int]) -> None:
+    world.agents[agent_id] = AgentSnapshot(
+        agent_id=agent_id,
+        position=position,
+        needs={"hunger": 0.5, "hygiene": 0.5, "energy": 0.5},
+        wallet=1.0,
+    )
+
+
+def test_validate_reports_vectorised_error_codes() -> None:
+    slots = ActionSlots(agents=("alice", "bob"), objects=("stove_1",), affordances=("cook",))
+    batch = ActionBatch.allocate(slots, size=6)
+    rows = batch.array
+    rows["agent_slot"] = [0, 5, 1, 1, 0, 0]
+    rows["kind_code"] = [
+        ACTION_KIND_INDEX["move"],
+        ACTION_KIND_INDEX["move"],
+        42,
+        ACTION_KIND_INDEX["request"],
+        ACTION_KIND_INDEX["start"],
+        ACTION_KIND_INDEX["start"],
+    ]
+    rows["target_object_slot"][3] = 9
+    rows["target_object_slot"][4:] = 0
+    rows["affordance_slot"][4:] = [0, 3]
+
+    errors = [ACTION_BATCH_ERRORS[code] for code in batch.validate().tolist()]
+    assert errors == [
+        "duplicate agent slot",
+        "agent_slot out of range",
+        "unsupported kind code",
+        "target slot out of range",
+        "duplicate agent slot",
+        "affordance slot out of range",
+    ]
+
+
+def test_as_mapping_decodes_rows_and_prefers_overrides() -> None:
+    slots = ActionSlots(agents=("alice", "bob", "carol"), objects=("stove_1",))
+    batch = ActionBatch.allocate(slots)
+    batch.array["kind_code"][0] = ACTION_KIND_INDEX["move"]
+    batch.array["dx"][0] = 1
+    batch.array["dy"][0] = -1
+    batch.array["kind_code"][1] = ACTION_KIND_INDEX["chat"]
+    batch.array["target_object_slot"][1] = 2
+    view = batch.with_overrides({"carol": {"kind": "wait"}}).as_mapping()
+
+    assert dict(view) == {
+        "alice": {"kind": "move", "duration": 1, "delta": (1, -1)},
+        "bob": {"kind": "chat", "duration": 1, "target": "carol"},
+        "carol": {"kind": "wait"},
+    }
+    batch.array["kind_code"][0] = ACTION_KIND_INDEX["noop"]
+    assert view["alice"] == {"kind": "move", "duration": 1, "delta": (1, -1)}
+
+    mapping, split_batch = split_action_input(batch)
+    assert mapping == {} and split_batch is batch
+    mapping, split_batch = split_action_input({"alice": {"kind": "wait"}})
+    assert mapping == {"alice": {"kind": "wait"}} and split_batch is None
+
+
+def test_process_action_batch_applies_moves_and_emits_one_event(loop: SimulationLoop) -> None:
+    world = loop.world
+    _register_agent(world, "alice", (2, 2))
+    _register_agent(world, "bob", (4, 4))
+    world.event_dispatcher().drain()
+
+    slots = ActionSlots(agents=("alice", "bob", "ghost"))
+    batch = ActionBatch.allocate(slots)
+    batch.array["kind_code"] = ACTION_KIND_INDEX["move"]
+    batch.array["dx"] = [1, -1, 0]
+    batch.array["dy"] = [0, 1, 0]
+
+    summary = process_action_batch(world, batch, tick=3, skip_agents=("bob",))
+
+    assert world.agents["alice"].position == (3, 2)
+    assert world.agents["bob"].position == (4, 4)
+    assert summary["applied"] == 1
+    assert summary["unknown_agents"] == 1
+    assert summary["kinds"] == {"move": 1}
+    batch_events = [event for event in world.event_dispatcher().drain() if event.type == "action.batch"]
+    assert len(batch_events) == 1
+    assert batch_events[0].payload["size"] == 3
+
+
+def test_simulation_loop_accepts_action_batch_from_policy(
+    loop: SimulationLoop, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    world = loop.world
+    _register_agent(world, "alice", (2, 2))
+    slots = ActionSlots.from_world(world)
+    batch = ActionBatch.allocate(slots)
+    batch.array["kind_code"][slots.agent_slot("alice")] = ACTION_KIND_INDEX["move"]
+    batch.array["dx"][slots.agent_slot("alice")] = 1
+
+    monkeypatch.setattr(loop.policy, "decide", lambda *args, **kwargs: batch)
+    loop.step()
+
+    assert world.agents["alice"].position == (3, 2)
+    assert np.all(batch.array["dx"][slots.agent_slot("alice")] == 1)
@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from townlet.config import load_config
+from townlet.core.sim_loop import SimulationLoop
+from townlet.world.events import EventDispatcher
+from townlet.world.rng import RngStreamManager
+from townlet.world.systems import SystemContext, SystemScheduler, SystemSpec, declare_system, system_spec
+
+
+def _ctx() -> SystemContext:
+    return SystemContext(state=SimpleNamespace(), rng=RngStreamManager.from_seed(1), events=EventDispatcher())
+
+
+def _recorder(calls: list[tuple[str, int]], name: str, ctx_tick: list[int]) -> SystemSpec:
+    return SystemSpec(name=name, step=lambda ctx: calls.append((name, ctx_tick[0])))
+
+
+def test_cadence_events_and_idle_skips() -> None:
+    calls: list[str] = []
+    busy = {"value": False}
+
+    @declare_system("every_three", every=3)
+    def every_three(ctx: SystemContext) -> None:
+        calls.append("every_three")
+
+    @declare_system("on_spike", every=None, on_events=("price_spike",))
+    def on_spike(ctx: SystemContext) -> None:
+        calls.append("on_spike")
+
+    @declare_system("when_busy", idle=lambda ctx: not busy["value"])
+    def when_busy(ctx: SystemContext) -> None:
+        calls.append("when_busy")
+
+    scheduler = SystemScheduler((every_three, on_spike, when_busy))
+    ctx = _ctx()
+    ran: list[list[str]] = []
+    for tick in range(1, 7):
+        calls.clear()
+        if tick == 2:
+            ctx.events.emit(event_type="price_spike", tick=tick)
+        busy["value"] = tick >= 5
+        timings = scheduler.run(ctx, tick)
+        assert list(timings) == calls
+        ran.append(list(calls))
+
+    assert ran == [[], ["on_spike"], ["every_three"], [], ["when_busy"], ["every_three", "when_busy"]]
+    stats = scheduler.snapshot()
+    assert (stats["every_three"]["runs"], stats["every_three"]["skips"]) == (2, 4)
+    assert (stats["on_spike"]["runs"], stats["when_busy"]["skips"]) == (1, 4)
+
+
+def test_cadence_overrides_and_validation() -> None:
+    calls: list[tuple[str, int]] = []
+    tick_box = [0]
+    spec = _recorder(calls, "economy", tick_box)
+    scheduler = SystemScheduler((spec,), every={"economy": 2})
+    for tick in range(1, 5):
+        tick_box[0] = tick
+        scheduler.run(_ctx(), tick)
+    assert calls == [("economy", 2), ("economy", 4)]
+
+    with pytest.raises(ValueError, match="unknown"):
+        SystemScheduler((spec,), every={"missing": 2})
+    with pytest.raises(ValueError, match="Duplicate"):
+        SystemScheduler((spec, spec))
+
+
+def test_undeclared_steps_conflict_with_everything() -> None:
+    def plain(ctx: SystemContext) -> None:
+        return None
+
+    spec = system_spec(plain)
+    assert spec.name.endswith("plain")
+    disjoint = SystemSpec(name="other", step=plain, reads=frozenset({"a"}), writes=frozenset({"b"}))
+    assert spec.conflicts_with(disjoint)
+    assert not disjoint.conflicts_with(SystemSpec(name="x", step=plain, reads=frozenset({"a"}), writes=frozenset()))
+    assert disjoint.conflicts_with(SystemSpec(name="y", step=plain, reads=frozenset({"b"}), writes=frozenset()))
+
+
+def test_disjoint_parallel_safe_systems_share_a_wave() -> None:
+    barrier = threading.Barrier(2, timeout=5)
+    order: list[str] = []
+    lock = threading.Lock()
+
+    def meeting(name: str):  # type: ignore[no-untyped-def]
+        def step(ctx: SystemContext) -> None:
+            barrier.wait()
+            with lock:
+                order.append(name)
+
+        return step
+
+    def sequential(ctx: SystemContext) -> None:
+        order.append("sequential")
+
+    left = SystemSpec("left", meeting("left"), reads=frozenset({"a"}), writes=frozenset({"a"}), parallel_safe=True)
+    right = SystemSpec("right", meeting("right"), reads=frozenset({"b"}), writes=frozenset({"b"}), parallel_safe=True)
+    scheduler = SystemScheduler((left, right, sequential), max_workers=2)
+    try:
+        timings = scheduler.run(_ctx(), 1)
+    finally:
+        scheduler.close()
+    assert sorted(order[:2]) == ["left", "right"]
+    assert order[2] == "sequential"
+    assert set(timings) == {"left", "right", f"{sequential.__module__}.{sequential.__qualname__}"}
+
+
+def test_world_context_reports_system_timings() -> None:
+    config = load_config(Path("configs/examples/poc_hybrid.yaml"))
+    config.system_scheduler.every = {"economy": 5}
+    loop = SimulationLoop(config)
+    loop.world.agents.clear()
+    loop.run_for(10)
+
+    timings = loop.world_context.system_timings()
+    assert list(timings) == ["queues", "affordances", "employment", "relationships", "economy", "perturbations"]
+    assert timings["queues"]["runs"] == 10
+    assert timings["economy"]["runs"] == 2
+    assert timings["relationships"]["skips"] == 10
+    assert all(stats["total_ms"] >= 0.0 for stats in timings.values())
+
+
+def _noop(ctx: SystemContext) -> None:
+    return None
+
+
+def test_close_releases_pool_and_event_listener() -> None:
+    left = SystemSpec("left", _noop, reads=frozenset({"a"}), writes=frozenset({"a"}), parallel_safe=True)
+    right = SystemSpec("right", _noop, reads=frozenset({"b"}), writes=frozenset({"b"}), parallel_safe=True)
+    listener = SystemSpec("listener", _noop, every=None, on_events=frozenset({"ping"}))
+    scheduler = SystemScheduler((left, right, listener), max_workers=2)
+    ctx = _ctx()
+    scheduler.run(ctx, 1)
+    assert scheduler._pool is not None
+    assert scheduler._on_event in ctx.events._listeners
+
+    scheduler.close()
+    assert scheduler._pool is None
+    assert scheduler._on_event not in ctx.events._listeners
+
+    ctx.events.emit(event_type="ping", tick=2)
+    assert "listener" not in scheduler.run(ctx, 2)
+
+
+def test_world_context_closes_replaced_scheduler_and_loop_shutdown() -> None:
+    config = load_config(Path("configs/examples/poc_hybrid.yaml"))
+    config.system_scheduler.max_workers = 2
+    loop = SimulationLoop(config)
+    loop.world.agents.clear()
+    context = loop.world_context
+    left = SystemSpec("left", _noop, reads=frozenset({"a"}), writes=frozenset({"a"}), parallel_safe=True)
+    right = SystemSpec("right", _noop, reads=frozenset({"b"}), writes=frozenset({"b"}), parallel_safe=True)
+
+    context.systems = (left, right)
+    loop.run_for(1)
+    first = context.scheduler
+    assert first is not None and first._pool is not None
+
+    context.systems = (right, left)
+    loop.run_for(1)
+    second = context.scheduler
+    assert second is not first
+    assert first._pool is None
+    assert second is not None and second._pool is not None
+
+    loop.close()
+    assert second._pool is None